@@ -0,0 +1,38 @@
+"""add workflow traces table
+
+Revision ID: 3c1f6a8e2d47
+Revises: 59fbac3b744e
+Create Date: 2025-03-20 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c1f6a8e2d47"
+down_revision: Union[str, None] = "59fbac3b744e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The DAO creates missing tables on startup, so the table may already exist.
+    if sa.inspect(op.get_bind()).has_table("workflow_traces"):
+        return
+    op.create_table(
+        "workflow_traces",
+        sa.Column("trace_id", sa.String(), nullable=False),
+        sa.Column("workflow_id", sa.String(), nullable=True),
+        sa.Column("project_name", sa.String(), nullable=True),
+        sa.Column("project_id", sa.String(), nullable=True),
+        sa.Column("global_trace_id", sa.String(), nullable=True),
+        sa.PrimaryKeyConstraint("trace_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("workflow_traces")
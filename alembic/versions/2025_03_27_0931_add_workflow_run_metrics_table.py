@@ -0,0 +1,49 @@
+"""add workflow run metrics table
+
+Revision ID: 8b2e4d9c1a35
+Revises: 3c1f6a8e2d47
+Create Date: 2025-03-27 09:31:08.524190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b2e4d9c1a35"
+down_revision: Union[str, None] = "3c1f6a8e2d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The DAO creates missing tables on startup, so the table may already exist.
+    if sa.inspect(op.get_bind()).has_table("workflow_run_metrics"):
+        return
+    op.create_table(
+        "workflow_run_metrics",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("trace_id", sa.String(), nullable=False),
+        sa.Column("workflow_id", sa.String(), nullable=True),
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("started_at", sa.Float(), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=True),
+        sa.Column("call_count", sa.Integer(), nullable=False),
+        sa.Column("error_count", sa.Integer(), nullable=False),
+        sa.Column("prompt_tokens", sa.Integer(), nullable=True),
+        sa.Column("completion_tokens", sa.Integer(), nullable=True),
+        sa.Column("total_tokens", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_workflow_run_metrics_workflow_id"), "workflow_run_metrics", ["workflow_id"], unique=False)
+    op.create_index(op.f("ix_workflow_run_metrics_started_at"), "workflow_run_metrics", ["started_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_workflow_run_metrics_started_at"), table_name="workflow_run_metrics")
+    op.drop_index(op.f("ix_workflow_run_metrics_workflow_id"), table_name="workflow_run_metrics")
+    op.drop_table("workflow_run_metrics")
@@ -0,0 +1,33 @@
+"""add created_at to workflow traces
+
+Revision ID: 5d7a2c9e4f18
+Revises: 8b2e4d9c1a35
+Create Date: 2025-04-03 14:20:16.907312
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d7a2c9e4f18"
+down_revision: Union[str, None] = "8b2e4d9c1a35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The DAO creates missing tables on startup, so the column may already exist.
+    columns = {column["name"] for column in sa.inspect(op.get_bind()).get_columns("workflow_traces")}
+    if "created_at" in columns:
+        return
+    with op.batch_alter_table("workflow_traces") as batch_op:
+        batch_op.add_column(sa.Column("created_at", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("workflow_traces") as batch_op:
+        batch_op.drop_column("created_at")
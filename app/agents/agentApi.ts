@@ -20,15 +20,15 @@ import {
   UpdateAgentTemplateRequest,
 } from '@/studio/proto/agent_studio';
 
-import { apiSlice } from '../api/apiSlice';
+import { apiSlice, withListRequestDefaults } from '../api/apiSlice';
 
 export const agentsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
-    listAgents: builder.query<AgentMetadata[], ListAgentsRequest>({
+    listAgents: builder.query<AgentMetadata[], Partial<ListAgentsRequest>>({
       query: (request) => ({
         url: '/grpc/listAgents',
         method: 'POST',
-        body: request,
+        body: withListRequestDefaults(request),
       }),
       transformResponse: (response: ListAgentsResponse) => {
         return response.agents;
@@ -22,3 +22,16 @@ export const apiSlice = createApi({
   tagTypes: TagTypes.slice(),
   endpoints: () => ({}),
 });
+
+/**
+ * Fill in the paging fields of a list request. The generated proto encoders expect
+ * every field of a message to be set, so list queries take a partial request and
+ * default its unset fields: no page size (every item), no page token and no read
+ * mask (every field).
+ */
+export const withListRequestDefaults = <T extends object>(request: T) => ({
+  page_size: 0,
+  page_token: '',
+  read_mask: [] as string[],
+  ...request,
+});
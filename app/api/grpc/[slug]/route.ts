@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { AgentStudioClient } from '@/studio/proto/agent_studio';
+import { AgentStudioClient, WorkflowRunEvent } from '@/studio/proto/agent_studio';
 import { credentials } from '@grpc/grpc-js';
+import { getGrpcClientOptions } from '@/app/lib/grpcClientOptions';
 
 function queryToJson(query: URLSearchParams): Record<string, string> {
   const json: Record<string, string> = {};
@@ -20,7 +21,7 @@ export async function POST(request: NextRequest) {
 
 async function handleRequest(request: NextRequest, method: string): Promise<NextResponse> {
   const addr = `${process.env.AGENT_STUDIO_SERVICE_IP}:${process.env.AGENT_STUDIO_SERVICE_PORT}`;
-  const client = new AgentStudioClient(addr, credentials.createInsecure());
+  const client = new AgentStudioClient(addr, credentials.createInsecure(), getGrpcClientOptions());
 
   const slug = request.nextUrl.pathname.split('/api/grpc/')[1];
 
@@ -95,6 +96,52 @@ async function handleRequest(request: NextRequest, method: string): Promise<Next
       });
     }
 
+    /*
+      -- Special handling for workflow event streams --
+      Events of a workflow test run are streamed from the studio as they happen. We
+      relay them to the browser as server-sent events, in the same shape as the
+      events returned from the ops server.
+    */
+    if (slug === 'streamWorkflowEvents') {
+      const stream = client.streamWorkflowEvents({ trace_id: body.trace_id });
+      const encoder = new TextEncoder();
+
+      const readableStream = new ReadableStream({
+        start(controller) {
+          stream.on('data', (event: WorkflowRunEvent) => {
+            const data = {
+              id: event.id,
+              name: event.name,
+              startTime: event.start_time,
+              attributes: JSON.parse(event.attributes || '{}'),
+              events: JSON.parse(event.events || '[]'),
+            };
+            controller.enqueue(encoder.encode(`data: ${JSON.stringify(data)}\n\n`));
+          });
+
+          stream.on('end', () => {
+            controller.close();
+          });
+
+          stream.on('error', (err) => {
+            console.error('gRPC stream error:', err);
+            controller.error(err);
+          });
+        },
+        cancel() {
+          // The browser closed the event source
+          stream.cancel();
+        },
+      });
+
+      return new NextResponse(readableStream, {
+        headers: {
+          'Content-Type': 'text/event-stream',
+          'Cache-Control': 'no-cache',
+        },
+      });
+    }
+
     const grpcMethod = (client as any)[slug].bind(client);
 
     const grpcResponse = await new Promise((resolve, reject) => {
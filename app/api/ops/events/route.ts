@@ -1,6 +1,9 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { GraphQLClient } from 'graphql-request';
-import { fetchOpsUrl, getCrewEvents } from '@/app/lib/ops';
+import { fetchOpsUrl, getCrewEvents, ProjectAndTraceInfo } from '@/app/lib/ops';
+import { AgentStudioClient, ResolveWorkflowTraceResponse } from '@/studio/proto/agent_studio';
+import { credentials } from '@grpc/grpc-js';
+import { getGrpcClientOptions } from '@/app/lib/grpcClientOptions';
 import fetch from 'node-fetch';
 import fs from 'fs';
 import https from 'https';
@@ -34,8 +37,40 @@ const getGraphQLClient = async () => {
   }
 };
 
+/**
+ * Resolve the project and global trace ID of a run through the studio's trace
+ * index. Returns null if the trace has not been reported to the ops server yet,
+ * and undefined if the studio is unavailable (e.g. in a deployed workflow app).
+ */
+const resolveWorkflowTrace = async (
+  traceId: string,
+): Promise<ProjectAndTraceInfo | null | undefined> => {
+  if (!process.env.AGENT_STUDIO_SERVICE_IP || !process.env.AGENT_STUDIO_SERVICE_PORT) {
+    return undefined;
+  }
+  const addr = `${process.env.AGENT_STUDIO_SERVICE_IP}:${process.env.AGENT_STUDIO_SERVICE_PORT}`;
+  const client = new AgentStudioClient(addr, credentials.createInsecure(), getGrpcClientOptions());
+  try {
+    const response = await new Promise<ResolveWorkflowTraceResponse>((resolve, reject) => {
+      client.resolveWorkflowTrace({ trace_id: traceId }, (err, res) =>
+        err ? reject(err) : resolve(res),
+      );
+    });
+    if (!response.global_trace_id) {
+      return null;
+    }
+    return { projectId: response.project_id, globalTraceId: response.global_trace_id };
+  } catch (error: any) {
+    console.error('Could not resolve workflow trace through the studio:', error.message);
+    return undefined;
+  } finally {
+    client.close();
+  }
+};
+
 export async function GET(request: NextRequest) {
   const traceId = request.nextUrl.searchParams.get('traceId');
+  const since = request.nextUrl.searchParams.get('since') ?? undefined;
 
   if (!traceId) {
     return NextResponse.json({
@@ -43,13 +78,21 @@ export async function GET(request: NextRequest) {
     });
   }
 
+  const traceInfo = await resolveWorkflowTrace(traceId);
+  if (traceInfo === null) {
+    return NextResponse.json({
+      events: [],
+      cursor: since,
+    });
+  }
+
   const client = await getGraphQLClient();
 
-  const { projectId, events } = await getCrewEvents(client, traceId);
-  // console.log(sortedEvents);
+  const { projectId, events, cursor } = await getCrewEvents(client, traceId, traceInfo, since);
 
   return NextResponse.json({
     projectId: projectId,
     events: events,
+    cursor: cursor,
   });
 }
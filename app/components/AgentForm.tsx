@@ -21,7 +21,10 @@ import {
   useGetAgentTemplateQuery,
   useUpdateAgentTemplateMutation,
 } from '@/app/agents/agentApi';
-import { useListGlobalToolTemplatesQuery } from '@/app/tools/toolTemplatesApi';
+import {
+  TOOL_TEMPLATE_LIST_FIELDS,
+  useListGlobalToolTemplatesQuery,
+} from '@/app/tools/toolTemplatesApi';
 import CommonBreadCrumb from './CommonBreadCrumb';
 import AddToolModal from './AddToolModal';
 import { useGlobalNotification } from '../components/Notifications';
@@ -47,7 +50,9 @@ const AgentTemplateForm = ({ agentTemplateId }: { agentTemplateId?: string }) =>
   const notificationApi = useGlobalNotification();
   const [isAddToolModalVisible, setAddToolModalVisible] = useState(false);
 
-  const { data: toolTemplates = [] } = useListGlobalToolTemplatesQuery({});
+  const { data: toolTemplates = [] } = useListGlobalToolTemplatesQuery({
+    read_mask: TOOL_TEMPLATE_LIST_FIELDS,
+  });
   const [addAgentTemplate] = useAddAgentTemplateMutation();
   const [updateAgentTemplate] = useUpdateAgentTemplateMutation();
 
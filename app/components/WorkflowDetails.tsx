@@ -32,7 +32,7 @@ import {
 import { useListAgentsQuery } from '../agents/agentApi';
 import { useListTasksQuery } from '../tasks/tasksApi';
 import { useImageAssetsData } from '@/app/lib/hooks/useAssetData';
-import { useListToolInstancesQuery } from '../tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '../tools/toolInstancesApi';
 import { useAppSelector } from '../lib/hooks/hooks';
 import {
   selectEditorWorkflowManagerAgentId,
@@ -67,7 +67,9 @@ const WorkflowDetails: React.FC<WorkflowDetailsProps> = ({
     data: toolInstances = [],
     isLoading: toolInstancesLoading,
     error: toolInstancesError,
-  } = useListToolInstancesQuery({});
+  } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
 
   const { data: tasks = [], isLoading: tasksLoading, error: tasksError } = useListTasksQuery({});
 
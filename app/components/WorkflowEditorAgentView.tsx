@@ -1,7 +1,7 @@
 import { useListAgentsQuery } from '../agents/agentApi';
 import { useAppSelector } from '../lib/hooks/hooks';
 import { useListTasksQuery } from '../tasks/tasksApi';
-import { useListToolInstancesQuery } from '../tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '../tools/toolInstancesApi';
 import { selectEditorWorkflow } from '../workflows/editorSlice';
 import WorkflowEditorAgentInputs from './WorkflowEditorAgentInputs';
 import { Divider, Layout } from 'antd';
@@ -11,7 +11,9 @@ interface WorkflowEditorAgentViewProps {}
 
 const WorkflowEditorAgentView: React.FC<WorkflowEditorAgentViewProps> = ({}) => {
   const workflowState = useAppSelector(selectEditorWorkflow);
-  const { data: toolInstances } = useListToolInstancesQuery({});
+  const { data: toolInstances } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
   const { data: tasks } = useListTasksQuery({});
   const { data: agents } = useListAgentsQuery({});
 
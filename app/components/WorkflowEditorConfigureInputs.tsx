@@ -12,7 +12,7 @@ import {
   Slider,
   InputNumber,
 } from 'antd';
-import { useListToolInstancesQuery } from '../tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '../tools/toolInstancesApi';
 import { ToolInstance } from '@/studio/proto/agent_studio';
 import { useListAgentsQuery } from '../agents/agentApi';
 import { useAppDispatch, useAppSelector } from '../lib/hooks/hooks';
@@ -211,7 +211,9 @@ const ToolConfigurationComponent: React.FC<ToolConfigurationComponentProps> = ({
 const WorkflowEditorConfigureInputs: React.FC = () => {
   const { data: agents } = useListAgentsQuery({});
   const workflowId = useAppSelector(selectEditorWorkflowId);
-  const { data: toolInstances } = useListToolInstancesQuery({});
+  const { data: toolInstances } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
   const workflowConfiguration = useAppSelector(selectWorkflowConfiguration);
   const workflowGenerationConfig = useAppSelector(selectWorkflowGenerationConfig);
   const dispatch = useAppDispatch();
@@ -2,7 +2,7 @@ import WorkflowEditorTaskInputs from './WorkflowEditorTaskInputs';
 import { Divider, Layout } from 'antd';
 import { useAppSelector } from '../lib/hooks/hooks';
 import { selectEditorWorkflow } from '../workflows/editorSlice';
-import { useListToolInstancesQuery } from '../tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '../tools/toolInstancesApi';
 import { useListTasksQuery } from '../tasks/tasksApi';
 import { useListAgentsQuery } from '../agents/agentApi';
 import WorkflowDiagramView from './workflow/WorkflowDiagramView';
@@ -11,7 +11,9 @@ interface WorkflowEditorTaskViewProps {}
 
 const WorkflowEditorTaskView: React.FC<WorkflowEditorTaskViewProps> = ({}) => {
   const workflowState = useAppSelector(selectEditorWorkflow);
-  const { data: toolInstances } = useListToolInstancesQuery({});
+  const { data: toolInstances } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
   const { data: tasks } = useListTasksQuery({});
   const { data: agents } = useListAgentsQuery({});
 
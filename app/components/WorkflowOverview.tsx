@@ -13,7 +13,7 @@ import { updatedEditorWorkflowFromExisting } from '../workflows/editorSlice';
 import { DeployedWorkflow } from '@/studio/proto/agent_studio';
 import { useGlobalNotification } from '../components/Notifications';
 import ErrorBoundary from './ErrorBoundary';
-import { useListToolInstancesQuery } from '../tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '../tools/toolInstancesApi';
 import { useListTasksQuery } from '../tasks/tasksApi';
 import { useListAgentsQuery } from '../agents/agentApi';
 import WorkflowDiagramView from './workflow/WorkflowDiagramView';
@@ -31,7 +31,9 @@ const WorkflowOverview: React.FC<WorkflowOverviewProps> = ({ workflowId }) => {
   const { data: deployedWorkflows = [] } = useListDeployedWorkflowsQuery({});
   const [undeployWorkflow] = useUndeployWorkflowMutation();
   const notificationsApi = useGlobalNotification();
-  const { data: toolInstances } = useListToolInstancesQuery({});
+  const { data: toolInstances } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
   const { data: tasks } = useListTasksQuery({});
   const { data: agents } = useListAgentsQuery({});
 
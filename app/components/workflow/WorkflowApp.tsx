@@ -133,6 +133,7 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
   const isRunning = useAppSelector(selectWorkflowIsRunning);
   const currentTraceId = useAppSelector(selectWorkflowCurrentTraceId);
   const intervalRef = useRef<NodeJS.Timeout | null>(null);
+  const eventSourceRef = useRef<EventSource | null>(null);
   const workflowPollingRef = useRef<NodeJS.Timeout | null>(null);
   const dispatch = useAppDispatch();
   const currentEvents = useAppSelector(selectCurrentEvents);
@@ -159,6 +160,10 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
   // Track processed exception IDs
   const processedExceptionsRef = useRef<Set<string>>(new Set());
 
+  // Events received so far for the current run, and the cursor to poll for newer events
+  const eventsRef = useRef<any[]>([]);
+  const eventsCursorRef = useRef<string | undefined>(undefined);
+
   // Add effect to update showMonitoring when renderMode changes
   useEffect(() => {
     setShowMonitoring(renderMode === 'studio');
@@ -305,80 +310,101 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
       return;
     }
 
-    // Set the interval function
-    const fetchEvents = async () => {
-      try {
-        const { projectId, events: allEvents } = await getEvents({
-          traceId: currentTraceId,
-        }).unwrap();
-        dispatch(updatedCurrentEvents(allEvents));
-        dispatch(updatedCurrentEventIndex(allEvents.length - 1));
-        dispatch(updatedCurrentPhoenixProjectId(projectId)); // TODO: there's a more graceful place for this
-
-        if (allEvents && allEvents.length > 0) {
-          // Find completion events and check for exceptions
-          const completionEvent = allEvents.find((event: WorkflowEventWithErrors) => {
-            if (event.name === 'completion') {
-              const hasException = event.events?.some((e: EventError) => e.name === 'exception');
-              return hasException && !processedExceptionsRef.current.has(event.id);
-            }
-            return false;
-          });
-
-          if (completionEvent) {
-            const exceptionEvent = completionEvent.events?.find(
-              (e: EventError) => e.name === 'exception',
-            );
-            if (exceptionEvent && isRunning) {
-              processedExceptionsRef.current.add(completionEvent.id);
-              stopPolling();
-              dispatch(updatedIsRunning(false));
-              const errorMessage = `Error: ${exceptionEvent.message}`;
-
-              if (workflow?.is_conversational) {
-                dispatch(addedChatMessage({ role: 'assistant', content: errorMessage }));
-              } else {
-                dispatch(updatedCrewOutput(errorMessage));
-              }
-              return;
-            }
+    // Merge newly received events into the events received so far, and stop
+    // receiving events once the run has completed or failed.
+    const handleEvents = (newEvents: any[]) => {
+      const knownEventIds = new Set(eventsRef.current.map((event) => event.id));
+      const allEvents = [
+        ...eventsRef.current,
+        ...newEvents.filter((event: any) => !knownEventIds.has(event.id)),
+      ].sort(
+        (a: any, b: any) => new Date(a.startTime).getTime() - new Date(b.startTime).getTime(),
+      );
+      eventsRef.current = allEvents;
+      dispatch(updatedCurrentEvents(allEvents));
+      dispatch(updatedCurrentEventIndex(allEvents.length - 1));
+
+      if (allEvents && allEvents.length > 0) {
+        // Find completion events and check for exceptions
+        const completionEvent = allEvents.find((event: WorkflowEventWithErrors) => {
+          if (event.name === 'completion' || event.name === 'Crew.error') {
+            const hasException = event.events?.some((e: EventError) => e.name === 'exception');
+            return hasException && !processedExceptionsRef.current.has(event.id);
           }
+          return false;
+        });
 
-          // Check for successful completion as before
-          const crewCompleteEvent = allEvents.find(
-            (event: WorkflowEvent) => event.name === 'Crew.complete',
+        if (completionEvent) {
+          const exceptionEvent = completionEvent.events?.find(
+            (e: EventError) => e.name === 'exception',
           );
-          if (crewCompleteEvent) {
-            stopPolling();
-            dispatch(updatedCrewOutput(crewCompleteEvent.attributes.crew_output));
+          if (exceptionEvent && isRunning) {
+            processedExceptionsRef.current.add(completionEvent.id);
+            stopUpdates();
             dispatch(updatedIsRunning(false));
+            const errorMessage = `Error: ${exceptionEvent.message}`;
 
             if (workflow?.is_conversational) {
-              dispatch(
-                addedChatMessage({
-                  id: crewCompleteEvent.id,
-                  role: 'assistant',
-                  content: crewCompleteEvent.attributes.crew_output,
-                }),
-              );
+              dispatch(addedChatMessage({ role: 'assistant', content: errorMessage }));
+            } else {
+              dispatch(updatedCrewOutput(errorMessage));
             }
             return;
           }
         }
+
+        // Check for successful completion as before
+        const crewCompleteEvent = allEvents.find(
+          (event: WorkflowEvent) => event.name === 'Crew.complete',
+        );
+        if (crewCompleteEvent) {
+          stopUpdates();
+          dispatch(updatedCrewOutput(crewCompleteEvent.attributes.crew_output));
+          dispatch(updatedIsRunning(false));
+
+          if (workflow?.is_conversational) {
+            dispatch(
+              addedChatMessage({
+                id: crewCompleteEvent.id,
+                role: 'assistant',
+                content: crewCompleteEvent.attributes.crew_output,
+              }),
+            );
+          }
+          return;
+        }
+      }
+    };
+
+    // Set the interval function
+    const fetchEvents = async () => {
+      try {
+        const { projectId, events: newEvents, cursor } = await getEvents({
+          traceId: currentTraceId,
+          since: eventsCursorRef.current,
+        }).unwrap();
+        eventsCursorRef.current = cursor;
+        dispatch(updatedCurrentPhoenixProjectId(projectId)); // TODO: there's a more graceful place for this
+        handleEvents(newEvents);
       } catch (error) {
         console.error('Error polling for events: ', error);
       }
     };
 
-    const startPolling = () => {
-      if (intervalRef.current) return; // Prevent duplicate polling
-      intervalRef.current = setInterval(fetchEvents, 1000);
+    const resetEvents = () => {
+      eventsRef.current = [];
+      eventsCursorRef.current = undefined;
       setSliderValue(0);
       dispatch(updatedCrewOutput(undefined));
       dispatch(updatedCurrentEvents([]));
       dispatch(updatedCurrentEventIndex(0));
     };
 
+    const startPolling = () => {
+      if (intervalRef.current) return; // Prevent duplicate polling
+      intervalRef.current = setInterval(fetchEvents, 1000);
+    };
+
     const stopPolling = () => {
       if (intervalRef.current) {
         clearInterval(intervalRef.current);
@@ -386,11 +412,57 @@ const WorkflowApp: React.FC<WorkflowAppProps> = ({
       }
     };
 
-    startPolling();
-    return () => {
-      // Only stop polling when component unmounts
+    // Test runs in the studio stream their events straight from the studio's event
+    // bus, rather than waiting for them to be exported to and queried from the ops
+    // server. The ops server is still polled if the stream is unavailable.
+    const startStreaming = () => {
+      if (eventSourceRef.current) return;
+      const eventSource = new EventSource(
+        `/api/grpc/streamWorkflowEvents?trace_id=${encodeURIComponent(currentTraceId)}`,
+      );
+      eventSource.onmessage = (message) => handleEvents([JSON.parse(message.data)]);
+      // EventSource also reports an error when the studio ends the stream, e.g. once
+      // the run is over or the stream times out.
+      eventSource.onerror = () => {
+        stopStreaming();
+        // Streamed events carry event bus IDs, while polled events carry the span IDs
+        // of the ops server, so merging them would show every event twice. Polling
+        // starts over with every event of the run instead.
+        eventsRef.current = [];
+        eventsCursorRef.current = undefined;
+        startPolling();
+      };
+      eventSourceRef.current = eventSource;
+    };
+
+    const stopStreaming = () => {
+      if (eventSourceRef.current) {
+        eventSourceRef.current.close();
+        eventSourceRef.current = null;
+        // The streamed events don't carry the ops project of the run, so look it
+        // up once for the monitoring view.
+        getEvents({ traceId: currentTraceId })
+          .unwrap()
+          .then(({ projectId }) => projectId && dispatch(updatedCurrentPhoenixProjectId(projectId)))
+          .catch(() => {});
+      }
+    };
+
+    const stopUpdates = () => {
+      stopStreaming();
       stopPolling();
     };
+
+    resetEvents();
+    if (renderMode === 'studio') {
+      startStreaming();
+    } else {
+      startPolling();
+    }
+    return () => {
+      // Only stop receiving events when component unmounts
+      stopUpdates();
+    };
   }, [isRunning, currentTraceId]);
 
   // Poll the workflow for changes every 2 seconds till it's ready
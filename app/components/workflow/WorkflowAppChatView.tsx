@@ -52,6 +52,11 @@ const WorkflowAppChatView: React.FC<WorkflowAppChatViewProps> = ({ workflow, tas
   const workflowModelUrl = workflowData?.workflowModelUrl;
 
   const messagesEndRef = useRef<HTMLDivElement | null>(null);
+
+  // Deployed workflows keep the conversation history of a session themselves. The
+  // history is still sent as context on every kickoff, as a session's history only
+  // lives in the memory of one model replica and is lost on restarts.
+  const sessionIdRef = useRef<string>(crypto.randomUUID());
   const messages = useAppSelector(selectWorkflowAppChatMessages);
 
   const scrollToBottom = () => {
@@ -105,13 +110,6 @@ const WorkflowAppChatView: React.FC<WorkflowAppChatViewProps> = ({ workflow, tas
       }).unwrap();
       traceId = response.trace_id;
     } else {
-      console.log({
-        action_type: 'kickoff',
-        kickoff_inputs: {
-          user_input: userInput || '',
-          context: JSON.stringify(context),
-        },
-      });
       const kickoffResponse = await fetch(`${workflowModelUrl}`, {
         method: 'POST',
         headers: {
@@ -124,6 +122,7 @@ const WorkflowAppChatView: React.FC<WorkflowAppChatViewProps> = ({ workflow, tas
               user_input: userInput || '',
               context: JSON.stringify(context),
             }),
+            session_id: sessionIdRef.current,
           },
         }),
       });
@@ -145,6 +144,7 @@ const WorkflowAppChatView: React.FC<WorkflowAppChatViewProps> = ({ workflow, tas
   };
 
   const handleClearMessages = () => {
+    sessionIdRef.current = crypto.randomUUID();
     dispatch(clearedChatMessages());
   };
 
@@ -0,0 +1,36 @@
+import { ChannelOptions } from '@grpc/grpc-js';
+
+// Defaults of studio/cross_cutting/grpc_options.py, which configures the server.
+const DEFAULT_MAX_MESSAGE_LENGTH = 64 * 1024 * 1024;
+const DEFAULT_KEEPALIVE_TIME_MS = 30000;
+const DEFAULT_KEEPALIVE_TIMEOUT_MS = 10000;
+
+const getIntEnv = (name: string, defaultValue: number): number => {
+  const value = parseInt(process.env[name] || '', 10);
+  return Number.isNaN(value) || value <= 0 ? defaultValue : value;
+};
+
+/**
+ * Channel options of clients of the studio's gRPC server, matching the message
+ * size limits and keepalive of the server (see studio/cross_cutting/grpc_options.py).
+ * Compressed responses are decompressed by grpc-js without further options.
+ */
+export const getGrpcClientOptions = (): ChannelOptions => {
+  const maxMessageLength = getIntEnv(
+    'AGENT_STUDIO_GRPC_MAX_MESSAGE_LENGTH',
+    DEFAULT_MAX_MESSAGE_LENGTH,
+  );
+  return {
+    'grpc.max_send_message_length': maxMessageLength,
+    'grpc.max_receive_message_length': maxMessageLength,
+    'grpc.keepalive_time_ms': getIntEnv(
+      'AGENT_STUDIO_GRPC_KEEPALIVE_TIME_MS',
+      DEFAULT_KEEPALIVE_TIME_MS,
+    ),
+    'grpc.keepalive_timeout_ms': getIntEnv(
+      'AGENT_STUDIO_GRPC_KEEPALIVE_TIMEOUT_MS',
+      DEFAULT_KEEPALIVE_TIMEOUT_MS,
+    ),
+    'grpc.keepalive_permit_without_calls': 1,
+  };
+};
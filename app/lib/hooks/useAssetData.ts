@@ -3,6 +3,20 @@ import { useGetAssetDataQuery } from '../crossCuttingApi';
 import { useAppSelector } from './hooks';
 import { useGetWorkflowDataQuery } from '@/app/workflows/workflowAppApi';
 
+/**
+ * Assets fetched from a deployed workflow model, shared across all hook instances so
+ * that identical icons are only downloaded once. The ETag of each asset is sent back to
+ * the workflow model on later requests so unchanged assets are not re-sent.
+ */
+const workflowAssetCache: { [key: string]: { etag: string; dataUrl: string } } = {};
+
+const getImageType = (uri: string) =>
+  uri.toLowerCase().endsWith('.png')
+    ? 'png'
+    : uri.toLowerCase().endsWith('.jpg') || uri.toLowerCase().endsWith('.jpeg')
+      ? 'jpeg'
+      : 'png';
+
 export const useImageAssetsData = (uris: (string | undefined)[]) => {
   const [imageData, setImageData] = useState<{ [key: string]: string }>({});
   const [workflowRenderModeError, setWorkflowRenderModeError] = useState(false);
@@ -26,6 +40,21 @@ export const useImageAssetsData = (uris: (string | undefined)[]) => {
         return;
       }
 
+      // Serve whatever we can from the shared cache. If anything still needs to be
+      // fetched, cached assets are revalidated in the same request by sending their
+      // ETags, so the workflow model only returns assets that actually changed.
+      const cachedImageData = Object.fromEntries(
+        urisToActuallyFetch
+          .filter((uri) => workflowAssetCache[uri])
+          .map((uri) => [uri, workflowAssetCache[uri].dataUrl]),
+      );
+      if (Object.keys(cachedImageData).length > 0) {
+        setImageData((prevData) => ({ ...prevData, ...cachedImageData }));
+      }
+      if (urisToActuallyFetch.every((uri) => workflowAssetCache[uri])) {
+        return;
+      }
+
       try {
         setWorkflowRenderModeError(false);
         const response = await fetch(workflowModelUrl, {
@@ -37,24 +66,30 @@ export const useImageAssetsData = (uris: (string | undefined)[]) => {
             request: {
               action_type: 'get-asset-data',
               get_asset_data_inputs: urisToActuallyFetch,
+              get_asset_data_etags: Object.fromEntries(
+                urisToActuallyFetch
+                  .filter((uri) => workflowAssetCache[uri])
+                  .map((uri) => [uri, workflowAssetCache[uri].etag]),
+              ),
             },
           }),
         });
         const responseData = (await response.json()) as any;
         const asset_data = responseData.response?.asset_data;
+        const asset_etags = responseData.response?.asset_etags || {};
         if (asset_data) {
+          const newImageData = Object.fromEntries(
+            Object.entries(asset_data).map(([uri, data]) => [
+              uri,
+              `data:image/${getImageType(uri)};base64,${data}`,
+            ]),
+          );
+          Object.entries(newImageData).forEach(([uri, dataUrl]) => {
+            workflowAssetCache[uri] = { etag: asset_etags[uri] || '', dataUrl: dataUrl as string };
+          });
           setImageData((prevData) => ({
             ...prevData,
-            ...Object.fromEntries(
-              Object.entries(asset_data).map(([uri, data]) => {
-                const imageType = uri.toLowerCase().endsWith('.png')
-                  ? 'png'
-                  : uri.toLowerCase().endsWith('.jpg') || uri.toLowerCase().endsWith('.jpeg')
-                    ? 'jpeg'
-                    : 'png';
-                return [uri, `data:image/${imageType};base64,${data}`];
-              }),
-            ),
+            ...newImageData,
           }));
         }
       } catch (error) {
@@ -84,13 +119,8 @@ export const useImageAssetsData = (uris: (string | undefined)[]) => {
     if (renderMode === 'studio' && assetData?.asset_data) {
       const newImageData: { [key: string]: string } = {};
       Object.entries(assetData.asset_data).forEach(([uri, data]) => {
-        const imageType = uri.toLowerCase().endsWith('.png')
-          ? 'png'
-          : uri.toLowerCase().endsWith('.jpg') || uri.toLowerCase().endsWith('.jpeg')
-            ? 'jpeg'
-            : 'png';
         newImageData[uri] =
-          `data:image/${imageType};base64,${Buffer.from(data).toString('base64')}`;
+          `data:image/${getImageType(uri)};base64,${Buffer.from(data).toString('base64')}`;
       });
       setImageData(newImageData);
     }
@@ -55,15 +55,104 @@ const eventTypes = [
   'Crew.complete',
 ];
 
+export interface ProjectAndTraceInfo {
+  projectId: string;
+  globalTraceId: string;
+}
+
+/**
+ * Parsed events of recent traces, keyed by global trace ID. Events are kept in
+ * the order they were first seen, which is the order in which incremental polls
+ * receive them. Spans are exported to the ops server once they end, so a span
+ * may be seen after spans that started later than it did.
+ */
+const MAX_CACHED_TRACES = 256;
+const crewEventCache = new Map<string, Map<string, any>>();
+
+const sortByStartTime = (events: any[]) => {
+  // Sort the data by startTime in ascending order
+  return [...events].sort((a: any, b: any) => {
+    const dateA = new Date(a.startTime);
+    const dateB = new Date(b.startTime);
+    return dateA.getTime() - dateB.getTime(); // Compare timestamps
+  });
+};
+
+const addCachedEvents = (globalTraceId: string, events: any[]) => {
+  const cachedEvents = crewEventCache.get(globalTraceId) ?? new Map<string, any>();
+  // Re-insert the trace to mark it as most recently used
+  crewEventCache.delete(globalTraceId);
+  crewEventCache.set(globalTraceId, cachedEvents);
+  sortByStartTime(events).forEach((event) => {
+    if (!cachedEvents.has(event.id)) {
+      cachedEvents.set(event.id, event);
+    }
+  });
+  while (crewEventCache.size > MAX_CACHED_TRACES) {
+    crewEventCache.delete(crewEventCache.keys().next().value!);
+  }
+};
+
+/**
+ * Fetch the full details (including the attributes JSON) of a set of spans in
+ * a single query, aliasing one node lookup per span.
+ */
+const getSpanEvents = async (client: GraphQLClient, spanIds: string[]) => {
+  const spanQueries = spanIds
+    .map(
+      (spanId, index) => `
+  span${index}: node(id: "${spanId}") {
+    ... on Span {
+      id
+      name
+      startTime
+      cumulativeTokenCountTotal
+      cumulativeTokenCountPrompt
+      cumulativeTokenCountCompletion
+      endTime
+      attributes
+      events {
+        message
+        name
+        timestamp
+      }
+    }
+  }`,
+    )
+    .join('');
+  const data: any = await client.request(`query GetCrewEventSpans {${spanQueries}\n}`);
+  return Object.values(data)
+    .filter((span: any) => span)
+    .map((span: any) => ({
+      ...span,
+      attributes: JSON.parse(span.attributes),
+      events: span.events || [],
+    }));
+};
+
 /**
  * Get all crew events given a specific crew Trace. It's assumed that the
  * traceId is the "local" trace ID that was passed from the crew kickoff call.
+ * If the project and global trace ID were already resolved (for example through
+ * the studio's trace index), they are used instead of searching every project.
+ *
+ * Parsed events are cached per trace, and only spans that have not been seen
+ * before are fetched with their attributes. Without a "since" cursor, every
+ * event of the trace is returned sorted by start time. With a cursor (the
+ * "cursor" returned from a previous call), only the events seen after that call
+ * are returned, and the caller merges them into the events it already has.
  */
-export const getCrewEvents = async (client: GraphQLClient, traceId: string) => {
+export const getCrewEvents = async (
+  client: GraphQLClient,
+  traceId: string,
+  traceInfo?: ProjectAndTraceInfo,
+  since?: string,
+) => {
   // Get the global trace ID
-  const { projectId, globalTraceId } = await getProjectAndTraceInfo(client, traceId);
+  const { projectId, globalTraceId } = traceInfo ?? (await getProjectAndTraceInfo(client, traceId));
 
-  // Query the global trace ID
+  // List the descendant spans without their attributes; the attributes are only
+  // fetched for spans that are not cached yet.
   const query = `
 query MyQuery {
   node(id: "${globalTraceId}") {
@@ -75,17 +164,6 @@ query MyQuery {
             node {
               id
               name
-              startTime
-              cumulativeTokenCountTotal
-              cumulativeTokenCountPrompt
-              cumulativeTokenCountCompletion
-              endTime
-              attributes
-              events {
-                message
-                name
-                timestamp
-              }
             }
           }
         }
@@ -95,29 +173,28 @@ query MyQuery {
 }
   `;
   const data: any = await client.request(query);
-  const events: any[] = [];
-
-  data.node.rootSpan.descendants.edges.map((edge: any) => {
-    if (eventTypes.includes(edge.node.name)) {
-      events.push({
-        ...edge.node,
-        attributes: JSON.parse(edge.node.attributes),
-        events: edge.node.events || [],
-      });
-    }
-    return;
-  });
+  const cachedEvents = crewEventCache.get(globalTraceId);
+  const newSpanIds: string[] = (data.node?.rootSpan?.descendants.edges ?? [])
+    .map((edge: any) => edge.node)
+    .filter((node: any) => eventTypes.includes(node.name) && !cachedEvents?.has(node.id))
+    .map((node: any) => node.id);
+  if (newSpanIds.length > 0) {
+    addCachedEvents(globalTraceId, await getSpanEvents(client, newSpanIds));
+  }
 
-  // Sort the data by startTime in ascending order
-  const sortedEvents = events.sort((a: any, b: any) => {
-    const dateA = new Date(a.startTime);
-    const dateB = new Date(b.startTime);
-    return dateA.getTime() - dateB.getTime(); // Compare timestamps
-  });
+  const allEvents = Array.from(crewEventCache.get(globalTraceId)?.values() ?? []);
+  const cursor = allEvents.length > 0 ? allEvents[allEvents.length - 1].id : since;
+  let events = sortByStartTime(allEvents);
+  if (since) {
+    // Unknown cursors (e.g. after the trace was evicted) return every event
+    const sinceIndex = allEvents.findIndex((event) => event.id === since);
+    events = sinceIndex >= 0 ? allEvents.slice(sinceIndex + 1) : allEvents;
+  }
 
   return {
     projectId: projectId,
-    events: sortedEvents,
+    events: events,
+    cursor: cursor,
   };
 };
 
@@ -14,11 +14,14 @@ export interface KickoffCrewRequest {
 
 export interface GetOpsEventsRequest {
   traceId: string;
+  // Cursor returned from a previous request; only newer events are returned
+  since?: string;
 }
 
 export interface GetOpsEventsResponse {
   projectId: string;
   events: any[];
+  cursor?: string;
 }
 
 export const opsApi = apiSlice.injectEndpoints({
@@ -28,7 +31,8 @@ export const opsApi = apiSlice.injectEndpoints({
     }),
     getEvents: builder.mutation<GetOpsEventsResponse, GetOpsEventsRequest>({
       query: (request) => ({
-        url: `/ops/events?traceId=${request.traceId}`,
+        url: '/ops/events',
+        params: { traceId: request.traceId, since: request.since },
         method: 'GET',
       }),
     }),
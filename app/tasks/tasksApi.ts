@@ -15,15 +15,15 @@ import {
   TaskTemplateMetadata,
 } from '@/studio/proto/agent_studio';
 
-import { apiSlice } from '../api/apiSlice';
+import { apiSlice, withListRequestDefaults } from '../api/apiSlice';
 
 export const tasksApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
-    listTasks: builder.query<CrewAITaskMetadata[], ListTasksRequest>({
+    listTasks: builder.query<CrewAITaskMetadata[], Partial<ListTasksRequest>>({
       query: (request) => ({
         url: '/grpc/listTasks',
         method: 'POST',
-        body: request,
+        body: withListRequestDefaults(request),
       }),
       transformResponse: (response: ListTasksResponse) => {
         return response.tasks;
@@ -6,6 +6,7 @@ import { Button, Typography, Input, Image } from 'antd';
 import { ArrowRightOutlined } from '@ant-design/icons';
 import ToolTemplateList from '../components/ToolTemplateList';
 import {
+  TOOL_TEMPLATE_LIST_FIELDS,
   useListGlobalToolTemplatesQuery,
   useRemoveToolTemplateMutation,
   useAddToolTemplateMutation,
@@ -18,7 +19,9 @@ import { useGlobalNotification } from '../components/Notifications'; // Assuming
 const { Text } = Typography;
 
 const ToolsPage = () => {
-  const { data: tools } = useListGlobalToolTemplatesQuery({});
+  const { data: tools } = useListGlobalToolTemplatesQuery({
+    read_mask: TOOL_TEMPLATE_LIST_FIELDS,
+  });
   const [removeToolTemplate] = useRemoveToolTemplateMutation();
   const [addToolTemplate] = useAddToolTemplateMutation();
 
@@ -12,16 +12,31 @@ import {
   UpdateToolInstanceResponse,
 } from '@/studio/proto/agent_studio';
 
-import { apiSlice } from '../api/apiSlice';
+import { apiSlice, withListRequestDefaults } from '../api/apiSlice';
+
+/**
+ * Fields of tool instances that workflow views show. The code and requirements of
+ * a tool are left out, as only the views of a single tool show them.
+ */
+export const TOOL_INSTANCE_LIST_FIELDS: (keyof ToolInstance)[] = [
+  'id',
+  'name',
+  'workflow_id',
+  'source_folder_path',
+  'tool_metadata',
+  'is_valid',
+  'tool_image_uri',
+  'tool_description',
+];
 
 export const toolInstancesApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
     // List Tool Instances
-    listToolInstances: builder.query<ToolInstance[], ListToolInstancesRequest>({
+    listToolInstances: builder.query<ToolInstance[], Partial<ListToolInstancesRequest>>({
       query: (request) => ({
         url: '/grpc/listToolInstances',
         method: 'POST',
-        body: request,
+        body: withListRequestDefaults(request),
       }),
       transformResponse: (response: ListToolInstancesResponse) => {
         return response.tool_instances;
@@ -11,16 +11,32 @@ import {
   ListToolTemplatesRequest,
 } from '@/studio/proto/agent_studio';
 
-import { apiSlice } from '../api/apiSlice';
+import { apiSlice, withListRequestDefaults } from '../api/apiSlice';
+
+/**
+ * Fields of tool templates that tool lists show. The code and requirements of a
+ * tool are left out, as only the views of a single tool show them.
+ */
+export const TOOL_TEMPLATE_LIST_FIELDS: (keyof ToolTemplate)[] = [
+  'id',
+  'name',
+  'source_folder_path',
+  'tool_metadata',
+  'is_valid',
+  'pre_built',
+  'tool_image_uri',
+  'tool_description',
+  'workflow_template_id',
+];
 
 export const toolsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
     // List Tool Templates
-    listGlobalToolTemplates: builder.query<ToolTemplate[], ListToolTemplatesRequest>({
+    listGlobalToolTemplates: builder.query<ToolTemplate[], Partial<ListToolTemplatesRequest>>({
       query: (request) => ({
         url: '/grpc/listToolTemplates',
         method: 'POST',
-        body: request,
+        body: withListRequestDefaults(request),
       }),
       transformResponse: (response: ListToolTemplatesResponse) => {
         return response.templates.filter((template) => !template.workflow_template_id);
@@ -80,7 +96,7 @@ export const toolsApi = apiSlice.injectEndpoints({
       query: () => ({
         url: '/grpc/listToolTemplates',
         method: 'POST',
-        body: { workflow_id: '' },
+        body: withListRequestDefaults({ read_mask: TOOL_TEMPLATE_LIST_FIELDS }),
       }),
       transformResponse: (response: ListToolTemplatesResponse) => {
         return response?.templates || [];
@@ -28,7 +28,7 @@ import WorkflowEditorTaskView from '@/app/components/WorkflowEditorTaskView';
 import WorkflowOverview from '@/app/components/WorkflowOverview';
 import CommonBreadCrumb from '@/app/components/CommonBreadCrumb';
 import WorkflowEditorConfigureView from '@/app/components/WorkflowEditorConfigureView';
-import { useListToolInstancesQuery } from '@/app/tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '@/app/tools/toolInstancesApi';
 import { useListTasksQuery } from '@/app/tasks/tasksApi';
 import { useListAgentsQuery } from '@/app/agents/agentApi';
 import { clearedWorkflowApp } from '../workflowAppSlice';
@@ -52,7 +52,9 @@ const CreateWorkflowContent: React.FC = () => {
   const [getWorkflow] = useGetWorkflowMutation();
   const router = useRouter();
   const { data: workflow, refetch: refetchWorkflow } = useGetWorkflowByIdQuery(workflowId);
-  const { data: toolInstances } = useListToolInstancesQuery({});
+  const { data: toolInstances } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
   const { data: tasks } = useListTasksQuery({});
   const { data: agents } = useListAgentsQuery({});
   const [isEditing, setIsEditing] = useState<boolean>(false);
@@ -5,7 +5,7 @@ import { useParams } from 'next/navigation';
 import CommonBreadCrumb from '@/app/components/CommonBreadCrumb';
 import { Layout } from 'antd';
 import { useGetWorkflowByIdQuery } from '../../workflowsApi';
-import { useListToolInstancesQuery } from '@/app/tools/toolInstancesApi';
+import { TOOL_INSTANCE_LIST_FIELDS, useListToolInstancesQuery } from '@/app/tools/toolInstancesApi';
 import { useListTasksQuery } from '@/app/tasks/tasksApi';
 import { useListAgentsQuery } from '@/app/agents/agentApi';
 import WorkflowApp from '@/app/components/workflow/WorkflowApp';
@@ -14,7 +14,9 @@ const TestWorkflowPage: React.FC = () => {
   const params = useParams();
   const workflowId = Array.isArray(params?.id) ? params.id[0] : params?.id;
   const { data: workflow, refetch: refetchWorkflow } = useGetWorkflowByIdQuery(workflowId);
-  const { data: toolInstances } = useListToolInstancesQuery({});
+  const { data: toolInstances } = useListToolInstancesQuery({
+    read_mask: TOOL_INSTANCE_LIST_FIELDS,
+  });
   const { data: tasks } = useListTasksQuery({});
   const { data: agents } = useListAgentsQuery({});
 
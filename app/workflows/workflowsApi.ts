@@ -26,15 +26,15 @@ import {
   ImportWorkflowTemplateResponse,
 } from '@/studio/proto/agent_studio';
 
-import { apiSlice } from '../api/apiSlice';
+import { apiSlice, withListRequestDefaults } from '../api/apiSlice';
 
 export const workflowsApi = apiSlice.injectEndpoints({
   endpoints: (builder) => ({
-    listWorkflows: builder.query<Workflow[], ListWorkflowsRequest>({
+    listWorkflows: builder.query<Workflow[], Partial<ListWorkflowsRequest>>({
       query: (request) => ({
         url: '/grpc/listWorkflows',
         method: 'POST',
-        body: request,
+        body: withListRequestDefaults(request),
       }),
       transformResponse: (response: ListWorkflowsResponse) => {
         return response.workflows;
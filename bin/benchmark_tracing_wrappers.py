@@ -0,0 +1,135 @@
+"""
+Benchmark the per-call overhead of the crewai tracing wrappers in
+studio/workflow_engine/src/engine/crewai/tracing.py.
+
+Spans are recorded by a tracer provider without any span processors, so the
+numbers cover the wrappers' own work (argument binding, attribute serialization,
+span bookkeeping) but not span export. Run from the root of the project:
+
+    uv run python bin/benchmark_tracing_wrappers.py [--iterations N]
+"""
+
+import sys
+
+sys.path.append("studio/workflow_engine/src")
+
+from types import SimpleNamespace
+import argparse
+import logging
+import timeit
+
+from opentelemetry.sdk.trace import TracerProvider
+
+import engine.crewai.tracing as tracing
+
+
+class FakeToolUsage:
+    function_calling_llm = None
+
+    def _use(self, tool_string, tool, calling):
+        return "tool output"
+
+
+class FakeCrew:
+    def __init__(self, agent_count: int, task_count: int, text_length: int):
+        text = "x" * text_length
+        tool = SimpleNamespace(name="Search Tool")
+        self.key = "crew-key"
+        self.id = "crew-id"
+        self.agents = [
+            SimpleNamespace(
+                key=f"agent-{i}",
+                id=f"agent-{i}",
+                role=f"Agent {i}",
+                goal=text,
+                backstory=text,
+                verbose=False,
+                max_iter=20,
+                max_rpm=None,
+                i18n=SimpleNamespace(prompt_file=None),
+                allow_delegation=False,
+                tools=[tool],
+            )
+            for i in range(agent_count)
+        ]
+        self.tasks = [
+            SimpleNamespace(
+                id=f"task-{i}",
+                description=text,
+                expected_output=text,
+                async_execution=False,
+                human_input=False,
+                agent=self.agents[i % agent_count],
+                context=None,
+                tools=[tool],
+            )
+            for i in range(task_count)
+        ]
+        self.usage_metrics = {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}
+
+    def kickoff(self, inputs=None):
+        return SimpleNamespace(raw="crew output", to_dict=lambda: {"output": "crew output"})
+
+
+def report(name: str, seconds: float, iterations: int) -> None:
+    print(f"{name:<48} {seconds / iterations * 1e6:>10.1f} us/call")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--text-length", type=int, default=2000, help="Length of agent and task texts.")
+    args = parser.parse_args()
+    iterations = args.iterations
+
+    # The wrappers end their spans early on purpose; silence the resulting warnings.
+    logging.getLogger("opentelemetry").setLevel(logging.ERROR)
+
+    tracer = TracerProvider().get_tracer("benchmark")
+    tool_usage = FakeToolUsage()
+    tool = SimpleNamespace(name="Search Tool")
+    calling = {"tool_name": "Search Tool", "arguments": {"query": "q" * args.text_length}}
+
+    report(
+        "_get_input_value (bound method)",
+        timeit.timeit(
+            lambda: tracing._get_input_value(tool_usage._use, "tool string", tool=tool, calling=calling),
+            number=iterations,
+        ),
+        iterations,
+    )
+
+    tool_use_wrapper = tracing._ToolUseWrapper(tracer)
+    report(
+        "_ToolUseWrapper",
+        timeit.timeit(
+            lambda: tool_use_wrapper(tool_usage._use, tool_usage, ("tool string",), {"tool": tool, "calling": calling}),
+            number=iterations,
+        ),
+        iterations,
+    )
+
+    kickoff_wrapper = tracing._KickoffWrapper(tracer)
+    crew = FakeCrew(agent_count=5, task_count=10, text_length=args.text_length)
+
+    def kickoff_new_revision():
+        tracing._reported_crew_revisions.clear()
+        kickoff_wrapper(crew.kickoff, crew, (), {"inputs": {"topic": "benchmark"}})
+
+    report(
+        "_KickoffWrapper (first run of a crew revision)",
+        timeit.timeit(kickoff_new_revision, number=iterations),
+        iterations,
+    )
+    report(
+        "_KickoffWrapper (repeated crew revision)",
+        timeit.timeit(
+            lambda: kickoff_wrapper(crew.kickoff, crew, (), {"inputs": {"topic": "benchmark"}}),
+            number=iterations,
+        ),
+        iterations,
+    )
+
+
+if __name__ == "__main__":
+    main()
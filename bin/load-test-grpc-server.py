@@ -0,0 +1,172 @@
+"""
+Compare the latency of cheap RPCs under mixed traffic between a threaded server with
+one shared worker pool, the threaded server with per-class concurrency limits (see
+studio/cross_cutting/rpc_classes.py) and the asyncio (grpc.aio) server mode of the
+studio (see studio/aio_service.py).
+
+The servers host a synthetic servicer, so no database, CML API or LLM is needed:
+TestModel and DeployWorkflow sleep for --slow-seconds (like waiting on an LLM or on
+the CML API), ListWorkflows takes a millisecond (like a small database read), and
+HealthCheck returns immediately. While a steady stream of slow calls keeps the
+servers busy, the test measures the latency of HealthCheck and ListWorkflows. Run
+from the root of the project:
+
+    uv run python bin/load-test-grpc-server.py [--slow-calls 20] [--fast-calls 500]
+"""
+
+from concurrent import futures
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+
+import grpc
+
+from studio.aio_service import AsyncAgentStudioApp, create_aio_server
+from studio.cross_cutting.rpc_classes import RpcClassServerInterceptor, get_rpc_classes, get_thread_server_workers
+from studio.proto import agent_studio_pb2_grpc
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer, AgentStudioStub
+from studio.api import *
+
+
+class SyntheticServicer(AgentStudioServicer):
+    def __init__(self, slow_seconds: float):
+        self.slow_seconds = slow_seconds
+
+    def HealthCheck(self, request, context):
+        return HealthCheckResponse(message="Studio is healthy")
+
+    def ListWorkflows(self, request, context):
+        time.sleep(0.001)
+        return ListWorkflowsResponse()
+
+    def TestModel(self, request, context):
+        time.sleep(self.slow_seconds)
+        return TestModelResponse()
+
+    def DeployWorkflow(self, request, context):
+        time.sleep(self.slow_seconds)
+        return DeployWorkflowResponse()
+
+
+def start_shared_server(servicer: AgentStudioServicer, port: str, max_workers: int):
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(servicer, server)
+    server.add_insecure_port("[::]:" + port)
+    server.start()
+    return lambda: server.stop(None)
+
+
+def start_thread_server(servicer: AgentStudioServicer, port: str, max_workers: int):
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=get_thread_server_workers()),
+        interceptors=[RpcClassServerInterceptor()],
+    )
+    agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(servicer, server)
+    server.add_insecure_port("[::]:" + port)
+    server.start()
+    return lambda: server.stop(None)
+
+
+def start_aio_server(servicer: AgentStudioServicer, port: str, max_workers: int):
+    loop = asyncio.new_event_loop()
+    aio_servicer = AsyncAgentStudioApp(servicer)
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+    async def start():
+        server = create_aio_server(aio_servicer, port)
+        await server.start()
+        return server
+
+    server = asyncio.run_coroutine_threadsafe(start(), loop).result()
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(server.stop(None), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        aio_servicer.shutdown()
+
+    return stop
+
+
+def percentile(latencies: list, p: float) -> float:
+    return (
+        statistics.quantiles(latencies, n=100, method="inclusive")[int(p) - 1] if len(latencies) > 1 else latencies[0]
+    )
+
+
+def run_mixed_traffic(port: str, slow_calls: int, fast_calls: int, fast_concurrency: int) -> dict:
+    channel = grpc.insecure_channel("localhost:" + port)
+    stub = AgentStudioStub(channel)
+    stub.HealthCheck(HealthCheckRequest(), timeout=30)
+
+    stop = threading.Event()
+    rejected = []
+
+    def keep_calling_slow_rpcs(index: int):
+        while not stop.is_set():
+            try:
+                if index % 2:
+                    stub.TestModel(TestModelRequest(), timeout=120)
+                else:
+                    stub.DeployWorkflow(DeployWorkflowRequest(), timeout=120)
+            except grpc.RpcError as e:
+                if e.code() != grpc.StatusCode.RESOURCE_EXHAUSTED:
+                    raise
+                rejected.append(index)
+                time.sleep(0.05)
+
+    slow_threads = [threading.Thread(target=keep_calling_slow_rpcs, args=(i,), daemon=True) for i in range(slow_calls)]
+    for thread in slow_threads:
+        thread.start()
+    # Let the slow calls occupy the server first.
+    time.sleep(0.2)
+
+    latencies = {"HealthCheck": [], "ListWorkflows": []}
+
+    def call_fast_rpc(index: int):
+        start = time.perf_counter()
+        if index % 2:
+            stub.HealthCheck(HealthCheckRequest(), timeout=120)
+            latencies["HealthCheck"].append(time.perf_counter() - start)
+        else:
+            stub.ListWorkflows(ListWorkflowsRequest(), timeout=120)
+            latencies["ListWorkflows"].append(time.perf_counter() - start)
+
+    with futures.ThreadPoolExecutor(max_workers=fast_concurrency) as executor:
+        list(executor.map(call_fast_rpc, range(fast_calls)))
+
+    stop.set()
+    for thread in slow_threads:
+        thread.join()
+    channel.close()
+    return latencies, len(rejected)
+
+
+def report(mode: str, latencies: dict, rejected: int):
+    for method, values in latencies.items():
+        print(
+            f"{mode:>6} {method:<14} p50 {percentile(values, 50) * 1000:9.1f} ms"
+            f"  p99 {percentile(values, 99) * 1000:9.1f} ms  max {max(values) * 1000:9.1f} ms"
+        )
+    print(f"{mode:>6} slow calls rejected: {rejected}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slow-calls", type=int, default=20, help="Concurrent callers of slow RPCs.")
+    parser.add_argument("--slow-seconds", type=float, default=0.5, help="Duration of a slow RPC.")
+    parser.add_argument("--fast-calls", type=int, default=500, help="Number of cheap RPCs to measure.")
+    parser.add_argument("--fast-concurrency", type=int, default=4, help="Concurrent callers of cheap RPCs.")
+    parser.add_argument("--max-workers", type=int, default=10, help="Worker pool size of the shared server.")
+    args = parser.parse_args()
+
+    print(f"RPC classes: {list(get_rpc_classes().values())}")
+    for mode, start in [("shared", start_shared_server), ("thread", start_thread_server), ("aio", start_aio_server)]:
+        port = "50199"
+        stop_server = start(SyntheticServicer(args.slow_seconds), port, args.max_workers)
+        try:
+            report(mode, *run_mixed_traffic(port, args.slow_calls, args.fast_calls, args.fast_concurrency))
+        finally:
+            stop_server()
+        time.sleep(0.5)
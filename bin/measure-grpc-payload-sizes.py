@@ -0,0 +1,170 @@
+"""
+Measure the bytes on the wire of the studio's large-payload RPCs with and without
+the per-RPC compression of studio/cross_cutting/grpc_options.py.
+
+A threaded server with the studio's server options hosts a servicer that serves
+ListToolTemplates from the tool template catalog (studio-data/tool_templates) and
+GetAssetData from the dynamic assets (studio-data/dynamic_assets), so no database
+or CML API is needed. The client reaches the server through a TCP proxy that
+counts the bytes sent in each direction, HTTP/2 framing included. Run from the
+root of the project:
+
+    uv run python bin/measure-grpc-payload-sizes.py [--calls 20]
+"""
+
+from concurrent import futures
+import argparse
+import os
+import socket
+import threading
+import time
+
+import grpc
+
+from studio import consts
+from studio.api import *
+from studio.cross_cutting.grpc_options import (
+    CompressionServerInterceptor,
+    get_channel_options,
+    get_compression,
+    get_server_options,
+)
+from studio.proto import agent_studio_pb2_grpc
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer, AgentStudioStub
+
+
+MEASURED_RPCS = ["ListToolTemplates", "GetAssetData"]
+
+
+class CatalogServicer(AgentStudioServicer):
+    def __init__(self):
+        self.templates = []
+        for name in sorted(os.listdir(consts.TOOL_TEMPLATE_CATALOG_LOCATION)):
+            template_dir = os.path.join(consts.TOOL_TEMPLATE_CATALOG_LOCATION, name)
+            with open(os.path.join(template_dir, "tool.py")) as f:
+                python_code = f.read()
+            with open(os.path.join(template_dir, "requirements.txt")) as f:
+                python_requirements = f.read()
+            self.templates.append(
+                ToolTemplate(
+                    id=name,
+                    name=name,
+                    python_code=python_code,
+                    python_requirements=python_requirements,
+                    source_folder_path=template_dir,
+                )
+            )
+        self.asset_uris = [
+            os.path.relpath(os.path.join(root, file_name), consts.DYNAMIC_ASSETS_LOCATION)
+            for root, _, file_names in os.walk(consts.DYNAMIC_ASSETS_LOCATION)
+            for file_name in file_names
+        ]
+
+    def ListToolTemplates(self, request, context):
+        return ListToolTemplatesResponse(templates=self.templates)
+
+    def GetAssetData(self, request, context):
+        asset_data = {}
+        for asset_uri in request.asset_uri_list:
+            with open(os.path.join(consts.DYNAMIC_ASSETS_LOCATION, asset_uri), "rb") as f:
+                asset_data[asset_uri] = f.read()
+        return GetAssetDataResponse(asset_data=asset_data)
+
+
+class CountingProxy:
+    """
+    TCP proxy that counts the bytes it forwards in each direction.
+    """
+
+    def __init__(self, target_port: int):
+        self.target_port = target_port
+        self.sent = 0
+        self.received = 0
+        self.lock = threading.Lock()
+        self.listener = socket.socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen()
+        self.port = self.listener.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def reset(self) -> None:
+        with self.lock:
+            self.sent = self.received = 0
+
+    def _accept(self) -> None:
+        while True:
+            client = self.listener.accept()[0]
+            server = socket.create_connection(("127.0.0.1", self.target_port))
+            threading.Thread(target=self._forward, args=(client, server, "sent"), daemon=True).start()
+            threading.Thread(target=self._forward, args=(server, client, "received"), daemon=True).start()
+
+    def _forward(self, source: socket.socket, destination: socket.socket, counter: str) -> None:
+        try:
+            while data := source.recv(65536):
+                with self.lock:
+                    setattr(self, counter, getattr(self, counter) + len(data))
+                destination.sendall(data)
+        except OSError:
+            pass
+        finally:
+            destination.close()
+
+
+def start_server(servicer: AgentStudioServicer, compressed_rpcs: frozenset) -> tuple:
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        interceptors=[CompressionServerInterceptor(compressed_rpcs=compressed_rpcs)],
+        options=get_server_options(),
+    )
+    agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, port
+
+
+def measure(servicer: CatalogServicer, compressed: bool, calls: int) -> dict:
+    server, port = start_server(servicer, frozenset(MEASURED_RPCS) if compressed else frozenset())
+    proxy = CountingProxy(port)
+    channel = grpc.insecure_channel(f"127.0.0.1:{proxy.port}", options=get_channel_options())
+    stub = AgentStudioStub(channel)
+    requests = {
+        "ListToolTemplates": (stub.ListToolTemplates, ListToolTemplatesRequest()),
+        "GetAssetData": (stub.GetAssetData, GetAssetDataRequest(asset_uri_list=servicer.asset_uris)),
+    }
+    results = {}
+    try:
+        for method in MEASURED_RPCS:
+            rpc, request = requests[method]
+            # Warm up the connection, so that only the calls are counted.
+            rpc(request, timeout=30)
+            time.sleep(0.1)
+            proxy.reset()
+            start = time.perf_counter()
+            for _ in range(calls):
+                message_size = rpc(request, timeout=30).ByteSize()
+            duration = time.perf_counter() - start
+            time.sleep(0.1)
+            results[method] = (message_size, proxy.received / calls, duration / calls)
+    finally:
+        channel.close()
+        server.stop(None)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20, help="Calls of each RPC to average over.")
+    args = parser.parse_args()
+
+    servicer = CatalogServicer()
+    print(f"{len(servicer.templates)} tool templates, {len(servicer.asset_uris)} assets, {get_compression().name}")
+    uncompressed = measure(servicer, compressed=False, calls=args.calls)
+    compressed = measure(servicer, compressed=True, calls=args.calls)
+    for method in MEASURED_RPCS:
+        message_size, plain_bytes, plain_duration = uncompressed[method]
+        _, compressed_bytes, compressed_duration = compressed[method]
+        print(
+            f"{method:<18} message {message_size:>9} B  on the wire {plain_bytes:>11.0f} B -> {compressed_bytes:>11.0f} B"
+            f" ({compressed_bytes / plain_bytes:6.1%})  latency {plain_duration * 1000:6.1f} ms ->"
+            f" {compressed_duration * 1000:6.1f} ms"
+        )
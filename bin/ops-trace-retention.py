@@ -0,0 +1,55 @@
+"""
+Delete traces older than the retention policy from the Phoenix ops server, and
+compact its database. Run from the root of the project, in the pod that runs the
+ops server:
+
+    uv run python bin/ops-trace-retention.py --dry-run
+    uv run python bin/ops-trace-retention.py --max-age-days 30 --project-max-age "Test Workflow - *=7"
+
+Without arguments, the policy is read from AGENT_STUDIO_OPS_TRACE_RETENTION_DAYS
+and AGENT_STUDIO_OPS_TRACE_RETENTION_PROJECTS.
+"""
+
+import argparse
+import json
+
+from studio.db.dao import AgentStudioDao
+from studio.ops_retention import get_trace_retention_policy, run_trace_retention
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Report what would be deleted without deleting it.")
+    parser.add_argument("--max-age-days", type=float, help="Maximum age of the traces of every project.")
+    parser.add_argument(
+        "--project-max-age",
+        action="append",
+        default=[],
+        metavar="PROJECT=DAYS",
+        help="Maximum age of the traces of a project, or of projects matching a glob pattern. Repeatable.",
+    )
+    parser.add_argument("--no-compact", action="store_true", help="Don't compact the database after deleting.")
+    parser.add_argument("--database-path", help="Path to the Phoenix SQLite database.")
+    args = parser.parse_args()
+
+    policy = get_trace_retention_policy()
+    if args.max_age_days is not None:
+        policy.default_max_age_days = args.max_age_days
+    for project_max_age in args.project_max_age:
+        project, _, days = project_max_age.rpartition("=")
+        if not project:
+            parser.error(f"Invalid --project-max-age {project_max_age!r}, expected PROJECT=DAYS.")
+        policy.project_max_age_days[project] = float(days)
+    if args.no_compact:
+        policy.compact = False
+    if not policy.is_enabled():
+        parser.error("No trace retention policy is configured.")
+
+    report = run_trace_retention(
+        policy=policy, dry_run=args.dry_run, database_path=args.database_path, dao=AgentStudioDao()
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
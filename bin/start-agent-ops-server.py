@@ -4,6 +4,7 @@ import os
 from typing import Dict 
 import json
 from studio.consts import DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT
+from studio.ops_retention import start_trace_retention_scheduler
 import http.server
 import http.client
 import urllib.parse
@@ -109,4 +110,5 @@ def run_proxy_server():
 
 set_ops_server_discovery()
 start_phoenix_server()
+start_trace_retention_scheduler()
 run_proxy_server()
\ No newline at end of file
@@ -1,26 +1,73 @@
 # start-grpc-server.py
 from concurrent import futures
+import asyncio
 import grpc
 from studio.proto import agent_studio_pb2_grpc
 from studio.service import AgentStudioApp
+from studio.aio_service import AsyncAgentStudioApp, create_aio_server, get_grpc_server_mode
+from studio.cross_cutting.metrics import AsyncMetricsServerInterceptor, MetricsServerInterceptor
+from studio.cross_cutting.grpc_options import (
+    AsyncCompressionServerInterceptor,
+    CompressionServerInterceptor,
+    get_server_options,
+)
+from studio.cross_cutting.rpc_classes import RpcClassServerInterceptor, get_thread_server_workers
+from engine.metrics import start_metrics_server_from_env
 from studio.consts import DEFAULT_AS_GRPC_PORT
 import cmlapi
 import os
 import json
 from typing import Dict
 
+
 def start_server(blocking: bool = False):
     port = DEFAULT_AS_GRPC_PORT
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    if get_grpc_server_mode() == "aio":
+        # The asyncio server runs on the event loop of this thread, so it always blocks.
+        asyncio.run(serve_aio(port))
+        return
+
+    # Each RPC class is limited separately (see studio.cross_cutting.rpc_classes), and
+    # the pool has enough workers for every class to use its full limit at once.
+    # Compression, message sizes and keepalive are set in studio/cross_cutting/grpc_options.py.
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=get_thread_server_workers()),
+        interceptors=[MetricsServerInterceptor(), RpcClassServerInterceptor(), CompressionServerInterceptor()],
+        options=get_server_options(),
+    )
     agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(AgentStudioApp(), server=server)
     server.add_insecure_port("[::]:" + port)
     server.start()
     print("Server started, listening on " + port)
-    
+
+    # Optionally serve operational metrics in the Prometheus text format.
+    start_metrics_server_from_env()
+
     if blocking:
         server.wait_for_termination()
 
 
+async def serve_aio(port: str):
+    """
+    Serve the studio from a grpc.aio server, which offloads blocking handlers
+    to a worker pool per RPC class (see studio.aio_service).
+    """
+    aio_servicer = AsyncAgentStudioApp(AgentStudioApp())
+    server = create_aio_server(
+        aio_servicer, port, interceptors=[AsyncMetricsServerInterceptor(), AsyncCompressionServerInterceptor()]
+    )
+    await server.start()
+    print("Async server started, listening on " + port)
+
+    # Optionally serve operational metrics in the Prometheus text format.
+    start_metrics_server_from_env()
+
+    try:
+        await server.wait_for_termination()
+    finally:
+        aio_servicer.shutdown()
+
+
 def update_agent_studio_service_in_project(cml: cmlapi.CMLServiceApi):
     """
     Update the agent studio service IP information in the project
@@ -31,30 +78,23 @@ def update_agent_studio_service_in_project(cml: cmlapi.CMLServiceApi):
     project_id = os.getenv("CDSW_PROJECT_ID")
     grpc_address = os.getenv("CDSW_IP_ADDRESS")
     grpc_port = DEFAULT_AS_GRPC_PORT
-    
+
     proj: cmlapi.Project = cml.get_project(project_id)
     proj_env: Dict = json.loads(proj.environment)
-    proj_env.update({
-        "AGENT_STUDIO_SERVICE_IP": grpc_address,
-        "AGENT_STUDIO_SERVICE_PORT": grpc_port
-    })
-    
-    updated_project: cmlapi.Project = cmlapi.Project(
-        environment= json.dumps(proj_env)
-    )
+    proj_env.update({"AGENT_STUDIO_SERVICE_IP": grpc_address, "AGENT_STUDIO_SERVICE_PORT": grpc_port})
+
+    updated_project: cmlapi.Project = cmlapi.Project(environment=json.dumps(proj_env))
     out: cmlapi.Project = cml.update_project(updated_project, project_id=project_id)
     print(out.environment)
-    
 
 
 if __name__ == "__main__":
-    
-    # Make the fine tuning studio IP address and port available as project-level 
-    # environment variables, so we can instantiate clients from anywhere 
+    # Make the fine tuning studio IP address and port available as project-level
+    # environment variables, so we can instantiate clients from anywhere
     # within the project.
-    
+
     cml = cmlapi.default_client()
-    
+
     # If we are in production mode, update the project env vars.
     if os.getenv("AGENT_STUDIO_DEPLOYMENT_CONFIG") == "prod":
         update_agent_studio_service_in_project(cml)
@@ -64,4 +104,4 @@ if __name__ == "__main__":
     # Start the server up. If this command fails (if the port is already
     # in use), the application script bin/start-app-script.sh will continue
     # to run and the error will exit gracefully.
-    start_server(blocking=True)
\ No newline at end of file
+    start_server(blocking=True)
@@ -1,7 +1,7 @@
 import os
 import shutil
 from uuid import uuid4
-from typing import List, Optional
+from typing import Optional
 from sqlalchemy.exc import SQLAlchemyError
 from studio import consts
 from studio.db.dao import AgentStudioDao
@@ -12,51 +12,59 @@ from studio.tools.tool_template import get_tool_template
 from cmlapi import CMLServiceApi
 from studio.workflow.utils import invalidate_workflow
 from studio.proto.utils import is_field_set
+from studio.cross_cutting.pagination import apply_read_mask, get_read_mask, is_field_requested, paginate_query
 from studio.tools.tool_instance import create_tool_instance, remove_tool_instance
 
 
+def _is_agent_valid(agent: db_model.Agent, session: DbSession, cml: CMLServiceApi, dao: AgentStudioDao) -> bool:
+    """
+    Whether the model of an agent exists, and the templates of all of its tools are valid.
+    """
+    # Check if llm_provider_model_id exists in models table
+    if session.query(db_model.Model).filter_by(model_id=agent.llm_provider_model_id).one_or_none() is None:
+        return False
+
+    # Validate tools associated with the agent
+    for tool_id in agent.tool_ids or []:
+        try:
+            tool_request = GetToolInstanceRequest(tool_instance_id=tool_id)
+            tool_response = get_tool_instance(tool_request, cml, dao=None, preexisting_db_session=session)
+            tool_template_id = tool_response.tool_instance.tool_template_id
+            tool_template = get_tool_template(
+                GetToolTemplateRequest(tool_template_id=tool_template_id), cml, dao
+            ).template
+            if not tool_template.is_valid:
+                return False
+        except Exception:
+            return False
+    return True
+
+
 def list_agents(
     request: ListAgentsRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> ListAgentsResponse:
     """
-    List all agents with metadata.
+    List all agents with metadata, optionally filtered by workflow, paginated and
+    limited to the fields of a read mask.
     """
     try:
+        read_mask = get_read_mask(request, AgentMetadata)
         with dao.get_session() as session:
-            agents: List[db_model.Agent] = session.query(db_model.Agent).all()
-            if not agents:
-                return ListAgentsResponse(agents=[])
+            query = session.query(db_model.Agent)
 
             # Filter by workflow id
             if is_field_set(request, "workflow_id"):
-                agents = list(filter(lambda x: x.workflow_id == request.workflow_id, agents))
+                query = query.filter(db_model.Agent.workflow_id == request.workflow_id)
+
+            agents, next_page_token = paginate_query(query, db_model.Agent, request.page_size, request.page_token)
 
             agent_list = []
             for agent in agents:
-                # Check if llm_provider_model_id exists in models table
-                is_valid = (
-                    session.query(db_model.Model).filter_by(model_id=agent.llm_provider_model_id).one_or_none()
-                    is not None
-                )
-
-                # Validate tools associated with the agent
-                tools_valid = True
-                for tool_id in agent.tool_ids or []:
-                    try:
-                        tool_request = GetToolInstanceRequest(tool_instance_id=tool_id)
-                        tool_response = get_tool_instance(tool_request, cml, dao=None, preexisting_db_session=session)
-                        tool_template_id = tool_response.tool_instance.tool_template_id
-                        tool_template = get_tool_template(
-                            GetToolTemplateRequest(tool_template_id=tool_template_id), cml, dao
-                        ).template
-                        if not tool_template.is_valid:
-                            tools_valid = False
-                            break
-                    except Exception:
-                        tools_valid = False
-                        break
-
-                is_valid = is_valid and tools_valid
+                # Validating the model and tools of an agent takes several queries and
+                # reading the tool code, so only do it when requested.
+                is_valid = False
+                if is_field_requested(read_mask, "is_valid"):
+                    is_valid = _is_agent_valid(agent, session, cml, dao)
 
                 agent_image_uri = ""
                 if agent.agent_image_path:
@@ -84,7 +92,9 @@ def list_agents(
                     )
                 )
 
-            return ListAgentsResponse(agents=agent_list)
+            return ListAgentsResponse(
+                agents=[apply_read_mask(agent, read_mask) for agent in agent_list], next_page_token=next_page_token
+            )
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list agents: {str(e)}")
 
@@ -14,7 +14,7 @@ import sys
 
 sys.path.append("studio/worfklow_engine/src")
 
-from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
+from engine.crewai.tracing import TracingConfig, instrument_crewai_workflow, reset_crewai_instrumentation
 
 
 def agent_test(request: TestAgentRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None) -> TestAgentResponse:
@@ -75,7 +75,7 @@ def studio_agent_test(request: TestAgentRequest, cml: CMLServiceApi, dao: AgentS
             # Retrieve the agent instance
             try:
                 reset_crewai_instrumentation()
-                instrument_crewai_workflow(f"Test Agents - {agent_response.agent.name}")
+                instrument_crewai_workflow(f"Test Agents - {agent_response.agent.name}", tracing_config=TracingConfig())
             except Exception as e:
                 pass
 
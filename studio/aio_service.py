@@ -0,0 +1,153 @@
+"""
+asyncio (grpc.aio) server mode for the Agent Studio gRPC service.
+
+The threaded server handles every RPC on the server's worker threads, so slow calls
+(DeployWorkflow, ListDeployedWorkflows fanning out to the CML API, TestModel waiting
+on an LLM) compete with every other RPC for them. In the asyncio mode, the
+servicer's handlers are dispatched from an event loop instead:
+
+  * cheap, non-blocking handlers (HealthCheck) run on the event loop itself,
+  * every other handler runs on the worker pool of its concurrency class
+    (see studio.cross_cutting.rpc_classes), sized to the class's limit and bounded
+    by the class's timeout,
+
+so slow external calls can only exhaust their own pool. Handlers stay synchronous;
+AsyncAgentStudioApp adapts any AgentStudioServicer to grpc.aio.
+
+The mode is configured with AGENT_STUDIO_GRPC_SERVER_MODE ("thread" or "aio").
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, Optional, Sequence
+import asyncio
+import os
+
+import grpc
+
+from studio.cross_cutting.grpc_options import get_server_options
+from studio.cross_cutting.rpc_classes import RpcClass, get_rpc_classes, get_rpc_method_classes
+from studio.proto import agent_studio_pb2, agent_studio_pb2_grpc
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer
+
+
+# Handlers that don't block, and run directly on the event loop.
+EVENT_LOOP_RPCS = frozenset({"HealthCheck"})
+
+
+def get_grpc_server_mode() -> str:
+    return os.getenv("AGENT_STUDIO_GRPC_SERVER_MODE", "thread")
+
+
+def _iterate_in_thread(async_iterator: AsyncIterator, loop: asyncio.AbstractEventLoop) -> Iterator:
+    """
+    Expose a request stream of the event loop as a blocking iterator to a handler
+    running on a worker thread.
+    """
+    while True:
+        try:
+            yield asyncio.run_coroutine_threadsafe(async_iterator.__anext__(), loop).result()
+        except StopAsyncIteration:
+            return
+
+
+class AsyncAgentStudioApp:
+    """
+    grpc.aio adapter of a synchronous AgentStudioServicer. Every RPC of the service
+    is exposed as a coroutine (or async generator) that runs the wrapped handler on
+    the event loop or on the worker pool of its concurrency class.
+    """
+
+    def __init__(
+        self,
+        servicer: AgentStudioServicer,
+        rpc_classes: Optional[Dict[str, RpcClass]] = None,
+        event_loop_rpcs: Sequence[str] = EVENT_LOOP_RPCS,
+    ):
+        self.servicer = servicer
+        rpc_classes = rpc_classes or get_rpc_classes()
+        self.executors = {
+            name: ThreadPoolExecutor(max_workers=rpc_class.concurrency, thread_name_prefix=f"grpc_{name}_worker_")
+            for name, rpc_class in rpc_classes.items()
+        }
+        method_classes = get_rpc_method_classes(rpc_classes)
+        for method in agent_studio_pb2.DESCRIPTOR.services_by_name["AgentStudio"].methods:
+            handler = getattr(servicer, method.name)
+            rpc_class = method_classes[method.name]
+            executor = None if method.name in event_loop_rpcs else self.executors[rpc_class.name]
+            setattr(
+                self,
+                method.name,
+                self._wrap(handler, rpc_class, executor, method.client_streaming, method.server_streaming),
+            )
+
+    def shutdown(self) -> None:
+        for executor in self.executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _wrap(
+        handler: Callable,
+        rpc_class: RpcClass,
+        executor: Optional[ThreadPoolExecutor],
+        client_streaming: bool,
+        server_streaming: bool,
+    ) -> Callable:
+        async def run(context: grpc.aio.ServicerContext, fn: Callable, *args: Any) -> Any:
+            if executor is None:
+                return fn(*args)
+            # The timeout also covers the wait for a worker of the class. A timed out
+            # handler keeps its worker until it returns, which bounds the class's
+            # concurrency but never another class's.
+            try:
+                return await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(executor, fn, *args), rpc_class.timeout
+                )
+            except asyncio.TimeoutError:
+                await context.abort(
+                    grpc.StatusCode.DEADLINE_EXCEEDED,
+                    f"The {rpc_class.name} request timed out after {rpc_class.timeout:g} seconds.",
+                )
+
+        async def call(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            if client_streaming:
+                request = _iterate_in_thread(request, asyncio.get_running_loop())
+            return await run(context, handler, request, context)
+
+        if not server_streaming:
+            return call
+
+        async def stream(request: Any, context: grpc.aio.ServicerContext) -> AsyncIterator:
+            responses = iter(await call(request, context))
+            done = object()
+            try:
+                while True:
+                    response = await run(context, next, responses, done)
+                    if response is done:
+                        return
+                    yield response
+            finally:
+                # Runs the handler's own cleanup when the client cancels the stream,
+                # unless the handler is still busy producing the next response.
+                close = getattr(responses, "close", None)
+                if close:
+                    try:
+                        close()
+                    except ValueError:
+                        pass
+
+        return stream
+
+
+def create_aio_server(
+    aio_servicer: AsyncAgentStudioApp, port: str, interceptors: Sequence[grpc.aio.ServerInterceptor] = ()
+) -> grpc.aio.Server:
+    """
+    Create (but don't start) a grpc.aio server for the servicer, listening on all
+    interfaces on the given port, with the transport options of
+    studio.cross_cutting.grpc_options. The caller shuts the servicer's worker pools
+    down once the server has stopped.
+    """
+    server = grpc.aio.server(interceptors=list(interceptors), options=get_server_options())
+    agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(aio_servicer, server)
+    server.add_insecure_port("[::]:" + port)
+    return server
@@ -1,5 +1,6 @@
 import grpc
 
+from studio.cross_cutting.grpc_options import get_channel_options, get_request_compression
 from studio.proto.agent_studio_pb2_grpc import AgentStudioStub
 
 
@@ -15,6 +16,10 @@ class AgentStudioClient:
 
     Note that this class inherits from the stub, still. Which means you can
     access all standard stub requests as needed in "proper" request/response format.
+
+    The channel uses the message size limits and keepalive of
+    studio.cross_cutting.grpc_options, and the requests of compressed RPCs are
+    compressed unless a call sets its own compression.
     """
 
     def __init__(self, server_ip: str = None, server_port: str = None):
@@ -22,16 +27,18 @@ class AgentStudioClient:
             server_ip = os.getenv("AGENT_STUDIO_SERVICE_IP")
         if not server_port:
             server_port = os.getenv("AGENT_STUDIO_SERVICE_PORT")
-        self.channel = grpc.insecure_channel(f"{server_ip}:{server_port}")
+        self.channel = grpc.insecure_channel(f"{server_ip}:{server_port}", options=get_channel_options())
         self.stub = AgentStudioStub(self.channel)
 
         # Automatically wrap all gRPC methods with error handling
         for attr in dir(self.stub):
             if not attr.startswith("_") and callable(getattr(self.stub, attr)):
-                setattr(self, attr, self._grpc_error_handler(getattr(self.stub, attr)))
+                setattr(self, attr, self._grpc_error_handler(getattr(self.stub, attr), get_request_compression(attr)))
 
-    def _grpc_error_handler(self, func):
+    def _grpc_error_handler(self, func, compression: grpc.Compression = None):
         def wrapper(*args, **kwargs):
+            if compression is not None:
+                kwargs.setdefault("compression", compression)
             try:
                 return func(*args, **kwargs)
             except grpc.RpcError as error:
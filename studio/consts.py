@@ -125,3 +125,12 @@ DEFAULT_GENERATION_CONFIG = {
     "num_beams": 1,
     "max_length": None,  # Explicity set max_length to Null to compensate for max_new_tokens
 }
+
+# Maximum number of seconds a workflow test run's event stream stays open.
+WORKFLOW_EVENT_STREAM_TIMEOUT_SECONDS = 3600
+
+# Maximum number of seconds a Watch* stream stays open, after which clients resume it.
+WATCH_STREAM_TIMEOUT_SECONDS = 3600
+
+# Number of seconds without changes after which a Watch* stream sends a heartbeat.
+WATCH_HEARTBEAT_SECONDS = 15
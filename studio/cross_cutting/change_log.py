@@ -0,0 +1,124 @@
+"""
+In-process log of the changes made to the studio's entities (workflows, agents,
+tasks, tool instances and deployed workflows), which feeds the Watch* RPCs.
+
+Changes are recorded by the database sessions of the DAO as they flush, and are
+appended to the log, with increasing sequence numbers, once the session commits
+(see studio.db.dao). This covers the mutating RPC handlers as well as the
+background tasks they start. Only a bounded number of the most recent changes is
+kept (AGENT_STUDIO_CHANGE_LOG_SIZE); watchers that fall further behind, or that
+resume with a sequence number of a previous server process, are told to re-list
+their entities instead.
+"""
+
+from collections import deque
+from typing import List, NamedTuple, Optional
+from uuid import uuid4
+import os
+import threading
+
+
+CREATED = "CREATED"
+UPDATED = "UPDATED"
+DELETED = "DELETED"
+
+# Entity types of the watched database tables.
+WATCHED_TABLES = {
+    "workflows": "workflow",
+    "agents": "agent",
+    "tasks": "task",
+    "tool_instances": "tool_instance",
+    "deployed_workflow_instance": "deployed_workflow",
+}
+
+
+class EntityChange(NamedTuple):
+    sequence: int
+    change_type: str
+    entity_type: str
+    entity_id: str
+    workflow_id: str
+
+
+def get_entity_change(entity: object, change_type: str) -> Optional[EntityChange]:
+    """
+    The (not yet numbered) change of an ORM object, if its table is watched.
+    """
+    entity_type = WATCHED_TABLES.get(getattr(entity, "__tablename__", None))
+    if entity_type is None:
+        return None
+    workflow_id = entity.id if entity_type == "workflow" else entity.workflow_id
+    return EntityChange(0, change_type, entity_type, entity.id, workflow_id or "")
+
+
+def merge_changes(changes: List[EntityChange]) -> List[EntityChange]:
+    """
+    Merge the changes of each entity into its last change, ordered by the entity's
+    last change. An entity that was created and then updated is CREATED.
+    """
+    merged = {}
+    for change in changes:
+        key = (change.entity_type, change.entity_id)
+        previous = merged.pop(key, None)
+        if previous is not None and previous.change_type == CREATED and change.change_type == UPDATED:
+            change = change._replace(change_type=CREATED)
+        merged[key] = change
+    return list(merged.values())
+
+
+class ChangeLog:
+    """
+    Thread-safe, bounded log of entity changes that watchers can block on.
+    """
+
+    def __init__(self, max_changes: int = 10000):
+        # Identifies the log, and so the sequence numbers, of this process.
+        self.id = uuid4().hex
+        self._changes: deque = deque(maxlen=max_changes)
+        self._sequence = 0
+        self._condition = threading.Condition()
+
+    def get_sequence(self) -> int:
+        return self._sequence
+
+    def append(self, changes: List[EntityChange]) -> None:
+        """
+        Number and append the changes of one committed transaction, merged per entity.
+        """
+        merged = merge_changes(changes)
+        if not merged:
+            return
+        with self._condition:
+            for change in merged:
+                self._sequence += 1
+                self._changes.append(change._replace(sequence=self._sequence))
+            self._condition.notify_all()
+
+    def has_changes_since(self, sequence: int) -> bool:
+        """
+        Whether every change after the sequence number is still in the log.
+        """
+        with self._condition:
+            oldest = self._changes[0].sequence if self._changes else self._sequence + 1
+            return oldest - 1 <= sequence <= self._sequence
+
+    def wait_for_changes(self, since: int, timeout: float) -> List[EntityChange]:
+        """
+        Get the changes after the sequence number, waiting up to the timeout for the
+        next change if there are none yet.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._sequence > since, timeout=timeout)
+            changes = []
+            for change in reversed(self._changes):
+                if change.sequence <= since:
+                    break
+                changes.append(change)
+            return changes[::-1]
+
+
+_change_log = ChangeLog(max_changes=int(os.getenv("AGENT_STUDIO_CHANGE_LOG_SIZE", "10000")))
+
+
+def get_change_log() -> ChangeLog:
+    return _change_log
@@ -1,6 +1,8 @@
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from studio.cross_cutting.metrics import THREAD_POOL_QUEUE_DEPTH
+
 _global_thread_pool: Optional[ThreadPoolExecutor] = None
 
 
@@ -14,6 +16,8 @@ def get_thread_pool() -> ThreadPoolExecutor:
 def initialize_thread_pool():
     global _global_thread_pool
     _global_thread_pool = ThreadPoolExecutor(max_workers=12, thread_name_prefix="global_thread_pool_")
+    # ThreadPoolExecutor doesn't expose its backlog other than through its work queue.
+    THREAD_POOL_QUEUE_DEPTH.set_function(lambda: _global_thread_pool._work_queue.qsize() if _global_thread_pool else 0)
 
 
 def cleanup_thread_pool():
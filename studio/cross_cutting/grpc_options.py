@@ -0,0 +1,213 @@
+"""
+Transport options of the studio's gRPC server and clients: per-RPC message
+compression, maximum message sizes and keepalive.
+
+  * Compression: the messages of the RPCs in AGENT_STUDIO_GRPC_COMPRESSED_RPCS (a
+    comma-separated list of method names, COMPRESSED_RPCS by default, empty or
+    "none" to disable) are compressed with AGENT_STUDIO_GRPC_COMPRESSION ("gzip" by
+    default, or "deflate"): the server compresses their responses, and
+    AgentStudioClient compresses their requests. Compression pays off for payloads
+    like tool source code, but costs CPU and latency for small or already-compressed
+    messages, so it is only enabled for the RPCs that carry compressible payloads.
+  * Message sizes: AGENT_STUDIO_GRPC_MAX_MESSAGE_LENGTH bounds, in bytes, the messages
+    both sides send and receive (DEFAULT_MAX_MESSAGE_LENGTH by default, instead of the
+    4 MiB gRPC receive limit that large template lists or assets can exceed).
+  * Keepalive: clients ping idle connections every AGENT_STUDIO_GRPC_KEEPALIVE_TIME_MS
+    milliseconds and drop them if a ping isn't answered within
+    AGENT_STUDIO_GRPC_KEEPALIVE_TIMEOUT_MS, so that connections silently dropped by
+    proxies are detected before the next call. The server pings its clients the same
+    way, and accepts their pings at up to twice that rate, so that pings arriving a
+    little early aren't counted as ping strikes (which end in a GOAWAY).
+"""
+
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
+import os
+
+import grpc
+
+
+# RPCs whose messages carry large, compressible payloads: tool source code. Images
+# (GetAssetData) and uploaded files are mostly already compressed, and gzip barely
+# shrinks them (PNG icons by about 7%, see bin/measure-grpc-payload-sizes.py) at
+# several times the latency.
+COMPRESSED_RPCS = frozenset(
+    {
+        "ListToolTemplates",
+        "GetToolTemplate",
+        "ListToolInstances",
+        "GetToolInstance",
+    }
+)
+
+COMPRESSION_ALGORITHMS = {
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+DEFAULT_MAX_MESSAGE_LENGTH = 64 * 1024 * 1024
+# gRPC message lengths are 32-bit signed integers.
+MAX_MESSAGE_LENGTH_LIMIT = 2**31 - 1
+
+DEFAULT_KEEPALIVE_TIME_MS = 30000
+DEFAULT_KEEPALIVE_TIMEOUT_MS = 10000
+
+
+def get_compressed_rpcs() -> FrozenSet[str]:
+    compressed_rpcs = os.getenv("AGENT_STUDIO_GRPC_COMPRESSED_RPCS")
+    if compressed_rpcs is None:
+        return COMPRESSED_RPCS
+    if compressed_rpcs.strip().lower() == "none":
+        return frozenset()
+    return frozenset(method.strip() for method in compressed_rpcs.split(",") if method.strip())
+
+
+def get_compression() -> grpc.Compression:
+    algorithm = os.getenv("AGENT_STUDIO_GRPC_COMPRESSION", "gzip").lower()
+    if algorithm not in COMPRESSION_ALGORITHMS:
+        raise ValueError(f"Invalid gRPC compression '{algorithm}', expected one of {sorted(COMPRESSION_ALGORITHMS)}.")
+    return COMPRESSION_ALGORITHMS[algorithm]
+
+
+def get_max_message_length() -> int:
+    max_message_length = int(os.getenv("AGENT_STUDIO_GRPC_MAX_MESSAGE_LENGTH", str(DEFAULT_MAX_MESSAGE_LENGTH)))
+    if not 0 < max_message_length <= MAX_MESSAGE_LENGTH_LIMIT:
+        raise ValueError(
+            f"Invalid gRPC max message length {max_message_length}, expected 1 to {MAX_MESSAGE_LENGTH_LIMIT} bytes."
+        )
+    return max_message_length
+
+
+def get_keepalive() -> Tuple[int, int]:
+    """
+    The keepalive (time, timeout) of connections, in milliseconds.
+    """
+    keepalive_time_ms = int(os.getenv("AGENT_STUDIO_GRPC_KEEPALIVE_TIME_MS", str(DEFAULT_KEEPALIVE_TIME_MS)))
+    keepalive_timeout_ms = int(os.getenv("AGENT_STUDIO_GRPC_KEEPALIVE_TIMEOUT_MS", str(DEFAULT_KEEPALIVE_TIMEOUT_MS)))
+    if keepalive_time_ms <= 0 or keepalive_timeout_ms <= 0:
+        raise ValueError("gRPC keepalive time and timeout must be positive.")
+    return keepalive_time_ms, keepalive_timeout_ms
+
+
+def _get_common_options() -> List[Tuple[str, Any]]:
+    max_message_length = get_max_message_length()
+    keepalive_time_ms, keepalive_timeout_ms = get_keepalive()
+    return [
+        ("grpc.max_send_message_length", max_message_length),
+        ("grpc.max_receive_message_length", max_message_length),
+        ("grpc.keepalive_time_ms", keepalive_time_ms),
+        ("grpc.keepalive_timeout_ms", keepalive_timeout_ms),
+        ("grpc.keepalive_permit_without_calls", 1),
+        # Keep pinging idle connections, instead of stopping after a few pings without data.
+        ("grpc.http2.max_pings_without_data", 0),
+    ]
+
+
+def get_server_options() -> List[Tuple[str, Any]]:
+    """
+    Channel arguments of the studio's gRPC servers.
+    """
+    keepalive_time_ms, _ = get_keepalive()
+    return _get_common_options() + [
+        # Accept the keepalive pings of clients, and send its own, at the keepalive
+        # rate: both are otherwise limited to one every 5 minutes on idle connections.
+        # Client pings are accepted at half the keepalive time, as timer jitter can
+        # bring them in just under it, and the server answers pings received too
+        # early with GOAWAY too_many_pings.
+        ("grpc.http2.min_recv_ping_interval_without_data_ms", keepalive_time_ms // 2),
+        ("grpc.http2.min_ping_interval_without_data_ms", keepalive_time_ms),
+    ]
+
+
+def get_channel_options() -> List[Tuple[str, Any]]:
+    """
+    Channel arguments of clients of the studio's gRPC server.
+    """
+    return _get_common_options()
+
+
+def get_request_compression(method: str) -> Optional[grpc.Compression]:
+    """
+    The compression of the requests of an RPC sent by clients, if any.
+    """
+    return get_compression() if method in get_compressed_rpcs() else None
+
+
+class CompressionServerInterceptor(grpc.ServerInterceptor):
+    """
+    Compresses the responses of the compressed RPCs of the threaded server.
+    """
+
+    def __init__(
+        self, compressed_rpcs: Optional[FrozenSet[str]] = None, compression: Optional[grpc.Compression] = None
+    ):
+        self.compressed_rpcs = get_compressed_rpcs() if compressed_rpcs is None else compressed_rpcs
+        self.compression = compression or get_compression()
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or handler_call_details.method.rsplit("/", 1)[-1] not in self.compressed_rpcs:
+            return handler
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._wrap_unary_response(handler.unary_unary))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=self._wrap_unary_response(handler.stream_unary))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._wrap_stream_response(handler.unary_stream))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._wrap_stream_response(handler.stream_stream))
+        return handler
+
+    def _wrap_unary_response(self, behavior: Callable) -> Callable:
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            context.set_compression(self.compression)
+            return behavior(request, context)
+
+        return wrapper
+
+    def _wrap_stream_response(self, behavior: Callable) -> Callable:
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            context.set_compression(self.compression)
+            yield from behavior(request, context)
+
+        return wrapper
+
+
+class AsyncCompressionServerInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Compresses the responses of the compressed RPCs of a grpc.aio server.
+    """
+
+    def __init__(
+        self, compressed_rpcs: Optional[FrozenSet[str]] = None, compression: Optional[grpc.Compression] = None
+    ):
+        self.compressed_rpcs = get_compressed_rpcs() if compressed_rpcs is None else compressed_rpcs
+        self.compression = compression or get_compression()
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None or handler_call_details.method.rsplit("/", 1)[-1] not in self.compressed_rpcs:
+            return handler
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._wrap_unary_response(handler.unary_unary))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=self._wrap_unary_response(handler.stream_unary))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._wrap_stream_response(handler.unary_stream))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._wrap_stream_response(handler.stream_stream))
+        return handler
+
+    def _wrap_unary_response(self, behavior: Callable) -> Callable:
+        async def wrapper(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            context.set_compression(self.compression)
+            return await behavior(request, context)
+
+        return wrapper
+
+    def _wrap_stream_response(self, behavior: Callable) -> Callable:
+        async def wrapper(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            context.set_compression(self.compression)
+            async for response in behavior(request, context):
+                yield response
+
+        return wrapper
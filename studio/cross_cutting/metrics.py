@@ -0,0 +1,171 @@
+"""
+Operational metrics of the studio server: gRPC method calls, the gRPC response
+cache, the global thread pool, tool virtual environment builds and database sessions. Metrics are served
+in the Prometheus text format when AGENT_STUDIO_METRICS_PORT is set (see
+engine.metrics).
+"""
+
+from typing import Any, Callable, Optional
+import time
+import grpc
+
+# Import engine code manually. Eventually when this code becomes
+# a separate git repo, or a custom runtime image, this path call
+# will go away and workflow engine features will be available already.
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+
+from engine.metrics import get_metrics_registry
+
+
+GRPC_REQUESTS = get_metrics_registry().counter(
+    "agent_studio_grpc_requests", "gRPC requests handled, by method and status code.", ["method", "code"]
+)
+GRPC_REQUEST_DURATION = get_metrics_registry().histogram(
+    "agent_studio_grpc_request_duration_seconds",
+    "gRPC request durations, by method. Streaming requests are measured until the stream ends.",
+    ["method"],
+)
+GRPC_REQUESTS_IN_PROGRESS = get_metrics_registry().gauge(
+    "agent_studio_grpc_requests_in_progress", "gRPC requests currently being handled, by method.", ["method"]
+)
+GRPC_RESPONSE_CACHE_LOOKUPS = get_metrics_registry().counter(
+    "agent_studio_grpc_response_cache_lookups",
+    "Lookups of the gRPC response cache, by method and result (hit or miss).",
+    ["method", "result"],
+)
+THREAD_POOL_QUEUE_DEPTH = get_metrics_registry().gauge(
+    "agent_studio_thread_pool_queue_depth", "Tasks waiting for a worker of the global thread pool."
+)
+TOOL_VENV_BUILDS = get_metrics_registry().counter(
+    "agent_studio_tool_venv_builds", "Tool virtual environment preparations, by result.", ["result"]
+)
+TOOL_VENV_BUILD_DURATION = get_metrics_registry().histogram(
+    "agent_studio_tool_venv_build_duration_seconds",
+    "Tool virtual environment preparation durations, by result.",
+    ["result"],
+)
+DB_SESSION_DURATION = get_metrics_registry().histogram(
+    "agent_studio_db_session_duration_seconds",
+    "Durations of database sessions, from opening to commit or rollback, by result.",
+    ["result"],
+)
+
+
+def _get_status_code(context: grpc.ServicerContext, exception: Optional[BaseException] = None) -> str:
+    code = None
+    try:
+        code = context.code()
+    except Exception:
+        pass
+    if code is None:
+        return grpc.StatusCode.UNKNOWN.name if exception is not None else grpc.StatusCode.OK.name
+    return code.name if isinstance(code, grpc.StatusCode) else str(code)
+
+
+class MetricsServerInterceptor(grpc.ServerInterceptor):
+    """
+    Measures the count, duration and concurrency of every gRPC method call.
+    """
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._wrap_unary_response(handler.unary_unary, method))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=self._wrap_unary_response(handler.stream_unary, method))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._wrap_stream_response(handler.unary_stream, method))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._wrap_stream_response(handler.stream_stream, method))
+        return handler
+
+    @staticmethod
+    def _observe(method: str, start: float, code: str) -> None:
+        GRPC_REQUEST_DURATION.observe(time.perf_counter() - start, method=method)
+        GRPC_REQUESTS.inc(method=method, code=code)
+
+    def _wrap_unary_response(self, behavior: Callable, method: str) -> Callable:
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            start = time.perf_counter()
+            with GRPC_REQUESTS_IN_PROGRESS.track_in_progress(method=method):
+                try:
+                    response = behavior(request, context)
+                except Exception as e:
+                    self._observe(method, start, _get_status_code(context, e))
+                    raise
+            self._observe(method, start, _get_status_code(context))
+            return response
+
+        return wrapper
+
+    def _wrap_stream_response(self, behavior: Callable, method: str) -> Callable:
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            start = time.perf_counter()
+            code = None
+            with GRPC_REQUESTS_IN_PROGRESS.track_in_progress(method=method):
+                try:
+                    yield from behavior(request, context)
+                except Exception as e:
+                    code = _get_status_code(context, e)
+                    raise
+                finally:
+                    self._observe(method, start, code or _get_status_code(context))
+
+        return wrapper
+
+
+class AsyncMetricsServerInterceptor(grpc.aio.ServerInterceptor):
+    """
+    Measures the count, duration and concurrency of every gRPC method call of a
+    grpc.aio server.
+    """
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._wrap_unary_response(handler.unary_unary, method))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=self._wrap_unary_response(handler.stream_unary, method))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._wrap_stream_response(handler.unary_stream, method))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._wrap_stream_response(handler.stream_stream, method))
+        return handler
+
+    def _wrap_unary_response(self, behavior: Callable, method: str) -> Callable:
+        async def wrapper(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            start = time.perf_counter()
+            with GRPC_REQUESTS_IN_PROGRESS.track_in_progress(method=method):
+                try:
+                    response = await behavior(request, context)
+                except Exception as e:
+                    MetricsServerInterceptor._observe(method, start, _get_status_code(context, e))
+                    raise
+            MetricsServerInterceptor._observe(method, start, _get_status_code(context))
+            return response
+
+        return wrapper
+
+    def _wrap_stream_response(self, behavior: Callable, method: str) -> Callable:
+        async def wrapper(request: Any, context: grpc.aio.ServicerContext) -> Any:
+            start = time.perf_counter()
+            code = None
+            with GRPC_REQUESTS_IN_PROGRESS.track_in_progress(method=method):
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                except Exception as e:
+                    code = _get_status_code(context, e)
+                    raise
+                finally:
+                    MetricsServerInterceptor._observe(method, start, code or _get_status_code(context))
+
+        return wrapper
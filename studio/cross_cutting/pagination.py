@@ -0,0 +1,86 @@
+"""
+Pagination and read masks of list RPCs.
+
+List requests can set a page_size, and pass the next_page_token of a response as
+the page_token of the next request. Pages are read with keyset pagination on the
+SQLite rowid, so items keep their insertion order and pages stay consistent while
+items are added or removed. List requests can also set a read_mask, the names of
+the fields of each listed item to return, so that list views can omit large fields
+like tool source code; fields that aren't requested aren't computed either.
+"""
+
+from typing import Any, List, Optional, Set, Tuple, Type
+import base64
+import json
+
+from google.protobuf.message import Message
+from sqlalchemy import literal_column
+from sqlalchemy.orm import Query
+
+
+# Upper bound of the page size of list RPCs.
+MAX_PAGE_SIZE = 1000
+
+
+def encode_page_token(rowid: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps({"after": rowid}).encode()).decode()
+
+
+def decode_page_token(page_token: str) -> int:
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(page_token.encode()))["after"])
+    except Exception:
+        raise ValueError(f"Invalid page token '{page_token}'.")
+
+
+def paginate_query(query: Query, model: Any, page_size: int = 0, page_token: str = "") -> Tuple[List[Any], str]:
+    """
+    Get a page of the items of a query on one table, in insertion order, and the
+    token of the next page (empty on the last page). All remaining items are
+    returned if the page size isn't set.
+    """
+    if page_size < 0:
+        raise ValueError("Page size must not be negative.")
+    rowid = literal_column(f"{model.__tablename__}.rowid")
+    query = query.add_columns(rowid).order_by(rowid)
+    if page_token:
+        query = query.filter(rowid > decode_page_token(page_token))
+    if not page_size:
+        return [item for item, _ in query.all()], ""
+
+    page_size = min(page_size, MAX_PAGE_SIZE)
+    rows = query.limit(page_size + 1).all()
+    next_page_token = encode_page_token(rows[page_size - 1][1]) if len(rows) > page_size else ""
+    return [item for item, _ in rows[:page_size]], next_page_token
+
+
+def get_read_mask(request: Message, item_cls: Type[Message]) -> Optional[Set[str]]:
+    """
+    The fields of the listed items requested by a list request, or None for all
+    of them.
+    """
+    if not request.read_mask:
+        return None
+    read_mask = set(request.read_mask)
+    unknown_fields = read_mask - set(item_cls.DESCRIPTOR.fields_by_name)
+    if unknown_fields:
+        raise ValueError(f"Unknown {item_cls.DESCRIPTOR.name} fields in read mask: {sorted(unknown_fields)}")
+    return read_mask
+
+
+def is_field_requested(read_mask: Optional[Set[str]], *fields: str) -> bool:
+    """
+    Whether any of the fields is requested by a read mask.
+    """
+    return read_mask is None or any(field in read_mask for field in fields)
+
+
+def apply_read_mask(item: Message, read_mask: Optional[Set[str]]) -> Message:
+    """
+    Clear the fields of an item that aren't requested by a read mask.
+    """
+    if read_mask is not None:
+        for field in item.DESCRIPTOR.fields:
+            if field.name not in read_mask:
+                item.ClearField(field.name)
+    return item
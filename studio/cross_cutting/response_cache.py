@@ -0,0 +1,184 @@
+"""
+In-memory cache of the responses of read-heavy list RPCs, which the frontend polls
+constantly and which otherwise hit the database (and often tool files) on every
+call. Responses are keyed by the RPC and the serialized request, and are tagged
+with the write generation at which they were computed:
+
+  * the write generation is bumped after every mutating RPC, and after every
+    committed database session that wrote to a table behind the cached RPCs
+    (covering writes made by background tasks, see studio.db.dao),
+  * a cached response is only served while the generation hasn't changed.
+
+Entries also expire after AGENT_STUDIO_GRPC_RESPONSE_CACHE_TTL seconds (30 by
+default, 0 disables the cache), which bounds staleness for changes made outside the
+studio, like tool code edited directly in the project files.
+AGENT_STUDIO_GRPC_RESPONSE_CACHE_SIZE bounds the number of cached responses.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+import os
+import threading
+import time
+
+from studio.cross_cutting.metrics import GRPC_RESPONSE_CACHE_LOOKUPS
+from studio.proto import agent_studio_pb2
+
+
+CACHED_RPCS = frozenset(
+    {
+        "ListWorkflows",
+        "ListAgents",
+        "ListTasks",
+        "ListToolInstances",
+        "ListToolTemplates",
+        "ListModels",
+    }
+)
+
+# Database tables that the responses of the cached RPCs are computed from.
+CACHED_TABLES = frozenset(
+    {
+        "workflows",
+        "agents",
+        "tasks",
+        "tool_instances",
+        "tool_templates",
+        "models",
+    }
+)
+
+# RPCs that don't change the state behind the cached RPCs, besides List*, Get* and
+# Watch* RPCs. Test runs and trace lookups only write the trace index and run
+# metrics, and are called constantly while a run is polled.
+READ_ONLY_RPCS = frozenset(
+    {
+        "HealthCheck",
+        "TestModel",
+        "TestAgent",
+        "TestWorkflow",
+        "StreamWorkflowEvents",
+        "ResolveWorkflowTrace",
+        "DownloadTemporaryFile",
+        "CheckStudioUpgradeStatus",
+    }
+)
+
+
+_write_generation = 0
+_write_generation_lock = threading.Lock()
+
+
+def get_write_generation() -> int:
+    return _write_generation
+
+
+def bump_write_generation() -> None:
+    """
+    Invalidate every cached response.
+    """
+    global _write_generation
+    with _write_generation_lock:
+        _write_generation += 1
+
+
+def is_mutating_rpc(method: str) -> bool:
+    return not (method.startswith(("List", "Get", "Watch")) or method in READ_ONLY_RPCS)
+
+
+class ResponseCache:
+    """
+    LRU cache of RPC responses, valid for one write generation and at most `ttl`
+    seconds.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(method: str, request: Any) -> Tuple[str, bytes]:
+        return method, request.SerializeToString(deterministic=True)
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            generation, expires_at, response = entry
+            if generation != get_write_generation() or expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: Tuple[str, bytes], generation: int, response: Any) -> None:
+        # A write that committed while the response was computed may not be in it.
+        if generation != get_write_generation():
+            return
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def wrap_cached(self, method: str, handler: Callable) -> Callable:
+        def cached_handler(request: Any, context: Any) -> Any:
+            key = self.get_key(method, request)
+            response = self.get(key)
+            if response is not None:
+                GRPC_RESPONSE_CACHE_LOOKUPS.inc(method=method, result="hit")
+                return response
+            GRPC_RESPONSE_CACHE_LOOKUPS.inc(method=method, result="miss")
+            generation = get_write_generation()
+            # Failed calls raise, and are never cached.
+            response = handler(request, context)
+            self.put(key, generation, response)
+            return response
+
+        return cached_handler
+
+    @staticmethod
+    def wrap_mutating(handler: Callable) -> Callable:
+        def mutating_handler(request: Any, context: Any) -> Any:
+            try:
+                return handler(request, context)
+            finally:
+                bump_write_generation()
+
+        return mutating_handler
+
+
+def get_response_cache_ttl() -> float:
+    return float(os.getenv("AGENT_STUDIO_GRPC_RESPONSE_CACHE_TTL", "30"))
+
+
+def get_response_cache_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_GRPC_RESPONSE_CACHE_SIZE", "256"))
+
+
+def install_response_cache(servicer: Any, cache: Optional[ResponseCache] = None) -> Optional[ResponseCache]:
+    """
+    Serve the cached RPCs of a servicer from a response cache, and invalidate the
+    cache after each of its mutating RPCs. Returns the cache, or None if caching is
+    disabled.
+    """
+    if cache is None:
+        ttl = get_response_cache_ttl()
+        if ttl <= 0:
+            return None
+        cache = ResponseCache(ttl, max_entries=get_response_cache_size())
+    for method in agent_studio_pb2.DESCRIPTOR.services_by_name["AgentStudio"].methods:
+        if method.server_streaming:
+            continue
+        if method.name in CACHED_RPCS and not method.client_streaming:
+            setattr(servicer, method.name, cache.wrap_cached(method.name, getattr(servicer, method.name)))
+        elif is_mutating_rpc(method.name):
+            setattr(servicer, method.name, cache.wrap_mutating(getattr(servicer, method.name)))
+    return cache
@@ -0,0 +1,229 @@
+"""
+Concurrency classes of the studio's gRPC methods. Every RPC is routed to one of:
+
+  * fast_read: cheap database reads (List*, Get*, HealthCheck),
+  * write: database writes (Add*, Update*, Remove*, ...),
+  * long_running: calls waiting on external services (LLMs, the CML API, the ops
+    server, git),
+  * file_transfer: uploads, downloads and template import/export,
+  * watch: the long-lived Watch* change streams,
+  * event_stream: the StreamWorkflowEvents streams, open for a whole test run,
+
+and each class has its own concurrency limit and timeout, so that a burst of
+TestModel or DeployWorkflow calls can only exhaust the long_running class, and
+never starves ListWorkflows or HealthCheck. Limits and timeouts are configured with
+AGENT_STUDIO_GRPC_<CLASS>_CONCURRENCY and AGENT_STUDIO_GRPC_<CLASS>_TIMEOUT (in
+seconds), e.g. AGENT_STUDIO_GRPC_LONG_RUNNING_CONCURRENCY.
+
+The threaded server enforces the classes with RpcClassServerInterceptor; the
+asyncio server (studio.aio_service) runs each class on its own worker pool.
+"""
+
+from typing import Any, Callable, Dict, Optional
+import os
+import threading
+
+import grpc
+from pydantic import BaseModel
+
+from studio.proto import agent_studio_pb2
+
+
+FAST_READ = "fast_read"
+WRITE = "write"
+LONG_RUNNING = "long_running"
+FILE_TRANSFER = "file_transfer"
+WATCH = "watch"
+EVENT_STREAM = "event_stream"
+
+# RPCs that don't follow the naming-based routing of get_rpc_class_name.
+RPC_CLASS_OVERRIDES = {
+    "HealthCheck": FAST_READ,
+    # Polled by the UI and the SDK while runs are in progress. Served from the trace
+    # index, or with one targeted ops server query for traces not resolved yet.
+    "ResolveWorkflowTrace": FAST_READ,
+    "TestModel": LONG_RUNNING,
+    "TestAgent": LONG_RUNNING,
+    "TestWorkflow": LONG_RUNNING,
+    "StreamWorkflowEvents": EVENT_STREAM,
+    "DeployWorkflow": LONG_RUNNING,
+    "UndeployWorkflow": LONG_RUNNING,
+    "ListDeployedWorkflows": LONG_RUNNING,
+    "GetParentProjectDetails": LONG_RUNNING,
+    "CheckStudioUpgradeStatus": LONG_RUNNING,
+    "UpgradeStudio": LONG_RUNNING,
+    "TemporaryFileUpload": FILE_TRANSFER,
+    "NonStreamingTemporaryFileUpload": FILE_TRANSFER,
+    "DownloadTemporaryFile": FILE_TRANSFER,
+    "GetAssetData": FILE_TRANSFER,
+    "ExportWorkflowTemplate": FILE_TRANSFER,
+    "ImportWorkflowTemplate": FILE_TRANSFER,
+}
+
+# Default (concurrency, timeout in seconds) of every class.
+DEFAULT_RPC_CLASS_LIMITS = {
+    FAST_READ: (8, 30.0),
+    WRITE: (4, 60.0),
+    LONG_RUNNING: (8, 600.0),
+    FILE_TRANSFER: (4, 300.0),
+    # Watch streams wait for changes for up to consts.WATCH_HEARTBEAT_SECONDS at a time.
+    WATCH: (16, 60.0),
+    # Workflow events can be minutes apart, and streams end with their run (see
+    # consts.WORKFLOW_EVENT_STREAM_TIMEOUT_SECONDS).
+    EVENT_STREAM: (16, 3600.0),
+}
+
+
+class RpcClass(BaseModel):
+    """
+    A concurrency class of RPCs. At most `concurrency` calls of the class are
+    handled at a time. `timeout` bounds, in seconds, how long a call may wait for
+    a free slot of its class and, in the asyncio server, how long a unary call (or
+    each message of a response stream) may take.
+    """
+
+    name: str
+    concurrency: int
+    timeout: float
+
+
+def get_rpc_class_name(method: str) -> str:
+    """
+    Route an RPC, given by its method name, to its concurrency class.
+    """
+    if method in RPC_CLASS_OVERRIDES:
+        return RPC_CLASS_OVERRIDES[method]
+    if method.startswith("Watch"):
+        return WATCH
+    if method.startswith(("List", "Get")):
+        return FAST_READ
+    return WRITE
+
+
+def get_rpc_classes() -> Dict[str, RpcClass]:
+    """
+    The concurrency classes, keyed by name, with limits read from the environment.
+    """
+    rpc_classes = {}
+    for name, (concurrency, timeout) in DEFAULT_RPC_CLASS_LIMITS.items():
+        prefix = f"AGENT_STUDIO_GRPC_{name.upper()}"
+        rpc_classes[name] = RpcClass(
+            name=name,
+            concurrency=int(os.getenv(f"{prefix}_CONCURRENCY", str(concurrency))),
+            timeout=float(os.getenv(f"{prefix}_TIMEOUT", str(timeout))),
+        )
+    return rpc_classes
+
+
+def get_rpc_method_classes(rpc_classes: Optional[Dict[str, RpcClass]] = None) -> Dict[str, RpcClass]:
+    """
+    The concurrency class of every RPC of the AgentStudio service, keyed by method name.
+    """
+    rpc_classes = rpc_classes or get_rpc_classes()
+    return {
+        method.name: rpc_classes[get_rpc_class_name(method.name)]
+        for method in agent_studio_pb2.DESCRIPTOR.services_by_name["AgentStudio"].methods
+    }
+
+
+def get_thread_server_workers(rpc_classes: Optional[Dict[str, RpcClass]] = None) -> int:
+    """
+    Worker threads a threaded server needs so that every class can run and queue
+    up to its limit at the same time (see RpcClassServerInterceptor).
+    """
+    rpc_classes = rpc_classes or get_rpc_classes()
+    return 2 * sum(rpc_class.concurrency for rpc_class in rpc_classes.values())
+
+
+class _RpcClassSlots:
+    """
+    Running and waiting slots of one class on the threaded server. A call waits
+    for a running slot only if fewer than `concurrency` calls are already waiting,
+    so the calls of a class never hold more than 2 * `concurrency` server workers.
+    """
+
+    def __init__(self, rpc_class: RpcClass):
+        self.rpc_class = rpc_class
+        self.running = threading.BoundedSemaphore(rpc_class.concurrency)
+        self.waiting = threading.BoundedSemaphore(rpc_class.concurrency)
+
+    def acquire(self, context: grpc.ServicerContext) -> bool:
+        if self.running.acquire(blocking=False):
+            return True
+        if not self.waiting.acquire(blocking=False):
+            return False
+        try:
+            timeout = self.rpc_class.timeout
+            time_remaining = context.time_remaining()
+            if time_remaining is not None:
+                timeout = min(timeout, time_remaining)
+            return self.running.acquire(timeout=max(timeout, 0))
+        finally:
+            self.waiting.release()
+
+    def release(self) -> None:
+        self.running.release()
+
+
+class RpcClassServerInterceptor(grpc.ServerInterceptor):
+    """
+    Enforces the concurrency limits of the RPC classes on the threaded server.
+    Calls beyond the limit of their class (and its queue) are rejected with
+    RESOURCE_EXHAUSTED instead of occupying the server's shared worker threads.
+    The server needs get_thread_server_workers() workers. Handlers running on the
+    server's own threads can't be preempted, so class timeouts only bound the wait
+    for a slot here.
+    """
+
+    def __init__(self, rpc_classes: Optional[Dict[str, RpcClass]] = None):
+        rpc_classes = rpc_classes or get_rpc_classes()
+        class_slots = {name: _RpcClassSlots(rpc_class) for name, rpc_class in rpc_classes.items()}
+        self.slots = {
+            method: class_slots[rpc_class.name] for method, rpc_class in get_rpc_method_classes(rpc_classes).items()
+        }
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        slots = self.slots.get(handler_call_details.method.rsplit("/", 1)[-1])
+        if slots is None:
+            return handler
+        if handler.unary_unary:
+            return handler._replace(unary_unary=self._wrap_unary_response(handler.unary_unary, slots))
+        if handler.stream_unary:
+            return handler._replace(stream_unary=self._wrap_unary_response(handler.stream_unary, slots))
+        if handler.unary_stream:
+            return handler._replace(unary_stream=self._wrap_stream_response(handler.unary_stream, slots))
+        if handler.stream_stream:
+            return handler._replace(stream_stream=self._wrap_stream_response(handler.stream_stream, slots))
+        return handler
+
+    @staticmethod
+    def _reject(context: grpc.ServicerContext, slots: _RpcClassSlots) -> None:
+        context.abort(
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+            f"Too many concurrent {slots.rpc_class.name} requests, please retry later.",
+        )
+
+    def _wrap_unary_response(self, behavior: Callable, slots: _RpcClassSlots) -> Callable:
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            if not slots.acquire(context):
+                self._reject(context, slots)
+            try:
+                return behavior(request, context)
+            finally:
+                slots.release()
+
+        return wrapper
+
+    def _wrap_stream_response(self, behavior: Callable, slots: _RpcClassSlots) -> Callable:
+        def wrapper(request: Any, context: grpc.ServicerContext) -> Any:
+            if not slots.acquire(context):
+                self._reject(context, slots)
+            try:
+                yield from behavior(request, context)
+            finally:
+                slots.release()
+
+        return wrapper
@@ -0,0 +1,142 @@
+from typing import Callable, Dict, Iterator
+import time
+
+from cmlapi import CMLServiceApi
+
+from studio import consts
+from studio.agents.agent import get_agent
+from studio.api import *
+from studio.cross_cutting.change_log import CREATED, UPDATED, EntityChange, get_change_log, merge_changes
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+from studio.task.task import get_task
+from studio.tools.tool_instance import get_tool_instance
+from studio.workflow.workflow import get_workflow
+
+
+SYNC = "SYNC"
+RESET = "RESET"
+HEARTBEAT = "HEARTBEAT"
+
+
+def _get_deployed_workflow(deployed_workflow_id: str, dao: AgentStudioDao) -> DeployedWorkflow:
+    """
+    The stored details of a deployed workflow. The status of its CML model and
+    application are only available from ListDeployedWorkflows.
+    """
+    with dao.get_session() as session:
+        deployed_workflow = session.query(db_model.DeployedWorkflowInstance).filter_by(id=deployed_workflow_id).one()
+        return DeployedWorkflow(
+            deployed_workflow_id=deployed_workflow.id,
+            workflow_id=deployed_workflow.workflow_id,
+            workflow_name=deployed_workflow.workflow.name,
+            deployed_workflow_name=deployed_workflow.name,
+            cml_deployed_model_id=deployed_workflow.cml_deployed_model_id or "",
+            is_stale=bool(deployed_workflow.is_stale),
+        )
+
+
+# How to get an entity of each type, as the EntityChangeEvent field to send it in.
+ENTITY_GETTERS: Dict[str, Callable] = {
+    "workflow": lambda entity_id, cml, dao: get_workflow(
+        GetWorkflowRequest(workflow_id=entity_id), cml, dao=dao
+    ).workflow,
+    "agent": lambda entity_id, cml, dao: get_agent(GetAgentRequest(agent_id=entity_id), cml, dao=dao).agent,
+    "task": lambda entity_id, cml, dao: get_task(GetTaskRequest(task_id=entity_id), cml, dao=dao).task,
+    "tool_instance": lambda entity_id, cml, dao: get_tool_instance(
+        GetToolInstanceRequest(tool_instance_id=entity_id), cml, dao=dao
+    ).tool_instance,
+    "deployed_workflow": lambda entity_id, cml, dao: _get_deployed_workflow(entity_id, dao),
+}
+
+
+def _get_change_event(change: EntityChange, cml: CMLServiceApi, dao: AgentStudioDao) -> EntityChangeEvent:
+    event = EntityChangeEvent(
+        sequence=change.sequence,
+        change_type=change.change_type,
+        entity_type=change.entity_type,
+        entity_id=change.entity_id,
+        workflow_id=change.workflow_id,
+        change_log_id=get_change_log().id,
+    )
+    if change.change_type in (CREATED, UPDATED):
+        try:
+            entity = ENTITY_GETTERS[change.entity_type](change.entity_id, cml, dao)
+            getattr(event, change.entity_type).CopyFrom(entity)
+        except Exception:
+            # The entity was deleted since, and its DELETED change follows.
+            pass
+    return event
+
+
+def watch_entities(
+    request: WatchRequest, entity_type: str, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> Iterator[EntityChangeEvent]:
+    """
+    Stream the changes of one type of entity from the change log. A new watch
+    starts with a SYNC event; a watch resumed with a sequence number whose changes
+    are no longer available starts with a RESET event. Changes that the stream
+    catches up on at once are merged per entity, and every created or updated
+    entity is sent with its current state. Heartbeats are sent while nothing
+    changes, and the stream ends after consts.WATCH_STREAM_TIMEOUT_SECONDS.
+    """
+    change_log = get_change_log()
+    since = request.since_sequence
+    if not request.change_log_id:
+        since = change_log.get_sequence()
+        yield EntityChangeEvent(sequence=since, change_type=SYNC, change_log_id=change_log.id)
+    elif request.change_log_id != change_log.id:
+        # The sequence number is from a previous server process.
+        since = change_log.get_sequence()
+        yield EntityChangeEvent(sequence=since, change_type=RESET, change_log_id=change_log.id)
+
+    deadline = time.monotonic() + consts.WATCH_STREAM_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if not change_log.has_changes_since(since):
+            since = change_log.get_sequence()
+            yield EntityChangeEvent(sequence=since, change_type=RESET, change_log_id=change_log.id)
+
+        changes = change_log.wait_for_changes(since, timeout=consts.WATCH_HEARTBEAT_SECONDS)
+        if not changes:
+            yield EntityChangeEvent(sequence=since, change_type=HEARTBEAT, change_log_id=change_log.id)
+            continue
+        since = changes[-1].sequence
+
+        watched = [
+            change
+            for change in changes
+            if change.entity_type == entity_type
+            and (not request.workflow_id or change.workflow_id == request.workflow_id)
+        ]
+        for change in merge_changes(watched):
+            yield _get_change_event(change, cml, dao)
+
+
+def watch_workflows(
+    request: WatchRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> Iterator[EntityChangeEvent]:
+    return watch_entities(request, "workflow", cml, dao=dao)
+
+
+def watch_agents(
+    request: WatchRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> Iterator[EntityChangeEvent]:
+    return watch_entities(request, "agent", cml, dao=dao)
+
+
+def watch_tasks(
+    request: WatchRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> Iterator[EntityChangeEvent]:
+    return watch_entities(request, "task", cml, dao=dao)
+
+
+def watch_tool_instances(
+    request: WatchRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> Iterator[EntityChangeEvent]:
+    return watch_entities(request, "tool_instance", cml, dao=dao)
+
+
+def watch_deployed_workflows(
+    request: WatchRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> Iterator[EntityChangeEvent]:
+    return watch_entities(request, "deployed_workflow", cml, dao=dao)
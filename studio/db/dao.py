@@ -1,10 +1,14 @@
 
 from studio.db.model import Base
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from contextlib import contextmanager
 from studio.consts import DEFAULT_SQLITE_DB_LOCATION
+from studio.cross_cutting.metrics import DB_SESSION_DURATION
+from studio.cross_cutting.response_cache import CACHED_TABLES, bump_write_generation
+from studio.cross_cutting.change_log import CREATED, DELETED, UPDATED, get_change_log, get_entity_change
+import time
 import os
 
 
@@ -31,6 +35,35 @@ def delete_database() -> None:
     return
 
 
+def _record_session_changes(session, flush_context) -> None:
+    session.info["has_writes"] = True
+    changes = session.info.setdefault("changes", [])
+    for change_type, entities in [(CREATED, session.new), (UPDATED, session.dirty), (DELETED, session.deleted)]:
+        for entity in entities:
+            if change_type == UPDATED and not session.is_modified(entity):
+                continue
+            if getattr(entity, "__tablename__", None) in CACHED_TABLES:
+                session.info["writes_cached_tables"] = True
+            change = get_entity_change(entity, change_type)
+            if change is not None:
+                changes.append(change)
+
+
+def _publish_session_changes(session) -> None:
+    if session.info.pop("has_writes", False):
+        get_change_log().append(session.info.pop("changes", []))
+        # Writes to other tables, like the trace index and run metrics written during
+        # runs, don't invalidate cached responses.
+        if session.info.pop("writes_cached_tables", False):
+            bump_write_generation()
+
+
+def _discard_session_changes(session) -> None:
+    session.info.pop("has_writes", None)
+    session.info.pop("writes_cached_tables", None)
+    session.info.pop("changes", None)
+
+
 class AgentStudioDao():
     """
     Data access layer for the Fine Tuning Studio application. In the future,
@@ -51,6 +84,11 @@ class AgentStudioDao():
         )
         self.Session = sessionmaker(
             bind=self.engine, autoflush=True, autocommit=False)
+        # Record the changes of every session as it flushes, to publish them to the
+        # change log and invalidate cached responses once they're committed.
+        event.listen(self.Session, "after_flush", _record_session_changes)
+        event.listen(self.Session, "after_commit", _publish_session_changes)
+        event.listen(self.Session, "after_rollback", _discard_session_changes)
 
         # Create all of our required tables if they do not yet exist.
         Base.metadata.create_all(self.engine)
@@ -64,11 +102,15 @@ class AgentStudioDao():
         the session once complete, releasing the sesion back to the session pool.
         """
         session = self.Session()
+        start = time.perf_counter()
+        result = "success"
         try:
             yield session
             session.commit()  # Commit on successful operation
         except Exception as e:
+            result = "error"
             session.rollback()  # Rollback in case of error
             raise e
         finally:
             session.close()
+            DB_SESSION_DURATION.observe(time.perf_counter() - start, result=result)
@@ -316,6 +316,42 @@ class TaskTemplate(Base, MappedProtobuf, MappedDict):
         )
 
 
+class WorkflowTrace(Base, MappedDict):
+    """
+    Index of workflow run traces to their location in the ops server, so that run
+    events can be fetched without searching every ops project for the trace.
+    """
+    __tablename__ = "workflow_traces"
+
+    trace_id = Column(String, primary_key=True, nullable=False)  # Local (hex) trace ID returned from a kickoff
+    workflow_id = Column(String, nullable=True)  # Workflow that was run, if known
+    project_name = Column(String, nullable=True)  # Ops project the run reports to, if known
+    project_id = Column(String, nullable=True)  # Global ID of the ops project, once resolved
+    global_trace_id = Column(String, nullable=True)  # Global ID of the trace in the ops server, once resolved
+    created_at = Column(Float, nullable=True)  # When the trace was indexed, in seconds since the epoch
+
+
+class WorkflowRunMetric(Base, MappedDict):
+    """
+    Token counts and durations of a completed workflow run. Every run has one "run"
+    scoped row, and one row per agent, tool and language model used in the run.
+    """
+    __tablename__ = "workflow_run_metrics"
+
+    id = Column(String, primary_key=True, nullable=False)
+    trace_id = Column(String, nullable=False)  # Local (hex) trace ID of the run
+    workflow_id = Column(String, nullable=True, index=True)  # Workflow that was run, if known
+    scope = Column(String, nullable=False)  # "run", "agent", "tool" or "model"
+    name = Column(String, nullable=True)  # Agent studio ID, tool name or model name. The workflow ID for runs.
+    started_at = Column(Float, nullable=False, index=True)  # Start of the run, in seconds since the epoch
+    duration_seconds = Column(Float, nullable=True)  # Total duration. Not known for models.
+    call_count = Column(Integer, nullable=False, default=0)  # Runs, tasks, tool calls or LLM requests
+    error_count = Column(Integer, nullable=False, default=0)
+    prompt_tokens = Column(Integer, nullable=True)  # Token counts. Not known for tools.
+    completion_tokens = Column(Integer, nullable=True)
+    total_tokens = Column(Integer, nullable=True)
+
+
 # Table-to-model mapping
 TABLE_TO_MODEL_REGISTRY = {
     "models": Model,
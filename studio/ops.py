@@ -3,36 +3,26 @@ import sys
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
-from studio.consts import AGENT_STUDIO_OPS_APPLICATION_NAME
-from studio.cross_cutting.utils import get_application_by_name
-from cmlapi import Application
 from phoenix.otel import register
-import cmlapi
-import os
+from typing import Optional, Tuple
 from gql import Client
 from gql.transport.requests import RequestsHTTPTransport
-from phoenix.otel import register
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
+import requests
+import os
 
+# Import engine code manually. Eventually when this code becomes
+# a separate git repo, or a custom runtime image, this path call
+# will go away and workflow engine features will be available already.
+sys.path.append("studio/workflow_engine/src/")
 
-def get_ops_provider() -> str:
-    return os.getenv("AGENT_STUDIO_OPS_PROVIDER", "phoenix")
+from engine.ops import get_ops_endpoint, invalidate_ops_endpoint_cache
 
 
-def get_ops_endpoint() -> str:
-    """
-    Get the current operational endpoint of the
-    Agent observability server. This can be overridden
-    by an endpoint specified in an environment variable. If this
-    env variable does not exist, extract the endpoint information
-    from the running ops application directly. This env var override
-    option is to make sure CML models can also reach the ops endpoint.
-    """
-    if os.getenv("AGENT_STUDIO_OPS_ENDPOINT"):
-        return os.getenv("AGENT_STUDIO_OPS_ENDPOINT")
-
-    cml = cmlapi.default_client()
-    application: Application = get_application_by_name(cml, AGENT_STUDIO_OPS_APPLICATION_NAME)
-    return f"https://{application.subdomain}.{os.getenv('CDSW_DOMAIN')}"
+def get_ops_provider() -> str:
+    return os.getenv("AGENT_STUDIO_OPS_PROVIDER", "phoenix")
 
 
 def get_ops_iframe_url() -> str:
@@ -68,21 +58,92 @@ def get_phoenix_ops_tracer_provider(workflow_name: str):
     return tracer_provider
 
 
+class PooledRequestsHTTPTransport(RequestsHTTPTransport):
+    """
+    GraphQL transport that keeps one pooled, keep-alive HTTP session for its whole
+    lifetime. RequestsHTTPTransport opens and closes a session around every
+    execution, which prevents connection reuse and makes a shared client fail when
+    two threads execute at the same time. Failed connections and 429/5xx responses
+    are retried with exponential backoff.
+    """
+
+    def __init__(self, *args, pool_maxsize: int = 10, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_maxsize = pool_maxsize
+        self._session_lock = threading.Lock()
+
+    def connect(self):
+        with self._session_lock:
+            if self.session is not None:
+                return
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=Retry(
+                    total=self.retries,
+                    backoff_factor=self.retry_backoff_factor,
+                    status_forcelist=self.retry_status_forcelist,
+                    allowed_methods=None,
+                ),
+            )
+            for prefix in "http://", "https://":
+                session.mount(prefix, adapter)
+            self.session = session
+
+    def execute(self, *args, **kwargs):
+        try:
+            return super().execute(*args, **kwargs)
+        except requests.exceptions.ConnectionError:
+            # The ops application may have been restarted elsewhere; discover it again
+            # on the next call.
+            invalidate_ops_endpoint_cache()
+            raise
+
+    def close(self):
+        # Called by the client after every execution; the session is kept open for
+        # the next one. See shutdown.
+        pass
+
+    def shutdown(self):
+        """
+        Close the pooled session and its connections.
+        """
+        with self._session_lock:
+            super().close()
+
+
+# The process-wide GraphQL client, with the (endpoint, API key) it was created for.
+_ops_graphql_client: Optional[Tuple[Tuple[str, Optional[str]], Client]] = None
+_ops_graphql_client_lock = threading.Lock()
+
+
 def get_phoenix_ops_graphql_client() -> Client:
     """
     Returns a client to the phoenix graphql server. Users can make generic
     requests about the current projects/workflows and resources stored in phoenix.
+    The client is shared by the whole process and reuses its HTTP connections; it
+    is only recreated when the ops endpoint or the API key changes.
 
     https://docs.arize.com/arize/resources/graphql-api
     """
 
+    global _ops_graphql_client
     ops_addr = get_ops_endpoint()
-
-    # Set up the GraphQL client
-    transport = RequestsHTTPTransport(
-        url=f"{ops_addr}/graphql",  # Replace with your GraphQL endpoint
-        # Add authentication headers if required
-        headers={"Content-Type": "application/json", "Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
-    )
-    client = Client(transport=transport, fetch_schema_from_transport=False)
-    return client
+    api_key = os.getenv("CDSW_APIV2_KEY")
+
+    with _ops_graphql_client_lock:
+        if _ops_graphql_client and _ops_graphql_client[0] == (ops_addr, api_key):
+            return _ops_graphql_client[1]
+
+        # Set up the GraphQL client
+        transport = PooledRequestsHTTPTransport(
+            url=f"{ops_addr}/graphql",
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"},
+            timeout=int(os.getenv("AGENT_STUDIO_OPS_GRAPHQL_TIMEOUT", "30")),
+            retries=int(os.getenv("AGENT_STUDIO_OPS_GRAPHQL_RETRIES", "3")),
+            retry_backoff_factor=float(os.getenv("AGENT_STUDIO_OPS_GRAPHQL_RETRY_BACKOFF", "0.5")),
+        )
+        client = Client(transport=transport, fetch_schema_from_transport=False)
+        _ops_graphql_client = ((ops_addr, api_key), client)
+        return client
@@ -0,0 +1,276 @@
+"""
+Trace retention for the Phoenix ops server.
+
+The ops server keeps every span of every test and deployed workflow run, and its
+GraphQL span lookups slow down as the store grows. The retention job deletes the
+traces of each ops project that are older than the project's maximum age, and then
+compacts the ops server's SQLite database to return the freed pages to the disk.
+The deleted traces are also removed from the studio's trace index.
+
+Maximum ages are configured with a default and per-project overrides, whose keys are
+project names or glob patterns of project names:
+
+    AGENT_STUDIO_OPS_TRACE_RETENTION_DAYS=30
+    AGENT_STUDIO_OPS_TRACE_RETENTION_PROJECTS='{"Test Workflow - *": 7, "Production Workflow": 0}'
+
+A maximum age of 0 keeps a project's traces forever, and retention is disabled
+altogether when no ages are configured. A dry run reports what would be deleted,
+with an estimate of the reclaimed space, without changing anything.
+"""
+
+from typing import Any, Dict, Optional
+from datetime import datetime, timedelta, timezone
+from fnmatch import fnmatchcase
+from gql import gql, Client
+from gql.transport.requests import RequestsHTTPTransport
+from pydantic import BaseModel
+import threading
+import sqlite3
+import json
+import time
+import os
+
+from studio.consts import DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT
+from studio.db.dao import AgentStudioDao
+from studio.workflow.traces import remove_workflow_traces
+
+
+class TraceRetentionPolicy(BaseModel):
+    """
+    Maximum age of the traces of ops projects, in days. A maximum age of 0 keeps
+    traces forever.
+    """
+
+    default_max_age_days: float = 0
+    # Maximum ages by project name or glob pattern of project names. Exact names take
+    # precedence over patterns.
+    project_max_age_days: Dict[str, float] = {}
+    # Compact the ops database after deleting traces.
+    compact: bool = True
+
+    def get_max_age_days(self, project_name: str) -> float:
+        if project_name in self.project_max_age_days:
+            return self.project_max_age_days[project_name]
+        for pattern, max_age_days in self.project_max_age_days.items():
+            if fnmatchcase(project_name, pattern):
+                return max_age_days
+        return self.default_max_age_days
+
+    def is_enabled(self) -> bool:
+        return self.default_max_age_days > 0 or any(age > 0 for age in self.project_max_age_days.values())
+
+
+def get_trace_retention_policy() -> TraceRetentionPolicy:
+    return TraceRetentionPolicy(
+        default_max_age_days=float(os.getenv("AGENT_STUDIO_OPS_TRACE_RETENTION_DAYS", "0")),
+        project_max_age_days=json.loads(os.getenv("AGENT_STUDIO_OPS_TRACE_RETENTION_PROJECTS", "{}")),
+        compact=os.getenv("AGENT_STUDIO_OPS_TRACE_RETENTION_COMPACT", "true").lower() == "true",
+    )
+
+
+def get_local_ops_graphql_client() -> Client:
+    """
+    Client to the GraphQL endpoint of the Phoenix server running in this pod, which
+    doesn't go through the authenticated application proxy.
+    """
+    port = os.getenv("AGENT_STUDIO_OPS_PORT", DEFAULT_AS_PHOENIX_OPS_PLATFORM_PORT)
+    transport = RequestsHTTPTransport(
+        url=f"http://127.0.0.1:{port}/graphql", headers={"Content-Type": "application/json"}
+    )
+    return Client(transport=transport, fetch_schema_from_transport=False)
+
+
+def get_ops_database_path() -> Optional[str]:
+    """
+    Location of the Phoenix SQLite database, or None if Phoenix is configured with
+    a database other than SQLite.
+    """
+    database_url = os.getenv("PHOENIX_SQL_DATABASE_URL")
+    if database_url:
+        return database_url.split(":///", 1)[1] if database_url.startswith("sqlite:///") else None
+    working_dir = os.getenv("PHOENIX_WORKING_DIR", os.path.join(os.path.expanduser("~"), ".phoenix"))
+    return os.path.join(working_dir, "phoenix.db")
+
+
+def _format_time(value: datetime) -> str:
+    return value.astimezone(timezone.utc).isoformat()
+
+
+# Start of the time range that counts every trace before a cutoff.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def plan_trace_retention(
+    client: Client, policy: TraceRetentionPolicy, now: Optional[datetime] = None, database_path: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Find the traces of every ops project that are older than the project's maximum
+    age. The reclaimed space is estimated from the size of the ops database and
+    the share of its spans that would be deleted.
+    """
+    now = now or datetime.now(timezone.utc)
+    result = client.execute(
+        gql(
+            """
+            query GetProjectsForTraceRetention {
+              projects(first: 1000) {
+                edges {
+                  node {
+                    id
+                    name
+                    traceCount
+                    recordCount
+                  }
+                }
+              }
+            }
+            """
+        )
+    )
+    projects = [edge["node"] for edge in result["projects"]["edges"]]
+
+    project_plans = []
+    for project in projects:
+        max_age_days = policy.get_max_age_days(project["name"])
+        if max_age_days <= 0:
+            continue
+        cutoff = now - timedelta(days=max_age_days)
+        counts = client.execute(
+            gql(
+                """
+                query GetProjectTraceCountsBefore($id: GlobalID!, $timeRange: TimeRange!) {
+                  node(id: $id) {
+                    ... on Project {
+                      traceCount(timeRange: $timeRange)
+                      recordCount(timeRange: $timeRange)
+                    }
+                  }
+                }
+                """
+            ),
+            variable_values={
+                "id": project["id"],
+                "timeRange": {"start": _format_time(_EPOCH), "end": _format_time(cutoff)},
+            },
+        )["node"]
+        if not counts["traceCount"]:
+            continue
+        project_plans.append(
+            {
+                "projectId": project["id"],
+                "projectName": project["name"],
+                "maxAgeDays": max_age_days,
+                "cutoff": _format_time(cutoff),
+                "traceCount": counts["traceCount"],
+                "spanCount": counts["recordCount"],
+            }
+        )
+
+    total_span_count = sum(project["recordCount"] or 0 for project in projects)
+    deleted_span_count = sum(plan["spanCount"] for plan in project_plans)
+    database_size = os.path.getsize(database_path) if database_path and os.path.exists(database_path) else None
+    estimated_reclaimed_bytes = None
+    if database_size is not None and total_span_count:
+        estimated_reclaimed_bytes = int(database_size * deleted_span_count / total_span_count)
+    return {
+        "projects": project_plans,
+        "traceCount": sum(plan["traceCount"] for plan in project_plans),
+        "spanCount": deleted_span_count,
+        "databaseSizeBytes": database_size,
+        "estimatedReclaimedBytes": estimated_reclaimed_bytes,
+    }
+
+
+def compact_ops_database(database_path: str) -> int:
+    """
+    Rebuild the ops database to release the pages of deleted traces. Phoenix keeps
+    serving while the database is compacted, but writes wait until it is done.
+    Returns the number of reclaimed bytes.
+    """
+    size_before = os.path.getsize(database_path)
+    connection = sqlite3.connect(database_path, timeout=60)
+    try:
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    return size_before - os.path.getsize(database_path)
+
+
+def run_trace_retention(
+    client: Optional[Client] = None,
+    policy: Optional[TraceRetentionPolicy] = None,
+    dry_run: bool = False,
+    database_path: Optional[str] = None,
+    dao: Optional[AgentStudioDao] = None,
+) -> Dict[str, Any]:
+    """
+    Delete the traces of every ops project that are older than the project's maximum
+    age, and compact the ops database. With a DAO, the deleted traces are removed
+    from the studio's trace index too. Returns a report of the deleted traces. With
+    dry_run, only reports what would be deleted.
+    """
+    client = client or get_local_ops_graphql_client()
+    policy = policy or get_trace_retention_policy()
+    database_path = database_path or get_ops_database_path()
+
+    report = plan_trace_retention(client, policy, database_path=database_path)
+    report["dryRun"] = dry_run
+    if dry_run or not report["projects"]:
+        return report
+
+    if dao is not None:
+        report["removedIndexedTraces"] = 0
+    for project_plan in report["projects"]:
+        # Clearing a project deletes its traces that started before the end time.
+        client.execute(
+            gql(
+                """
+                mutation ClearProjectTraces($input: ClearProjectInput!) {
+                  clearProject(input: $input) {
+                    __typename
+                  }
+                }
+                """
+            ),
+            variable_values={"input": {"id": project_plan["projectId"], "endTime": project_plan["cutoff"]}},
+        )
+        if dao is not None:
+            report["removedIndexedTraces"] += remove_workflow_traces(
+                project_plan["projectId"],
+                project_plan["projectName"],
+                before=datetime.fromisoformat(project_plan["cutoff"]).timestamp(),
+                dao=dao,
+            )
+    if policy.compact and database_path and os.path.exists(database_path):
+        try:
+            report["reclaimedBytes"] = compact_ops_database(database_path)
+        except sqlite3.Error as e:
+            print(f"Failed to compact the ops database: {e}")
+    return report
+
+
+def start_trace_retention_scheduler(interval_seconds: Optional[float] = None) -> Optional[threading.Thread]:
+    """
+    Run the trace retention job periodically in a daemon thread, if a retention
+    policy is configured. The first run happens one interval after the start.
+    """
+    if not get_trace_retention_policy().is_enabled():
+        return None
+    interval_seconds = interval_seconds or float(os.getenv("AGENT_STUDIO_OPS_TRACE_RETENTION_INTERVAL", "86400"))
+
+    def run_periodically():
+        dao = AgentStudioDao()
+        while True:
+            time.sleep(interval_seconds)
+            try:
+                report = run_trace_retention(dao=dao)
+                print(
+                    f"Trace retention deleted {report['traceCount']} traces ({report['spanCount']} spans) "
+                    f"from {len(report['projects'])} ops projects."
+                )
+            except Exception as e:
+                print(f"Trace retention failed: {e}")
+
+    thread = threading.Thread(target=run_periodically, name="ops_trace_retention", daemon=True)
+    thread.start()
+    return thread
@@ -143,12 +143,22 @@ export interface GetStudioDefaultModelResponse {
 /** Messages for ListToolTemplates */
 export interface ListToolTemplatesRequest {
   /** Optional workflow template */
-  workflow_template_id?: string | undefined;
+  workflow_template_id?:
+    | string
+    | undefined;
+  /** Maximum number of templates to return, all of them if unset */
+  page_size: number;
+  /** next_page_token of the previous page, to get the next page */
+  page_token: string;
+  /** Names of the fields of each template to return, all of them if empty */
+  read_mask: string[];
 }
 
 export interface ListToolTemplatesResponse {
   /** List of tool templates */
   templates: ToolTemplate[];
+  /** Token to get the next page with, empty on the last page */
+  next_page_token: string;
 }
 
 /** Messages for GetToolTemplate */
@@ -201,11 +211,21 @@ export interface RemoveToolTemplateResponse {
 /** Messages for ListToolInstances */
 export interface ListToolInstancesRequest {
   /** Optional workflow id */
-  workflow_id?: string | undefined;
+  workflow_id?:
+    | string
+    | undefined;
+  /** Maximum number of tool instances to return, all of them if unset */
+  page_size: number;
+  /** next_page_token of the previous page, to get the next page */
+  page_token: string;
+  /** Names of the fields of each tool instance to return, all of them if empty */
+  read_mask: string[];
 }
 
 export interface ListToolInstancesResponse {
   tool_instances: ToolInstance[];
+  /** Token to get the next page with, empty on the last page */
+  next_page_token: string;
 }
 
 /** Messages for GetToolInstance */
@@ -303,12 +323,22 @@ export interface ToolInstance {
 /** Agent Messages */
 export interface ListAgentsRequest {
   /** Optional workflow id */
-  workflow_id?: string | undefined;
+  workflow_id?:
+    | string
+    | undefined;
+  /** Maximum number of agents to return, all of them if unset */
+  page_size: number;
+  /** next_page_token of the previous page, to get the next page */
+  page_token: string;
+  /** Names of the fields of each agent to return, all of them if empty */
+  read_mask: string[];
 }
 
 export interface ListAgentsResponse {
   /** A list of agents with metadata */
   agents: AgentMetadata[];
+  /** Token to get the next page with, empty on the last page */
+  next_page_token: string;
 }
 
 export interface GetAgentRequest {
@@ -467,11 +497,19 @@ export interface AddWorkflowResponse {
 
 /** Messages for listing workflows */
 export interface ListWorkflowsRequest {
+  /** Maximum number of workflows to return, all of them if unset */
+  page_size: number;
+  /** next_page_token of the previous page, to get the next page */
+  page_token: string;
+  /** Names of the fields of each workflow to return, all of them if empty */
+  read_mask: string[];
 }
 
 export interface ListWorkflowsResponse {
   /** List of workflows */
   workflows: Workflow[];
+  /** Token to get the next page with, empty on the last page */
+  next_page_token: string;
 }
 
 /** Messages for retrieving a single workflow */
@@ -549,6 +587,24 @@ export interface TestWorkflowResponse {
   trace_id: string;
 }
 
+export interface StreamWorkflowEventsRequest {
+  /** Trace ID returned from a workflow test run */
+  trace_id: string;
+}
+
+export interface WorkflowRunEvent {
+  /** Unique ID of the event */
+  id: string;
+  /** Name of the event, e.g. "Agent._start_task" or "Crew.complete" */
+  name: string;
+  /** ISO timestamp of the event */
+  start_time: string;
+  /** JSON-serialized attributes of the event */
+  attributes: string;
+  /** JSON-serialized list of errors recorded with the event */
+  events: string;
+}
+
 /** Messages for deploying workflows */
 export interface DeployWorkflowRequest {
   /** ID of the workflow to deploy */
@@ -638,6 +694,76 @@ export interface DeployedWorkflow {
   model_deep_link: string;
 }
 
+/** Messages for resolving the ops server location of a workflow run trace */
+export interface ResolveWorkflowTraceRequest {
+  /** Local (hex) trace ID returned from a workflow kickoff */
+  trace_id: string;
+  /** Ops project that the run reports its trace to, if known */
+  project_name?:
+    | string
+    | undefined;
+  /** ID of the workflow that was run, if known */
+  workflow_id?: string | undefined;
+}
+
+export interface ResolveWorkflowTraceResponse {
+  /** Global ID of the ops project that owns the trace. Empty if the trace has not been reported yet. */
+  project_id: string;
+  /** Global ID of the trace in the ops server. Empty if the trace has not been reported yet. */
+  global_trace_id: string;
+}
+
+/** Messages for aggregated token and latency metrics of workflow runs */
+export interface GetWorkflowRunMetricsRequest {
+  /** Only aggregate runs of this workflow, if set */
+  workflow_id?:
+    | string
+    | undefined;
+  /** Metrics to aggregate: "run" (default), "agent", "tool" or "model" */
+  scope: string;
+  /** Start and end of the time range of run starts, in seconds since the epoch. Defaults to the last 24 hours. */
+  start_time: number;
+  end_time: number;
+  /** Width of the time windows that the range is split into, in seconds. 0 aggregates the whole range. */
+  window_seconds: number;
+  /** Percentiles (0-100) of durations and token counts to return. Defaults to 50, 90 and 99. */
+  percentiles: number[];
+}
+
+export interface MetricPercentile {
+  /** Percentile (0-100) */
+  percentile: number;
+  value: number;
+}
+
+export interface WorkflowRunMetricsSummary {
+  /** Metrics scope: "run", "agent", "tool" or "model" */
+  scope: string;
+  /** Agent studio ID, tool name or model name. The workflow ID for the "run" scope. */
+  name: string;
+  /** Time window of the summary, in seconds since the epoch */
+  window_start: number;
+  window_end: number;
+  /** Number of runs that the summary aggregates */
+  run_count: number;
+  /** Number of runs, tasks, tool calls or LLM requests, and how many of them failed */
+  call_count: number;
+  error_count: number;
+  /** Total token counts */
+  prompt_tokens: number;
+  completion_tokens: number;
+  total_tokens: number;
+  /** Total duration in seconds */
+  duration_seconds: number;
+  /** Percentiles of the per-run durations and total token counts */
+  duration_seconds_percentiles: MetricPercentile[];
+  total_tokens_percentiles: MetricPercentile[];
+}
+
+export interface GetWorkflowRunMetricsResponse {
+  summaries: WorkflowRunMetricsSummary[];
+}
+
 /** Workflow metadata */
 export interface Workflow {
   /** ID of the workflow */
@@ -696,12 +822,22 @@ export interface AddTaskResponse {
 
 export interface ListTasksRequest {
   /** Optional workflow id */
-  workflow_id?: string | undefined;
+  workflow_id?:
+    | string
+    | undefined;
+  /** Maximum number of tasks to return, all of them if unset */
+  page_size: number;
+  /** next_page_token of the previous page, to get the next page */
+  page_token: string;
+  /** Names of the fields of each task to return, all of them if empty */
+  read_mask: string[];
 }
 
 export interface ListTasksResponse {
   /** List of tasks */
   tasks: CrewAITaskMetadata[];
+  /** Token to get the next page with, empty on the last page */
+  next_page_token: string;
 }
 
 export interface GetTaskRequest {
@@ -1086,6 +1222,45 @@ export interface HealthCheckResponse {
   message: string;
 }
 
+/**
+ * Watch the changes of one type of entity instead of polling its list. A new watch
+ * starts with a SYNC event, after which the client lists the entities once and
+ * applies the changes that follow.
+ */
+export interface WatchRequest {
+  /**
+   * Sequence number of the last change the client has applied, to resume a watch
+   * (0 for a new watch). If the changes since then are no longer available, the
+   * stream starts with a RESET event instead, and the client lists the entities again.
+   */
+  since_sequence: number;
+  /** Change log the sequence number belongs to, from the client's last event */
+  change_log_id: string;
+  /** Only watch the entities of this workflow, if set */
+  workflow_id: string;
+}
+
+export interface EntityChangeEvent {
+  /** Sequence number of the (last) change */
+  sequence: number;
+  /** CREATED, UPDATED or DELETED, or one of the stream events SYNC, RESET and HEARTBEAT */
+  change_type: string;
+  /** workflow, agent, task, tool_instance or deployed_workflow */
+  entity_type: string;
+  /** ID of the changed entity */
+  entity_id: string;
+  /** Workflow of the changed entity */
+  workflow_id: string;
+  /** Change log of the sequence number, to resume the watch with */
+  change_log_id: string;
+  /** The entity after a CREATED or UPDATED change (one of, by entity type) */
+  workflow: Workflow | undefined;
+  agent: AgentMetadata | undefined;
+  task: CrewAITaskMetadata | undefined;
+  tool_instance: ToolInstance | undefined;
+  deployed_workflow: DeployedWorkflow | undefined;
+}
+
 function createBaseModel(): Model {
   return { model_id: "", model_name: "", provider_model: "", model_type: "", api_base: "", is_studio_default: false };
 }
@@ -2337,7 +2512,7 @@ export const GetStudioDefaultModelResponse: MessageFns<GetStudioDefaultModelResp
 };
 
 function createBaseListToolTemplatesRequest(): ListToolTemplatesRequest {
-  return { workflow_template_id: undefined };
+  return { workflow_template_id: undefined, page_size: 0, page_token: "", read_mask: [] };
 }
 
 export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
@@ -2345,6 +2520,15 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
     if (message.workflow_template_id !== undefined) {
       writer.uint32(10).string(message.workflow_template_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.read_mask) {
+      writer.uint32(34).string(v!);
+    }
     return writer;
   },
 
@@ -2363,6 +2547,30 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
           message.workflow_template_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.read_mask.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -2377,6 +2585,11 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
       workflow_template_id: isSet(object.workflow_template_id)
         ? globalThis.String(object.workflow_template_id)
         : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      read_mask: globalThis.Array.isArray(object?.read_mask)
+        ? object.read_mask.map((e: any) => globalThis.String(e))
+        : [],
     };
   },
 
@@ -2385,6 +2598,15 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
     if (message.workflow_template_id !== undefined) {
       obj.workflow_template_id = message.workflow_template_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.read_mask?.length) {
+      obj.read_mask = message.read_mask;
+    }
     return obj;
   },
 
@@ -2394,12 +2616,15 @@ export const ListToolTemplatesRequest: MessageFns<ListToolTemplatesRequest> = {
   fromPartial(object: DeepPartial<ListToolTemplatesRequest>): ListToolTemplatesRequest {
     const message = createBaseListToolTemplatesRequest();
     message.workflow_template_id = object.workflow_template_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.read_mask = object.read_mask?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListToolTemplatesResponse(): ListToolTemplatesResponse {
-  return { templates: [] };
+  return { templates: [], next_page_token: "" };
 }
 
 export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> = {
@@ -2407,6 +2632,9 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
     for (const v of message.templates) {
       ToolTemplate.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -2425,6 +2653,14 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
           message.templates.push(ToolTemplate.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -2439,6 +2675,7 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
       templates: globalThis.Array.isArray(object?.templates)
         ? object.templates.map((e: any) => ToolTemplate.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -2447,6 +2684,9 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
     if (message.templates?.length) {
       obj.templates = message.templates.map((e) => ToolTemplate.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -2456,6 +2696,7 @@ export const ListToolTemplatesResponse: MessageFns<ListToolTemplatesResponse> =
   fromPartial(object: DeepPartial<ListToolTemplatesResponse>): ListToolTemplatesResponse {
     const message = createBaseListToolTemplatesResponse();
     message.templates = object.templates?.map((e) => ToolTemplate.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -2982,7 +3223,7 @@ export const RemoveToolTemplateResponse: MessageFns<RemoveToolTemplateResponse>
 };
 
 function createBaseListToolInstancesRequest(): ListToolInstancesRequest {
-  return { workflow_id: undefined };
+  return { workflow_id: undefined, page_size: 0, page_token: "", read_mask: [] };
 }
 
 export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
@@ -2990,6 +3231,15 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
     if (message.workflow_id !== undefined) {
       writer.uint32(10).string(message.workflow_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.read_mask) {
+      writer.uint32(34).string(v!);
+    }
     return writer;
   },
 
@@ -3008,6 +3258,30 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
           message.workflow_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.read_mask.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -3018,7 +3292,14 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
   },
 
   fromJSON(object: any): ListToolInstancesRequest {
-    return { workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined };
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      read_mask: globalThis.Array.isArray(object?.read_mask)
+        ? object.read_mask.map((e: any) => globalThis.String(e))
+        : [],
+    };
   },
 
   toJSON(message: ListToolInstancesRequest): unknown {
@@ -3026,6 +3307,15 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
     if (message.workflow_id !== undefined) {
       obj.workflow_id = message.workflow_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.read_mask?.length) {
+      obj.read_mask = message.read_mask;
+    }
     return obj;
   },
 
@@ -3035,12 +3325,15 @@ export const ListToolInstancesRequest: MessageFns<ListToolInstancesRequest> = {
   fromPartial(object: DeepPartial<ListToolInstancesRequest>): ListToolInstancesRequest {
     const message = createBaseListToolInstancesRequest();
     message.workflow_id = object.workflow_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.read_mask = object.read_mask?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListToolInstancesResponse(): ListToolInstancesResponse {
-  return { tool_instances: [] };
+  return { tool_instances: [], next_page_token: "" };
 }
 
 export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> = {
@@ -3048,6 +3341,9 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
     for (const v of message.tool_instances) {
       ToolInstance.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -3066,6 +3362,14 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
           message.tool_instances.push(ToolInstance.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -3080,6 +3384,7 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
       tool_instances: globalThis.Array.isArray(object?.tool_instances)
         ? object.tool_instances.map((e: any) => ToolInstance.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -3088,6 +3393,9 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
     if (message.tool_instances?.length) {
       obj.tool_instances = message.tool_instances.map((e) => ToolInstance.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -3097,6 +3405,7 @@ export const ListToolInstancesResponse: MessageFns<ListToolInstancesResponse> =
   fromPartial(object: DeepPartial<ListToolInstancesResponse>): ListToolInstancesResponse {
     const message = createBaseListToolInstancesResponse();
     message.tool_instances = object.tool_instances?.map((e) => ToolInstance.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -4104,7 +4413,7 @@ export const ToolInstance: MessageFns<ToolInstance> = {
 };
 
 function createBaseListAgentsRequest(): ListAgentsRequest {
-  return { workflow_id: undefined };
+  return { workflow_id: undefined, page_size: 0, page_token: "", read_mask: [] };
 }
 
 export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
@@ -4112,6 +4421,15 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
     if (message.workflow_id !== undefined) {
       writer.uint32(10).string(message.workflow_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.read_mask) {
+      writer.uint32(34).string(v!);
+    }
     return writer;
   },
 
@@ -4130,6 +4448,30 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
           message.workflow_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.read_mask.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -4140,7 +4482,14 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
   },
 
   fromJSON(object: any): ListAgentsRequest {
-    return { workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined };
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      read_mask: globalThis.Array.isArray(object?.read_mask)
+        ? object.read_mask.map((e: any) => globalThis.String(e))
+        : [],
+    };
   },
 
   toJSON(message: ListAgentsRequest): unknown {
@@ -4148,6 +4497,15 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
     if (message.workflow_id !== undefined) {
       obj.workflow_id = message.workflow_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.read_mask?.length) {
+      obj.read_mask = message.read_mask;
+    }
     return obj;
   },
 
@@ -4157,12 +4515,15 @@ export const ListAgentsRequest: MessageFns<ListAgentsRequest> = {
   fromPartial(object: DeepPartial<ListAgentsRequest>): ListAgentsRequest {
     const message = createBaseListAgentsRequest();
     message.workflow_id = object.workflow_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.read_mask = object.read_mask?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListAgentsResponse(): ListAgentsResponse {
-  return { agents: [] };
+  return { agents: [], next_page_token: "" };
 }
 
 export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
@@ -4170,6 +4531,9 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
     for (const v of message.agents) {
       AgentMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -4188,6 +4552,14 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
           message.agents.push(AgentMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -4200,6 +4572,7 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
   fromJSON(object: any): ListAgentsResponse {
     return {
       agents: globalThis.Array.isArray(object?.agents) ? object.agents.map((e: any) => AgentMetadata.fromJSON(e)) : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -4208,6 +4581,9 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
     if (message.agents?.length) {
       obj.agents = message.agents.map((e) => AgentMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -4217,6 +4593,7 @@ export const ListAgentsResponse: MessageFns<ListAgentsResponse> = {
   fromPartial(object: DeepPartial<ListAgentsResponse>): ListAgentsResponse {
     const message = createBaseListAgentsResponse();
     message.agents = object.agents?.map((e) => AgentMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -5613,11 +5990,20 @@ export const AddWorkflowResponse: MessageFns<AddWorkflowResponse> = {
 };
 
 function createBaseListWorkflowsRequest(): ListWorkflowsRequest {
-  return {};
+  return { page_size: 0, page_token: "", read_mask: [] };
 }
 
 export const ListWorkflowsRequest: MessageFns<ListWorkflowsRequest> = {
-  encode(_: ListWorkflowsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+  encode(message: ListWorkflowsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.page_size !== 0) {
+      writer.uint32(8).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(18).string(message.page_token);
+    }
+    for (const v of message.read_mask) {
+      writer.uint32(26).string(v!);
+    }
     return writer;
   },
 
@@ -5628,6 +6014,30 @@ export const ListWorkflowsRequest: MessageFns<ListWorkflowsRequest> = {
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.read_mask.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -5637,26 +6047,44 @@ export const ListWorkflowsRequest: MessageFns<ListWorkflowsRequest> = {
     return message;
   },
 
-  fromJSON(_: any): ListWorkflowsRequest {
-    return {};
+  fromJSON(object: any): ListWorkflowsRequest {
+    return {
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      read_mask: globalThis.Array.isArray(object?.read_mask)
+        ? object.read_mask.map((e: any) => globalThis.String(e))
+        : [],
+    };
   },
 
-  toJSON(_: ListWorkflowsRequest): unknown {
+  toJSON(message: ListWorkflowsRequest): unknown {
     const obj: any = {};
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.read_mask?.length) {
+      obj.read_mask = message.read_mask;
+    }
     return obj;
   },
 
   create(base?: DeepPartial<ListWorkflowsRequest>): ListWorkflowsRequest {
     return ListWorkflowsRequest.fromPartial(base ?? {});
   },
-  fromPartial(_: DeepPartial<ListWorkflowsRequest>): ListWorkflowsRequest {
+  fromPartial(object: DeepPartial<ListWorkflowsRequest>): ListWorkflowsRequest {
     const message = createBaseListWorkflowsRequest();
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.read_mask = object.read_mask?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListWorkflowsResponse(): ListWorkflowsResponse {
-  return { workflows: [] };
+  return { workflows: [], next_page_token: "" };
 }
 
 export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
@@ -5664,6 +6092,9 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
     for (const v of message.workflows) {
       Workflow.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -5682,6 +6113,14 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
           message.workflows.push(Workflow.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -5696,6 +6135,7 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
       workflows: globalThis.Array.isArray(object?.workflows)
         ? object.workflows.map((e: any) => Workflow.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -5704,6 +6144,9 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
     if (message.workflows?.length) {
       obj.workflows = message.workflows.map((e) => Workflow.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -5713,6 +6156,7 @@ export const ListWorkflowsResponse: MessageFns<ListWorkflowsResponse> = {
   fromPartial(object: DeepPartial<ListWorkflowsResponse>): ListWorkflowsResponse {
     const message = createBaseListWorkflowsResponse();
     message.workflows = object.workflows?.map((e) => Workflow.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -6561,41 +7005,22 @@ export const TestWorkflowResponse: MessageFns<TestWorkflowResponse> = {
   },
 };
 
-function createBaseDeployWorkflowRequest(): DeployWorkflowRequest {
-  return {
-    workflow_id: "",
-    env_variable_overrides: {},
-    tool_user_parameters: {},
-    bypass_authentication: false,
-    generation_config: "",
-  };
+function createBaseStreamWorkflowEventsRequest(): StreamWorkflowEventsRequest {
+  return { trace_id: "" };
 }
 
-export const DeployWorkflowRequest: MessageFns<DeployWorkflowRequest> = {
-  encode(message: DeployWorkflowRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.workflow_id !== "") {
-      writer.uint32(10).string(message.workflow_id);
-    }
-    Object.entries(message.env_variable_overrides).forEach(([key, value]) => {
-      DeployWorkflowRequest_EnvVariableOverridesEntry.encode({ key: key as any, value }, writer.uint32(18).fork())
-        .join();
-    });
-    Object.entries(message.tool_user_parameters).forEach(([key, value]) => {
-      DeployWorkflowRequest_ToolUserParametersEntry.encode({ key: key as any, value }, writer.uint32(26).fork()).join();
-    });
-    if (message.bypass_authentication !== false) {
-      writer.uint32(32).bool(message.bypass_authentication);
-    }
-    if (message.generation_config !== "") {
-      writer.uint32(42).string(message.generation_config);
+export const StreamWorkflowEventsRequest: MessageFns<StreamWorkflowEventsRequest> = {
+  encode(message: StreamWorkflowEventsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.trace_id !== "") {
+      writer.uint32(10).string(message.trace_id);
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): DeployWorkflowRequest {
+  decode(input: BinaryReader | Uint8Array, length?: number): StreamWorkflowEventsRequest {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     let end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseDeployWorkflowRequest();
+    const message = createBaseStreamWorkflowEventsRequest();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
@@ -6604,23 +7029,224 @@ export const DeployWorkflowRequest: MessageFns<DeployWorkflowRequest> = {
             break;
           }
 
-          message.workflow_id = reader.string();
+          message.trace_id = reader.string();
           continue;
         }
-        case 2: {
-          if (tag !== 18) {
-            break;
-          }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
 
-          const entry2 = DeployWorkflowRequest_EnvVariableOverridesEntry.decode(reader, reader.uint32());
-          if (entry2.value !== undefined) {
-            message.env_variable_overrides[entry2.key] = entry2.value;
-          }
-          continue;
-        }
-        case 3: {
-          if (tag !== 26) {
-            break;
+  fromJSON(object: any): StreamWorkflowEventsRequest {
+    return { trace_id: isSet(object.trace_id) ? globalThis.String(object.trace_id) : "" };
+  },
+
+  toJSON(message: StreamWorkflowEventsRequest): unknown {
+    const obj: any = {};
+    if (message.trace_id !== "") {
+      obj.trace_id = message.trace_id;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<StreamWorkflowEventsRequest>): StreamWorkflowEventsRequest {
+    return StreamWorkflowEventsRequest.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<StreamWorkflowEventsRequest>): StreamWorkflowEventsRequest {
+    const message = createBaseStreamWorkflowEventsRequest();
+    message.trace_id = object.trace_id ?? "";
+    return message;
+  },
+};
+
+function createBaseWorkflowRunEvent(): WorkflowRunEvent {
+  return { id: "", name: "", start_time: "", attributes: "", events: "" };
+}
+
+export const WorkflowRunEvent: MessageFns<WorkflowRunEvent> = {
+  encode(message: WorkflowRunEvent, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.id !== "") {
+      writer.uint32(10).string(message.id);
+    }
+    if (message.name !== "") {
+      writer.uint32(18).string(message.name);
+    }
+    if (message.start_time !== "") {
+      writer.uint32(26).string(message.start_time);
+    }
+    if (message.attributes !== "") {
+      writer.uint32(34).string(message.attributes);
+    }
+    if (message.events !== "") {
+      writer.uint32(42).string(message.events);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): WorkflowRunEvent {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseWorkflowRunEvent();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.id = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.name = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.start_time = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.attributes = reader.string();
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.events = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): WorkflowRunEvent {
+    return {
+      id: isSet(object.id) ? globalThis.String(object.id) : "",
+      name: isSet(object.name) ? globalThis.String(object.name) : "",
+      start_time: isSet(object.start_time) ? globalThis.String(object.start_time) : "",
+      attributes: isSet(object.attributes) ? globalThis.String(object.attributes) : "",
+      events: isSet(object.events) ? globalThis.String(object.events) : "",
+    };
+  },
+
+  toJSON(message: WorkflowRunEvent): unknown {
+    const obj: any = {};
+    if (message.id !== "") {
+      obj.id = message.id;
+    }
+    if (message.name !== "") {
+      obj.name = message.name;
+    }
+    if (message.start_time !== "") {
+      obj.start_time = message.start_time;
+    }
+    if (message.attributes !== "") {
+      obj.attributes = message.attributes;
+    }
+    if (message.events !== "") {
+      obj.events = message.events;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<WorkflowRunEvent>): WorkflowRunEvent {
+    return WorkflowRunEvent.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<WorkflowRunEvent>): WorkflowRunEvent {
+    const message = createBaseWorkflowRunEvent();
+    message.id = object.id ?? "";
+    message.name = object.name ?? "";
+    message.start_time = object.start_time ?? "";
+    message.attributes = object.attributes ?? "";
+    message.events = object.events ?? "";
+    return message;
+  },
+};
+
+function createBaseDeployWorkflowRequest(): DeployWorkflowRequest {
+  return {
+    workflow_id: "",
+    env_variable_overrides: {},
+    tool_user_parameters: {},
+    bypass_authentication: false,
+    generation_config: "",
+  };
+}
+
+export const DeployWorkflowRequest: MessageFns<DeployWorkflowRequest> = {
+  encode(message: DeployWorkflowRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.workflow_id !== "") {
+      writer.uint32(10).string(message.workflow_id);
+    }
+    Object.entries(message.env_variable_overrides).forEach(([key, value]) => {
+      DeployWorkflowRequest_EnvVariableOverridesEntry.encode({ key: key as any, value }, writer.uint32(18).fork())
+        .join();
+    });
+    Object.entries(message.tool_user_parameters).forEach(([key, value]) => {
+      DeployWorkflowRequest_ToolUserParametersEntry.encode({ key: key as any, value }, writer.uint32(26).fork()).join();
+    });
+    if (message.bypass_authentication !== false) {
+      writer.uint32(32).bool(message.bypass_authentication);
+    }
+    if (message.generation_config !== "") {
+      writer.uint32(42).string(message.generation_config);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): DeployWorkflowRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseDeployWorkflowRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.workflow_id = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          const entry2 = DeployWorkflowRequest_EnvVariableOverridesEntry.decode(reader, reader.uint32());
+          if (entry2.value !== undefined) {
+            message.env_variable_overrides[entry2.key] = entry2.value;
+          }
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
           }
 
           const entry3 = DeployWorkflowRequest_ToolUserParametersEntry.decode(reader, reader.uint32());
@@ -7418,36 +8044,687 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
           message.is_stale = reader.bool();
           continue;
         }
-        case 7: {
-          if (tag !== 58) {
+        case 7: {
+          if (tag !== 58) {
+            break;
+          }
+
+          message.application_url = reader.string();
+          continue;
+        }
+        case 8: {
+          if (tag !== 66) {
+            break;
+          }
+
+          message.application_status = reader.string();
+          continue;
+        }
+        case 9: {
+          if (tag !== 74) {
+            break;
+          }
+
+          message.application_deep_link = reader.string();
+          continue;
+        }
+        case 10: {
+          if (tag !== 82) {
+            break;
+          }
+
+          message.model_deep_link = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): DeployedWorkflow {
+    return {
+      deployed_workflow_id: isSet(object.deployed_workflow_id) ? globalThis.String(object.deployed_workflow_id) : "",
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
+      workflow_name: isSet(object.workflow_name) ? globalThis.String(object.workflow_name) : "",
+      deployed_workflow_name: isSet(object.deployed_workflow_name)
+        ? globalThis.String(object.deployed_workflow_name)
+        : "",
+      cml_deployed_model_id: isSet(object.cml_deployed_model_id) ? globalThis.String(object.cml_deployed_model_id) : "",
+      is_stale: isSet(object.is_stale) ? globalThis.Boolean(object.is_stale) : false,
+      application_url: isSet(object.application_url) ? globalThis.String(object.application_url) : "",
+      application_status: isSet(object.application_status) ? globalThis.String(object.application_status) : "",
+      application_deep_link: isSet(object.application_deep_link) ? globalThis.String(object.application_deep_link) : "",
+      model_deep_link: isSet(object.model_deep_link) ? globalThis.String(object.model_deep_link) : "",
+    };
+  },
+
+  toJSON(message: DeployedWorkflow): unknown {
+    const obj: any = {};
+    if (message.deployed_workflow_id !== "") {
+      obj.deployed_workflow_id = message.deployed_workflow_id;
+    }
+    if (message.workflow_id !== "") {
+      obj.workflow_id = message.workflow_id;
+    }
+    if (message.workflow_name !== "") {
+      obj.workflow_name = message.workflow_name;
+    }
+    if (message.deployed_workflow_name !== "") {
+      obj.deployed_workflow_name = message.deployed_workflow_name;
+    }
+    if (message.cml_deployed_model_id !== "") {
+      obj.cml_deployed_model_id = message.cml_deployed_model_id;
+    }
+    if (message.is_stale !== false) {
+      obj.is_stale = message.is_stale;
+    }
+    if (message.application_url !== "") {
+      obj.application_url = message.application_url;
+    }
+    if (message.application_status !== "") {
+      obj.application_status = message.application_status;
+    }
+    if (message.application_deep_link !== "") {
+      obj.application_deep_link = message.application_deep_link;
+    }
+    if (message.model_deep_link !== "") {
+      obj.model_deep_link = message.model_deep_link;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<DeployedWorkflow>): DeployedWorkflow {
+    return DeployedWorkflow.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<DeployedWorkflow>): DeployedWorkflow {
+    const message = createBaseDeployedWorkflow();
+    message.deployed_workflow_id = object.deployed_workflow_id ?? "";
+    message.workflow_id = object.workflow_id ?? "";
+    message.workflow_name = object.workflow_name ?? "";
+    message.deployed_workflow_name = object.deployed_workflow_name ?? "";
+    message.cml_deployed_model_id = object.cml_deployed_model_id ?? "";
+    message.is_stale = object.is_stale ?? false;
+    message.application_url = object.application_url ?? "";
+    message.application_status = object.application_status ?? "";
+    message.application_deep_link = object.application_deep_link ?? "";
+    message.model_deep_link = object.model_deep_link ?? "";
+    return message;
+  },
+};
+
+function createBaseResolveWorkflowTraceRequest(): ResolveWorkflowTraceRequest {
+  return { trace_id: "", project_name: undefined, workflow_id: undefined };
+}
+
+export const ResolveWorkflowTraceRequest: MessageFns<ResolveWorkflowTraceRequest> = {
+  encode(message: ResolveWorkflowTraceRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.trace_id !== "") {
+      writer.uint32(10).string(message.trace_id);
+    }
+    if (message.project_name !== undefined) {
+      writer.uint32(18).string(message.project_name);
+    }
+    if (message.workflow_id !== undefined) {
+      writer.uint32(26).string(message.workflow_id);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ResolveWorkflowTraceRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseResolveWorkflowTraceRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.trace_id = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.project_name = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.workflow_id = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ResolveWorkflowTraceRequest {
+    return {
+      trace_id: isSet(object.trace_id) ? globalThis.String(object.trace_id) : "",
+      project_name: isSet(object.project_name) ? globalThis.String(object.project_name) : undefined,
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined,
+    };
+  },
+
+  toJSON(message: ResolveWorkflowTraceRequest): unknown {
+    const obj: any = {};
+    if (message.trace_id !== "") {
+      obj.trace_id = message.trace_id;
+    }
+    if (message.project_name !== undefined) {
+      obj.project_name = message.project_name;
+    }
+    if (message.workflow_id !== undefined) {
+      obj.workflow_id = message.workflow_id;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<ResolveWorkflowTraceRequest>): ResolveWorkflowTraceRequest {
+    return ResolveWorkflowTraceRequest.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<ResolveWorkflowTraceRequest>): ResolveWorkflowTraceRequest {
+    const message = createBaseResolveWorkflowTraceRequest();
+    message.trace_id = object.trace_id ?? "";
+    message.project_name = object.project_name ?? undefined;
+    message.workflow_id = object.workflow_id ?? undefined;
+    return message;
+  },
+};
+
+function createBaseResolveWorkflowTraceResponse(): ResolveWorkflowTraceResponse {
+  return { project_id: "", global_trace_id: "" };
+}
+
+export const ResolveWorkflowTraceResponse: MessageFns<ResolveWorkflowTraceResponse> = {
+  encode(message: ResolveWorkflowTraceResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.project_id !== "") {
+      writer.uint32(10).string(message.project_id);
+    }
+    if (message.global_trace_id !== "") {
+      writer.uint32(18).string(message.global_trace_id);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): ResolveWorkflowTraceResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseResolveWorkflowTraceResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.project_id = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.global_trace_id = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): ResolveWorkflowTraceResponse {
+    return {
+      project_id: isSet(object.project_id) ? globalThis.String(object.project_id) : "",
+      global_trace_id: isSet(object.global_trace_id) ? globalThis.String(object.global_trace_id) : "",
+    };
+  },
+
+  toJSON(message: ResolveWorkflowTraceResponse): unknown {
+    const obj: any = {};
+    if (message.project_id !== "") {
+      obj.project_id = message.project_id;
+    }
+    if (message.global_trace_id !== "") {
+      obj.global_trace_id = message.global_trace_id;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<ResolveWorkflowTraceResponse>): ResolveWorkflowTraceResponse {
+    return ResolveWorkflowTraceResponse.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<ResolveWorkflowTraceResponse>): ResolveWorkflowTraceResponse {
+    const message = createBaseResolveWorkflowTraceResponse();
+    message.project_id = object.project_id ?? "";
+    message.global_trace_id = object.global_trace_id ?? "";
+    return message;
+  },
+};
+
+function createBaseGetWorkflowRunMetricsRequest(): GetWorkflowRunMetricsRequest {
+  return { workflow_id: undefined, scope: "", start_time: 0, end_time: 0, window_seconds: 0, percentiles: [] };
+}
+
+export const GetWorkflowRunMetricsRequest: MessageFns<GetWorkflowRunMetricsRequest> = {
+  encode(message: GetWorkflowRunMetricsRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.workflow_id !== undefined) {
+      writer.uint32(10).string(message.workflow_id);
+    }
+    if (message.scope !== "") {
+      writer.uint32(18).string(message.scope);
+    }
+    if (message.start_time !== 0) {
+      writer.uint32(25).double(message.start_time);
+    }
+    if (message.end_time !== 0) {
+      writer.uint32(33).double(message.end_time);
+    }
+    if (message.window_seconds !== 0) {
+      writer.uint32(41).double(message.window_seconds);
+    }
+    writer.uint32(50).fork();
+    for (const v of message.percentiles) {
+      writer.double(v);
+    }
+    writer.join();
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetWorkflowRunMetricsRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetWorkflowRunMetricsRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.workflow_id = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.scope = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 25) {
+            break;
+          }
+
+          message.start_time = reader.double();
+          continue;
+        }
+        case 4: {
+          if (tag !== 33) {
+            break;
+          }
+
+          message.end_time = reader.double();
+          continue;
+        }
+        case 5: {
+          if (tag !== 41) {
+            break;
+          }
+
+          message.window_seconds = reader.double();
+          continue;
+        }
+        case 6: {
+          if (tag === 49) {
+            message.percentiles.push(reader.double());
+
+            continue;
+          }
+
+          if (tag === 50) {
+            const end2 = reader.uint32() + reader.pos;
+            while (reader.pos < end2) {
+              message.percentiles.push(reader.double());
+            }
+
+            continue;
+          }
+
+          break;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetWorkflowRunMetricsRequest {
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined,
+      scope: isSet(object.scope) ? globalThis.String(object.scope) : "",
+      start_time: isSet(object.start_time) ? globalThis.Number(object.start_time) : 0,
+      end_time: isSet(object.end_time) ? globalThis.Number(object.end_time) : 0,
+      window_seconds: isSet(object.window_seconds) ? globalThis.Number(object.window_seconds) : 0,
+      percentiles: globalThis.Array.isArray(object?.percentiles)
+        ? object.percentiles.map((e: any) => globalThis.Number(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetWorkflowRunMetricsRequest): unknown {
+    const obj: any = {};
+    if (message.workflow_id !== undefined) {
+      obj.workflow_id = message.workflow_id;
+    }
+    if (message.scope !== "") {
+      obj.scope = message.scope;
+    }
+    if (message.start_time !== 0) {
+      obj.start_time = message.start_time;
+    }
+    if (message.end_time !== 0) {
+      obj.end_time = message.end_time;
+    }
+    if (message.window_seconds !== 0) {
+      obj.window_seconds = message.window_seconds;
+    }
+    if (message.percentiles?.length) {
+      obj.percentiles = message.percentiles;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<GetWorkflowRunMetricsRequest>): GetWorkflowRunMetricsRequest {
+    return GetWorkflowRunMetricsRequest.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<GetWorkflowRunMetricsRequest>): GetWorkflowRunMetricsRequest {
+    const message = createBaseGetWorkflowRunMetricsRequest();
+    message.workflow_id = object.workflow_id ?? undefined;
+    message.scope = object.scope ?? "";
+    message.start_time = object.start_time ?? 0;
+    message.end_time = object.end_time ?? 0;
+    message.window_seconds = object.window_seconds ?? 0;
+    message.percentiles = object.percentiles?.map((e) => e) || [];
+    return message;
+  },
+};
+
+function createBaseMetricPercentile(): MetricPercentile {
+  return { percentile: 0, value: 0 };
+}
+
+export const MetricPercentile: MessageFns<MetricPercentile> = {
+  encode(message: MetricPercentile, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.percentile !== 0) {
+      writer.uint32(9).double(message.percentile);
+    }
+    if (message.value !== 0) {
+      writer.uint32(17).double(message.value);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): MetricPercentile {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseMetricPercentile();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 9) {
+            break;
+          }
+
+          message.percentile = reader.double();
+          continue;
+        }
+        case 2: {
+          if (tag !== 17) {
+            break;
+          }
+
+          message.value = reader.double();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): MetricPercentile {
+    return {
+      percentile: isSet(object.percentile) ? globalThis.Number(object.percentile) : 0,
+      value: isSet(object.value) ? globalThis.Number(object.value) : 0,
+    };
+  },
+
+  toJSON(message: MetricPercentile): unknown {
+    const obj: any = {};
+    if (message.percentile !== 0) {
+      obj.percentile = message.percentile;
+    }
+    if (message.value !== 0) {
+      obj.value = message.value;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<MetricPercentile>): MetricPercentile {
+    return MetricPercentile.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<MetricPercentile>): MetricPercentile {
+    const message = createBaseMetricPercentile();
+    message.percentile = object.percentile ?? 0;
+    message.value = object.value ?? 0;
+    return message;
+  },
+};
+
+function createBaseWorkflowRunMetricsSummary(): WorkflowRunMetricsSummary {
+  return {
+    scope: "",
+    name: "",
+    window_start: 0,
+    window_end: 0,
+    run_count: 0,
+    call_count: 0,
+    error_count: 0,
+    prompt_tokens: 0,
+    completion_tokens: 0,
+    total_tokens: 0,
+    duration_seconds: 0,
+    duration_seconds_percentiles: [],
+    total_tokens_percentiles: [],
+  };
+}
+
+export const WorkflowRunMetricsSummary: MessageFns<WorkflowRunMetricsSummary> = {
+  encode(message: WorkflowRunMetricsSummary, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.scope !== "") {
+      writer.uint32(10).string(message.scope);
+    }
+    if (message.name !== "") {
+      writer.uint32(18).string(message.name);
+    }
+    if (message.window_start !== 0) {
+      writer.uint32(25).double(message.window_start);
+    }
+    if (message.window_end !== 0) {
+      writer.uint32(33).double(message.window_end);
+    }
+    if (message.run_count !== 0) {
+      writer.uint32(40).int32(message.run_count);
+    }
+    if (message.call_count !== 0) {
+      writer.uint32(48).int32(message.call_count);
+    }
+    if (message.error_count !== 0) {
+      writer.uint32(56).int32(message.error_count);
+    }
+    if (message.prompt_tokens !== 0) {
+      writer.uint32(65).double(message.prompt_tokens);
+    }
+    if (message.completion_tokens !== 0) {
+      writer.uint32(73).double(message.completion_tokens);
+    }
+    if (message.total_tokens !== 0) {
+      writer.uint32(81).double(message.total_tokens);
+    }
+    if (message.duration_seconds !== 0) {
+      writer.uint32(89).double(message.duration_seconds);
+    }
+    for (const v of message.duration_seconds_percentiles) {
+      MetricPercentile.encode(v!, writer.uint32(98).fork()).join();
+    }
+    for (const v of message.total_tokens_percentiles) {
+      MetricPercentile.encode(v!, writer.uint32(106).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): WorkflowRunMetricsSummary {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseWorkflowRunMetricsSummary();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.scope = reader.string();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.name = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 25) {
+            break;
+          }
+
+          message.window_start = reader.double();
+          continue;
+        }
+        case 4: {
+          if (tag !== 33) {
+            break;
+          }
+
+          message.window_end = reader.double();
+          continue;
+        }
+        case 5: {
+          if (tag !== 40) {
+            break;
+          }
+
+          message.run_count = reader.int32();
+          continue;
+        }
+        case 6: {
+          if (tag !== 48) {
+            break;
+          }
+
+          message.call_count = reader.int32();
+          continue;
+        }
+        case 7: {
+          if (tag !== 56) {
+            break;
+          }
+
+          message.error_count = reader.int32();
+          continue;
+        }
+        case 8: {
+          if (tag !== 65) {
+            break;
+          }
+
+          message.prompt_tokens = reader.double();
+          continue;
+        }
+        case 9: {
+          if (tag !== 73) {
+            break;
+          }
+
+          message.completion_tokens = reader.double();
+          continue;
+        }
+        case 10: {
+          if (tag !== 81) {
             break;
           }
 
-          message.application_url = reader.string();
+          message.total_tokens = reader.double();
           continue;
         }
-        case 8: {
-          if (tag !== 66) {
+        case 11: {
+          if (tag !== 89) {
             break;
           }
 
-          message.application_status = reader.string();
+          message.duration_seconds = reader.double();
           continue;
         }
-        case 9: {
-          if (tag !== 74) {
+        case 12: {
+          if (tag !== 98) {
             break;
           }
 
-          message.application_deep_link = reader.string();
+          message.duration_seconds_percentiles.push(MetricPercentile.decode(reader, reader.uint32()));
           continue;
         }
-        case 10: {
-          if (tag !== 82) {
+        case 13: {
+          if (tag !== 106) {
             break;
           }
 
-          message.model_deep_link = reader.string();
+          message.total_tokens_percentiles.push(MetricPercentile.decode(reader, reader.uint32()));
           continue;
         }
       }
@@ -7459,73 +8736,152 @@ export const DeployedWorkflow: MessageFns<DeployedWorkflow> = {
     return message;
   },
 
-  fromJSON(object: any): DeployedWorkflow {
+  fromJSON(object: any): WorkflowRunMetricsSummary {
     return {
-      deployed_workflow_id: isSet(object.deployed_workflow_id) ? globalThis.String(object.deployed_workflow_id) : "",
-      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
-      workflow_name: isSet(object.workflow_name) ? globalThis.String(object.workflow_name) : "",
-      deployed_workflow_name: isSet(object.deployed_workflow_name)
-        ? globalThis.String(object.deployed_workflow_name)
-        : "",
-      cml_deployed_model_id: isSet(object.cml_deployed_model_id) ? globalThis.String(object.cml_deployed_model_id) : "",
-      is_stale: isSet(object.is_stale) ? globalThis.Boolean(object.is_stale) : false,
-      application_url: isSet(object.application_url) ? globalThis.String(object.application_url) : "",
-      application_status: isSet(object.application_status) ? globalThis.String(object.application_status) : "",
-      application_deep_link: isSet(object.application_deep_link) ? globalThis.String(object.application_deep_link) : "",
-      model_deep_link: isSet(object.model_deep_link) ? globalThis.String(object.model_deep_link) : "",
+      scope: isSet(object.scope) ? globalThis.String(object.scope) : "",
+      name: isSet(object.name) ? globalThis.String(object.name) : "",
+      window_start: isSet(object.window_start) ? globalThis.Number(object.window_start) : 0,
+      window_end: isSet(object.window_end) ? globalThis.Number(object.window_end) : 0,
+      run_count: isSet(object.run_count) ? globalThis.Number(object.run_count) : 0,
+      call_count: isSet(object.call_count) ? globalThis.Number(object.call_count) : 0,
+      error_count: isSet(object.error_count) ? globalThis.Number(object.error_count) : 0,
+      prompt_tokens: isSet(object.prompt_tokens) ? globalThis.Number(object.prompt_tokens) : 0,
+      completion_tokens: isSet(object.completion_tokens) ? globalThis.Number(object.completion_tokens) : 0,
+      total_tokens: isSet(object.total_tokens) ? globalThis.Number(object.total_tokens) : 0,
+      duration_seconds: isSet(object.duration_seconds) ? globalThis.Number(object.duration_seconds) : 0,
+      duration_seconds_percentiles: globalThis.Array.isArray(object?.duration_seconds_percentiles)
+        ? object.duration_seconds_percentiles.map((e: any) => MetricPercentile.fromJSON(e))
+        : [],
+      total_tokens_percentiles: globalThis.Array.isArray(object?.total_tokens_percentiles)
+        ? object.total_tokens_percentiles.map((e: any) => MetricPercentile.fromJSON(e))
+        : [],
     };
   },
 
-  toJSON(message: DeployedWorkflow): unknown {
+  toJSON(message: WorkflowRunMetricsSummary): unknown {
     const obj: any = {};
-    if (message.deployed_workflow_id !== "") {
-      obj.deployed_workflow_id = message.deployed_workflow_id;
+    if (message.scope !== "") {
+      obj.scope = message.scope;
     }
-    if (message.workflow_id !== "") {
-      obj.workflow_id = message.workflow_id;
+    if (message.name !== "") {
+      obj.name = message.name;
     }
-    if (message.workflow_name !== "") {
-      obj.workflow_name = message.workflow_name;
+    if (message.window_start !== 0) {
+      obj.window_start = message.window_start;
     }
-    if (message.deployed_workflow_name !== "") {
-      obj.deployed_workflow_name = message.deployed_workflow_name;
+    if (message.window_end !== 0) {
+      obj.window_end = message.window_end;
     }
-    if (message.cml_deployed_model_id !== "") {
-      obj.cml_deployed_model_id = message.cml_deployed_model_id;
+    if (message.run_count !== 0) {
+      obj.run_count = Math.round(message.run_count);
     }
-    if (message.is_stale !== false) {
-      obj.is_stale = message.is_stale;
+    if (message.call_count !== 0) {
+      obj.call_count = Math.round(message.call_count);
     }
-    if (message.application_url !== "") {
-      obj.application_url = message.application_url;
+    if (message.error_count !== 0) {
+      obj.error_count = Math.round(message.error_count);
     }
-    if (message.application_status !== "") {
-      obj.application_status = message.application_status;
+    if (message.prompt_tokens !== 0) {
+      obj.prompt_tokens = message.prompt_tokens;
     }
-    if (message.application_deep_link !== "") {
-      obj.application_deep_link = message.application_deep_link;
+    if (message.completion_tokens !== 0) {
+      obj.completion_tokens = message.completion_tokens;
     }
-    if (message.model_deep_link !== "") {
-      obj.model_deep_link = message.model_deep_link;
+    if (message.total_tokens !== 0) {
+      obj.total_tokens = message.total_tokens;
+    }
+    if (message.duration_seconds !== 0) {
+      obj.duration_seconds = message.duration_seconds;
+    }
+    if (message.duration_seconds_percentiles?.length) {
+      obj.duration_seconds_percentiles = message.duration_seconds_percentiles.map((e) => MetricPercentile.toJSON(e));
+    }
+    if (message.total_tokens_percentiles?.length) {
+      obj.total_tokens_percentiles = message.total_tokens_percentiles.map((e) => MetricPercentile.toJSON(e));
     }
     return obj;
   },
 
-  create(base?: DeepPartial<DeployedWorkflow>): DeployedWorkflow {
-    return DeployedWorkflow.fromPartial(base ?? {});
+  create(base?: DeepPartial<WorkflowRunMetricsSummary>): WorkflowRunMetricsSummary {
+    return WorkflowRunMetricsSummary.fromPartial(base ?? {});
   },
-  fromPartial(object: DeepPartial<DeployedWorkflow>): DeployedWorkflow {
-    const message = createBaseDeployedWorkflow();
-    message.deployed_workflow_id = object.deployed_workflow_id ?? "";
-    message.workflow_id = object.workflow_id ?? "";
-    message.workflow_name = object.workflow_name ?? "";
-    message.deployed_workflow_name = object.deployed_workflow_name ?? "";
-    message.cml_deployed_model_id = object.cml_deployed_model_id ?? "";
-    message.is_stale = object.is_stale ?? false;
-    message.application_url = object.application_url ?? "";
-    message.application_status = object.application_status ?? "";
-    message.application_deep_link = object.application_deep_link ?? "";
-    message.model_deep_link = object.model_deep_link ?? "";
+  fromPartial(object: DeepPartial<WorkflowRunMetricsSummary>): WorkflowRunMetricsSummary {
+    const message = createBaseWorkflowRunMetricsSummary();
+    message.scope = object.scope ?? "";
+    message.name = object.name ?? "";
+    message.window_start = object.window_start ?? 0;
+    message.window_end = object.window_end ?? 0;
+    message.run_count = object.run_count ?? 0;
+    message.call_count = object.call_count ?? 0;
+    message.error_count = object.error_count ?? 0;
+    message.prompt_tokens = object.prompt_tokens ?? 0;
+    message.completion_tokens = object.completion_tokens ?? 0;
+    message.total_tokens = object.total_tokens ?? 0;
+    message.duration_seconds = object.duration_seconds ?? 0;
+    message.duration_seconds_percentiles = object.duration_seconds_percentiles?.map((e) => MetricPercentile.fromPartial(e)) || [];
+    message.total_tokens_percentiles = object.total_tokens_percentiles?.map((e) => MetricPercentile.fromPartial(e)) || [];
+    return message;
+  },
+};
+
+function createBaseGetWorkflowRunMetricsResponse(): GetWorkflowRunMetricsResponse {
+  return { summaries: [] };
+}
+
+export const GetWorkflowRunMetricsResponse: MessageFns<GetWorkflowRunMetricsResponse> = {
+  encode(message: GetWorkflowRunMetricsResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    for (const v of message.summaries) {
+      WorkflowRunMetricsSummary.encode(v!, writer.uint32(10).fork()).join();
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): GetWorkflowRunMetricsResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseGetWorkflowRunMetricsResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.summaries.push(WorkflowRunMetricsSummary.decode(reader, reader.uint32()));
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): GetWorkflowRunMetricsResponse {
+    return {
+      summaries: globalThis.Array.isArray(object?.summaries)
+        ? object.summaries.map((e: any) => WorkflowRunMetricsSummary.fromJSON(e))
+        : [],
+    };
+  },
+
+  toJSON(message: GetWorkflowRunMetricsResponse): unknown {
+    const obj: any = {};
+    if (message.summaries?.length) {
+      obj.summaries = message.summaries.map((e) => WorkflowRunMetricsSummary.toJSON(e));
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<GetWorkflowRunMetricsResponse>): GetWorkflowRunMetricsResponse {
+    return GetWorkflowRunMetricsResponse.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<GetWorkflowRunMetricsResponse>): GetWorkflowRunMetricsResponse {
+    const message = createBaseGetWorkflowRunMetricsResponse();
+    message.summaries = object.summaries?.map((e) => WorkflowRunMetricsSummary.fromPartial(e)) || [];
     return message;
   },
 };
@@ -8031,7 +9387,7 @@ export const AddTaskResponse: MessageFns<AddTaskResponse> = {
 };
 
 function createBaseListTasksRequest(): ListTasksRequest {
-  return { workflow_id: undefined };
+  return { workflow_id: undefined, page_size: 0, page_token: "", read_mask: [] };
 }
 
 export const ListTasksRequest: MessageFns<ListTasksRequest> = {
@@ -8039,6 +9395,15 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
     if (message.workflow_id !== undefined) {
       writer.uint32(10).string(message.workflow_id);
     }
+    if (message.page_size !== 0) {
+      writer.uint32(16).int32(message.page_size);
+    }
+    if (message.page_token !== "") {
+      writer.uint32(26).string(message.page_token);
+    }
+    for (const v of message.read_mask) {
+      writer.uint32(34).string(v!);
+    }
     return writer;
   },
 
@@ -8057,6 +9422,30 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
           message.workflow_id = reader.string();
           continue;
         }
+        case 2: {
+          if (tag !== 16) {
+            break;
+          }
+
+          message.page_size = reader.int32();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.page_token = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.read_mask.push(reader.string());
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -8067,7 +9456,14 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
   },
 
   fromJSON(object: any): ListTasksRequest {
-    return { workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined };
+    return {
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : undefined,
+      page_size: isSet(object.page_size) ? globalThis.Number(object.page_size) : 0,
+      page_token: isSet(object.page_token) ? globalThis.String(object.page_token) : "",
+      read_mask: globalThis.Array.isArray(object?.read_mask)
+        ? object.read_mask.map((e: any) => globalThis.String(e))
+        : [],
+    };
   },
 
   toJSON(message: ListTasksRequest): unknown {
@@ -8075,6 +9471,15 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
     if (message.workflow_id !== undefined) {
       obj.workflow_id = message.workflow_id;
     }
+    if (message.page_size !== 0) {
+      obj.page_size = Math.round(message.page_size);
+    }
+    if (message.page_token !== "") {
+      obj.page_token = message.page_token;
+    }
+    if (message.read_mask?.length) {
+      obj.read_mask = message.read_mask;
+    }
     return obj;
   },
 
@@ -8084,12 +9489,15 @@ export const ListTasksRequest: MessageFns<ListTasksRequest> = {
   fromPartial(object: DeepPartial<ListTasksRequest>): ListTasksRequest {
     const message = createBaseListTasksRequest();
     message.workflow_id = object.workflow_id ?? undefined;
+    message.page_size = object.page_size ?? 0;
+    message.page_token = object.page_token ?? "";
+    message.read_mask = object.read_mask?.map((e) => e) || [];
     return message;
   },
 };
 
 function createBaseListTasksResponse(): ListTasksResponse {
-  return { tasks: [] };
+  return { tasks: [], next_page_token: "" };
 }
 
 export const ListTasksResponse: MessageFns<ListTasksResponse> = {
@@ -8097,6 +9505,9 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
     for (const v of message.tasks) {
       CrewAITaskMetadata.encode(v!, writer.uint32(10).fork()).join();
     }
+    if (message.next_page_token !== "") {
+      writer.uint32(18).string(message.next_page_token);
+    }
     return writer;
   },
 
@@ -8115,6 +9526,14 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
           message.tasks.push(CrewAITaskMetadata.decode(reader, reader.uint32()));
           continue;
         }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.next_page_token = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -8129,6 +9548,7 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
       tasks: globalThis.Array.isArray(object?.tasks)
         ? object.tasks.map((e: any) => CrewAITaskMetadata.fromJSON(e))
         : [],
+      next_page_token: isSet(object.next_page_token) ? globalThis.String(object.next_page_token) : "",
     };
   },
 
@@ -8137,6 +9557,9 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
     if (message.tasks?.length) {
       obj.tasks = message.tasks.map((e) => CrewAITaskMetadata.toJSON(e));
     }
+    if (message.next_page_token !== "") {
+      obj.next_page_token = message.next_page_token;
+    }
     return obj;
   },
 
@@ -8146,6 +9569,7 @@ export const ListTasksResponse: MessageFns<ListTasksResponse> = {
   fromPartial(object: DeepPartial<ListTasksResponse>): ListTasksResponse {
     const message = createBaseListTasksResponse();
     message.tasks = object.tasks?.map((e) => CrewAITaskMetadata.fromPartial(e)) || [];
+    message.next_page_token = object.next_page_token ?? "";
     return message;
   },
 };
@@ -12743,22 +14167,156 @@ export const UpgradeStudioResponse: MessageFns<UpgradeStudioResponse> = {
   },
 };
 
-function createBaseHealthCheckRequest(): HealthCheckRequest {
-  return {};
+function createBaseHealthCheckRequest(): HealthCheckRequest {
+  return {};
+}
+
+export const HealthCheckRequest: MessageFns<HealthCheckRequest> = {
+  encode(_: HealthCheckRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): HealthCheckRequest {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseHealthCheckRequest();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(_: any): HealthCheckRequest {
+    return {};
+  },
+
+  toJSON(_: HealthCheckRequest): unknown {
+    const obj: any = {};
+    return obj;
+  },
+
+  create(base?: DeepPartial<HealthCheckRequest>): HealthCheckRequest {
+    return HealthCheckRequest.fromPartial(base ?? {});
+  },
+  fromPartial(_: DeepPartial<HealthCheckRequest>): HealthCheckRequest {
+    const message = createBaseHealthCheckRequest();
+    return message;
+  },
+};
+
+function createBaseHealthCheckResponse(): HealthCheckResponse {
+  return { message: "" };
+}
+
+export const HealthCheckResponse: MessageFns<HealthCheckResponse> = {
+  encode(message: HealthCheckResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.message !== "") {
+      writer.uint32(10).string(message.message);
+    }
+    return writer;
+  },
+
+  decode(input: BinaryReader | Uint8Array, length?: number): HealthCheckResponse {
+    const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
+    let end = length === undefined ? reader.len : reader.pos + length;
+    const message = createBaseHealthCheckResponse();
+    while (reader.pos < end) {
+      const tag = reader.uint32();
+      switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 10) {
+            break;
+          }
+
+          message.message = reader.string();
+          continue;
+        }
+      }
+      if ((tag & 7) === 4 || tag === 0) {
+        break;
+      }
+      reader.skip(tag & 7);
+    }
+    return message;
+  },
+
+  fromJSON(object: any): HealthCheckResponse {
+    return { message: isSet(object.message) ? globalThis.String(object.message) : "" };
+  },
+
+  toJSON(message: HealthCheckResponse): unknown {
+    const obj: any = {};
+    if (message.message !== "") {
+      obj.message = message.message;
+    }
+    return obj;
+  },
+
+  create(base?: DeepPartial<HealthCheckResponse>): HealthCheckResponse {
+    return HealthCheckResponse.fromPartial(base ?? {});
+  },
+  fromPartial(object: DeepPartial<HealthCheckResponse>): HealthCheckResponse {
+    const message = createBaseHealthCheckResponse();
+    message.message = object.message ?? "";
+    return message;
+  },
+};
+
+function createBaseWatchRequest(): WatchRequest {
+  return { since_sequence: 0, change_log_id: "", workflow_id: "" };
 }
 
-export const HealthCheckRequest: MessageFns<HealthCheckRequest> = {
-  encode(_: HealthCheckRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+export const WatchRequest: MessageFns<WatchRequest> = {
+  encode(message: WatchRequest, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.since_sequence !== 0) {
+      writer.uint32(8).int32(message.since_sequence);
+    }
+    if (message.change_log_id !== "") {
+      writer.uint32(18).string(message.change_log_id);
+    }
+    if (message.workflow_id !== "") {
+      writer.uint32(26).string(message.workflow_id);
+    }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): HealthCheckRequest {
+  decode(input: BinaryReader | Uint8Array, length?: number): WatchRequest {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     let end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseHealthCheckRequest();
+    const message = createBaseWatchRequest();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
+        case 1: {
+          if (tag !== 8) {
+            break;
+          }
+
+          message.since_sequence = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.change_log_id = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.workflow_id = reader.string();
+          continue;
+        }
       }
       if ((tag & 7) === 4 || tag === 0) {
         break;
@@ -12768,49 +14326,187 @@ export const HealthCheckRequest: MessageFns<HealthCheckRequest> = {
     return message;
   },
 
-  fromJSON(_: any): HealthCheckRequest {
-    return {};
+  fromJSON(object: any): WatchRequest {
+    return {
+      since_sequence: isSet(object.since_sequence) ? globalThis.Number(object.since_sequence) : 0,
+      change_log_id: isSet(object.change_log_id) ? globalThis.String(object.change_log_id) : "",
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
+    };
   },
 
-  toJSON(_: HealthCheckRequest): unknown {
+  toJSON(message: WatchRequest): unknown {
     const obj: any = {};
+    if (message.since_sequence !== 0) {
+      obj.since_sequence = Math.round(message.since_sequence);
+    }
+    if (message.change_log_id !== "") {
+      obj.change_log_id = message.change_log_id;
+    }
+    if (message.workflow_id !== "") {
+      obj.workflow_id = message.workflow_id;
+    }
     return obj;
   },
 
-  create(base?: DeepPartial<HealthCheckRequest>): HealthCheckRequest {
-    return HealthCheckRequest.fromPartial(base ?? {});
+  create(base?: DeepPartial<WatchRequest>): WatchRequest {
+    return WatchRequest.fromPartial(base ?? {});
   },
-  fromPartial(_: DeepPartial<HealthCheckRequest>): HealthCheckRequest {
-    const message = createBaseHealthCheckRequest();
+  fromPartial(object: DeepPartial<WatchRequest>): WatchRequest {
+    const message = createBaseWatchRequest();
+    message.since_sequence = object.since_sequence ?? 0;
+    message.change_log_id = object.change_log_id ?? "";
+    message.workflow_id = object.workflow_id ?? "";
     return message;
   },
 };
 
-function createBaseHealthCheckResponse(): HealthCheckResponse {
-  return { message: "" };
+function createBaseEntityChangeEvent(): EntityChangeEvent {
+  return {
+    sequence: 0,
+    change_type: "",
+    entity_type: "",
+    entity_id: "",
+    workflow_id: "",
+    change_log_id: "",
+    workflow: undefined,
+    agent: undefined,
+    task: undefined,
+    tool_instance: undefined,
+    deployed_workflow: undefined,
+  };
 }
 
-export const HealthCheckResponse: MessageFns<HealthCheckResponse> = {
-  encode(message: HealthCheckResponse, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
-    if (message.message !== "") {
-      writer.uint32(10).string(message.message);
+export const EntityChangeEvent: MessageFns<EntityChangeEvent> = {
+  encode(message: EntityChangeEvent, writer: BinaryWriter = new BinaryWriter()): BinaryWriter {
+    if (message.sequence !== 0) {
+      writer.uint32(8).int32(message.sequence);
+    }
+    if (message.change_type !== "") {
+      writer.uint32(18).string(message.change_type);
+    }
+    if (message.entity_type !== "") {
+      writer.uint32(26).string(message.entity_type);
+    }
+    if (message.entity_id !== "") {
+      writer.uint32(34).string(message.entity_id);
+    }
+    if (message.workflow_id !== "") {
+      writer.uint32(42).string(message.workflow_id);
+    }
+    if (message.change_log_id !== "") {
+      writer.uint32(50).string(message.change_log_id);
+    }
+    if (message.workflow !== undefined) {
+      Workflow.encode(message.workflow, writer.uint32(58).fork()).join();
+    }
+    if (message.agent !== undefined) {
+      AgentMetadata.encode(message.agent, writer.uint32(66).fork()).join();
+    }
+    if (message.task !== undefined) {
+      CrewAITaskMetadata.encode(message.task, writer.uint32(74).fork()).join();
+    }
+    if (message.tool_instance !== undefined) {
+      ToolInstance.encode(message.tool_instance, writer.uint32(82).fork()).join();
+    }
+    if (message.deployed_workflow !== undefined) {
+      DeployedWorkflow.encode(message.deployed_workflow, writer.uint32(90).fork()).join();
     }
     return writer;
   },
 
-  decode(input: BinaryReader | Uint8Array, length?: number): HealthCheckResponse {
+  decode(input: BinaryReader | Uint8Array, length?: number): EntityChangeEvent {
     const reader = input instanceof BinaryReader ? input : new BinaryReader(input);
     let end = length === undefined ? reader.len : reader.pos + length;
-    const message = createBaseHealthCheckResponse();
+    const message = createBaseEntityChangeEvent();
     while (reader.pos < end) {
       const tag = reader.uint32();
       switch (tag >>> 3) {
         case 1: {
-          if (tag !== 10) {
+          if (tag !== 8) {
             break;
           }
 
-          message.message = reader.string();
+          message.sequence = reader.int32();
+          continue;
+        }
+        case 2: {
+          if (tag !== 18) {
+            break;
+          }
+
+          message.change_type = reader.string();
+          continue;
+        }
+        case 3: {
+          if (tag !== 26) {
+            break;
+          }
+
+          message.entity_type = reader.string();
+          continue;
+        }
+        case 4: {
+          if (tag !== 34) {
+            break;
+          }
+
+          message.entity_id = reader.string();
+          continue;
+        }
+        case 5: {
+          if (tag !== 42) {
+            break;
+          }
+
+          message.workflow_id = reader.string();
+          continue;
+        }
+        case 6: {
+          if (tag !== 50) {
+            break;
+          }
+
+          message.change_log_id = reader.string();
+          continue;
+        }
+        case 7: {
+          if (tag !== 58) {
+            break;
+          }
+
+          message.workflow = Workflow.decode(reader, reader.uint32());
+          continue;
+        }
+        case 8: {
+          if (tag !== 66) {
+            break;
+          }
+
+          message.agent = AgentMetadata.decode(reader, reader.uint32());
+          continue;
+        }
+        case 9: {
+          if (tag !== 74) {
+            break;
+          }
+
+          message.task = CrewAITaskMetadata.decode(reader, reader.uint32());
+          continue;
+        }
+        case 10: {
+          if (tag !== 82) {
+            break;
+          }
+
+          message.tool_instance = ToolInstance.decode(reader, reader.uint32());
+          continue;
+        }
+        case 11: {
+          if (tag !== 90) {
+            break;
+          }
+
+          message.deployed_workflow = DeployedWorkflow.decode(reader, reader.uint32());
           continue;
         }
       }
@@ -12822,24 +14518,88 @@ export const HealthCheckResponse: MessageFns<HealthCheckResponse> = {
     return message;
   },
 
-  fromJSON(object: any): HealthCheckResponse {
-    return { message: isSet(object.message) ? globalThis.String(object.message) : "" };
+  fromJSON(object: any): EntityChangeEvent {
+    return {
+      sequence: isSet(object.sequence) ? globalThis.Number(object.sequence) : 0,
+      change_type: isSet(object.change_type) ? globalThis.String(object.change_type) : "",
+      entity_type: isSet(object.entity_type) ? globalThis.String(object.entity_type) : "",
+      entity_id: isSet(object.entity_id) ? globalThis.String(object.entity_id) : "",
+      workflow_id: isSet(object.workflow_id) ? globalThis.String(object.workflow_id) : "",
+      change_log_id: isSet(object.change_log_id) ? globalThis.String(object.change_log_id) : "",
+      workflow: isSet(object.workflow) ? Workflow.fromJSON(object.workflow) : undefined,
+      agent: isSet(object.agent) ? AgentMetadata.fromJSON(object.agent) : undefined,
+      task: isSet(object.task) ? CrewAITaskMetadata.fromJSON(object.task) : undefined,
+      tool_instance: isSet(object.tool_instance) ? ToolInstance.fromJSON(object.tool_instance) : undefined,
+      deployed_workflow: isSet(object.deployed_workflow)
+        ? DeployedWorkflow.fromJSON(object.deployed_workflow)
+        : undefined,
+    };
   },
 
-  toJSON(message: HealthCheckResponse): unknown {
+  toJSON(message: EntityChangeEvent): unknown {
     const obj: any = {};
-    if (message.message !== "") {
-      obj.message = message.message;
+    if (message.sequence !== 0) {
+      obj.sequence = Math.round(message.sequence);
+    }
+    if (message.change_type !== "") {
+      obj.change_type = message.change_type;
+    }
+    if (message.entity_type !== "") {
+      obj.entity_type = message.entity_type;
+    }
+    if (message.entity_id !== "") {
+      obj.entity_id = message.entity_id;
+    }
+    if (message.workflow_id !== "") {
+      obj.workflow_id = message.workflow_id;
+    }
+    if (message.change_log_id !== "") {
+      obj.change_log_id = message.change_log_id;
+    }
+    if (message.workflow !== undefined) {
+      obj.workflow = Workflow.toJSON(message.workflow);
+    }
+    if (message.agent !== undefined) {
+      obj.agent = AgentMetadata.toJSON(message.agent);
+    }
+    if (message.task !== undefined) {
+      obj.task = CrewAITaskMetadata.toJSON(message.task);
+    }
+    if (message.tool_instance !== undefined) {
+      obj.tool_instance = ToolInstance.toJSON(message.tool_instance);
+    }
+    if (message.deployed_workflow !== undefined) {
+      obj.deployed_workflow = DeployedWorkflow.toJSON(message.deployed_workflow);
     }
     return obj;
   },
 
-  create(base?: DeepPartial<HealthCheckResponse>): HealthCheckResponse {
-    return HealthCheckResponse.fromPartial(base ?? {});
+  create(base?: DeepPartial<EntityChangeEvent>): EntityChangeEvent {
+    return EntityChangeEvent.fromPartial(base ?? {});
   },
-  fromPartial(object: DeepPartial<HealthCheckResponse>): HealthCheckResponse {
-    const message = createBaseHealthCheckResponse();
-    message.message = object.message ?? "";
+  fromPartial(object: DeepPartial<EntityChangeEvent>): EntityChangeEvent {
+    const message = createBaseEntityChangeEvent();
+    message.sequence = object.sequence ?? 0;
+    message.change_type = object.change_type ?? "";
+    message.entity_type = object.entity_type ?? "";
+    message.entity_id = object.entity_id ?? "";
+    message.workflow_id = object.workflow_id ?? "";
+    message.change_log_id = object.change_log_id ?? "";
+    message.workflow = (object.workflow !== undefined && object.workflow !== null)
+      ? Workflow.fromPartial(object.workflow)
+      : undefined;
+    message.agent = (object.agent !== undefined && object.agent !== null)
+      ? AgentMetadata.fromPartial(object.agent)
+      : undefined;
+    message.task = (object.task !== undefined && object.task !== null)
+      ? CrewAITaskMetadata.fromPartial(object.task)
+      : undefined;
+    message.tool_instance = (object.tool_instance !== undefined && object.tool_instance !== null)
+      ? ToolInstance.fromPartial(object.tool_instance)
+      : undefined;
+    message.deployed_workflow = (object.deployed_workflow !== undefined && object.deployed_workflow !== null)
+      ? DeployedWorkflow.fromPartial(object.deployed_workflow)
+      : undefined;
     return message;
   },
 };
@@ -13176,6 +14936,16 @@ export const AgentStudioService = {
     responseSerialize: (value: TestWorkflowResponse) => Buffer.from(TestWorkflowResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer) => TestWorkflowResponse.decode(value),
   },
+  streamWorkflowEvents: {
+    path: "/agent_studio.AgentStudio/StreamWorkflowEvents",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: StreamWorkflowEventsRequest) =>
+      Buffer.from(StreamWorkflowEventsRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => StreamWorkflowEventsRequest.decode(value),
+    responseSerialize: (value: WorkflowRunEvent) => Buffer.from(WorkflowRunEvent.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => WorkflowRunEvent.decode(value),
+  },
   removeWorkflow: {
     path: "/agent_studio.AgentStudio/RemoveWorkflow",
     requestStream: false,
@@ -13216,6 +14986,28 @@ export const AgentStudioService = {
       Buffer.from(ListDeployedWorkflowsResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer) => ListDeployedWorkflowsResponse.decode(value),
   },
+  resolveWorkflowTrace: {
+    path: "/agent_studio.AgentStudio/ResolveWorkflowTrace",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: ResolveWorkflowTraceRequest) =>
+      Buffer.from(ResolveWorkflowTraceRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => ResolveWorkflowTraceRequest.decode(value),
+    responseSerialize: (value: ResolveWorkflowTraceResponse) =>
+      Buffer.from(ResolveWorkflowTraceResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => ResolveWorkflowTraceResponse.decode(value),
+  },
+  getWorkflowRunMetrics: {
+    path: "/agent_studio.AgentStudio/GetWorkflowRunMetrics",
+    requestStream: false,
+    responseStream: false,
+    requestSerialize: (value: GetWorkflowRunMetricsRequest) =>
+      Buffer.from(GetWorkflowRunMetricsRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => GetWorkflowRunMetricsRequest.decode(value),
+    responseSerialize: (value: GetWorkflowRunMetricsResponse) =>
+      Buffer.from(GetWorkflowRunMetricsResponse.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => GetWorkflowRunMetricsResponse.decode(value),
+  },
   /** Utility functions */
   temporaryFileUpload: {
     path: "/agent_studio.AgentStudio/TemporaryFileUpload",
@@ -13456,6 +15248,52 @@ export const AgentStudioService = {
       Buffer.from(RemoveTaskTemplateResponse.encode(value).finish()),
     responseDeserialize: (value: Buffer) => RemoveTaskTemplateResponse.decode(value),
   },
+  /** Change watching operations */
+  watchWorkflows: {
+    path: "/agent_studio.AgentStudio/WatchWorkflows",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: WatchRequest) => Buffer.from(WatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => WatchRequest.decode(value),
+    responseSerialize: (value: EntityChangeEvent) => Buffer.from(EntityChangeEvent.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => EntityChangeEvent.decode(value),
+  },
+  watchAgents: {
+    path: "/agent_studio.AgentStudio/WatchAgents",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: WatchRequest) => Buffer.from(WatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => WatchRequest.decode(value),
+    responseSerialize: (value: EntityChangeEvent) => Buffer.from(EntityChangeEvent.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => EntityChangeEvent.decode(value),
+  },
+  watchTasks: {
+    path: "/agent_studio.AgentStudio/WatchTasks",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: WatchRequest) => Buffer.from(WatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => WatchRequest.decode(value),
+    responseSerialize: (value: EntityChangeEvent) => Buffer.from(EntityChangeEvent.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => EntityChangeEvent.decode(value),
+  },
+  watchToolInstances: {
+    path: "/agent_studio.AgentStudio/WatchToolInstances",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: WatchRequest) => Buffer.from(WatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => WatchRequest.decode(value),
+    responseSerialize: (value: EntityChangeEvent) => Buffer.from(EntityChangeEvent.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => EntityChangeEvent.decode(value),
+  },
+  watchDeployedWorkflows: {
+    path: "/agent_studio.AgentStudio/WatchDeployedWorkflows",
+    requestStream: false,
+    responseStream: true,
+    requestSerialize: (value: WatchRequest) => Buffer.from(WatchRequest.encode(value).finish()),
+    requestDeserialize: (value: Buffer) => WatchRequest.decode(value),
+    responseSerialize: (value: EntityChangeEvent) => Buffer.from(EntityChangeEvent.encode(value).finish()),
+    responseDeserialize: (value: Buffer) => EntityChangeEvent.decode(value),
+  },
 } as const;
 
 export interface AgentStudioServer extends UntypedServiceImplementation {
@@ -13500,11 +15338,14 @@ export interface AgentStudioServer extends UntypedServiceImplementation {
   addWorkflow: handleUnaryCall<AddWorkflowRequest, AddWorkflowResponse>;
   updateWorkflow: handleUnaryCall<UpdateWorkflowRequest, UpdateWorkflowResponse>;
   testWorkflow: handleUnaryCall<TestWorkflowRequest, TestWorkflowResponse>;
+  streamWorkflowEvents: handleServerStreamingCall<StreamWorkflowEventsRequest, WorkflowRunEvent>;
   removeWorkflow: handleUnaryCall<RemoveWorkflowRequest, RemoveWorkflowResponse>;
   /** Deployed Workflow Operations */
   deployWorkflow: handleUnaryCall<DeployWorkflowRequest, DeployWorkflowResponse>;
   undeployWorkflow: handleUnaryCall<UndeployWorkflowRequest, UndeployWorkflowResponse>;
   listDeployedWorkflows: handleUnaryCall<ListDeployedWorkflowsRequest, ListDeployedWorkflowsResponse>;
+  resolveWorkflowTrace: handleUnaryCall<ResolveWorkflowTraceRequest, ResolveWorkflowTraceResponse>;
+  getWorkflowRunMetrics: handleUnaryCall<GetWorkflowRunMetricsRequest, GetWorkflowRunMetricsResponse>;
   /** Utility functions */
   temporaryFileUpload: handleClientStreamingCall<FileChunk, FileUploadResponse>;
   nonStreamingTemporaryFileUpload: handleUnaryCall<NonStreamingTemporaryFileUploadRequest, FileUploadResponse>;
@@ -13532,6 +15373,12 @@ export interface AgentStudioServer extends UntypedServiceImplementation {
   getTaskTemplate: handleUnaryCall<GetTaskTemplateRequest, GetTaskTemplateResponse>;
   addTaskTemplate: handleUnaryCall<AddTaskTemplateRequest, AddTaskTemplateResponse>;
   removeTaskTemplate: handleUnaryCall<RemoveTaskTemplateRequest, RemoveTaskTemplateResponse>;
+  /** Change watching operations */
+  watchWorkflows: handleServerStreamingCall<WatchRequest, EntityChangeEvent>;
+  watchAgents: handleServerStreamingCall<WatchRequest, EntityChangeEvent>;
+  watchTasks: handleServerStreamingCall<WatchRequest, EntityChangeEvent>;
+  watchToolInstances: handleServerStreamingCall<WatchRequest, EntityChangeEvent>;
+  watchDeployedWorkflows: handleServerStreamingCall<WatchRequest, EntityChangeEvent>;
 }
 
 export interface AgentStudioClient extends Client {
@@ -14052,6 +15899,15 @@ export interface AgentStudioClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: TestWorkflowResponse) => void,
   ): ClientUnaryCall;
+  streamWorkflowEvents(
+    request: StreamWorkflowEventsRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<WorkflowRunEvent>;
+  streamWorkflowEvents(
+    request: StreamWorkflowEventsRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<WorkflowRunEvent>;
   removeWorkflow(
     request: RemoveWorkflowRequest,
     callback: (error: ServiceError | null, response: RemoveWorkflowResponse) => void,
@@ -14113,6 +15969,36 @@ export interface AgentStudioClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: ListDeployedWorkflowsResponse) => void,
   ): ClientUnaryCall;
+  resolveWorkflowTrace(
+    request: ResolveWorkflowTraceRequest,
+    callback: (error: ServiceError | null, response: ResolveWorkflowTraceResponse) => void,
+  ): ClientUnaryCall;
+  resolveWorkflowTrace(
+    request: ResolveWorkflowTraceRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: ResolveWorkflowTraceResponse) => void,
+  ): ClientUnaryCall;
+  resolveWorkflowTrace(
+    request: ResolveWorkflowTraceRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: ResolveWorkflowTraceResponse) => void,
+  ): ClientUnaryCall;
+  getWorkflowRunMetrics(
+    request: GetWorkflowRunMetricsRequest,
+    callback: (error: ServiceError | null, response: GetWorkflowRunMetricsResponse) => void,
+  ): ClientUnaryCall;
+  getWorkflowRunMetrics(
+    request: GetWorkflowRunMetricsRequest,
+    metadata: Metadata,
+    callback: (error: ServiceError | null, response: GetWorkflowRunMetricsResponse) => void,
+  ): ClientUnaryCall;
+  getWorkflowRunMetrics(
+    request: GetWorkflowRunMetricsRequest,
+    metadata: Metadata,
+    options: Partial<CallOptions>,
+    callback: (error: ServiceError | null, response: GetWorkflowRunMetricsResponse) => void,
+  ): ClientUnaryCall;
   /** Utility functions */
   temporaryFileUpload(
     callback: (error: ServiceError | null, response: FileUploadResponse) => void,
@@ -14457,6 +16343,52 @@ export interface AgentStudioClient extends Client {
     options: Partial<CallOptions>,
     callback: (error: ServiceError | null, response: RemoveTaskTemplateResponse) => void,
   ): ClientUnaryCall;
+  /** Change watching operations */
+  watchWorkflows(
+    request: WatchRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchWorkflows(
+    request: WatchRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchAgents(
+    request: WatchRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchAgents(
+    request: WatchRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchTasks(
+    request: WatchRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchTasks(
+    request: WatchRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchToolInstances(
+    request: WatchRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchToolInstances(
+    request: WatchRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchDeployedWorkflows(
+    request: WatchRequest,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
+  watchDeployedWorkflows(
+    request: WatchRequest,
+    metadata?: Metadata,
+    options?: Partial<CallOptions>,
+  ): ClientReadableStream<EntityChangeEvent>;
 }
 
 export const AgentStudioClient = makeGenericClientConstructor(
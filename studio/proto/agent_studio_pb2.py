@@ -20,7 +20,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\x1fstudio/proto/agent_studio.proto\x12\x0c\x61gent_studio"\x86\x01\n\x05Model\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x12\n\nmodel_type\x18\x04 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x05 \x01(\t\x12\x19\n\x11is_studio_default\x18\x06 \x01(\x08"\x13\n\x11ListModelsRequest"@\n\x12ListModelsResponse\x12*\n\rmodel_details\x18\x01 \x03(\x0b\x32\x13.agent_studio.Model"#\n\x0fGetModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t">\n\x10GetModelResponse\x12*\n\rmodel_details\x18\x01 \x01(\x0b\x32\x13.agent_studio.Model"t\n\x0f\x41\x64\x64ModelRequest\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x16\n\x0eprovider_model\x18\x02 \x01(\t\x12\x12\n\nmodel_type\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"$\n\x10\x41\x64\x64ModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"&\n\x12RemoveModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x15\n\x13RemoveModelResponse"u\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"\'\n\x13UpdateModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x93\x01\n\x10TestModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ompletion_role\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompletion_content\x18\x03 \x01(\t\x12\x13\n\x0btemperature\x18\x04 \x01(\x02\x12\x12\n\nmax_tokens\x18\x05 \x01(\x05\x12\x0f\n\x07timeout\x18\x06 \x01(\x05"%\n\x11TestModelResponse\x12\x10\n\x08response\x18\x01 \x01(\t"0\n\x1cSetStudioDefaultModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x1f\n\x1dSetStudioDefaultModelResponse"\x1e\n\x1cGetStudioDefaultModelRequest"p\n\x1dGetStudioDefaultModelResponse\x12#\n\x1bis_default_model_configured\x18\x01 \x01(\x08\x12*\n\rmodel_details\x18\x02 \x01(\x0b\x32\x13.agent_studio.Model"V\n\x18ListToolTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"J\n\x19ListToolTemplatesResponse\x12-\n\ttemplates\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolTemplate"2\n\x16GetToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"G\n\x17GetToolTemplateResponse\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolTemplate"\x8d\x01\n\x16\x41\x64\x64ToolTemplateRequest\x12\x1a\n\x12tool_template_name\x18\x01 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x02 \x01(\t\x12!\n\x14workflow_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"3\n\x17\x41\x64\x64ToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"n\n\x19UpdateToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t\x12\x1a\n\x12tool_template_name\x18\x02 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x03 \x01(\t"6\n\x1aUpdateToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"5\n\x19RemoveToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolTemplateResponse"D\n\x18ListToolInstancesRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"O\n\x19ListToolInstancesResponse\x12\x32\n\x0etool_instances\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolInstance"2\n\x16GetToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"L\n\x17GetToolInstanceResponse\x12\x31\n\rtool_instance\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolInstance"r\n\x19\x43reateToolInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x10tool_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x13\n\x11_tool_template_id"R\n\x1a\x43reateToolInstanceResponse\x12\x1a\n\x12tool_instance_name\x18\x01 \x01(\t\x12\x18\n\x10tool_instance_id\x18\x02 \x01(\t"u\n\x19UpdateToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x04 \x01(\t"6\n\x1aUpdateToolInstanceResponse\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"5\n\x19RemoveToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolInstanceResponse"\xa0\x02\n\x0cToolTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bpython_code\x18\x03 \x01(\t\x12\x1b\n\x13python_requirements\x18\x04 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x05 \x01(\t\x12\x15\n\rtool_metadata\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x11\n\tpre_built\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12!\n\x14workflow_template_id\x18\x0b \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"\xe6\x01\n\x0cToolInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x13\n\x0bpython_code\x18\x04 \x01(\t\x12\x1b\n\x13python_requirements\x18\x05 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x06 \x01(\t\x12\x15\n\rtool_metadata\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t"=\n\x11ListAgentsRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"A\n\x12ListAgentsResponse\x12+\n\x06\x61gents\x18\x01 \x03(\x0b\x32\x1b.agent_studio.AgentMetadata"#\n\x0fGetAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t">\n\x10GetAgentResponse\x12*\n\x05\x61gent\x18\x01 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata"\x8b\x02\n\x0f\x41\x64\x64\x41gentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x02 \x01(\t\x12\x10\n\x08tools_id\x18\x03 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x04 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x18\n\x0btemplate_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x0bworkflow_id\x18\x06 \x01(\t\x12\x1c\n\x14tmp_agent_image_path\x18\x07 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x08 \x03(\tB\x0e\n\x0c_template_id"$\n\x10\x41\x64\x64\x41gentResponse\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\xe1\x01\n\x12UpdateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x1c\n\x14tmp_agent_image_path\x18\x06 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x07 \x03(\t"\x15\n\x13UpdateAgentResponse"&\n\x12RemoveAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\x15\n\x13RemoveAgentResponse"\xdd\x01\n\rAgentMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x17\n\x0f\x61gent_image_uri\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x13\n\x0bworkflow_id\x18\x08 \x01(\t"\xa5\x01\n\x13\x43rewAIAgentMetadata\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x11\n\tbackstory\x18\x02 \x01(\t\x12\x0c\n\x04goal\x18\x03 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x04 \x01(\x08\x12\x0f\n\x07verbose\x18\x05 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x06 \x01(\x08\x12\x13\n\x0btemperature\x18\x07 \x01(\x02\x12\x10\n\x08max_iter\x18\x08 \x01(\x05"I\n\x10TestAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x12\n\nuser_input\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t"%\n\x11TestAgentResponse\x12\x10\n\x08response\x18\x01 \x01(\t"\xb8\x02\n\x12\x41\x64\x64WorkflowRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x19\x63rew_ai_workflow_metadata\x18\x02 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadataH\x01\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12!\n\x14workflow_template_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x1c\n\x1a_crew_ai_workflow_metadataB\x14\n\x12_is_conversationalB\x17\n\x15_workflow_template_idB\x0e\n\x0c_description"*\n\x13\x41\x64\x64WorkflowResponse\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x16\n\x14ListWorkflowsRequest"B\n\x15ListWorkflowsResponse\x12)\n\tworkflows\x18\x01 \x03(\x0b\x32\x16.agent_studio.Workflow")\n\x12GetWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"?\n\x13GetWorkflowResponse\x12(\n\x08workflow\x18\x01 \x01(\x0b\x32\x16.agent_studio.Workflow"\xb3\x01\n\x15UpdateWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x19\n\x11is_conversational\x18\x04 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t"\x18\n\x16UpdateWorkflowResponse"\xa5\x01\n\x1eTestWorkflowToolUserParameters\x12P\n\nparameters\x18\x01 \x03(\x0b\x32<.agent_studio.TestWorkflowToolUserParameters.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\xf5\x02\n\x13TestWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12=\n\x06inputs\x18\x02 \x03(\x0b\x32-.agent_studio.TestWorkflowRequest.InputsEntry\x12W\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.ToolUserParametersEntry\x12\x19\n\x11generation_config\x18\x04 \x01(\t\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"9\n\x14TestWorkflowResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t"\xc6\x03\n\x15\x44\x65ployWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12]\n\x16\x65nv_variable_overrides\x18\x02 \x03(\x0b\x32=.agent_studio.DeployWorkflowRequest.EnvVariableOverridesEntry\x12Y\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.ToolUserParametersEntry\x12\x1d\n\x15\x62ypass_authentication\x18\x04 \x01(\x08\x12\x19\n\x11generation_config\x18\x05 \x01(\t\x1a;\n\x19\x45nvVariableOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"u\n\x16\x44\x65ployWorkflowResponse\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x02 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x03 \x01(\t"7\n\x17UndeployWorkflowRequest\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t"\x1a\n\x18UndeployWorkflowResponse"\x1e\n\x1cListDeployedWorkflowsRequest"[\n\x1dListDeployedWorkflowsResponse\x12:\n\x12\x64\x65ployed_workflows\x18\x01 \x03(\x0b\x32\x1e.agent_studio.DeployedWorkflow",\n\x15RemoveWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x18\n\x16RemoveWorkflowResponse"\x9a\x02\n\x10\x44\x65ployedWorkflow\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x02 \x01(\t\x12\x15\n\rworkflow_name\x18\x03 \x01(\t\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x04 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x05 \x01(\t\x12\x10\n\x08is_stale\x18\x06 \x01(\x08\x12\x17\n\x0f\x61pplication_url\x18\x07 \x01(\t\x12\x1a\n\x12\x61pplication_status\x18\x08 \x01(\t\x12\x1d\n\x15\x61pplication_deep_link\x18\t \x01(\t\x12\x17\n\x0fmodel_deep_link\x18\n \x01(\t"\x82\x02\n\x08Workflow\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x10\n\x08is_valid\x18\x04 \x01(\x08\x12\x10\n\x08is_ready\x18\x05 \x01(\x08\x12\x19\n\x11is_conversational\x18\x06 \x01(\x08\x12\x10\n\x08is_draft\x18\x07 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\x16\n\tdirectory\x18\t \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_directory"\xb4\x01\n\x16\x43rewAIWorkflowMetadata\x12\x10\n\x08\x61gent_id\x18\x01 \x03(\t\x12\x0f\n\x07task_id\x18\x02 \x03(\t\x12\x18\n\x10manager_agent_id\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12*\n\x1dmanager_llm_model_provider_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42 \n\x1e_manager_llm_model_provider_id"\xa3\x01\n\x0e\x41\x64\x64TaskRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x18\x61\x64\x64_crew_ai_task_request\x18\x02 \x01(\x0b\x32".agent_studio.AddCrewAITaskRequest\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x18\n\x0btemplate_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_template_id""\n\x0f\x41\x64\x64TaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"<\n\x10ListTasksRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_workflow_id"D\n\x11ListTasksResponse\x12/\n\x05tasks\x18\x01 \x03(\x0b\x32 .agent_studio.CrewAITaskMetadata"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"A\n\x0fGetTaskResponse\x12.\n\x04task\x18\x01 \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata"l\n\x11UpdateTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x46\n\x17UpdateCrewAITaskRequest\x18\x02 \x01(\x0b\x32%.agent_studio.UpdateCrewAITaskRequest"\x14\n\x12UpdateTaskResponse"$\n\x11RemoveTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\x14\n\x12RemoveTaskResponse"\xa5\x01\n\x12\x43rewAITaskMetadata\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x04 \x01(\t\x12\x10\n\x08is_valid\x18\x05 \x01(\x08\x12\x0e\n\x06inputs\x18\x06 \x03(\t\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t"b\n\x17UpdateCrewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"_\n\x14\x41\x64\x64\x43rewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"-\n\x13GetAssetDataRequest\x12\x16\n\x0e\x61sset_uri_list\x18\x01 \x03(\t"\xab\x01\n\x14GetAssetDataResponse\x12\x45\n\nasset_data\x18\x01 \x03(\x0b\x32\x31.agent_studio.GetAssetDataResponse.AssetDataEntry\x12\x1a\n\x12unavailable_assets\x18\x02 \x03(\t\x1a\x30\n\x0e\x41ssetDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01"F\n\tFileChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x15\n\ris_last_chunk\x18\x03 \x01(\x08"Q\n&NonStreamingTemporaryFileUploadRequest\x12\x14\n\x0c\x66ull_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t"8\n\x12\x46ileUploadResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t"1\n\x1c\x44ownloadTemporaryFileRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t" \n\x1eGetParentProjectDetailsRequest"T\n\x1fGetParentProjectDetailsResponse\x12\x14\n\x0cproject_base\x18\x01 \x01(\t\x12\x1b\n\x13studio_subdirectory\x18\x02 \x01(\t"W\n\x19ListAgentTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"Z\n\x1aListAgentTemplatesResponse\x12<\n\x0f\x61gent_templates\x18\x01 \x03(\x0b\x32#.agent_studio.AgentTemplateMetadata"%\n\x17GetAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"W\n\x18GetAgentTemplateResponse\x12;\n\x0e\x61gent_template\x18\x01 \x01(\x0b\x32#.agent_studio.AgentTemplateMetadata"\xc1\x02\n\x17\x41\x64\x64\x41gentTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x03 \x03(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x11\n\tbackstory\x18\x05 \x01(\t\x12\x0c\n\x04goal\x18\x06 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x07 \x01(\x08\x12\x0f\n\x07verbose\x18\x08 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\t \x01(\x08\x12\x13\n\x0btemperature\x18\n \x01(\x02\x12\x10\n\x08max_iter\x18\x0b \x01(\x05\x12\x1c\n\x14tmp_agent_image_path\x18\x0c \x01(\t\x12!\n\x14workflow_template_id\x18\r \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"&\n\x18\x41\x64\x64\x41gentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xf4\x03\n\x1aUpdateAgentTemplateRequest\x12\x19\n\x11\x61gent_template_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x11\n\x04role\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x16\n\tbackstory\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04goal\x18\x07 \x01(\tH\x04\x88\x01\x01\x12\x1d\n\x10\x61llow_delegation\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x14\n\x07verbose\x18\t \x01(\x08H\x06\x88\x01\x01\x12\x12\n\x05\x63\x61\x63he\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x18\n\x0btemperature\x18\x0b \x01(\x02H\x08\x88\x01\x01\x12\x15\n\x08max_iter\x18\x0c \x01(\x05H\t\x88\x01\x01\x12!\n\x14tmp_agent_image_path\x18\r \x01(\tH\n\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\x07\n\x05_roleB\x0c\n\n_backstoryB\x07\n\x05_goalB\x13\n\x11_allow_delegationB\n\n\x08_verboseB\x08\n\x06_cacheB\x0e\n\x0c_temperatureB\x0b\n\t_max_iterB\x17\n\x15_tmp_agent_image_path")\n\x1bUpdateAgentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"(\n\x1aRemoveAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1d\n\x1bRemoveAgentTemplateResponse"\xdc\x02\n\x15\x41gentTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\x12\x11\n\tbackstory\x18\x06 \x01(\t\x12\x0c\n\x04goal\x18\x07 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x08 \x01(\x08\x12\x0f\n\x07verbose\x18\t \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\n \x01(\x08\x12\x13\n\x0btemperature\x18\x0b \x01(\x02\x12\x10\n\x08max_iter\x18\x0c \x01(\x05\x12\x17\n\x0f\x61gent_image_uri\x18\r \x01(\t\x12!\n\x14workflow_template_id\x18\x0e \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cpre_packaged\x18\x0f \x01(\x08\x42\x17\n\x15_workflow_template_id"\x1e\n\x1cListWorkflowTemplatesRequest"c\n\x1dListWorkflowTemplatesResponse\x12\x42\n\x12workflow_templates\x18\x01 \x03(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"(\n\x1aGetWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"`\n\x1bGetWorkflowTemplateResponse\x12\x41\n\x11workflow_template\x18\x01 \x01(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"\x9b\x03\n\x1a\x41\x64\x64WorkflowTemplateRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07process\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\x12\x61gent_template_ids\x18\x04 \x03(\t\x12\x19\n\x11task_template_ids\x18\x05 \x03(\t\x12&\n\x19manager_agent_template_id\x18\x06 \x01(\tH\x03\x88\x01\x01\x12 \n\x13use_default_manager\x18\x07 \x01(\x08H\x04\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\t \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\n\n\x08_processB\x1c\n\x1a_manager_agent_template_idB\x16\n\x14_use_default_managerB\x14\n\x12_is_conversationalB\x0e\n\x0c_workflow_id")\n\x1b\x41\x64\x64WorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"+\n\x1dRemoveWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t" \n\x1eRemoveWorkflowTemplateResponse"\x82\x02\n\x18WorkflowTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12\x1a\n\x12\x61gent_template_ids\x18\x05 \x03(\t\x12\x19\n\x11task_template_ids\x18\x06 \x03(\t\x12!\n\x19manager_agent_template_id\x18\x07 \x01(\t\x12\x1b\n\x13use_default_manager\x18\x08 \x01(\x08\x12\x19\n\x11is_conversational\x18\t \x01(\x08\x12\x14\n\x0cpre_packaged\x18\n \x01(\x08"+\n\x1d\x45xportWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"3\n\x1e\x45xportWorkflowTemplateResponse\x12\x11\n\tfile_path\x18\x01 \x01(\t"2\n\x1dImportWorkflowTemplateRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t",\n\x1eImportWorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"V\n\x18ListTaskTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"W\n\x19ListTaskTemplatesResponse\x12:\n\x0etask_templates\x18\x01 \x03(\x0b\x32".agent_studio.TaskTemplateMetadata"$\n\x16GetTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"T\n\x17GetTaskTemplateResponse\x12\x39\n\rtask_template\x18\x01 \x01(\x0b\x32".agent_studio.TaskTemplateMetadata"\xb4\x01\n\x16\x41\x64\x64TaskTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x04 \x01(\t\x12!\n\x14workflow_template_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"%\n\x17\x41\x64\x64TaskTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\'\n\x19RemoveTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1c\n\x1aRemoveTaskTemplateResponse"\xbe\x01\n\x14TaskTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x04 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"!\n\x1f\x43heckStudioUpgradeStatusRequest"Q\n CheckStudioUpgradeStatusResponse\x12\x15\n\rlocal_version\x18\x01 \x01(\t\x12\x16\n\x0enewest_version\x18\x02 \x01(\t"\x16\n\x14UpgradeStudioRequest"\x17\n\x15UpgradeStudioResponse"\x14\n\x12HealthCheckRequest"&\n\x13HealthCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t2\xc9.\n\x0b\x41gentStudio\x12Q\n\nListModels\x12\x1f.agent_studio.ListModelsRequest\x1a .agent_studio.ListModelsResponse"\x00\x12K\n\x08GetModel\x12\x1d.agent_studio.GetModelRequest\x1a\x1e.agent_studio.GetModelResponse"\x00\x12K\n\x08\x41\x64\x64Model\x12\x1d.agent_studio.AddModelRequest\x1a\x1e.agent_studio.AddModelResponse"\x00\x12T\n\x0bRemoveModel\x12 .agent_studio.RemoveModelRequest\x1a!.agent_studio.RemoveModelResponse"\x00\x12T\n\x0bUpdateModel\x12 .agent_studio.UpdateModelRequest\x1a!.agent_studio.UpdateModelResponse"\x00\x12N\n\tTestModel\x12\x1e.agent_studio.TestModelRequest\x1a\x1f.agent_studio.TestModelResponse"\x00\x12r\n\x15SetStudioDefaultModel\x12*.agent_studio.SetStudioDefaultModelRequest\x1a+.agent_studio.SetStudioDefaultModelResponse"\x00\x12r\n\x15GetStudioDefaultModel\x12*.agent_studio.GetStudioDefaultModelRequest\x1a+.agent_studio.GetStudioDefaultModelResponse"\x00\x12\x66\n\x11ListToolTemplates\x12&.agent_studio.ListToolTemplatesRequest\x1a\'.agent_studio.ListToolTemplatesResponse"\x00\x12`\n\x0fGetToolTemplate\x12$.agent_studio.GetToolTemplateRequest\x1a%.agent_studio.GetToolTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64ToolTemplate\x12$.agent_studio.AddToolTemplateRequest\x1a%.agent_studio.AddToolTemplateResponse"\x00\x12i\n\x12UpdateToolTemplate\x12\'.agent_studio.UpdateToolTemplateRequest\x1a(.agent_studio.UpdateToolTemplateResponse"\x00\x12i\n\x12RemoveToolTemplate\x12\'.agent_studio.RemoveToolTemplateRequest\x1a(.agent_studio.RemoveToolTemplateResponse"\x00\x12\x66\n\x11ListToolInstances\x12&.agent_studio.ListToolInstancesRequest\x1a\'.agent_studio.ListToolInstancesResponse"\x00\x12`\n\x0fGetToolInstance\x12$.agent_studio.GetToolInstanceRequest\x1a%.agent_studio.GetToolInstanceResponse"\x00\x12i\n\x12\x43reateToolInstance\x12\'.agent_studio.CreateToolInstanceRequest\x1a(.agent_studio.CreateToolInstanceResponse"\x00\x12i\n\x12UpdateToolInstance\x12\'.agent_studio.UpdateToolInstanceRequest\x1a(.agent_studio.UpdateToolInstanceResponse"\x00\x12i\n\x12RemoveToolInstance\x12\'.agent_studio.RemoveToolInstanceRequest\x1a(.agent_studio.RemoveToolInstanceResponse"\x00\x12Q\n\nListAgents\x12\x1f.agent_studio.ListAgentsRequest\x1a .agent_studio.ListAgentsResponse"\x00\x12K\n\x08GetAgent\x12\x1d.agent_studio.GetAgentRequest\x1a\x1e.agent_studio.GetAgentResponse"\x00\x12K\n\x08\x41\x64\x64\x41gent\x12\x1d.agent_studio.AddAgentRequest\x1a\x1e.agent_studio.AddAgentResponse"\x00\x12T\n\x0bUpdateAgent\x12 .agent_studio.UpdateAgentRequest\x1a!.agent_studio.UpdateAgentResponse"\x00\x12T\n\x0bRemoveAgent\x12 .agent_studio.RemoveAgentRequest\x1a!.agent_studio.RemoveAgentResponse"\x00\x12N\n\tTestAgent\x12\x1e.agent_studio.TestAgentRequest\x1a\x1f.agent_studio.TestAgentResponse"\x00\x12H\n\x07\x41\x64\x64Task\x12\x1c.agent_studio.AddTaskRequest\x1a\x1d.agent_studio.AddTaskResponse"\x00\x12N\n\tListTasks\x12\x1e.agent_studio.ListTasksRequest\x1a\x1f.agent_studio.ListTasksResponse"\x00\x12H\n\x07GetTask\x12\x1c.agent_studio.GetTaskRequest\x1a\x1d.agent_studio.GetTaskResponse"\x00\x12Q\n\nUpdateTask\x12\x1f.agent_studio.UpdateTaskRequest\x1a .agent_studio.UpdateTaskResponse"\x00\x12Q\n\nRemoveTask\x12\x1f.agent_studio.RemoveTaskRequest\x1a .agent_studio.RemoveTaskResponse"\x00\x12Z\n\rListWorkflows\x12".agent_studio.ListWorkflowsRequest\x1a#.agent_studio.ListWorkflowsResponse"\x00\x12T\n\x0bGetWorkflow\x12 .agent_studio.GetWorkflowRequest\x1a!.agent_studio.GetWorkflowResponse"\x00\x12T\n\x0b\x41\x64\x64Workflow\x12 .agent_studio.AddWorkflowRequest\x1a!.agent_studio.AddWorkflowResponse"\x00\x12]\n\x0eUpdateWorkflow\x12#.agent_studio.UpdateWorkflowRequest\x1a$.agent_studio.UpdateWorkflowResponse"\x00\x12W\n\x0cTestWorkflow\x12!.agent_studio.TestWorkflowRequest\x1a".agent_studio.TestWorkflowResponse"\x00\x12]\n\x0eRemoveWorkflow\x12#.agent_studio.RemoveWorkflowRequest\x1a$.agent_studio.RemoveWorkflowResponse"\x00\x12]\n\x0e\x44\x65ployWorkflow\x12#.agent_studio.DeployWorkflowRequest\x1a$.agent_studio.DeployWorkflowResponse"\x00\x12\x63\n\x10UndeployWorkflow\x12%.agent_studio.UndeployWorkflowRequest\x1a&.agent_studio.UndeployWorkflowResponse"\x00\x12r\n\x15ListDeployedWorkflows\x12*.agent_studio.ListDeployedWorkflowsRequest\x1a+.agent_studio.ListDeployedWorkflowsResponse"\x00\x12T\n\x13TemporaryFileUpload\x12\x17.agent_studio.FileChunk\x1a .agent_studio.FileUploadResponse"\x00(\x01\x12{\n\x1fNonStreamingTemporaryFileUpload\x12\x34.agent_studio.NonStreamingTemporaryFileUploadRequest\x1a .agent_studio.FileUploadResponse"\x00\x12`\n\x15\x44ownloadTemporaryFile\x12*.agent_studio.DownloadTemporaryFileRequest\x1a\x17.agent_studio.FileChunk"\x00\x30\x01\x12W\n\x0cGetAssetData\x12!.agent_studio.GetAssetDataRequest\x1a".agent_studio.GetAssetDataResponse"\x00\x12x\n\x17GetParentProjectDetails\x12,.agent_studio.GetParentProjectDetailsRequest\x1a-.agent_studio.GetParentProjectDetailsResponse"\x00\x12{\n\x18\x43heckStudioUpgradeStatus\x12-.agent_studio.CheckStudioUpgradeStatusRequest\x1a..agent_studio.CheckStudioUpgradeStatusResponse"\x00\x12Z\n\rUpgradeStudio\x12".agent_studio.UpgradeStudioRequest\x1a#.agent_studio.UpgradeStudioResponse"\x00\x12T\n\x0bHealthCheck\x12 .agent_studio.HealthCheckRequest\x1a!.agent_studio.HealthCheckResponse"\x00\x12i\n\x12ListAgentTemplates\x12\'.agent_studio.ListAgentTemplatesRequest\x1a(.agent_studio.ListAgentTemplatesResponse"\x00\x12\x63\n\x10GetAgentTemplate\x12%.agent_studio.GetAgentTemplateRequest\x1a&.agent_studio.GetAgentTemplateResponse"\x00\x12\x63\n\x10\x41\x64\x64\x41gentTemplate\x12%.agent_studio.AddAgentTemplateRequest\x1a&.agent_studio.AddAgentTemplateResponse"\x00\x12l\n\x13UpdateAgentTemplate\x12(.agent_studio.UpdateAgentTemplateRequest\x1a).agent_studio.UpdateAgentTemplateResponse"\x00\x12l\n\x13RemoveAgentTemplate\x12(.agent_studio.RemoveAgentTemplateRequest\x1a).agent_studio.RemoveAgentTemplateResponse"\x00\x12r\n\x15ListWorkflowTemplates\x12*.agent_studio.ListWorkflowTemplatesRequest\x1a+.agent_studio.ListWorkflowTemplatesResponse"\x00\x12l\n\x13GetWorkflowTemplate\x12(.agent_studio.GetWorkflowTemplateRequest\x1a).agent_studio.GetWorkflowTemplateResponse"\x00\x12l\n\x13\x41\x64\x64WorkflowTemplate\x12(.agent_studio.AddWorkflowTemplateRequest\x1a).agent_studio.AddWorkflowTemplateResponse"\x00\x12u\n\x16RemoveWorkflowTemplate\x12+.agent_studio.RemoveWorkflowTemplateRequest\x1a,.agent_studio.RemoveWorkflowTemplateResponse"\x00\x12u\n\x16\x45xportWorkflowTemplate\x12+.agent_studio.ExportWorkflowTemplateRequest\x1a,.agent_studio.ExportWorkflowTemplateResponse"\x00\x12u\n\x16ImportWorkflowTemplate\x12+.agent_studio.ImportWorkflowTemplateRequest\x1a,.agent_studio.ImportWorkflowTemplateResponse"\x00\x12\x66\n\x11ListTaskTemplates\x12&.agent_studio.ListTaskTemplatesRequest\x1a\'.agent_studio.ListTaskTemplatesResponse"\x00\x12`\n\x0fGetTaskTemplate\x12$.agent_studio.GetTaskTemplateRequest\x1a%.agent_studio.GetTaskTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64TaskTemplate\x12$.agent_studio.AddTaskTemplateRequest\x1a%.agent_studio.AddTaskTemplateResponse"\x00\x12i\n\x12RemoveTaskTemplate\x12\'.agent_studio.RemoveTaskTemplateRequest\x1a(.agent_studio.RemoveTaskTemplateResponse"\x00\x62\x06proto3'
+    b'\n\x1fstudio/proto/agent_studio.proto\x12\x0c\x61gent_studio"\x86\x01\n\x05Model\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x12\n\nmodel_type\x18\x04 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x05 \x01(\t\x12\x19\n\x11is_studio_default\x18\x06 \x01(\x08"\x13\n\x11ListModelsRequest"@\n\x12ListModelsResponse\x12*\n\rmodel_details\x18\x01 \x03(\x0b\x32\x13.agent_studio.Model"#\n\x0fGetModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t">\n\x10GetModelResponse\x12*\n\rmodel_details\x18\x01 \x01(\x0b\x32\x13.agent_studio.Model"t\n\x0f\x41\x64\x64ModelRequest\x12\x12\n\nmodel_name\x18\x01 \x01(\t\x12\x16\n\x0eprovider_model\x18\x02 \x01(\t\x12\x12\n\nmodel_type\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"$\n\x10\x41\x64\x64ModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"&\n\x12RemoveModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x15\n\x13RemoveModelResponse"u\n\x12UpdateModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x12\n\nmodel_name\x18\x02 \x01(\t\x12\x16\n\x0eprovider_model\x18\x03 \x01(\t\x12\x10\n\x08\x61pi_base\x18\x04 \x01(\t\x12\x0f\n\x07\x61pi_key\x18\x05 \x01(\t"\'\n\x13UpdateModelResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x93\x01\n\x10TestModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x17\n\x0f\x63ompletion_role\x18\x02 \x01(\t\x12\x1a\n\x12\x63ompletion_content\x18\x03 \x01(\t\x12\x13\n\x0btemperature\x18\x04 \x01(\x02\x12\x12\n\nmax_tokens\x18\x05 \x01(\x05\x12\x0f\n\x07timeout\x18\x06 \x01(\x05"%\n\x11TestModelResponse\x12\x10\n\x08response\x18\x01 \x01(\t"0\n\x1cSetStudioDefaultModelRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t"\x1f\n\x1dSetStudioDefaultModelResponse"\x1e\n\x1cGetStudioDefaultModelRequest"p\n\x1dGetStudioDefaultModelResponse\x12#\n\x1bis_default_model_configured\x18\x01 \x01(\x08\x12*\n\rmodel_details\x18\x02 \x01(\x0b\x32\x13.agent_studio.Model"\x90\x01\n\x18ListToolTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x11\n\tread_mask\x18\x04 \x03(\tB\x17\n\x15_workflow_template_id"c\n\x19ListToolTemplatesResponse\x12-\n\ttemplates\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolTemplate\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"2\n\x16GetToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"G\n\x17GetToolTemplateResponse\x12,\n\x08template\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolTemplate"\x8d\x01\n\x16\x41\x64\x64ToolTemplateRequest\x12\x1a\n\x12tool_template_name\x18\x01 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x02 \x01(\t\x12!\n\x14workflow_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"3\n\x17\x41\x64\x64ToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"n\n\x19UpdateToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t\x12\x1a\n\x12tool_template_name\x18\x02 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x03 \x01(\t"6\n\x1aUpdateToolTemplateResponse\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"5\n\x19RemoveToolTemplateRequest\x12\x18\n\x10tool_template_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolTemplateResponse"~\n\x18ListToolInstancesRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x11\n\tread_mask\x18\x04 \x03(\tB\x0e\n\x0c_workflow_id"h\n\x19ListToolInstancesResponse\x12\x32\n\x0etool_instances\x18\x01 \x03(\x0b\x32\x1a.agent_studio.ToolInstance\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"2\n\x16GetToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"L\n\x17GetToolInstanceResponse\x12\x31\n\rtool_instance\x18\x01 \x01(\x0b\x32\x1a.agent_studio.ToolInstance"r\n\x19\x43reateToolInstanceRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x10tool_template_id\x18\x03 \x01(\tH\x00\x88\x01\x01\x42\x13\n\x11_tool_template_id"R\n\x1a\x43reateToolInstanceResponse\x12\x1a\n\x12tool_instance_name\x18\x01 \x01(\t\x12\x18\n\x10tool_instance_id\x18\x02 \x01(\t"u\n\x19UpdateToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1b\n\x13tmp_tool_image_path\x18\x04 \x01(\t"6\n\x1aUpdateToolInstanceResponse\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"5\n\x19RemoveToolInstanceRequest\x12\x18\n\x10tool_instance_id\x18\x01 \x01(\t"\x1c\n\x1aRemoveToolInstanceResponse"\xa0\x02\n\x0cToolTemplate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bpython_code\x18\x03 \x01(\t\x12\x1b\n\x13python_requirements\x18\x04 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x05 \x01(\t\x12\x15\n\rtool_metadata\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x11\n\tpre_built\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t\x12!\n\x14workflow_template_id\x18\x0b \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"\xe6\x01\n\x0cToolInstance\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x13\n\x0bpython_code\x18\x04 \x01(\t\x12\x1b\n\x13python_requirements\x18\x05 \x01(\t\x12\x1a\n\x12source_folder_path\x18\x06 \x01(\t\x12\x15\n\rtool_metadata\x18\x07 \x01(\t\x12\x10\n\x08is_valid\x18\x08 \x01(\x08\x12\x16\n\x0etool_image_uri\x18\t \x01(\t\x12\x18\n\x10tool_description\x18\n \x01(\t"w\n\x11ListAgentsRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x11\n\tread_mask\x18\x04 \x03(\tB\x0e\n\x0c_workflow_id"Z\n\x12ListAgentsResponse\x12+\n\x06\x61gents\x18\x01 \x03(\x0b\x32\x1b.agent_studio.AgentMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"#\n\x0fGetAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t">\n\x10GetAgentResponse\x12*\n\x05\x61gent\x18\x01 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata"\x8b\x02\n\x0f\x41\x64\x64\x41gentRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x02 \x01(\t\x12\x10\n\x08tools_id\x18\x03 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x04 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x18\n\x0btemplate_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x12\x13\n\x0bworkflow_id\x18\x06 \x01(\t\x12\x1c\n\x14tmp_agent_image_path\x18\x07 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x08 \x03(\tB\x0e\n\x0c_template_id"$\n\x10\x41\x64\x64\x41gentResponse\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\xe1\x01\n\x12UpdateAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x1c\n\x14tmp_agent_image_path\x18\x06 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x07 \x03(\t"\x15\n\x13UpdateAgentResponse"&\n\x12RemoveAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t"\x15\n\x13RemoveAgentResponse"\xdd\x01\n\rAgentMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x1d\n\x15llm_provider_model_id\x18\x03 \x01(\t\x12\x10\n\x08tools_id\x18\x04 \x03(\t\x12\x41\n\x16\x63rew_ai_agent_metadata\x18\x05 \x01(\x0b\x32!.agent_studio.CrewAIAgentMetadata\x12\x17\n\x0f\x61gent_image_uri\x18\x06 \x01(\t\x12\x10\n\x08is_valid\x18\x07 \x01(\x08\x12\x13\n\x0bworkflow_id\x18\x08 \x01(\t"\xa5\x01\n\x13\x43rewAIAgentMetadata\x12\x0c\n\x04role\x18\x01 \x01(\t\x12\x11\n\tbackstory\x18\x02 \x01(\t\x12\x0c\n\x04goal\x18\x03 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x04 \x01(\x08\x12\x0f\n\x07verbose\x18\x05 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\x06 \x01(\x08\x12\x13\n\x0btemperature\x18\x07 \x01(\x02\x12\x10\n\x08max_iter\x18\x08 \x01(\x05"I\n\x10TestAgentRequest\x12\x10\n\x08\x61gent_id\x18\x01 \x01(\t\x12\x12\n\nuser_input\x18\x02 \x01(\t\x12\x0f\n\x07\x63ontext\x18\x03 \x01(\t"%\n\x11TestAgentResponse\x12\x10\n\x08response\x18\x01 \x01(\t"\xb8\x02\n\x12\x41\x64\x64WorkflowRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12L\n\x19\x63rew_ai_workflow_metadata\x18\x02 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadataH\x01\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x03 \x01(\x08H\x02\x88\x01\x01\x12!\n\x14workflow_template_id\x18\x04 \x01(\tH\x03\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x05 \x01(\tH\x04\x88\x01\x01\x42\x07\n\x05_nameB\x1c\n\x1a_crew_ai_workflow_metadataB\x14\n\x12_is_conversationalB\x17\n\x15_workflow_template_idB\x0e\n\x0c_description"*\n\x13\x41\x64\x64WorkflowResponse\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"P\n\x14ListWorkflowsRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\x12\x11\n\tread_mask\x18\x03 \x03(\t"[\n\x15ListWorkflowsResponse\x12)\n\tworkflows\x18\x01 \x03(\x0b\x32\x16.agent_studio.Workflow\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t")\n\x12GetWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"?\n\x13GetWorkflowResponse\x12(\n\x08workflow\x18\x01 \x01(\x0b\x32\x16.agent_studio.Workflow"\xb3\x01\n\x15UpdateWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x19\n\x11is_conversational\x18\x04 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t"\x18\n\x16UpdateWorkflowResponse"\xa5\x01\n\x1eTestWorkflowToolUserParameters\x12P\n\nparameters\x18\x01 \x03(\x0b\x32<.agent_studio.TestWorkflowToolUserParameters.ParametersEntry\x1a\x31\n\x0fParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01"\xf5\x02\n\x13TestWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12=\n\x06inputs\x18\x02 \x03(\x0b\x32-.agent_studio.TestWorkflowRequest.InputsEntry\x12W\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32\x39.agent_studio.TestWorkflowRequest.ToolUserParametersEntry\x12\x19\n\x11generation_config\x18\x04 \x01(\t\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"9\n\x14TestWorkflowResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t"/\n\x1bStreamWorkflowEventsRequest\x12\x10\n\x08trace_id\x18\x01 \x01(\t"d\n\x10WorkflowRunEvent\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\t\x12\x12\n\nattributes\x18\x04 \x01(\t\x12\x0e\n\x06\x65vents\x18\x05 \x01(\t"\xc6\x03\n\x15\x44\x65ployWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12]\n\x16\x65nv_variable_overrides\x18\x02 \x03(\x0b\x32=.agent_studio.DeployWorkflowRequest.EnvVariableOverridesEntry\x12Y\n\x14tool_user_parameters\x18\x03 \x03(\x0b\x32;.agent_studio.DeployWorkflowRequest.ToolUserParametersEntry\x12\x1d\n\x15\x62ypass_authentication\x18\x04 \x01(\x08\x12\x19\n\x11generation_config\x18\x05 \x01(\t\x1a;\n\x19\x45nvVariableOverridesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1ag\n\x17ToolUserParametersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.agent_studio.TestWorkflowToolUserParameters:\x02\x38\x01"u\n\x16\x44\x65ployWorkflowResponse\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x01 \x01(\t\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x02 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x03 \x01(\t"7\n\x17UndeployWorkflowRequest\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t"\x1a\n\x18UndeployWorkflowResponse"\x1e\n\x1cListDeployedWorkflowsRequest"[\n\x1dListDeployedWorkflowsResponse\x12:\n\x12\x64\x65ployed_workflows\x18\x01 \x03(\x0b\x32\x1e.agent_studio.DeployedWorkflow",\n\x15RemoveWorkflowRequest\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t"\x18\n\x16RemoveWorkflowResponse"\x9a\x02\n\x10\x44\x65ployedWorkflow\x12\x1c\n\x14\x64\x65ployed_workflow_id\x18\x01 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x02 \x01(\t\x12\x15\n\rworkflow_name\x18\x03 \x01(\t\x12\x1e\n\x16\x64\x65ployed_workflow_name\x18\x04 \x01(\t\x12\x1d\n\x15\x63ml_deployed_model_id\x18\x05 \x01(\t\x12\x10\n\x08is_stale\x18\x06 \x01(\x08\x12\x17\n\x0f\x61pplication_url\x18\x07 \x01(\t\x12\x1a\n\x12\x61pplication_status\x18\x08 \x01(\t\x12\x1d\n\x15\x61pplication_deep_link\x18\t \x01(\t\x12\x17\n\x0fmodel_deep_link\x18\n \x01(\t"\x85\x01\n\x1bResolveWorkflowTraceRequest\x12\x10\n\x08trace_id\x18\x01 \x01(\t\x12\x19\n\x0cproject_name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x0f\n\r_project_nameB\x0e\n\x0c_workflow_id"K\n\x1cResolveWorkflowTraceResponse\x12\x12\n\nproject_id\x18\x01 \x01(\t\x12\x17\n\x0fglobal_trace_id\x18\x02 \x01(\t"\xaa\x01\n\x1cGetWorkflowRunMetricsRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\r\n\x05scope\x18\x02 \x01(\t\x12\x12\n\nstart_time\x18\x03 \x01(\x01\x12\x10\n\x08\x65nd_time\x18\x04 \x01(\x01\x12\x16\n\x0ewindow_seconds\x18\x05 \x01(\x01\x12\x13\n\x0bpercentiles\x18\x06 \x03(\x01\x42\x0e\n\x0c_workflow_id"5\n\x10MetricPercentile\x12\x12\n\npercentile\x18\x01 \x01(\x01\x12\r\n\x05value\x18\x02 \x01(\x01"\x88\x03\n\x19WorkflowRunMetricsSummary\x12\r\n\x05scope\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x14\n\x0cwindow_start\x18\x03 \x01(\x01\x12\x12\n\nwindow_end\x18\x04 \x01(\x01\x12\x11\n\trun_count\x18\x05 \x01(\x05\x12\x12\n\ncall_count\x18\x06 \x01(\x05\x12\x13\n\x0b\x65rror_count\x18\x07 \x01(\x05\x12\x15\n\rprompt_tokens\x18\x08 \x01(\x01\x12\x19\n\x11\x63ompletion_tokens\x18\t \x01(\x01\x12\x14\n\x0ctotal_tokens\x18\n \x01(\x01\x12\x18\n\x10\x64uration_seconds\x18\x0b \x01(\x01\x12\x44\n\x1c\x64uration_seconds_percentiles\x18\x0c \x03(\x0b\x32\x1e.agent_studio.MetricPercentile\x12@\n\x18total_tokens_percentiles\x18\r \x03(\x0b\x32\x1e.agent_studio.MetricPercentile"[\n\x1dGetWorkflowRunMetricsResponse\x12:\n\tsummaries\x18\x01 \x03(\x0b\x32\'.agent_studio.WorkflowRunMetricsSummary"\x82\x02\n\x08Workflow\x12\x13\n\x0bworkflow_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12G\n\x19\x63rew_ai_workflow_metadata\x18\x03 \x01(\x0b\x32$.agent_studio.CrewAIWorkflowMetadata\x12\x10\n\x08is_valid\x18\x04 \x01(\x08\x12\x10\n\x08is_ready\x18\x05 \x01(\x08\x12\x19\n\x11is_conversational\x18\x06 \x01(\x08\x12\x10\n\x08is_draft\x18\x07 \x01(\x08\x12\x13\n\x0b\x64\x65scription\x18\x08 \x01(\t\x12\x16\n\tdirectory\x18\t \x01(\tH\x00\x88\x01\x01\x42\x0c\n\n_directory"\xb4\x01\n\x16\x43rewAIWorkflowMetadata\x12\x10\n\x08\x61gent_id\x18\x01 \x03(\t\x12\x0f\n\x07task_id\x18\x02 \x03(\t\x12\x18\n\x10manager_agent_id\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12*\n\x1dmanager_llm_model_provider_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42 \n\x1e_manager_llm_model_provider_id"\xa3\x01\n\x0e\x41\x64\x64TaskRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x44\n\x18\x61\x64\x64_crew_ai_task_request\x18\x02 \x01(\x0b\x32".agent_studio.AddCrewAITaskRequest\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t\x12\x18\n\x0btemplate_id\x18\x04 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_template_id""\n\x0f\x41\x64\x64TaskResponse\x12\x0f\n\x07task_id\x18\x01 \x01(\t"v\n\x10ListTasksRequest\x12\x18\n\x0bworkflow_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x11\n\tpage_size\x18\x02 \x01(\x05\x12\x12\n\npage_token\x18\x03 \x01(\t\x12\x11\n\tread_mask\x18\x04 \x03(\tB\x0e\n\x0c_workflow_id"]\n\x11ListTasksResponse\x12/\n\x05tasks\x18\x01 \x03(\x0b\x32 .agent_studio.CrewAITaskMetadata\x12\x17\n\x0fnext_page_token\x18\x02 \x01(\t"!\n\x0eGetTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"A\n\x0fGetTaskResponse\x12.\n\x04task\x18\x01 \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata"l\n\x11UpdateTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x46\n\x17UpdateCrewAITaskRequest\x18\x02 \x01(\x0b\x32%.agent_studio.UpdateCrewAITaskRequest"\x14\n\x12UpdateTaskResponse"$\n\x11RemoveTaskRequest\x12\x0f\n\x07task_id\x18\x01 \x01(\t"\x14\n\x12RemoveTaskResponse"\xa5\x01\n\x12\x43rewAITaskMetadata\x12\x0f\n\x07task_id\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x04 \x01(\t\x12\x10\n\x08is_valid\x18\x05 \x01(\x08\x12\x0e\n\x06inputs\x18\x06 \x03(\t\x12\x13\n\x0bworkflow_id\x18\x07 \x01(\t"b\n\x17UpdateCrewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"_\n\x14\x41\x64\x64\x43rewAITaskRequest\x12\x13\n\x0b\x64\x65scription\x18\x01 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x02 \x01(\t\x12\x19\n\x11\x61ssigned_agent_id\x18\x03 \x01(\t"-\n\x13GetAssetDataRequest\x12\x16\n\x0e\x61sset_uri_list\x18\x01 \x03(\t"\xab\x01\n\x14GetAssetDataResponse\x12\x45\n\nasset_data\x18\x01 \x03(\x0b\x32\x31.agent_studio.GetAssetDataResponse.AssetDataEntry\x12\x1a\n\x12unavailable_assets\x18\x02 \x03(\t\x1a\x30\n\x0e\x41ssetDataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01"F\n\tFileChunk\x12\x0f\n\x07\x63ontent\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t\x12\x15\n\ris_last_chunk\x18\x03 \x01(\x08"Q\n&NonStreamingTemporaryFileUploadRequest\x12\x14\n\x0c\x66ull_content\x18\x01 \x01(\x0c\x12\x11\n\tfile_name\x18\x02 \x01(\t"8\n\x12\x46ileUploadResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\tfile_path\x18\x02 \x01(\t"1\n\x1c\x44ownloadTemporaryFileRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t" \n\x1eGetParentProjectDetailsRequest"T\n\x1fGetParentProjectDetailsResponse\x12\x14\n\x0cproject_base\x18\x01 \x01(\t\x12\x1b\n\x13studio_subdirectory\x18\x02 \x01(\t"W\n\x19ListAgentTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"Z\n\x1aListAgentTemplatesResponse\x12<\n\x0f\x61gent_templates\x18\x01 \x03(\x0b\x32#.agent_studio.AgentTemplateMetadata"%\n\x17GetAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"W\n\x18GetAgentTemplateResponse\x12;\n\x0e\x61gent_template\x18\x01 \x01(\x0b\x32#.agent_studio.AgentTemplateMetadata"\xc1\x02\n\x17\x41\x64\x64\x41gentTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x03 \x03(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12\x11\n\tbackstory\x18\x05 \x01(\t\x12\x0c\n\x04goal\x18\x06 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x07 \x01(\x08\x12\x0f\n\x07verbose\x18\x08 \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\t \x01(\x08\x12\x13\n\x0btemperature\x18\n \x01(\x02\x12\x10\n\x08max_iter\x18\x0b \x01(\x05\x12\x1c\n\x14tmp_agent_image_path\x18\x0c \x01(\t\x12!\n\x14workflow_template_id\x18\r \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"&\n\x18\x41\x64\x64\x41gentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\xf4\x03\n\x1aUpdateAgentTemplateRequest\x12\x19\n\x11\x61gent_template_id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x11\n\x04role\x18\x05 \x01(\tH\x02\x88\x01\x01\x12\x16\n\tbackstory\x18\x06 \x01(\tH\x03\x88\x01\x01\x12\x11\n\x04goal\x18\x07 \x01(\tH\x04\x88\x01\x01\x12\x1d\n\x10\x61llow_delegation\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x14\n\x07verbose\x18\t \x01(\x08H\x06\x88\x01\x01\x12\x12\n\x05\x63\x61\x63he\x18\n \x01(\x08H\x07\x88\x01\x01\x12\x18\n\x0btemperature\x18\x0b \x01(\x02H\x08\x88\x01\x01\x12\x15\n\x08max_iter\x18\x0c \x01(\x05H\t\x88\x01\x01\x12!\n\x14tmp_agent_image_path\x18\r \x01(\tH\n\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\x07\n\x05_roleB\x0c\n\n_backstoryB\x07\n\x05_goalB\x13\n\x11_allow_delegationB\n\n\x08_verboseB\x08\n\x06_cacheB\x0e\n\x0c_temperatureB\x0b\n\t_max_iterB\x17\n\x15_tmp_agent_image_path")\n\x1bUpdateAgentTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"(\n\x1aRemoveAgentTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1d\n\x1bRemoveAgentTemplateResponse"\xdc\x02\n\x15\x41gentTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x19\n\x11tool_template_ids\x18\x04 \x03(\t\x12\x0c\n\x04role\x18\x05 \x01(\t\x12\x11\n\tbackstory\x18\x06 \x01(\t\x12\x0c\n\x04goal\x18\x07 \x01(\t\x12\x18\n\x10\x61llow_delegation\x18\x08 \x01(\x08\x12\x0f\n\x07verbose\x18\t \x01(\x08\x12\r\n\x05\x63\x61\x63he\x18\n \x01(\x08\x12\x13\n\x0btemperature\x18\x0b \x01(\x02\x12\x10\n\x08max_iter\x18\x0c \x01(\x05\x12\x17\n\x0f\x61gent_image_uri\x18\r \x01(\t\x12!\n\x14workflow_template_id\x18\x0e \x01(\tH\x00\x88\x01\x01\x12\x14\n\x0cpre_packaged\x18\x0f \x01(\x08\x42\x17\n\x15_workflow_template_id"\x1e\n\x1cListWorkflowTemplatesRequest"c\n\x1dListWorkflowTemplatesResponse\x12\x42\n\x12workflow_templates\x18\x01 \x03(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"(\n\x1aGetWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"`\n\x1bGetWorkflowTemplateResponse\x12\x41\n\x11workflow_template\x18\x01 \x01(\x0b\x32&.agent_studio.WorkflowTemplateMetadata"\x9b\x03\n\x1a\x41\x64\x64WorkflowTemplateRequest\x12\x11\n\x04name\x18\x01 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x02 \x01(\tH\x01\x88\x01\x01\x12\x14\n\x07process\x18\x03 \x01(\tH\x02\x88\x01\x01\x12\x1a\n\x12\x61gent_template_ids\x18\x04 \x03(\t\x12\x19\n\x11task_template_ids\x18\x05 \x03(\t\x12&\n\x19manager_agent_template_id\x18\x06 \x01(\tH\x03\x88\x01\x01\x12 \n\x13use_default_manager\x18\x07 \x01(\x08H\x04\x88\x01\x01\x12\x1e\n\x11is_conversational\x18\x08 \x01(\x08H\x05\x88\x01\x01\x12\x18\n\x0bworkflow_id\x18\t \x01(\tH\x06\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_descriptionB\n\n\x08_processB\x1c\n\x1a_manager_agent_template_idB\x16\n\x14_use_default_managerB\x14\n\x12_is_conversationalB\x0e\n\x0c_workflow_id")\n\x1b\x41\x64\x64WorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"+\n\x1dRemoveWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t" \n\x1eRemoveWorkflowTemplateResponse"\x82\x02\n\x18WorkflowTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0f\n\x07process\x18\x04 \x01(\t\x12\x1a\n\x12\x61gent_template_ids\x18\x05 \x03(\t\x12\x19\n\x11task_template_ids\x18\x06 \x03(\t\x12!\n\x19manager_agent_template_id\x18\x07 \x01(\t\x12\x1b\n\x13use_default_manager\x18\x08 \x01(\x08\x12\x19\n\x11is_conversational\x18\t \x01(\x08\x12\x14\n\x0cpre_packaged\x18\n \x01(\x08"+\n\x1d\x45xportWorkflowTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"3\n\x1e\x45xportWorkflowTemplateResponse\x12\x11\n\tfile_path\x18\x01 \x01(\t"2\n\x1dImportWorkflowTemplateRequest\x12\x11\n\tfile_path\x18\x01 \x01(\t",\n\x1eImportWorkflowTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"V\n\x18ListTaskTemplatesRequest\x12!\n\x14workflow_template_id\x18\x01 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"W\n\x19ListTaskTemplatesResponse\x12:\n\x0etask_templates\x18\x01 \x03(\x0b\x32".agent_studio.TaskTemplateMetadata"$\n\x16GetTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"T\n\x17GetTaskTemplateResponse\x12\x39\n\rtask_template\x18\x01 \x01(\x0b\x32".agent_studio.TaskTemplateMetadata"\xb4\x01\n\x16\x41\x64\x64TaskTemplateRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x03 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x04 \x01(\t\x12!\n\x14workflow_template_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"%\n\x17\x41\x64\x64TaskTemplateResponse\x12\n\n\x02id\x18\x01 \x01(\t"\'\n\x19RemoveTaskTemplateRequest\x12\n\n\x02id\x18\x01 \x01(\t"\x1c\n\x1aRemoveTaskTemplateResponse"\xbe\x01\n\x14TaskTemplateMetadata\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x17\n\x0f\x65xpected_output\x18\x04 \x01(\t\x12"\n\x1a\x61ssigned_agent_template_id\x18\x05 \x01(\t\x12!\n\x14workflow_template_id\x18\x06 \x01(\tH\x00\x88\x01\x01\x42\x17\n\x15_workflow_template_id"!\n\x1f\x43heckStudioUpgradeStatusRequest"Q\n CheckStudioUpgradeStatusResponse\x12\x15\n\rlocal_version\x18\x01 \x01(\t\x12\x16\n\x0enewest_version\x18\x02 \x01(\t"\x16\n\x14UpgradeStudioRequest"\x17\n\x15UpgradeStudioResponse"\x14\n\x12HealthCheckRequest"&\n\x13HealthCheckResponse\x12\x0f\n\x07message\x18\x01 \x01(\t"R\n\x0cWatchRequest\x12\x16\n\x0esince_sequence\x18\x01 \x01(\x05\x12\x15\n\rchange_log_id\x18\x02 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x03 \x01(\t"\x82\x03\n\x11\x45ntityChangeEvent\x12\x10\n\x08sequence\x18\x01 \x01(\x05\x12\x13\n\x0b\x63hange_type\x18\x02 \x01(\t\x12\x13\n\x0b\x65ntity_type\x18\x03 \x01(\t\x12\x11\n\tentity_id\x18\x04 \x01(\t\x12\x13\n\x0bworkflow_id\x18\x05 \x01(\t\x12\x15\n\rchange_log_id\x18\x06 \x01(\t\x12(\n\x08workflow\x18\x07 \x01(\x0b\x32\x16.agent_studio.Workflow\x12*\n\x05\x61gent\x18\x08 \x01(\x0b\x32\x1b.agent_studio.AgentMetadata\x12.\n\x04task\x18\t \x01(\x0b\x32 .agent_studio.CrewAITaskMetadata\x12\x31\n\rtool_instance\x18\n \x01(\x0b\x32\x1a.agent_studio.ToolInstance\x12\x39\n\x11\x64\x65ployed_workflow\x18\x0b \x01(\x0b\x32\x1e.agent_studio.DeployedWorkflow2\xb9\x34\n\x0b\x41gentStudio\x12Q\n\nListModels\x12\x1f.agent_studio.ListModelsRequest\x1a .agent_studio.ListModelsResponse"\x00\x12K\n\x08GetModel\x12\x1d.agent_studio.GetModelRequest\x1a\x1e.agent_studio.GetModelResponse"\x00\x12K\n\x08\x41\x64\x64Model\x12\x1d.agent_studio.AddModelRequest\x1a\x1e.agent_studio.AddModelResponse"\x00\x12T\n\x0bRemoveModel\x12 .agent_studio.RemoveModelRequest\x1a!.agent_studio.RemoveModelResponse"\x00\x12T\n\x0bUpdateModel\x12 .agent_studio.UpdateModelRequest\x1a!.agent_studio.UpdateModelResponse"\x00\x12N\n\tTestModel\x12\x1e.agent_studio.TestModelRequest\x1a\x1f.agent_studio.TestModelResponse"\x00\x12r\n\x15SetStudioDefaultModel\x12*.agent_studio.SetStudioDefaultModelRequest\x1a+.agent_studio.SetStudioDefaultModelResponse"\x00\x12r\n\x15GetStudioDefaultModel\x12*.agent_studio.GetStudioDefaultModelRequest\x1a+.agent_studio.GetStudioDefaultModelResponse"\x00\x12\x66\n\x11ListToolTemplates\x12&.agent_studio.ListToolTemplatesRequest\x1a\'.agent_studio.ListToolTemplatesResponse"\x00\x12`\n\x0fGetToolTemplate\x12$.agent_studio.GetToolTemplateRequest\x1a%.agent_studio.GetToolTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64ToolTemplate\x12$.agent_studio.AddToolTemplateRequest\x1a%.agent_studio.AddToolTemplateResponse"\x00\x12i\n\x12UpdateToolTemplate\x12\'.agent_studio.UpdateToolTemplateRequest\x1a(.agent_studio.UpdateToolTemplateResponse"\x00\x12i\n\x12RemoveToolTemplate\x12\'.agent_studio.RemoveToolTemplateRequest\x1a(.agent_studio.RemoveToolTemplateResponse"\x00\x12\x66\n\x11ListToolInstances\x12&.agent_studio.ListToolInstancesRequest\x1a\'.agent_studio.ListToolInstancesResponse"\x00\x12`\n\x0fGetToolInstance\x12$.agent_studio.GetToolInstanceRequest\x1a%.agent_studio.GetToolInstanceResponse"\x00\x12i\n\x12\x43reateToolInstance\x12\'.agent_studio.CreateToolInstanceRequest\x1a(.agent_studio.CreateToolInstanceResponse"\x00\x12i\n\x12UpdateToolInstance\x12\'.agent_studio.UpdateToolInstanceRequest\x1a(.agent_studio.UpdateToolInstanceResponse"\x00\x12i\n\x12RemoveToolInstance\x12\'.agent_studio.RemoveToolInstanceRequest\x1a(.agent_studio.RemoveToolInstanceResponse"\x00\x12Q\n\nListAgents\x12\x1f.agent_studio.ListAgentsRequest\x1a .agent_studio.ListAgentsResponse"\x00\x12K\n\x08GetAgent\x12\x1d.agent_studio.GetAgentRequest\x1a\x1e.agent_studio.GetAgentResponse"\x00\x12K\n\x08\x41\x64\x64\x41gent\x12\x1d.agent_studio.AddAgentRequest\x1a\x1e.agent_studio.AddAgentResponse"\x00\x12T\n\x0bUpdateAgent\x12 .agent_studio.UpdateAgentRequest\x1a!.agent_studio.UpdateAgentResponse"\x00\x12T\n\x0bRemoveAgent\x12 .agent_studio.RemoveAgentRequest\x1a!.agent_studio.RemoveAgentResponse"\x00\x12N\n\tTestAgent\x12\x1e.agent_studio.TestAgentRequest\x1a\x1f.agent_studio.TestAgentResponse"\x00\x12H\n\x07\x41\x64\x64Task\x12\x1c.agent_studio.AddTaskRequest\x1a\x1d.agent_studio.AddTaskResponse"\x00\x12N\n\tListTasks\x12\x1e.agent_studio.ListTasksRequest\x1a\x1f.agent_studio.ListTasksResponse"\x00\x12H\n\x07GetTask\x12\x1c.agent_studio.GetTaskRequest\x1a\x1d.agent_studio.GetTaskResponse"\x00\x12Q\n\nUpdateTask\x12\x1f.agent_studio.UpdateTaskRequest\x1a .agent_studio.UpdateTaskResponse"\x00\x12Q\n\nRemoveTask\x12\x1f.agent_studio.RemoveTaskRequest\x1a .agent_studio.RemoveTaskResponse"\x00\x12Z\n\rListWorkflows\x12".agent_studio.ListWorkflowsRequest\x1a#.agent_studio.ListWorkflowsResponse"\x00\x12T\n\x0bGetWorkflow\x12 .agent_studio.GetWorkflowRequest\x1a!.agent_studio.GetWorkflowResponse"\x00\x12T\n\x0b\x41\x64\x64Workflow\x12 .agent_studio.AddWorkflowRequest\x1a!.agent_studio.AddWorkflowResponse"\x00\x12]\n\x0eUpdateWorkflow\x12#.agent_studio.UpdateWorkflowRequest\x1a$.agent_studio.UpdateWorkflowResponse"\x00\x12W\n\x0cTestWorkflow\x12!.agent_studio.TestWorkflowRequest\x1a".agent_studio.TestWorkflowResponse"\x00\x12\x65\n\x14StreamWorkflowEvents\x12).agent_studio.StreamWorkflowEventsRequest\x1a\x1e.agent_studio.WorkflowRunEvent"\x00\x30\x01\x12]\n\x0eRemoveWorkflow\x12#.agent_studio.RemoveWorkflowRequest\x1a$.agent_studio.RemoveWorkflowResponse"\x00\x12]\n\x0e\x44\x65ployWorkflow\x12#.agent_studio.DeployWorkflowRequest\x1a$.agent_studio.DeployWorkflowResponse"\x00\x12\x63\n\x10UndeployWorkflow\x12%.agent_studio.UndeployWorkflowRequest\x1a&.agent_studio.UndeployWorkflowResponse"\x00\x12r\n\x15ListDeployedWorkflows\x12*.agent_studio.ListDeployedWorkflowsRequest\x1a+.agent_studio.ListDeployedWorkflowsResponse"\x00\x12o\n\x14ResolveWorkflowTrace\x12).agent_studio.ResolveWorkflowTraceRequest\x1a*.agent_studio.ResolveWorkflowTraceResponse"\x00\x12r\n\x15GetWorkflowRunMetrics\x12*.agent_studio.GetWorkflowRunMetricsRequest\x1a+.agent_studio.GetWorkflowRunMetricsResponse"\x00\x12T\n\x13TemporaryFileUpload\x12\x17.agent_studio.FileChunk\x1a .agent_studio.FileUploadResponse"\x00(\x01\x12{\n\x1fNonStreamingTemporaryFileUpload\x12\x34.agent_studio.NonStreamingTemporaryFileUploadRequest\x1a .agent_studio.FileUploadResponse"\x00\x12`\n\x15\x44ownloadTemporaryFile\x12*.agent_studio.DownloadTemporaryFileRequest\x1a\x17.agent_studio.FileChunk"\x00\x30\x01\x12W\n\x0cGetAssetData\x12!.agent_studio.GetAssetDataRequest\x1a".agent_studio.GetAssetDataResponse"\x00\x12x\n\x17GetParentProjectDetails\x12,.agent_studio.GetParentProjectDetailsRequest\x1a-.agent_studio.GetParentProjectDetailsResponse"\x00\x12{\n\x18\x43heckStudioUpgradeStatus\x12-.agent_studio.CheckStudioUpgradeStatusRequest\x1a..agent_studio.CheckStudioUpgradeStatusResponse"\x00\x12Z\n\rUpgradeStudio\x12".agent_studio.UpgradeStudioRequest\x1a#.agent_studio.UpgradeStudioResponse"\x00\x12T\n\x0bHealthCheck\x12 .agent_studio.HealthCheckRequest\x1a!.agent_studio.HealthCheckResponse"\x00\x12i\n\x12ListAgentTemplates\x12\'.agent_studio.ListAgentTemplatesRequest\x1a(.agent_studio.ListAgentTemplatesResponse"\x00\x12\x63\n\x10GetAgentTemplate\x12%.agent_studio.GetAgentTemplateRequest\x1a&.agent_studio.GetAgentTemplateResponse"\x00\x12\x63\n\x10\x41\x64\x64\x41gentTemplate\x12%.agent_studio.AddAgentTemplateRequest\x1a&.agent_studio.AddAgentTemplateResponse"\x00\x12l\n\x13UpdateAgentTemplate\x12(.agent_studio.UpdateAgentTemplateRequest\x1a).agent_studio.UpdateAgentTemplateResponse"\x00\x12l\n\x13RemoveAgentTemplate\x12(.agent_studio.RemoveAgentTemplateRequest\x1a).agent_studio.RemoveAgentTemplateResponse"\x00\x12r\n\x15ListWorkflowTemplates\x12*.agent_studio.ListWorkflowTemplatesRequest\x1a+.agent_studio.ListWorkflowTemplatesResponse"\x00\x12l\n\x13GetWorkflowTemplate\x12(.agent_studio.GetWorkflowTemplateRequest\x1a).agent_studio.GetWorkflowTemplateResponse"\x00\x12l\n\x13\x41\x64\x64WorkflowTemplate\x12(.agent_studio.AddWorkflowTemplateRequest\x1a).agent_studio.AddWorkflowTemplateResponse"\x00\x12u\n\x16RemoveWorkflowTemplate\x12+.agent_studio.RemoveWorkflowTemplateRequest\x1a,.agent_studio.RemoveWorkflowTemplateResponse"\x00\x12u\n\x16\x45xportWorkflowTemplate\x12+.agent_studio.ExportWorkflowTemplateRequest\x1a,.agent_studio.ExportWorkflowTemplateResponse"\x00\x12u\n\x16ImportWorkflowTemplate\x12+.agent_studio.ImportWorkflowTemplateRequest\x1a,.agent_studio.ImportWorkflowTemplateResponse"\x00\x12\x66\n\x11ListTaskTemplates\x12&.agent_studio.ListTaskTemplatesRequest\x1a\'.agent_studio.ListTaskTemplatesResponse"\x00\x12`\n\x0fGetTaskTemplate\x12$.agent_studio.GetTaskTemplateRequest\x1a%.agent_studio.GetTaskTemplateResponse"\x00\x12`\n\x0f\x41\x64\x64TaskTemplate\x12$.agent_studio.AddTaskTemplateRequest\x1a%.agent_studio.AddTaskTemplateResponse"\x00\x12i\n\x12RemoveTaskTemplate\x12\'.agent_studio.RemoveTaskTemplateRequest\x1a(.agent_studio.RemoveTaskTemplateResponse"\x00\x12Q\n\x0eWatchWorkflows\x12\x1a.agent_studio.WatchRequest\x1a\x1f.agent_studio.EntityChangeEvent"\x00\x30\x01\x12N\n\x0bWatchAgents\x12\x1a.agent_studio.WatchRequest\x1a\x1f.agent_studio.EntityChangeEvent"\x00\x30\x01\x12M\n\nWatchTasks\x12\x1a.agent_studio.WatchRequest\x1a\x1f.agent_studio.EntityChangeEvent"\x00\x30\x01\x12U\n\x12WatchToolInstances\x12\x1a.agent_studio.WatchRequest\x1a\x1f.agent_studio.EntityChangeEvent"\x00\x30\x01\x12Y\n\x16WatchDeployedWorkflows\x12\x1a.agent_studio.WatchRequest\x1a\x1f.agent_studio.EntityChangeEvent"\x00\x30\x01\x62\x06proto3'
 )
 
 _globals = globals()
@@ -74,254 +74,274 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_GETSTUDIODEFAULTMODELREQUEST"]._serialized_end = 1055
     _globals["_GETSTUDIODEFAULTMODELRESPONSE"]._serialized_start = 1057
     _globals["_GETSTUDIODEFAULTMODELRESPONSE"]._serialized_end = 1169
-    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_start = 1171
-    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_end = 1257
-    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_start = 1259
-    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_end = 1333
-    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_start = 1335
-    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_end = 1385
-    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_start = 1387
-    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_end = 1458
-    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_start = 1461
-    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_end = 1602
-    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_start = 1604
-    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_end = 1655
-    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_start = 1657
-    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_end = 1767
-    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_start = 1769
-    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_end = 1823
-    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_start = 1825
-    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_end = 1878
-    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_start = 1880
-    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_end = 1908
-    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_start = 1910
-    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_end = 1978
-    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_start = 1980
-    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_end = 2059
-    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_start = 2061
-    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_end = 2111
-    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_start = 2113
-    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_end = 2189
-    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_start = 2191
-    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_end = 2305
-    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_start = 2307
-    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_end = 2389
-    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_start = 2391
-    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_end = 2508
-    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_start = 2510
-    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_end = 2564
-    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_start = 2566
-    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_end = 2619
-    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_start = 2621
-    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_end = 2649
-    _globals["_TOOLTEMPLATE"]._serialized_start = 2652
-    _globals["_TOOLTEMPLATE"]._serialized_end = 2940
-    _globals["_TOOLINSTANCE"]._serialized_start = 2943
-    _globals["_TOOLINSTANCE"]._serialized_end = 3173
-    _globals["_LISTAGENTSREQUEST"]._serialized_start = 3175
-    _globals["_LISTAGENTSREQUEST"]._serialized_end = 3236
-    _globals["_LISTAGENTSRESPONSE"]._serialized_start = 3238
-    _globals["_LISTAGENTSRESPONSE"]._serialized_end = 3303
-    _globals["_GETAGENTREQUEST"]._serialized_start = 3305
-    _globals["_GETAGENTREQUEST"]._serialized_end = 3340
-    _globals["_GETAGENTRESPONSE"]._serialized_start = 3342
-    _globals["_GETAGENTRESPONSE"]._serialized_end = 3404
-    _globals["_ADDAGENTREQUEST"]._serialized_start = 3407
-    _globals["_ADDAGENTREQUEST"]._serialized_end = 3674
-    _globals["_ADDAGENTRESPONSE"]._serialized_start = 3676
-    _globals["_ADDAGENTRESPONSE"]._serialized_end = 3712
-    _globals["_UPDATEAGENTREQUEST"]._serialized_start = 3715
-    _globals["_UPDATEAGENTREQUEST"]._serialized_end = 3940
-    _globals["_UPDATEAGENTRESPONSE"]._serialized_start = 3942
-    _globals["_UPDATEAGENTRESPONSE"]._serialized_end = 3963
-    _globals["_REMOVEAGENTREQUEST"]._serialized_start = 3965
-    _globals["_REMOVEAGENTREQUEST"]._serialized_end = 4003
-    _globals["_REMOVEAGENTRESPONSE"]._serialized_start = 4005
-    _globals["_REMOVEAGENTRESPONSE"]._serialized_end = 4026
-    _globals["_AGENTMETADATA"]._serialized_start = 4029
-    _globals["_AGENTMETADATA"]._serialized_end = 4250
-    _globals["_CREWAIAGENTMETADATA"]._serialized_start = 4253
-    _globals["_CREWAIAGENTMETADATA"]._serialized_end = 4418
-    _globals["_TESTAGENTREQUEST"]._serialized_start = 4420
-    _globals["_TESTAGENTREQUEST"]._serialized_end = 4493
-    _globals["_TESTAGENTRESPONSE"]._serialized_start = 4495
-    _globals["_TESTAGENTRESPONSE"]._serialized_end = 4532
-    _globals["_ADDWORKFLOWREQUEST"]._serialized_start = 4535
-    _globals["_ADDWORKFLOWREQUEST"]._serialized_end = 4847
-    _globals["_ADDWORKFLOWRESPONSE"]._serialized_start = 4849
-    _globals["_ADDWORKFLOWRESPONSE"]._serialized_end = 4891
-    _globals["_LISTWORKFLOWSREQUEST"]._serialized_start = 4893
-    _globals["_LISTWORKFLOWSREQUEST"]._serialized_end = 4915
-    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_start = 4917
-    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_end = 4983
-    _globals["_GETWORKFLOWREQUEST"]._serialized_start = 4985
-    _globals["_GETWORKFLOWREQUEST"]._serialized_end = 5026
-    _globals["_GETWORKFLOWRESPONSE"]._serialized_start = 5028
-    _globals["_GETWORKFLOWRESPONSE"]._serialized_end = 5091
-    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_start = 5094
-    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_end = 5273
-    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_start = 5275
-    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_end = 5299
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_start = 5302
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_end = 5467
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_start = 5418
-    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_end = 5467
-    _globals["_TESTWORKFLOWREQUEST"]._serialized_start = 5470
-    _globals["_TESTWORKFLOWREQUEST"]._serialized_end = 5843
-    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_start = 5693
-    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_end = 5738
-    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 5740
-    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 5843
-    _globals["_TESTWORKFLOWRESPONSE"]._serialized_start = 5845
-    _globals["_TESTWORKFLOWRESPONSE"]._serialized_end = 5902
-    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_start = 5905
-    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_end = 6359
-    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_start = 6195
-    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_end = 6254
-    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 5740
-    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 5843
-    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_start = 6361
-    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_end = 6478
-    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_start = 6480
-    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_end = 6535
-    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_start = 6537
-    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_end = 6563
-    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_start = 6565
-    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_end = 6595
-    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_start = 6597
-    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_end = 6688
-    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_start = 6690
-    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_end = 6734
-    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_start = 6736
-    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_end = 6760
-    _globals["_DEPLOYEDWORKFLOW"]._serialized_start = 6763
-    _globals["_DEPLOYEDWORKFLOW"]._serialized_end = 7045
-    _globals["_WORKFLOW"]._serialized_start = 7048
-    _globals["_WORKFLOW"]._serialized_end = 7306
-    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_start = 7309
-    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_end = 7489
-    _globals["_ADDTASKREQUEST"]._serialized_start = 7492
-    _globals["_ADDTASKREQUEST"]._serialized_end = 7655
-    _globals["_ADDTASKRESPONSE"]._serialized_start = 7657
-    _globals["_ADDTASKRESPONSE"]._serialized_end = 7691
-    _globals["_LISTTASKSREQUEST"]._serialized_start = 7693
-    _globals["_LISTTASKSREQUEST"]._serialized_end = 7753
-    _globals["_LISTTASKSRESPONSE"]._serialized_start = 7755
-    _globals["_LISTTASKSRESPONSE"]._serialized_end = 7823
-    _globals["_GETTASKREQUEST"]._serialized_start = 7825
-    _globals["_GETTASKREQUEST"]._serialized_end = 7858
-    _globals["_GETTASKRESPONSE"]._serialized_start = 7860
-    _globals["_GETTASKRESPONSE"]._serialized_end = 7925
-    _globals["_UPDATETASKREQUEST"]._serialized_start = 7927
-    _globals["_UPDATETASKREQUEST"]._serialized_end = 8035
-    _globals["_UPDATETASKRESPONSE"]._serialized_start = 8037
-    _globals["_UPDATETASKRESPONSE"]._serialized_end = 8057
-    _globals["_REMOVETASKREQUEST"]._serialized_start = 8059
-    _globals["_REMOVETASKREQUEST"]._serialized_end = 8095
-    _globals["_REMOVETASKRESPONSE"]._serialized_start = 8097
-    _globals["_REMOVETASKRESPONSE"]._serialized_end = 8117
-    _globals["_CREWAITASKMETADATA"]._serialized_start = 8120
-    _globals["_CREWAITASKMETADATA"]._serialized_end = 8285
-    _globals["_UPDATECREWAITASKREQUEST"]._serialized_start = 8287
-    _globals["_UPDATECREWAITASKREQUEST"]._serialized_end = 8385
-    _globals["_ADDCREWAITASKREQUEST"]._serialized_start = 8387
-    _globals["_ADDCREWAITASKREQUEST"]._serialized_end = 8482
-    _globals["_GETASSETDATAREQUEST"]._serialized_start = 8484
-    _globals["_GETASSETDATAREQUEST"]._serialized_end = 8529
-    _globals["_GETASSETDATARESPONSE"]._serialized_start = 8532
-    _globals["_GETASSETDATARESPONSE"]._serialized_end = 8703
-    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_start = 8655
-    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_end = 8703
-    _globals["_FILECHUNK"]._serialized_start = 8705
-    _globals["_FILECHUNK"]._serialized_end = 8775
-    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_start = 8777
-    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_end = 8858
-    _globals["_FILEUPLOADRESPONSE"]._serialized_start = 8860
-    _globals["_FILEUPLOADRESPONSE"]._serialized_end = 8916
-    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_start = 8918
-    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_end = 8967
-    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_start = 8969
-    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_end = 9001
-    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_start = 9003
-    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_end = 9087
-    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_start = 9089
-    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_end = 9176
-    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_start = 9178
-    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_end = 9268
-    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_start = 9270
-    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_end = 9307
-    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_start = 9309
-    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_end = 9396
-    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_start = 9399
-    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_end = 9720
-    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_start = 9722
-    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_end = 9760
-    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_start = 9763
-    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_end = 10263
-    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_start = 10265
-    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_end = 10306
-    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_start = 10308
-    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_end = 10348
-    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_start = 10350
-    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_end = 10379
-    _globals["_AGENTTEMPLATEMETADATA"]._serialized_start = 10382
-    _globals["_AGENTTEMPLATEMETADATA"]._serialized_end = 10730
-    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_start = 10732
-    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_end = 10762
-    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_start = 10764
-    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_end = 10863
-    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_start = 10865
-    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_end = 10905
-    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_start = 10907
-    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11003
-    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11006
-    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11417
-    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11419
-    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11460
-    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11462
-    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11505
-    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11507
-    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11539
-    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_start = 11542
-    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_end = 11800
-    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11802
-    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11845
-    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11847
-    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11898
-    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 11900
-    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 11950
-    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 11952
-    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 11996
-    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_start = 11998
-    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_end = 12084
-    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_start = 12086
-    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_end = 12173
-    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_start = 12175
-    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_end = 12211
-    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_start = 12213
-    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_end = 12297
-    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_start = 12300
-    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_end = 12480
-    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_start = 12482
-    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_end = 12519
-    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_start = 12521
-    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_end = 12560
-    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_start = 12562
-    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_end = 12590
-    _globals["_TASKTEMPLATEMETADATA"]._serialized_start = 12593
-    _globals["_TASKTEMPLATEMETADATA"]._serialized_end = 12783
-    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_start = 12785
-    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_end = 12818
-    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_start = 12820
-    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_end = 12901
-    _globals["_UPGRADESTUDIOREQUEST"]._serialized_start = 12903
-    _globals["_UPGRADESTUDIOREQUEST"]._serialized_end = 12925
-    _globals["_UPGRADESTUDIORESPONSE"]._serialized_start = 12927
-    _globals["_UPGRADESTUDIORESPONSE"]._serialized_end = 12950
-    _globals["_HEALTHCHECKREQUEST"]._serialized_start = 12952
-    _globals["_HEALTHCHECKREQUEST"]._serialized_end = 12972
-    _globals["_HEALTHCHECKRESPONSE"]._serialized_start = 12974
-    _globals["_HEALTHCHECKRESPONSE"]._serialized_end = 13012
-    _globals["_AGENTSTUDIO"]._serialized_start = 13015
-    _globals["_AGENTSTUDIO"]._serialized_end = 18976
+    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_start = 1172
+    _globals["_LISTTOOLTEMPLATESREQUEST"]._serialized_end = 1316
+    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_start = 1318
+    _globals["_LISTTOOLTEMPLATESRESPONSE"]._serialized_end = 1417
+    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_start = 1419
+    _globals["_GETTOOLTEMPLATEREQUEST"]._serialized_end = 1469
+    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_start = 1471
+    _globals["_GETTOOLTEMPLATERESPONSE"]._serialized_end = 1542
+    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_start = 1545
+    _globals["_ADDTOOLTEMPLATEREQUEST"]._serialized_end = 1686
+    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_start = 1688
+    _globals["_ADDTOOLTEMPLATERESPONSE"]._serialized_end = 1739
+    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_start = 1741
+    _globals["_UPDATETOOLTEMPLATEREQUEST"]._serialized_end = 1851
+    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_start = 1853
+    _globals["_UPDATETOOLTEMPLATERESPONSE"]._serialized_end = 1907
+    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_start = 1909
+    _globals["_REMOVETOOLTEMPLATEREQUEST"]._serialized_end = 1962
+    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_start = 1964
+    _globals["_REMOVETOOLTEMPLATERESPONSE"]._serialized_end = 1992
+    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_start = 1994
+    _globals["_LISTTOOLINSTANCESREQUEST"]._serialized_end = 2120
+    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_start = 2122
+    _globals["_LISTTOOLINSTANCESRESPONSE"]._serialized_end = 2226
+    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_start = 2228
+    _globals["_GETTOOLINSTANCEREQUEST"]._serialized_end = 2278
+    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_start = 2280
+    _globals["_GETTOOLINSTANCERESPONSE"]._serialized_end = 2356
+    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_start = 2358
+    _globals["_CREATETOOLINSTANCEREQUEST"]._serialized_end = 2472
+    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_start = 2474
+    _globals["_CREATETOOLINSTANCERESPONSE"]._serialized_end = 2556
+    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_start = 2558
+    _globals["_UPDATETOOLINSTANCEREQUEST"]._serialized_end = 2675
+    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_start = 2677
+    _globals["_UPDATETOOLINSTANCERESPONSE"]._serialized_end = 2731
+    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_start = 2733
+    _globals["_REMOVETOOLINSTANCEREQUEST"]._serialized_end = 2786
+    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_start = 2788
+    _globals["_REMOVETOOLINSTANCERESPONSE"]._serialized_end = 2816
+    _globals["_TOOLTEMPLATE"]._serialized_start = 2819
+    _globals["_TOOLTEMPLATE"]._serialized_end = 3107
+    _globals["_TOOLINSTANCE"]._serialized_start = 3110
+    _globals["_TOOLINSTANCE"]._serialized_end = 3340
+    _globals["_LISTAGENTSREQUEST"]._serialized_start = 3342
+    _globals["_LISTAGENTSREQUEST"]._serialized_end = 3461
+    _globals["_LISTAGENTSRESPONSE"]._serialized_start = 3463
+    _globals["_LISTAGENTSRESPONSE"]._serialized_end = 3553
+    _globals["_GETAGENTREQUEST"]._serialized_start = 3555
+    _globals["_GETAGENTREQUEST"]._serialized_end = 3590
+    _globals["_GETAGENTRESPONSE"]._serialized_start = 3592
+    _globals["_GETAGENTRESPONSE"]._serialized_end = 3654
+    _globals["_ADDAGENTREQUEST"]._serialized_start = 3657
+    _globals["_ADDAGENTREQUEST"]._serialized_end = 3924
+    _globals["_ADDAGENTRESPONSE"]._serialized_start = 3926
+    _globals["_ADDAGENTRESPONSE"]._serialized_end = 3962
+    _globals["_UPDATEAGENTREQUEST"]._serialized_start = 3965
+    _globals["_UPDATEAGENTREQUEST"]._serialized_end = 4190
+    _globals["_UPDATEAGENTRESPONSE"]._serialized_start = 4192
+    _globals["_UPDATEAGENTRESPONSE"]._serialized_end = 4213
+    _globals["_REMOVEAGENTREQUEST"]._serialized_start = 4215
+    _globals["_REMOVEAGENTREQUEST"]._serialized_end = 4253
+    _globals["_REMOVEAGENTRESPONSE"]._serialized_start = 4255
+    _globals["_REMOVEAGENTRESPONSE"]._serialized_end = 4276
+    _globals["_AGENTMETADATA"]._serialized_start = 4279
+    _globals["_AGENTMETADATA"]._serialized_end = 4500
+    _globals["_CREWAIAGENTMETADATA"]._serialized_start = 4503
+    _globals["_CREWAIAGENTMETADATA"]._serialized_end = 4668
+    _globals["_TESTAGENTREQUEST"]._serialized_start = 4670
+    _globals["_TESTAGENTREQUEST"]._serialized_end = 4743
+    _globals["_TESTAGENTRESPONSE"]._serialized_start = 4745
+    _globals["_TESTAGENTRESPONSE"]._serialized_end = 4782
+    _globals["_ADDWORKFLOWREQUEST"]._serialized_start = 4785
+    _globals["_ADDWORKFLOWREQUEST"]._serialized_end = 5097
+    _globals["_ADDWORKFLOWRESPONSE"]._serialized_start = 5099
+    _globals["_ADDWORKFLOWRESPONSE"]._serialized_end = 5141
+    _globals["_LISTWORKFLOWSREQUEST"]._serialized_start = 5143
+    _globals["_LISTWORKFLOWSREQUEST"]._serialized_end = 5223
+    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_start = 5225
+    _globals["_LISTWORKFLOWSRESPONSE"]._serialized_end = 5316
+    _globals["_GETWORKFLOWREQUEST"]._serialized_start = 5318
+    _globals["_GETWORKFLOWREQUEST"]._serialized_end = 5359
+    _globals["_GETWORKFLOWRESPONSE"]._serialized_start = 5361
+    _globals["_GETWORKFLOWRESPONSE"]._serialized_end = 5424
+    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_start = 5427
+    _globals["_UPDATEWORKFLOWREQUEST"]._serialized_end = 5606
+    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_start = 5608
+    _globals["_UPDATEWORKFLOWRESPONSE"]._serialized_end = 5632
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_start = 5635
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS"]._serialized_end = 5800
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_start = 5751
+    _globals["_TESTWORKFLOWTOOLUSERPARAMETERS_PARAMETERSENTRY"]._serialized_end = 5800
+    _globals["_TESTWORKFLOWREQUEST"]._serialized_start = 5803
+    _globals["_TESTWORKFLOWREQUEST"]._serialized_end = 6176
+    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_start = 6026
+    _globals["_TESTWORKFLOWREQUEST_INPUTSENTRY"]._serialized_end = 6071
+    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 6073
+    _globals["_TESTWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 6176
+    _globals["_TESTWORKFLOWRESPONSE"]._serialized_start = 6178
+    _globals["_TESTWORKFLOWRESPONSE"]._serialized_end = 6235
+    _globals["_STREAMWORKFLOWEVENTSREQUEST"]._serialized_start = 6237
+    _globals["_STREAMWORKFLOWEVENTSREQUEST"]._serialized_end = 6284
+    _globals["_WORKFLOWRUNEVENT"]._serialized_start = 6286
+    _globals["_WORKFLOWRUNEVENT"]._serialized_end = 6386
+    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_start = 6389
+    _globals["_DEPLOYWORKFLOWREQUEST"]._serialized_end = 6843
+    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_start = 6679
+    _globals["_DEPLOYWORKFLOWREQUEST_ENVVARIABLEOVERRIDESENTRY"]._serialized_end = 6738
+    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_start = 6073
+    _globals["_DEPLOYWORKFLOWREQUEST_TOOLUSERPARAMETERSENTRY"]._serialized_end = 6176
+    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_start = 6845
+    _globals["_DEPLOYWORKFLOWRESPONSE"]._serialized_end = 6962
+    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_start = 6964
+    _globals["_UNDEPLOYWORKFLOWREQUEST"]._serialized_end = 7019
+    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_start = 7021
+    _globals["_UNDEPLOYWORKFLOWRESPONSE"]._serialized_end = 7047
+    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_start = 7049
+    _globals["_LISTDEPLOYEDWORKFLOWSREQUEST"]._serialized_end = 7079
+    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_start = 7081
+    _globals["_LISTDEPLOYEDWORKFLOWSRESPONSE"]._serialized_end = 7172
+    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_start = 7174
+    _globals["_REMOVEWORKFLOWREQUEST"]._serialized_end = 7218
+    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_start = 7220
+    _globals["_REMOVEWORKFLOWRESPONSE"]._serialized_end = 7244
+    _globals["_DEPLOYEDWORKFLOW"]._serialized_start = 7247
+    _globals["_DEPLOYEDWORKFLOW"]._serialized_end = 7529
+    _globals["_RESOLVEWORKFLOWTRACEREQUEST"]._serialized_start = 7532
+    _globals["_RESOLVEWORKFLOWTRACEREQUEST"]._serialized_end = 7665
+    _globals["_RESOLVEWORKFLOWTRACERESPONSE"]._serialized_start = 7667
+    _globals["_RESOLVEWORKFLOWTRACERESPONSE"]._serialized_end = 7742
+    _globals["_GETWORKFLOWRUNMETRICSREQUEST"]._serialized_start = 7745
+    _globals["_GETWORKFLOWRUNMETRICSREQUEST"]._serialized_end = 7915
+    _globals["_METRICPERCENTILE"]._serialized_start = 7917
+    _globals["_METRICPERCENTILE"]._serialized_end = 7970
+    _globals["_WORKFLOWRUNMETRICSSUMMARY"]._serialized_start = 7973
+    _globals["_WORKFLOWRUNMETRICSSUMMARY"]._serialized_end = 8365
+    _globals["_GETWORKFLOWRUNMETRICSRESPONSE"]._serialized_start = 8367
+    _globals["_GETWORKFLOWRUNMETRICSRESPONSE"]._serialized_end = 8458
+    _globals["_WORKFLOW"]._serialized_start = 8461
+    _globals["_WORKFLOW"]._serialized_end = 8719
+    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_start = 8722
+    _globals["_CREWAIWORKFLOWMETADATA"]._serialized_end = 8902
+    _globals["_ADDTASKREQUEST"]._serialized_start = 8905
+    _globals["_ADDTASKREQUEST"]._serialized_end = 9068
+    _globals["_ADDTASKRESPONSE"]._serialized_start = 9070
+    _globals["_ADDTASKRESPONSE"]._serialized_end = 9104
+    _globals["_LISTTASKSREQUEST"]._serialized_start = 9106
+    _globals["_LISTTASKSREQUEST"]._serialized_end = 9224
+    _globals["_LISTTASKSRESPONSE"]._serialized_start = 9226
+    _globals["_LISTTASKSRESPONSE"]._serialized_end = 9319
+    _globals["_GETTASKREQUEST"]._serialized_start = 9321
+    _globals["_GETTASKREQUEST"]._serialized_end = 9354
+    _globals["_GETTASKRESPONSE"]._serialized_start = 9356
+    _globals["_GETTASKRESPONSE"]._serialized_end = 9421
+    _globals["_UPDATETASKREQUEST"]._serialized_start = 9423
+    _globals["_UPDATETASKREQUEST"]._serialized_end = 9531
+    _globals["_UPDATETASKRESPONSE"]._serialized_start = 9533
+    _globals["_UPDATETASKRESPONSE"]._serialized_end = 9553
+    _globals["_REMOVETASKREQUEST"]._serialized_start = 9555
+    _globals["_REMOVETASKREQUEST"]._serialized_end = 9591
+    _globals["_REMOVETASKRESPONSE"]._serialized_start = 9593
+    _globals["_REMOVETASKRESPONSE"]._serialized_end = 9613
+    _globals["_CREWAITASKMETADATA"]._serialized_start = 9616
+    _globals["_CREWAITASKMETADATA"]._serialized_end = 9781
+    _globals["_UPDATECREWAITASKREQUEST"]._serialized_start = 9783
+    _globals["_UPDATECREWAITASKREQUEST"]._serialized_end = 9881
+    _globals["_ADDCREWAITASKREQUEST"]._serialized_start = 9883
+    _globals["_ADDCREWAITASKREQUEST"]._serialized_end = 9978
+    _globals["_GETASSETDATAREQUEST"]._serialized_start = 9980
+    _globals["_GETASSETDATAREQUEST"]._serialized_end = 10025
+    _globals["_GETASSETDATARESPONSE"]._serialized_start = 10028
+    _globals["_GETASSETDATARESPONSE"]._serialized_end = 10199
+    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_start = 10151
+    _globals["_GETASSETDATARESPONSE_ASSETDATAENTRY"]._serialized_end = 10199
+    _globals["_FILECHUNK"]._serialized_start = 10201
+    _globals["_FILECHUNK"]._serialized_end = 10271
+    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_start = 10273
+    _globals["_NONSTREAMINGTEMPORARYFILEUPLOADREQUEST"]._serialized_end = 10354
+    _globals["_FILEUPLOADRESPONSE"]._serialized_start = 10356
+    _globals["_FILEUPLOADRESPONSE"]._serialized_end = 10412
+    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_start = 10414
+    _globals["_DOWNLOADTEMPORARYFILEREQUEST"]._serialized_end = 10463
+    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_start = 10465
+    _globals["_GETPARENTPROJECTDETAILSREQUEST"]._serialized_end = 10497
+    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_start = 10499
+    _globals["_GETPARENTPROJECTDETAILSRESPONSE"]._serialized_end = 10583
+    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_start = 10585
+    _globals["_LISTAGENTTEMPLATESREQUEST"]._serialized_end = 10672
+    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_start = 10674
+    _globals["_LISTAGENTTEMPLATESRESPONSE"]._serialized_end = 10764
+    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_start = 10766
+    _globals["_GETAGENTTEMPLATEREQUEST"]._serialized_end = 10803
+    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_start = 10805
+    _globals["_GETAGENTTEMPLATERESPONSE"]._serialized_end = 10892
+    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_start = 10895
+    _globals["_ADDAGENTTEMPLATEREQUEST"]._serialized_end = 11216
+    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_start = 11218
+    _globals["_ADDAGENTTEMPLATERESPONSE"]._serialized_end = 11256
+    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_start = 11259
+    _globals["_UPDATEAGENTTEMPLATEREQUEST"]._serialized_end = 11759
+    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_start = 11761
+    _globals["_UPDATEAGENTTEMPLATERESPONSE"]._serialized_end = 11802
+    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_start = 11804
+    _globals["_REMOVEAGENTTEMPLATEREQUEST"]._serialized_end = 11844
+    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_start = 11846
+    _globals["_REMOVEAGENTTEMPLATERESPONSE"]._serialized_end = 11875
+    _globals["_AGENTTEMPLATEMETADATA"]._serialized_start = 11878
+    _globals["_AGENTTEMPLATEMETADATA"]._serialized_end = 12226
+    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_start = 12228
+    _globals["_LISTWORKFLOWTEMPLATESREQUEST"]._serialized_end = 12258
+    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_start = 12260
+    _globals["_LISTWORKFLOWTEMPLATESRESPONSE"]._serialized_end = 12359
+    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_start = 12361
+    _globals["_GETWORKFLOWTEMPLATEREQUEST"]._serialized_end = 12401
+    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_start = 12403
+    _globals["_GETWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12499
+    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_start = 12502
+    _globals["_ADDWORKFLOWTEMPLATEREQUEST"]._serialized_end = 12913
+    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_start = 12915
+    _globals["_ADDWORKFLOWTEMPLATERESPONSE"]._serialized_end = 12956
+    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_start = 12958
+    _globals["_REMOVEWORKFLOWTEMPLATEREQUEST"]._serialized_end = 13001
+    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_start = 13003
+    _globals["_REMOVEWORKFLOWTEMPLATERESPONSE"]._serialized_end = 13035
+    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_start = 13038
+    _globals["_WORKFLOWTEMPLATEMETADATA"]._serialized_end = 13296
+    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 13298
+    _globals["_EXPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 13341
+    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 13343
+    _globals["_EXPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 13394
+    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_start = 13396
+    _globals["_IMPORTWORKFLOWTEMPLATEREQUEST"]._serialized_end = 13446
+    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_start = 13448
+    _globals["_IMPORTWORKFLOWTEMPLATERESPONSE"]._serialized_end = 13492
+    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_start = 13494
+    _globals["_LISTTASKTEMPLATESREQUEST"]._serialized_end = 13580
+    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_start = 13582
+    _globals["_LISTTASKTEMPLATESRESPONSE"]._serialized_end = 13669
+    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_start = 13671
+    _globals["_GETTASKTEMPLATEREQUEST"]._serialized_end = 13707
+    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_start = 13709
+    _globals["_GETTASKTEMPLATERESPONSE"]._serialized_end = 13793
+    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_start = 13796
+    _globals["_ADDTASKTEMPLATEREQUEST"]._serialized_end = 13976
+    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_start = 13978
+    _globals["_ADDTASKTEMPLATERESPONSE"]._serialized_end = 14015
+    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_start = 14017
+    _globals["_REMOVETASKTEMPLATEREQUEST"]._serialized_end = 14056
+    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_start = 14058
+    _globals["_REMOVETASKTEMPLATERESPONSE"]._serialized_end = 14086
+    _globals["_TASKTEMPLATEMETADATA"]._serialized_start = 14089
+    _globals["_TASKTEMPLATEMETADATA"]._serialized_end = 14279
+    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_start = 14281
+    _globals["_CHECKSTUDIOUPGRADESTATUSREQUEST"]._serialized_end = 14314
+    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_start = 14316
+    _globals["_CHECKSTUDIOUPGRADESTATUSRESPONSE"]._serialized_end = 14397
+    _globals["_UPGRADESTUDIOREQUEST"]._serialized_start = 14399
+    _globals["_UPGRADESTUDIOREQUEST"]._serialized_end = 14421
+    _globals["_UPGRADESTUDIORESPONSE"]._serialized_start = 14423
+    _globals["_UPGRADESTUDIORESPONSE"]._serialized_end = 14446
+    _globals["_HEALTHCHECKREQUEST"]._serialized_start = 14448
+    _globals["_HEALTHCHECKREQUEST"]._serialized_end = 14468
+    _globals["_HEALTHCHECKRESPONSE"]._serialized_start = 14470
+    _globals["_HEALTHCHECKRESPONSE"]._serialized_end = 14508
+    _globals["_WATCHREQUEST"]._serialized_start = 14510
+    _globals["_WATCHREQUEST"]._serialized_end = 14592
+    _globals["_ENTITYCHANGEEVENT"]._serialized_start = 14595
+    _globals["_ENTITYCHANGEEVENT"]._serialized_end = 14981
+    _globals["_AGENTSTUDIO"]._serialized_start = 14984
+    _globals["_AGENTSTUDIO"]._serialized_end = 21697
 # @@protoc_insertion_point(module_scope)
@@ -176,16 +176,34 @@ class GetStudioDefaultModelResponse(_message.Message):
     ) -> None: ...
 
 class ListToolTemplatesRequest(_message.Message):
-    __slots__ = ("workflow_template_id",)
+    __slots__ = ("workflow_template_id", "page_size", "page_token", "read_mask")
     WORKFLOW_TEMPLATE_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
     workflow_template_id: str
-    def __init__(self, workflow_template_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    read_mask: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_template_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        read_mask: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListToolTemplatesResponse(_message.Message):
-    __slots__ = ("templates",)
+    __slots__ = ("templates", "next_page_token")
     TEMPLATES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     templates: _containers.RepeatedCompositeFieldContainer[ToolTemplate]
-    def __init__(self, templates: _Optional[_Iterable[_Union[ToolTemplate, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        templates: _Optional[_Iterable[_Union[ToolTemplate, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetToolTemplateRequest(_message.Message):
     __slots__ = ("tool_template_id",)
@@ -252,16 +270,34 @@ class RemoveToolTemplateResponse(_message.Message):
     def __init__(self) -> None: ...
 
 class ListToolInstancesRequest(_message.Message):
-    __slots__ = ("workflow_id",)
+    __slots__ = ("workflow_id", "page_size", "page_token", "read_mask")
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
     workflow_id: str
-    def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    read_mask: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        read_mask: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListToolInstancesResponse(_message.Message):
-    __slots__ = ("tool_instances",)
+    __slots__ = ("tool_instances", "next_page_token")
     TOOL_INSTANCES_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     tool_instances: _containers.RepeatedCompositeFieldContainer[ToolInstance]
-    def __init__(self, tool_instances: _Optional[_Iterable[_Union[ToolInstance, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        tool_instances: _Optional[_Iterable[_Union[ToolInstance, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetToolInstanceRequest(_message.Message):
     __slots__ = ("tool_instance_id",)
@@ -428,16 +464,32 @@ class ToolInstance(_message.Message):
     ) -> None: ...
 
 class ListAgentsRequest(_message.Message):
-    __slots__ = ("workflow_id",)
+    __slots__ = ("workflow_id", "page_size", "page_token", "read_mask")
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
     workflow_id: str
-    def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    read_mask: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        read_mask: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListAgentsResponse(_message.Message):
-    __slots__ = ("agents",)
+    __slots__ = ("agents", "next_page_token")
     AGENTS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     agents: _containers.RepeatedCompositeFieldContainer[AgentMetadata]
-    def __init__(self, agents: _Optional[_Iterable[_Union[AgentMetadata, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self, agents: _Optional[_Iterable[_Union[AgentMetadata, _Mapping]]] = ..., next_page_token: _Optional[str] = ...
+    ) -> None: ...
 
 class GetAgentRequest(_message.Message):
     __slots__ = ("agent_id",)
@@ -660,14 +712,29 @@ class AddWorkflowResponse(_message.Message):
     def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
 
 class ListWorkflowsRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("page_size", "page_token", "read_mask")
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
+    page_size: int
+    page_token: str
+    read_mask: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        read_mask: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListWorkflowsResponse(_message.Message):
-    __slots__ = ("workflows",)
+    __slots__ = ("workflows", "next_page_token")
     WORKFLOWS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     workflows: _containers.RepeatedCompositeFieldContainer[Workflow]
-    def __init__(self, workflows: _Optional[_Iterable[_Union[Workflow, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self, workflows: _Optional[_Iterable[_Union[Workflow, _Mapping]]] = ..., next_page_token: _Optional[str] = ...
+    ) -> None: ...
 
 class GetWorkflowRequest(_message.Message):
     __slots__ = ("workflow_id",)
@@ -764,6 +831,33 @@ class TestWorkflowResponse(_message.Message):
     trace_id: str
     def __init__(self, message: _Optional[str] = ..., trace_id: _Optional[str] = ...) -> None: ...
 
+class StreamWorkflowEventsRequest(_message.Message):
+    __slots__ = ("trace_id",)
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    trace_id: str
+    def __init__(self, trace_id: _Optional[str] = ...) -> None: ...
+
+class WorkflowRunEvent(_message.Message):
+    __slots__ = ("id", "name", "start_time", "attributes", "events")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    ATTRIBUTES_FIELD_NUMBER: _ClassVar[int]
+    EVENTS_FIELD_NUMBER: _ClassVar[int]
+    id: str
+    name: str
+    start_time: str
+    attributes: str
+    events: str
+    def __init__(
+        self,
+        id: _Optional[str] = ...,
+        name: _Optional[str] = ...,
+        start_time: _Optional[str] = ...,
+        attributes: _Optional[str] = ...,
+        events: _Optional[str] = ...,
+    ) -> None: ...
+
 class DeployWorkflowRequest(_message.Message):
     __slots__ = (
         "workflow_id",
@@ -901,6 +995,123 @@ class DeployedWorkflow(_message.Message):
         model_deep_link: _Optional[str] = ...,
     ) -> None: ...
 
+class ResolveWorkflowTraceRequest(_message.Message):
+    __slots__ = ("trace_id", "project_name", "workflow_id")
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    PROJECT_NAME_FIELD_NUMBER: _ClassVar[int]
+    WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    trace_id: str
+    project_name: str
+    workflow_id: str
+    def __init__(
+        self, trace_id: _Optional[str] = ..., project_name: _Optional[str] = ..., workflow_id: _Optional[str] = ...
+    ) -> None: ...
+
+class ResolveWorkflowTraceResponse(_message.Message):
+    __slots__ = ("project_id", "global_trace_id")
+    PROJECT_ID_FIELD_NUMBER: _ClassVar[int]
+    GLOBAL_TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    project_id: str
+    global_trace_id: str
+    def __init__(self, project_id: _Optional[str] = ..., global_trace_id: _Optional[str] = ...) -> None: ...
+
+class GetWorkflowRunMetricsRequest(_message.Message):
+    __slots__ = ("workflow_id", "scope", "start_time", "end_time", "window_seconds", "percentiles")
+    WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    SCOPE_FIELD_NUMBER: _ClassVar[int]
+    START_TIME_FIELD_NUMBER: _ClassVar[int]
+    END_TIME_FIELD_NUMBER: _ClassVar[int]
+    WINDOW_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    PERCENTILES_FIELD_NUMBER: _ClassVar[int]
+    workflow_id: str
+    scope: str
+    start_time: float
+    end_time: float
+    window_seconds: float
+    percentiles: _containers.RepeatedScalarFieldContainer[float]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        scope: _Optional[str] = ...,
+        start_time: _Optional[float] = ...,
+        end_time: _Optional[float] = ...,
+        window_seconds: _Optional[float] = ...,
+        percentiles: _Optional[_Iterable[float]] = ...,
+    ) -> None: ...
+
+class MetricPercentile(_message.Message):
+    __slots__ = ("percentile", "value")
+    PERCENTILE_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    percentile: float
+    value: float
+    def __init__(self, percentile: _Optional[float] = ..., value: _Optional[float] = ...) -> None: ...
+
+class WorkflowRunMetricsSummary(_message.Message):
+    __slots__ = (
+        "scope",
+        "name",
+        "window_start",
+        "window_end",
+        "run_count",
+        "call_count",
+        "error_count",
+        "prompt_tokens",
+        "completion_tokens",
+        "total_tokens",
+        "duration_seconds",
+        "duration_seconds_percentiles",
+        "total_tokens_percentiles",
+    )
+    SCOPE_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    WINDOW_START_FIELD_NUMBER: _ClassVar[int]
+    WINDOW_END_FIELD_NUMBER: _ClassVar[int]
+    RUN_COUNT_FIELD_NUMBER: _ClassVar[int]
+    CALL_COUNT_FIELD_NUMBER: _ClassVar[int]
+    ERROR_COUNT_FIELD_NUMBER: _ClassVar[int]
+    PROMPT_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    COMPLETION_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_TOKENS_FIELD_NUMBER: _ClassVar[int]
+    DURATION_SECONDS_FIELD_NUMBER: _ClassVar[int]
+    DURATION_SECONDS_PERCENTILES_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_TOKENS_PERCENTILES_FIELD_NUMBER: _ClassVar[int]
+    scope: str
+    name: str
+    window_start: float
+    window_end: float
+    run_count: int
+    call_count: int
+    error_count: int
+    prompt_tokens: float
+    completion_tokens: float
+    total_tokens: float
+    duration_seconds: float
+    duration_seconds_percentiles: _containers.RepeatedCompositeFieldContainer[MetricPercentile]
+    total_tokens_percentiles: _containers.RepeatedCompositeFieldContainer[MetricPercentile]
+    def __init__(
+        self,
+        scope: _Optional[str] = ...,
+        name: _Optional[str] = ...,
+        window_start: _Optional[float] = ...,
+        window_end: _Optional[float] = ...,
+        run_count: _Optional[int] = ...,
+        call_count: _Optional[int] = ...,
+        error_count: _Optional[int] = ...,
+        prompt_tokens: _Optional[float] = ...,
+        completion_tokens: _Optional[float] = ...,
+        total_tokens: _Optional[float] = ...,
+        duration_seconds: _Optional[float] = ...,
+        duration_seconds_percentiles: _Optional[_Iterable[_Union[MetricPercentile, _Mapping]]] = ...,
+        total_tokens_percentiles: _Optional[_Iterable[_Union[MetricPercentile, _Mapping]]] = ...,
+    ) -> None: ...
+
+class GetWorkflowRunMetricsResponse(_message.Message):
+    __slots__ = ("summaries",)
+    SUMMARIES_FIELD_NUMBER: _ClassVar[int]
+    summaries: _containers.RepeatedCompositeFieldContainer[WorkflowRunMetricsSummary]
+    def __init__(self, summaries: _Optional[_Iterable[_Union[WorkflowRunMetricsSummary, _Mapping]]] = ...) -> None: ...
+
 class Workflow(_message.Message):
     __slots__ = (
         "workflow_id",
@@ -990,16 +1201,34 @@ class AddTaskResponse(_message.Message):
     def __init__(self, task_id: _Optional[str] = ...) -> None: ...
 
 class ListTasksRequest(_message.Message):
-    __slots__ = ("workflow_id",)
+    __slots__ = ("workflow_id", "page_size", "page_token", "read_mask")
     WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    PAGE_SIZE_FIELD_NUMBER: _ClassVar[int]
+    PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
+    READ_MASK_FIELD_NUMBER: _ClassVar[int]
     workflow_id: str
-    def __init__(self, workflow_id: _Optional[str] = ...) -> None: ...
+    page_size: int
+    page_token: str
+    read_mask: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(
+        self,
+        workflow_id: _Optional[str] = ...,
+        page_size: _Optional[int] = ...,
+        page_token: _Optional[str] = ...,
+        read_mask: _Optional[_Iterable[str]] = ...,
+    ) -> None: ...
 
 class ListTasksResponse(_message.Message):
-    __slots__ = ("tasks",)
+    __slots__ = ("tasks", "next_page_token")
     TASKS_FIELD_NUMBER: _ClassVar[int]
+    NEXT_PAGE_TOKEN_FIELD_NUMBER: _ClassVar[int]
     tasks: _containers.RepeatedCompositeFieldContainer[CrewAITaskMetadata]
-    def __init__(self, tasks: _Optional[_Iterable[_Union[CrewAITaskMetadata, _Mapping]]] = ...) -> None: ...
+    next_page_token: str
+    def __init__(
+        self,
+        tasks: _Optional[_Iterable[_Union[CrewAITaskMetadata, _Mapping]]] = ...,
+        next_page_token: _Optional[str] = ...,
+    ) -> None: ...
 
 class GetTaskRequest(_message.Message):
     __slots__ = ("task_id",)
@@ -1667,3 +1896,69 @@ class HealthCheckResponse(_message.Message):
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
     message: str
     def __init__(self, message: _Optional[str] = ...) -> None: ...
+
+class WatchRequest(_message.Message):
+    __slots__ = ("since_sequence", "change_log_id", "workflow_id")
+    SINCE_SEQUENCE_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_LOG_ID_FIELD_NUMBER: _ClassVar[int]
+    WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    since_sequence: int
+    change_log_id: str
+    workflow_id: str
+    def __init__(
+        self,
+        since_sequence: _Optional[int] = ...,
+        change_log_id: _Optional[str] = ...,
+        workflow_id: _Optional[str] = ...,
+    ) -> None: ...
+
+class EntityChangeEvent(_message.Message):
+    __slots__ = (
+        "sequence",
+        "change_type",
+        "entity_type",
+        "entity_id",
+        "workflow_id",
+        "change_log_id",
+        "workflow",
+        "agent",
+        "task",
+        "tool_instance",
+        "deployed_workflow",
+    )
+    SEQUENCE_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_TYPE_FIELD_NUMBER: _ClassVar[int]
+    ENTITY_TYPE_FIELD_NUMBER: _ClassVar[int]
+    ENTITY_ID_FIELD_NUMBER: _ClassVar[int]
+    WORKFLOW_ID_FIELD_NUMBER: _ClassVar[int]
+    CHANGE_LOG_ID_FIELD_NUMBER: _ClassVar[int]
+    WORKFLOW_FIELD_NUMBER: _ClassVar[int]
+    AGENT_FIELD_NUMBER: _ClassVar[int]
+    TASK_FIELD_NUMBER: _ClassVar[int]
+    TOOL_INSTANCE_FIELD_NUMBER: _ClassVar[int]
+    DEPLOYED_WORKFLOW_FIELD_NUMBER: _ClassVar[int]
+    sequence: int
+    change_type: str
+    entity_type: str
+    entity_id: str
+    workflow_id: str
+    change_log_id: str
+    workflow: Workflow
+    agent: AgentMetadata
+    task: CrewAITaskMetadata
+    tool_instance: ToolInstance
+    deployed_workflow: DeployedWorkflow
+    def __init__(
+        self,
+        sequence: _Optional[int] = ...,
+        change_type: _Optional[str] = ...,
+        entity_type: _Optional[str] = ...,
+        entity_id: _Optional[str] = ...,
+        workflow_id: _Optional[str] = ...,
+        change_log_id: _Optional[str] = ...,
+        workflow: _Optional[_Union[Workflow, _Mapping]] = ...,
+        agent: _Optional[_Union[AgentMetadata, _Mapping]] = ...,
+        task: _Optional[_Union[CrewAITaskMetadata, _Mapping]] = ...,
+        tool_instance: _Optional[_Union[ToolInstance, _Mapping]] = ...,
+        deployed_workflow: _Optional[_Union[DeployedWorkflow, _Mapping]] = ...,
+    ) -> None: ...
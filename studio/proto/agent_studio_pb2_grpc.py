@@ -246,6 +246,12 @@ class AgentStudioStub(object):
             response_deserializer=studio_dot_proto_dot_agent__studio__pb2.TestWorkflowResponse.FromString,
             _registered_method=True,
         )
+        self.StreamWorkflowEvents = channel.unary_stream(
+            "/agent_studio.AgentStudio/StreamWorkflowEvents",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.StreamWorkflowEventsRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.WorkflowRunEvent.FromString,
+            _registered_method=True,
+        )
         self.RemoveWorkflow = channel.unary_unary(
             "/agent_studio.AgentStudio/RemoveWorkflow",
             request_serializer=studio_dot_proto_dot_agent__studio__pb2.RemoveWorkflowRequest.SerializeToString,
@@ -270,6 +276,18 @@ class AgentStudioStub(object):
             response_deserializer=studio_dot_proto_dot_agent__studio__pb2.ListDeployedWorkflowsResponse.FromString,
             _registered_method=True,
         )
+        self.ResolveWorkflowTrace = channel.unary_unary(
+            "/agent_studio.AgentStudio/ResolveWorkflowTrace",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.ResolveWorkflowTraceRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.ResolveWorkflowTraceResponse.FromString,
+            _registered_method=True,
+        )
+        self.GetWorkflowRunMetrics = channel.unary_unary(
+            "/agent_studio.AgentStudio/GetWorkflowRunMetrics",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.GetWorkflowRunMetricsRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.GetWorkflowRunMetricsResponse.FromString,
+            _registered_method=True,
+        )
         self.TemporaryFileUpload = channel.stream_unary(
             "/agent_studio.AgentStudio/TemporaryFileUpload",
             request_serializer=studio_dot_proto_dot_agent__studio__pb2.FileChunk.SerializeToString,
@@ -408,6 +426,36 @@ class AgentStudioStub(object):
             response_deserializer=studio_dot_proto_dot_agent__studio__pb2.RemoveTaskTemplateResponse.FromString,
             _registered_method=True,
         )
+        self.WatchWorkflows = channel.unary_stream(
+            "/agent_studio.AgentStudio/WatchWorkflows",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            _registered_method=True,
+        )
+        self.WatchAgents = channel.unary_stream(
+            "/agent_studio.AgentStudio/WatchAgents",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            _registered_method=True,
+        )
+        self.WatchTasks = channel.unary_stream(
+            "/agent_studio.AgentStudio/WatchTasks",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            _registered_method=True,
+        )
+        self.WatchToolInstances = channel.unary_stream(
+            "/agent_studio.AgentStudio/WatchToolInstances",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            _registered_method=True,
+        )
+        self.WatchDeployedWorkflows = channel.unary_stream(
+            "/agent_studio.AgentStudio/WatchDeployedWorkflows",
+            request_serializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            response_deserializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            _registered_method=True,
+        )
 
 
 class AgentStudioServicer(object):
@@ -623,6 +671,12 @@ class AgentStudioServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def StreamWorkflowEvents(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def RemoveWorkflow(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -647,6 +701,18 @@ class AgentStudioServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def ResolveWorkflowTrace(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def GetWorkflowRunMetrics(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
     def TemporaryFileUpload(self, request_iterator, context):
         """Utility functions"""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -785,6 +851,36 @@ class AgentStudioServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def WatchWorkflows(self, request, context):
+        """Change watching operations"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def WatchAgents(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def WatchTasks(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def WatchToolInstances(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def WatchDeployedWorkflows(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_AgentStudioServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -958,6 +1054,11 @@ def add_AgentStudioServicer_to_server(servicer, server):
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.TestWorkflowRequest.FromString,
             response_serializer=studio_dot_proto_dot_agent__studio__pb2.TestWorkflowResponse.SerializeToString,
         ),
+        "StreamWorkflowEvents": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamWorkflowEvents,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.StreamWorkflowEventsRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.WorkflowRunEvent.SerializeToString,
+        ),
         "RemoveWorkflow": grpc.unary_unary_rpc_method_handler(
             servicer.RemoveWorkflow,
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.RemoveWorkflowRequest.FromString,
@@ -978,6 +1079,16 @@ def add_AgentStudioServicer_to_server(servicer, server):
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.ListDeployedWorkflowsRequest.FromString,
             response_serializer=studio_dot_proto_dot_agent__studio__pb2.ListDeployedWorkflowsResponse.SerializeToString,
         ),
+        "ResolveWorkflowTrace": grpc.unary_unary_rpc_method_handler(
+            servicer.ResolveWorkflowTrace,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.ResolveWorkflowTraceRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.ResolveWorkflowTraceResponse.SerializeToString,
+        ),
+        "GetWorkflowRunMetrics": grpc.unary_unary_rpc_method_handler(
+            servicer.GetWorkflowRunMetrics,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.GetWorkflowRunMetricsRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.GetWorkflowRunMetricsResponse.SerializeToString,
+        ),
         "TemporaryFileUpload": grpc.stream_unary_rpc_method_handler(
             servicer.TemporaryFileUpload,
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.FileChunk.FromString,
@@ -1093,6 +1204,31 @@ def add_AgentStudioServicer_to_server(servicer, server):
             request_deserializer=studio_dot_proto_dot_agent__studio__pb2.RemoveTaskTemplateRequest.FromString,
             response_serializer=studio_dot_proto_dot_agent__studio__pb2.RemoveTaskTemplateResponse.SerializeToString,
         ),
+        "WatchWorkflows": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchWorkflows,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.SerializeToString,
+        ),
+        "WatchAgents": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchAgents,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.SerializeToString,
+        ),
+        "WatchTasks": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchTasks,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.SerializeToString,
+        ),
+        "WatchToolInstances": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchToolInstances,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.SerializeToString,
+        ),
+        "WatchDeployedWorkflows": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchDeployedWorkflows,
+            request_deserializer=studio_dot_proto_dot_agent__studio__pb2.WatchRequest.FromString,
+            response_serializer=studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler("agent_studio.AgentStudio", rpc_method_handlers)
     server.add_generic_rpc_handlers((generic_handler,))
@@ -2129,6 +2265,36 @@ class AgentStudio(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def StreamWorkflowEvents(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/agent_studio.AgentStudio/StreamWorkflowEvents",
+            studio_dot_proto_dot_agent__studio__pb2.StreamWorkflowEventsRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.WorkflowRunEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def RemoveWorkflow(
         request,
@@ -2249,6 +2415,66 @@ class AgentStudio(object):
             _registered_method=True,
         )
 
+    @staticmethod
+    def ResolveWorkflowTrace(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/agent_studio.AgentStudio/ResolveWorkflowTrace",
+            studio_dot_proto_dot_agent__studio__pb2.ResolveWorkflowTraceRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.ResolveWorkflowTraceResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def GetWorkflowRunMetrics(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/agent_studio.AgentStudio/GetWorkflowRunMetrics",
+            studio_dot_proto_dot_agent__studio__pb2.GetWorkflowRunMetricsRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.GetWorkflowRunMetricsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def TemporaryFileUpload(
         request_iterator,
@@ -2938,3 +3164,153 @@ class AgentStudio(object):
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def WatchWorkflows(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/agent_studio.AgentStudio/WatchWorkflows",
+            studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def WatchAgents(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/agent_studio.AgentStudio/WatchAgents",
+            studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def WatchTasks(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/agent_studio.AgentStudio/WatchTasks",
+            studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def WatchToolInstances(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/agent_studio.AgentStudio/WatchToolInstances",
+            studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def WatchDeployedWorkflows(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/agent_studio.AgentStudio/WatchDeployedWorkflows",
+            studio_dot_proto_dot_agent__studio__pb2.WatchRequest.SerializeToString,
+            studio_dot_proto_dot_agent__studio__pb2.EntityChangeEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
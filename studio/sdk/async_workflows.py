@@ -0,0 +1,223 @@
+"""
+asyncio SDK for deployed workflows. Runs are kicked off over a shared aiohttp
+session and traced through a grpc.aio channel to the studio, so many runs can be
+driven concurrently from one event loop:
+
+    async with AsyncWorkflowClient() as client:
+        results = await asyncio.gather(
+            *(client.run_and_wait("Research Assistant", inputs={"topic": topic}) for topic in topics)
+        )
+
+Workflow, input and endpoint lookups go through the (cached) synchronous
+WorkflowClient in a worker thread, as do the ops server event queries, which share
+the SDK's crew event cache.
+"""
+
+from typing import Awaitable, Callable, Optional, Union
+import asyncio
+import time
+import os
+
+import aiohttp
+import grpc
+
+from studio.api import *
+from studio.cross_cutting.grpc_options import get_channel_options
+from studio.proto.agent_studio_pb2_grpc import AgentStudioStub
+from studio.ops import get_phoenix_ops_graphql_client
+from studio.sdk.ops import get_crew_events
+from studio.sdk.workflows import (
+    WorkflowClient,
+    get_kickoff_request,
+    get_record_trace_request,
+    get_workflow_client,
+    get_workflow_status_from_events,
+)
+
+
+class AsyncWorkflowClient:
+    """
+    asyncio client to the deployed workflows of Agent Studio. Use it as an async
+    context manager, or call close() when done.
+    """
+
+    def __init__(
+        self,
+        workflow_client: WorkflowClient = None,
+        server_ip: str = None,
+        server_port: str = None,
+        max_connections: int = 100,
+    ):
+        self.workflow_client = workflow_client or get_workflow_client()
+        server_ip = server_ip or os.getenv("AGENT_STUDIO_SERVICE_IP")
+        server_port = server_port or os.getenv("AGENT_STUDIO_SERVICE_PORT")
+        self.server_address = f"{server_ip}:{server_port}"
+        self.max_connections = max_connections
+        # Created on first use, within the event loop.
+        self._channel: Optional[grpc.aio.Channel] = None
+        self._stub: Optional[AgentStudioStub] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncWorkflowClient":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        if self._http:
+            await self._http.close()
+            self._http = None
+        if self._channel:
+            await self._channel.close()
+            self._channel = None
+            self._stub = None
+
+    @property
+    def stub(self) -> AgentStudioStub:
+        if self._stub is None:
+            self._channel = grpc.aio.insecure_channel(self.server_address, options=get_channel_options())
+            self._stub = AgentStudioStub(self._channel)
+        return self._stub
+
+    @property
+    def http(self) -> aiohttp.ClientSession:
+        if self._http is None:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.max_connections))
+        return self._http
+
+    def _resolve_run(self, workflow_name: str, workflow_id: str, inputs: dict, session_id: str):
+        workflow = self.workflow_client.get_workflow(workflow_name, workflow_id)
+        self.workflow_client.validate_workflow_inputs(workflow, inputs, session_id)
+        deployed_workflow = self.workflow_client.get_deployed_workflow(workflow)
+        deployed_workflow_endpoint = self.workflow_client.get_deployed_workflow_endpoint(deployed_workflow)
+        if not deployed_workflow_endpoint:
+            raise ValueError(f"Could not find the model endpoint of deployed workflow '{workflow.name}'.")
+        return workflow, deployed_workflow, deployed_workflow_endpoint
+
+    async def run_workflow(
+        self, workflow_name: str = None, workflow_id: str = None, inputs: dict = None, session_id: str = None
+    ) -> str:
+        """
+        Run a workflow and return the ID of the workflow run. See
+        studio.sdk.workflows.run_workflow().
+        """
+        workflow, deployed_workflow, deployed_workflow_endpoint = await asyncio.to_thread(
+            self._resolve_run, workflow_name, workflow_id, inputs, session_id
+        )
+
+        async with self.http.post(
+            deployed_workflow_endpoint,
+            json={"request": get_kickoff_request(inputs, session_id)},
+            headers={"authorization": f"Bearer {os.environ.get('CDSW_APIV2_KEY')}"},
+        ) as out:
+            response = await out.json(content_type=None)
+        if not response["success"]:
+            raise ValueError("Workflow was unable to kick off successfully.", response)
+
+        trace_id = response["response"]["trace_id"]
+        try:
+            await self.stub.ResolveWorkflowTrace(get_record_trace_request(trace_id, workflow, deployed_workflow))
+        except grpc.RpcError as e:
+            print(f"Could not record workflow run trace '{trace_id}': {e}")
+        return trace_id
+
+    async def get_workflow_status(self, run_id: str, since: Optional[str] = None) -> dict:
+        """
+        Get the events and status of the workflow run. See
+        studio.sdk.workflows.get_workflow_status().
+        """
+        try:
+            trace_info: ResolveWorkflowTraceResponse = await self.stub.ResolveWorkflowTrace(
+                ResolveWorkflowTraceRequest(trace_id=run_id)
+            )
+            if trace_info.global_trace_id:
+                crew_events = await asyncio.to_thread(
+                    get_crew_events,
+                    get_phoenix_ops_graphql_client(),
+                    run_id,
+                    {"projectId": trace_info.project_id, "globalTraceId": trace_info.global_trace_id},
+                    since=since,
+                )
+            else:
+                # The run has not reported its trace yet.
+                crew_events = {"projectId": None, "events": [], "cursor": since}
+        except Exception as e:
+            raise ValueError(f"There was an issue with trying to get events from workflow id '{run_id}'", str(e))
+        return get_workflow_status_from_events(crew_events)
+
+    async def wait_for_workflow(
+        self,
+        run_id: str,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.5,
+        max_poll_interval: float = 5.0,
+        on_events: Optional[Callable[[list], Union[None, Awaitable[None]]]] = None,
+    ) -> dict:
+        """
+        Wait until the workflow run completes, and return its final status with all of
+        its events.
+
+        Only new events are requested on every poll. The poll interval starts at
+        poll_interval, doubles (up to max_poll_interval) while the run reports no new
+        events, and goes back to poll_interval when it does. on_events, which may be a
+        coroutine function, is called with every batch of new events. Raises
+        asyncio.TimeoutError if the run doesn't complete within timeout seconds.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = poll_interval
+        events = []
+        cursor = None
+        while True:
+            status = await self.get_workflow_status(run_id, since=cursor)
+            cursor = status["cursor"] or cursor
+            if status["events"]:
+                events.extend(status["events"])
+                interval = poll_interval
+                if on_events:
+                    result = on_events(status["events"])
+                    if asyncio.iscoroutine(result):
+                        await result
+            else:
+                interval = min(interval * 2, max_poll_interval)
+            if status["complete"]:
+                return get_workflow_status_from_events({"events": events, "cursor": cursor})
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"Workflow run '{run_id}' did not complete within {timeout} seconds.")
+                interval = min(interval, remaining)
+            await asyncio.sleep(interval)
+
+    async def run_and_wait(
+        self,
+        workflow_name: str = None,
+        workflow_id: str = None,
+        inputs: dict = None,
+        session_id: str = None,
+        timeout: Optional[float] = None,
+        **wait_kwargs,
+    ) -> dict:
+        """
+        Run a workflow and wait for it to complete. Returns the final status of the run
+        (see wait_for_workflow()), with its run ID under "run_id".
+        """
+        run_id = await self.run_workflow(workflow_name, workflow_id, inputs, session_id)
+        status = await self.wait_for_workflow(run_id, timeout=timeout, **wait_kwargs)
+        return {"run_id": run_id, **status}
+
+
+async def run_and_wait(
+    workflow_name: str = None,
+    workflow_id: str = None,
+    inputs: dict = None,
+    session_id: str = None,
+    timeout: Optional[float] = None,
+    **wait_kwargs,
+) -> dict:
+    """
+    Run a workflow and wait for it to complete, with a client of its own. To run
+    many workflows concurrently, share one AsyncWorkflowClient between them instead.
+    """
+    async with AsyncWorkflowClient() as client:
+        return await client.run_and_wait(workflow_name, workflow_id, inputs, session_id, timeout, **wait_kwargs)
@@ -1,3 +1,6 @@
+from typing import Optional
+from collections import OrderedDict
+import threading
 import json
 from gql import gql, Client
 from datetime import datetime
@@ -17,7 +20,10 @@ EVENT_TYPES = [
 def get_project_and_trace_info(client: Client, local_trace_id: str):
     """
     Given a local trace ID, query all projects and find the one whose node.trace.id exists.
-    Returns a dictionary containing { "projectId": ..., "globalTraceId": ... }.
+    Returns a dictionary containing { "projectId": ..., "projectName": ..., "globalTraceId": ... }.
+
+    This searches every project, so prefer get_trace_info_for_project() when the
+    owning project is already known.
     """
 
     # GraphQL query in a multi-line string.
@@ -28,6 +34,7 @@ def get_project_and_trace_info(client: Client, local_trace_id: str):
         edges {{
           node {{
             id
+            name
             trace(traceId: "{local_trace_id}") {{
               id
             }}
@@ -51,27 +58,122 @@ def get_project_and_trace_info(client: Client, local_trace_id: str):
     global_trace_id = project["node"]["trace"]["id"]
     project_id = project["node"]["id"]
 
-    return {"projectId": project_id, "globalTraceId": global_trace_id}
+    return {"projectId": project_id, "projectName": project["node"].get("name"), "globalTraceId": global_trace_id}
 
 
-def get_crew_events(client: Client, local_trace_id: str) -> dict:
+def get_trace_info_for_project(client: Client, project_id: str, local_trace_id: str):
     """
-    Get all "descendants" spanning events for the global trace that corresponds
-    to a local trace ID. Returns a dict with keys "projectId" and "events".
+    Given the global ID of the project that owns a local trace ID, look up the
+    trace in just that project. Returns a dictionary containing
+    { "projectId": ..., "globalTraceId": ... }, or None if the project does not
+    (yet) have the trace. Raises a ValueError if the project no longer exists.
     """
-    # First, retrieve the global trace ID (and project ID) from your helper:
-    project_and_trace_info = get_project_and_trace_info(client, local_trace_id)
-    project_id = project_and_trace_info["projectId"]
-    global_trace_id = project_and_trace_info["globalTraceId"]
 
-    # GraphQL query using a variable for the global trace ID
     query_str = f"""
-    query GetCrewEvents {{
-        node(id: "{global_trace_id}") {{
-            ... on Trace {{
-            rootSpan {{
-                name
-                descendants {{
+    query QueryProjectForTrace {{
+      node(id: "{project_id}") {{
+        ... on Project {{
+          id
+          trace(traceId: "{local_trace_id}") {{
+            id
+          }}
+        }}
+      }}
+    }}
+    """
+
+    result = client.execute(gql(query_str))
+
+    node = result.get("node")
+    if not node:
+        raise ValueError(f"No project found for projectId={project_id}")
+    if not node.get("trace") or not node["trace"].get("id"):
+        return None
+
+    return {"projectId": node["id"], "globalTraceId": node["trace"]["id"]}
+
+
+class CrewEventCache:
+    """
+    Thread-safe LRU of the parsed events of recent traces, keyed by global trace ID.
+    Events are kept in the order they were first seen, which is the order in which
+    incremental polls receive them. Spans are exported to the ops server once they
+    end, so a span may be seen after spans that started later than it did.
+    """
+
+    def __init__(self, max_traces: int = 256):
+        self._lock = threading.Lock()
+        self._traces: "OrderedDict[str, OrderedDict[str, dict]]" = OrderedDict()
+        self.max_traces = max_traces
+
+    def get_event_ids(self, global_trace_id: str) -> set:
+        with self._lock:
+            return set(self._traces.get(global_trace_id, {}).keys())
+
+    def add_events(self, global_trace_id: str, events: list) -> None:
+        with self._lock:
+            cached_events = self._traces.setdefault(global_trace_id, OrderedDict())
+            self._traces.move_to_end(global_trace_id)
+            for event in sorted(events, key=_parse_start_time):
+                cached_events.setdefault(event["id"], event)
+            while len(self._traces) > self.max_traces:
+                self._traces.popitem(last=False)
+
+    def get_events(self, global_trace_id: str, since: Optional[str] = None) -> list:
+        """
+        Get the events of a trace in the order they were first seen. If since is the
+        ID of a cached event, only events seen after that event are returned. Unknown
+        cursors (e.g. after the trace was evicted) return every event.
+        """
+        with self._lock:
+            events = list(self._traces.get(global_trace_id, {}).values())
+        if since:
+            for index, event in enumerate(events):
+                if event["id"] == since:
+                    return events[index + 1 :]
+        return events
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+_crew_event_cache = CrewEventCache()
+
+
+def get_crew_event_cache() -> CrewEventCache:
+    return _crew_event_cache
+
+
+def _parse_start_time(event: dict) -> datetime:
+    # e.g. '2023-03-12T12:34:56.789Z'
+    return datetime.fromisoformat(event["startTime"].replace("Z", "+00:00"))
+
+
+def _parse_span_event(span: dict) -> dict:
+    # Parse the "attributes" JSON, if present
+    parsed_attributes = {}
+    if span["attributes"]:
+        try:
+            parsed_attributes = json.loads(span["attributes"])
+        except json.JSONDecodeError:
+            parsed_attributes = {}
+    return {
+        **span,
+        "attributes": parsed_attributes,
+        "events": span.get("events") or [],
+    }
+
+
+def _get_span_events(client: Client, span_ids: list) -> list:
+    """
+    Fetch the full details (including the "attributes" JSON) of a set of spans in a
+    single query, aliasing one node lookup per span.
+    """
+    span_queries = "\n".join(
+        f"""
+        span{index}: node(id: "{span_id}") {{
+            ... on Span {{
                 id
                 name
                 startTime
@@ -85,6 +187,49 @@ def get_crew_events(client: Client, local_trace_id: str) -> dict:
                     name
                     timestamp
                 }}
+            }}
+        }}"""
+        for index, span_id in enumerate(span_ids)
+    )
+    result = client.execute(gql(f"query GetCrewEventSpans {{{span_queries}\n}}"))
+    return [_parse_span_event(span) for span in result.values() if span]
+
+
+def get_crew_events(
+    client: Client, local_trace_id: str, project_and_trace_info: dict = None, since: Optional[str] = None
+) -> dict:
+    """
+    Get all "descendants" spanning events for the global trace that corresponds
+    to a local trace ID. Returns a dict with keys "projectId", "events" and
+    "cursor".
+
+    If the project and global trace ID of the trace have already been resolved (see
+    the ResolveWorkflowTrace RPC), pass them as project_and_trace_info to skip
+    searching every project for the trace.
+
+    Parsed events are cached per trace, and only spans that have not been seen before
+    are fetched with their attributes. Without a "since" cursor, every event of the
+    trace is returned sorted by start time. With a cursor (the "cursor" returned from
+    a previous call), only the events seen after that call are returned, so a poller
+    receives each event once and should merge them into the events it already has.
+    """
+    # First, retrieve the global trace ID (and project ID) from your helper:
+    if not project_and_trace_info:
+        project_and_trace_info = get_project_and_trace_info(client, local_trace_id)
+    project_id = project_and_trace_info["projectId"]
+    global_trace_id = project_and_trace_info["globalTraceId"]
+
+    # List the descendant spans without their attributes; the attributes are only
+    # fetched for spans that are not cached yet.
+    query_str = f"""
+    query GetCrewEvents {{
+        node(id: "{global_trace_id}") {{
+            ... on Trace {{
+            rootSpan {{
+                name
+                descendants {{
+                id
+                name
                 }}
             }}
             }}
@@ -96,35 +241,21 @@ def get_crew_events(client: Client, local_trace_id: str) -> dict:
     result = client.execute(gql(query_str))
 
     node_data = result["node"]
-    if not node_data or not node_data.get("rootSpan"):
-        return {"projectId": project_id, "events": []}
+    if node_data and node_data.get("rootSpan"):
+        descendants = node_data["rootSpan"]["descendants"] or []
 
-    descendants = node_data["rootSpan"]["descendants"] or []
+        # Filter to the uncached spans whose `name` is in EVENT_TYPES
+        cached_span_ids = _crew_event_cache.get_event_ids(global_trace_id)
+        new_span_ids = [d["id"] for d in descendants if d["name"] in EVENT_TYPES and d["id"] not in cached_span_ids]
+        if new_span_ids:
+            _crew_event_cache.add_events(global_trace_id, _get_span_events(client, new_span_ids))
 
-    # Filter to the spans whose `name` is in EVENT_TYPES
-    filtered_events = []
-    for d in descendants:
-        if d["name"] in EVENT_TYPES:
-            # Parse the "attributes" JSON, if present
-            parsed_attributes = {}
-            if d["attributes"]:
-                try:
-                    parsed_attributes = json.loads(d["attributes"])
-                except json.JSONDecodeError:
-                    parsed_attributes = {}
-
-            event_object = {
-                **d,
-                "attributes": parsed_attributes,
-                "events": d.get("events", []),
-            }
-            filtered_events.append(event_object)
-
-    # Sort by the 'startTime' ascending, converting ISO string to datetime
-    def parse_time(e):
-        # e.g. '2023-03-12T12:34:56.789Z'
-        return datetime.fromisoformat(e["startTime"].replace("Z", "+00:00"))
-
-    filtered_events.sort(key=parse_time)
-
-    return {"projectId": project_id, "events": filtered_events}
+    all_events = _crew_event_cache.get_events(global_trace_id)
+    cursor = all_events[-1]["id"] if all_events else since
+    if since:
+        events = _crew_event_cache.get_events(global_trace_id, since)
+    else:
+        # Sort by the 'startTime' ascending, converting ISO string to datetime
+        events = sorted(all_events, key=_parse_start_time)
+
+    return {"projectId": project_id, "events": events, "cursor": cursor}
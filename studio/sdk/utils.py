@@ -1,14 +1,47 @@
+from typing import Any, Callable, Dict, Hashable, Tuple
+import threading
 import requests
+import time
 import os
 from studio.api import *
 
 
-def get_deployed_workflow_endpoint(deployed_workflow: DeployedWorkflow):
+class TTLCache:
+    """
+    Thread-safe cache of values that expire ttl seconds after they were loaded.
+    Values are loaded on first use; None is never cached, so failed lookups are
+    retried on the next use.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (value, load time on the monotonic clock)
+        self._entries: Dict[Hashable, Tuple[Any, float]] = {}
+
+    def get(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() - entry[1] < self.ttl:
+                return entry[0]
+        value = load()
+        if value is not None:
+            with self._lock:
+                self._entries[key] = (value, time.monotonic())
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def get_deployed_workflow_endpoint(deployed_workflow: DeployedWorkflow, http: requests.Session = None):
     """
     Get the endpoint of the Workbench model that represents this deployed workflow.
 
     Args:
         deployed_workflow (DeployedWorkflow): the deployed workflow object.
+        http (requests.Session): optional session to send the request with.
 
     Returns:
         str: the Workbench model endpoint that can be used to send requests.
@@ -17,30 +50,24 @@ def get_deployed_workflow_endpoint(deployed_workflow: DeployedWorkflow):
     # Read these values from your environment or define them directly:
     CDSW_DOMAIN = os.environ.get("CDSW_DOMAIN")
     CDSW_APIV2_KEY = os.environ.get("CDSW_APIV2_KEY")
+    CDSW_PROJECT_ID = os.environ.get("CDSW_PROJECT_ID")
 
     try:
-        # 1. Send GET request to /api/v2/models with page_size=10000
-        # TODO: we should really be using a search_filter here, but there is
-        # no search filter available on the cml model id, and the cml model name
-        # is not being stored in our db. So this is very much not performant
-        # but is sufficient for now to unblock workflow app development.
-        url = f"https://{CDSW_DOMAIN}/api/v2/models"
-        params = {"page_size": 10000}
+        # 1. Get the model by its ID. Deployed workflow models live in the same project
+        # as Agent Studio, which is the project this SDK runs in.
+        url = (
+            f"https://{CDSW_DOMAIN}/api/v2/projects/{CDSW_PROJECT_ID}/models/{deployed_workflow.cml_deployed_model_id}"
+        )
         headers = {"authorization": f"Bearer {CDSW_APIV2_KEY}"}
 
-        response = requests.get(url, params=params, headers=headers)
-        response.raise_for_status()  # Raises an exception if 4xx/5xx
-
-        # 2. Parse JSON and find the model
-        data = response.json()  # e.g., { "models": [ ... ] }
-        models_list = data.get("models", [])
-        model = next((m for m in models_list if m["id"] == deployed_workflow.cml_deployed_model_id), None)
-
-        if not model:
+        response = (http or requests).get(url, headers=headers)
+        if response.status_code == 404:
             print("Model is not found.")
             return None
+        response.raise_for_status()  # Raises an exception if 4xx/5xx
 
-        # 3. Build the output URL
+        # 2. Build the output URL
+        model = response.json()
         output_url = f"https://modelservice.{CDSW_DOMAIN}/model?accessKey={model['access_key']}"
         return output_url
 
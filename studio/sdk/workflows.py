@@ -1,138 +1,62 @@
 from studio.client import AgentStudioClient
 from studio.api import *
-from studio.sdk.utils import get_deployed_workflow_endpoint
+from studio.sdk.utils import TTLCache, get_deployed_workflow_endpoint
 from studio.ops import get_phoenix_ops_graphql_client
 from studio.sdk.ops import get_crew_events
 
 
-from cmlapi import CMLServiceApi, default_client
-
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import threading
 import requests
 import os
 import json
 import base64
+from typing import Optional
 
 
-def run_workflow(workflow_name: str = None, workflow_id: str = None, inputs: dict = None) -> str:
+def get_kickoff_request(inputs: dict, session_id: str = None) -> dict:
     """
-    Run a workflow based on the workflow name, and return the ID of the workflow
-    run which can then be used to query the status of that specific workflow run.
+    Request to a deployed workflow model that kicks off a run with the given inputs.
+    """
+    return {
+        "action_type": "kickoff",
+        "kickoff_inputs": base64.b64encode(json.dumps(inputs).encode("utf-8")).decode("utf-8"),
+        "session_id": session_id,
+    }
 
-    Params:
-    - workflow_name: the name of the workflow to run. It is currently assumed that every
-    workflow has just one deployed workflow instance, so for now we extract the deployed
-    workflow information from just the workflow name.
-    - workflow_id: if you know the Agent Studio id of the workflow, you can call the
-    workflow directly from the id
-    - inputs: a dictionary of inputs to the workflow. For standard (sequential) workflows,
-    this will be a key-value pair of all input fields created during task creation steps.
-    If this is a conversational workflow, then there are exactly two input keys expected:
-    "user_input" and "context". "user_input" is the most recent chat message and "context"
-    is the entire context of the previous conversation, formatted however you want.
 
-    Returns:
-    - a workflow run ID that can be used with get_workflow_events() to track workflow run.
+def get_record_trace_request(
+    trace_id: str, workflow: Workflow, deployed_workflow: DeployedWorkflow
+) -> ResolveWorkflowTraceRequest:
     """
-
-    if not workflow_name and not workflow_id:
-        raise ValueError("Either a 'workflow_name' or 'workflow_id' must be provided.")
-    if workflow_name and workflow_id:
-        raise ValueError("Only 'workflow_name' or 'workflow_id' can be used.")
-
-    CDSW_APIV2_KEY = os.environ.get("CDSW_APIV2_KEY")
-
-    # We assume this SDK is ran in the same project as Agent Studio, which means
-    # our client can be automatically configured with env variables that represent
-    # studio's gRPC IP/port.
-    studio: AgentStudioClient = AgentStudioClient()
-
-    # Create our default cml client
-    cml: CMLServiceApi = default_client()
-
-    resp: ListWorkflowsResponse = studio.stub.ListWorkflows(ListWorkflowsRequest())
-    workflows: list[Workflow] = resp.workflows
-
-    if workflow_name:
-        workflows = list(filter(lambda x: x.name == workflow_name, workflows))
-    else:
-        workflows = list(filter(lambda x: x.workflow_id == workflow_id, workflows))
-
-    if len(workflows) == 0:
-        raise ValueError("Workflow not found.")
-    if len(workflows) > 1:
-        raise ValueError("Multiple workflows match this criterion.")
-
-    workflow = workflows[0]
-
-    # As an early fail-safe, make sure that all inputs necessary for this workflow
-    # exist within the inputs dict field.
-    task_ids: list[CrewAITaskMetadata] = workflow.crew_ai_workflow_metadata.task_id
-    workflow_input_fields = []
-    for task_id in task_ids:
-        task: CrewAITaskMetadata = studio.stub.GetTask(GetTaskRequest(task_id=task_id)).task
-        workflow_input_fields.extend(task.inputs)
-    for input in inputs.keys():
-        if input not in workflow_input_fields:
-            raise ValueError(f"Input '{input}' is not one of the workflow's inputs: {workflow_input_fields}")
-    for workflow_input_field in workflow_input_fields:
-        if workflow_input_field not in inputs.keys():
-            raise ValueError(f"Input field '{workflow_input_field}' is required but not provided in workflow inputs.")
-
-    # Now that we've confirmed the workflow exists, we can see if there is a deployed workflow
-    # that matches this workflow.
-    resp: ListDeployedWorkflowsResponse = studio.stub.ListDeployedWorkflows(ListDeployedWorkflowsRequest())
-    deployed_workflows: list[DeployedWorkflow] = resp.deployed_workflows
-    try:
-        deployed_workflow = next(dw for dw in deployed_workflows if dw.workflow_id == workflow.workflow_id)
-    except:
-        raise ValueError(f"Workflow '{workflow_name}' has not been deployed yet!")
-
-    # Let's get the deployed workflow endpoint to send requests
-    deployed_workflow_endpoint = get_deployed_workflow_endpoint(deployed_workflow)
-
-    # Now we can send requests to this endpoint.
-    out = requests.post(
-        deployed_workflow_endpoint,
-        json={
-            "request": {
-                "action_type": "kickoff",
-                "kickoff_inputs": base64.b64encode(json.dumps(inputs).encode("utf-8")).decode("utf-8"),
-            },
-        },
-        headers={"authorization": f"Bearer {CDSW_APIV2_KEY}", "Content-Type": "application/json"},
+    Request that records which ops project a run reports to, so status queries can
+    resolve the run's trace without searching every project.
+    """
+    return ResolveWorkflowTraceRequest(
+        trace_id=trace_id,
+        project_name=deployed_workflow.deployed_workflow_name,
+        workflow_id=workflow.workflow_id,
     )
 
-    # Return the run ID.
-    response = out.json()
-    if not response["success"]:
-        raise ValueError("Workflow was unable to kick off successfully.", response)
-
-    return response["response"]["trace_id"]
 
-
-def get_workflow_status(run_id: str) -> dict:
+def get_workflow_status_from_events(crew_events: dict) -> dict:
     """
-    Get the events and status of the
+    Summarize the events of a workflow run into its status, as returned by
+    get_workflow_status().
     """
-
-    # Create a graphQL client to our Phoenix server
-    studio_gql_client = get_phoenix_ops_graphql_client()
-
-    try:
-        crew_events = get_crew_events(studio_gql_client, run_id)
-    except Exception as e:
-        raise ValueError(f"There was an issue with trying to get events from workflow id '{run_id}'", str(e))
-
     # Determine if the crew has completed running.
     out_dict = {
         "complete": False,
         "output": None,
         "error": None,
         "events": crew_events["events"] or [],
+        "cursor": crew_events.get("cursor"),
     }
-    if len(crew_events["events"]) > 0 and crew_events["events"][-1]["name"] == "Crew.complete":
+    crew_complete_event = next((e for e in crew_events["events"] if e["name"] == "Crew.complete"), None)
+    if crew_complete_event:
         out_dict["complete"] = True
-        out_dict["output"] = crew_events["events"][-1]["attributes"]["crew_output"]
+        out_dict["output"] = crew_complete_event["attributes"]["crew_output"]
 
     # Report any errors that appear
     for crew_event in crew_events["events"]:
@@ -146,56 +70,320 @@ def get_workflow_status(run_id: str) -> dict:
     return out_dict
 
 
+class WorkflowClient:
+    """
+    Client to the deployed workflows of Agent Studio.
+
+    Running a workflow takes several lookups: the workflow, the inputs of its tasks,
+    its deployment and the endpoint of its deployed model. The client caches these
+    for cache_ttl seconds, and reuses one gRPC channel to the studio and one pooled
+    HTTP session to the deployed models. Call refresh() to drop the cached lookups,
+    for example after redeploying a workflow.
+
+    The module-level functions (run_workflow, get_workflow_status, ...) use a
+    client shared by the whole process, see get_workflow_client().
+    """
+
+    def __init__(self, studio: AgentStudioClient = None, cache_ttl: float = 300, pool_maxsize: int = 10):
+        # We assume this SDK is ran in the same project as Agent Studio, which means
+        # our client can be automatically configured with env variables that represent
+        # studio's gRPC IP/port.
+        self.studio: AgentStudioClient = studio or AgentStudioClient()
+        self._cache = TTLCache(cache_ttl)
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+
+    def refresh(self) -> None:
+        """
+        Drop every cached lookup, so that the next calls see the current workflows
+        and deployments.
+        """
+        self._cache.clear()
+
+    def get_workflow(self, workflow_name: str = None, workflow_id: str = None) -> Workflow:
+        if not workflow_name and not workflow_id:
+            raise ValueError("Either a 'workflow_name' or 'workflow_id' must be provided.")
+        if workflow_name and workflow_id:
+            raise ValueError("Only 'workflow_name' or 'workflow_id' can be used.")
+
+        workflows: list[Workflow] = self._cache.get(
+            "workflows", lambda: list(self.studio.stub.ListWorkflows(ListWorkflowsRequest()).workflows)
+        )
+
+        if workflow_name:
+            workflows = list(filter(lambda x: x.name == workflow_name, workflows))
+        else:
+            workflows = list(filter(lambda x: x.workflow_id == workflow_id, workflows))
+
+        if len(workflows) == 0:
+            raise ValueError("Workflow not found.")
+        if len(workflows) > 1:
+            raise ValueError("Multiple workflows match this criterion.")
+
+        return workflows[0]
+
+    def get_workflow_input_fields(self, workflow: Workflow) -> list[str]:
+        def load() -> list[str]:
+            task_ids: list[CrewAITaskMetadata] = workflow.crew_ai_workflow_metadata.task_id
+            workflow_input_fields = []
+            for task_id in task_ids:
+                task: CrewAITaskMetadata = self.studio.stub.GetTask(GetTaskRequest(task_id=task_id)).task
+                workflow_input_fields.extend(task.inputs)
+            return workflow_input_fields
+
+        return self._cache.get(("input_fields", workflow.workflow_id), load)
+
+    def get_deployed_workflow(self, workflow: Workflow) -> DeployedWorkflow:
+        deployed_workflows: list[DeployedWorkflow] = self._cache.get(
+            "deployed_workflows",
+            lambda: list(self.studio.stub.ListDeployedWorkflows(ListDeployedWorkflowsRequest()).deployed_workflows),
+        )
+        try:
+            return next(dw for dw in deployed_workflows if dw.workflow_id == workflow.workflow_id)
+        except:
+            raise ValueError(f"Workflow '{workflow.name}' has not been deployed yet!")
+
+    def get_deployed_workflow_endpoint(self, deployed_workflow: DeployedWorkflow) -> Optional[str]:
+        # Failed lookups return None, which isn't cached.
+        return self._cache.get(
+            ("endpoint", deployed_workflow.cml_deployed_model_id),
+            lambda: get_deployed_workflow_endpoint(deployed_workflow, http=self.http),
+        )
+
+    def validate_workflow_inputs(self, workflow: Workflow, inputs: dict, session_id: str = None) -> None:
+        """
+        As an early fail-safe, make sure that all inputs necessary for this workflow
+        exist within the inputs dict field.
+        """
+        workflow_input_fields = self.get_workflow_input_fields(workflow)
+        for input in inputs.keys():
+            if input not in workflow_input_fields:
+                raise ValueError(f"Input '{input}' is not one of the workflow's inputs: {workflow_input_fields}")
+        for workflow_input_field in workflow_input_fields:
+            # The context of a conversation session is kept by the deployed workflow.
+            if session_id and workflow.is_conversational and workflow_input_field == "context":
+                continue
+            if workflow_input_field not in inputs.keys():
+                raise ValueError(
+                    f"Input field '{workflow_input_field}' is required but not provided in workflow inputs."
+                )
+
+    def _post_to_deployed_workflow(self, workflow: Workflow, request: dict) -> dict:
+        CDSW_APIV2_KEY = os.environ.get("CDSW_APIV2_KEY")
+
+        # Let's get the deployed workflow endpoint to send requests
+        deployed_workflow_endpoint = self.get_deployed_workflow_endpoint(self.get_deployed_workflow(workflow))
+        if not deployed_workflow_endpoint:
+            raise ValueError(f"Could not find the model endpoint of deployed workflow '{workflow.name}'.")
+
+        out = self.http.post(
+            deployed_workflow_endpoint,
+            json={"request": request},
+            headers={"authorization": f"Bearer {CDSW_APIV2_KEY}", "Content-Type": "application/json"},
+        )
+        return out.json()
+
+    def _kickoff_workflow(self, workflow: Workflow, inputs: dict, session_id: str = None) -> str:
+        """
+        Kick off a run of the deployed workflow and return its run (trace) ID.
+        """
+        response = self._post_to_deployed_workflow(workflow, get_kickoff_request(inputs, session_id))
+        if not response["success"]:
+            raise ValueError("Workflow was unable to kick off successfully.", response)
+
+        trace_id = response["response"]["trace_id"]
+
+        # Record which ops project this run reports to, so status queries can resolve
+        # the run's trace without searching every project.
+        try:
+            self.studio.stub.ResolveWorkflowTrace(
+                get_record_trace_request(trace_id, workflow, self.get_deployed_workflow(workflow))
+            )
+        except Exception as e:
+            print(f"Could not record workflow run trace '{trace_id}': {e}")
+
+        return trace_id
+
+    def run_workflow(
+        self, workflow_name: str = None, workflow_id: str = None, inputs: dict = None, session_id: str = None
+    ) -> str:
+        """
+        Run a workflow and return the ID of the workflow run. See run_workflow().
+        """
+        workflow = self.get_workflow(workflow_name, workflow_id)
+        self.validate_workflow_inputs(workflow, inputs, session_id)
+        # Make sure there is a deployed workflow that matches this workflow.
+        self.get_deployed_workflow(workflow)
+        return self._kickoff_workflow(workflow, inputs, session_id)
+
+    def run_workflow_batch(
+        self,
+        workflow_name: str = None,
+        workflow_id: str = None,
+        inputs_list: list[dict] = None,
+        concurrency: int = 8,
+        session_ids: Optional[list[str]] = None,
+    ) -> list[dict]:
+        """
+        Run a workflow once for every item of a list of inputs. See run_workflow_batch().
+        """
+        inputs_list = inputs_list or []
+        if session_ids is not None and len(session_ids) != len(inputs_list):
+            raise ValueError("'session_ids' must have one session ID per item of 'inputs_list'.")
+        if concurrency < 1:
+            raise ValueError("'concurrency' must be at least 1.")
+        session_ids = session_ids or [None] * len(inputs_list)
+
+        workflow = self.get_workflow(workflow_name, workflow_id)
+        self.get_workflow_input_fields(workflow)
+        if not self.get_deployed_workflow_endpoint(self.get_deployed_workflow(workflow)):
+            raise ValueError(f"Could not find the model endpoint of deployed workflow '{workflow.name}'.")
+
+        def run(inputs: dict, session_id: Optional[str]) -> dict:
+            try:
+                self.validate_workflow_inputs(workflow, inputs, session_id)
+                return {"run_id": self._kickoff_workflow(workflow, inputs, session_id), "error": None}
+            except Exception as e:
+                return {"run_id": None, "error": str(e)}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return list(executor.map(run, inputs_list, session_ids))
+
+    def get_workflow_status(self, run_id: str, since: Optional[str] = None) -> dict:
+        """
+        Get the events and status of the workflow run. See get_workflow_status().
+        """
+
+        # Create a graphQL client to our Phoenix server
+        studio_gql_client = get_phoenix_ops_graphql_client()
+
+        try:
+            # Resolve the run's trace through the studio's trace index, which avoids
+            # searching every ops project on every status query.
+            trace_info: ResolveWorkflowTraceResponse = self.studio.stub.ResolveWorkflowTrace(
+                ResolveWorkflowTraceRequest(trace_id=run_id)
+            )
+            if trace_info.global_trace_id:
+                crew_events = get_crew_events(
+                    studio_gql_client,
+                    run_id,
+                    {"projectId": trace_info.project_id, "globalTraceId": trace_info.global_trace_id},
+                    since=since,
+                )
+            else:
+                # The run has not reported its trace yet.
+                crew_events = {"projectId": None, "events": [], "cursor": since}
+        except Exception as e:
+            raise ValueError(f"There was an issue with trying to get events from workflow id '{run_id}'", str(e))
+
+        return get_workflow_status_from_events(crew_events)
+
+    def get_workflow_configuration(self, workflow_name: str) -> dict:
+        """
+        Get the workflow configuration of a given deployed workflow. See
+        get_workflow_configuration().
+        """
+        try:
+            workflow = self.get_workflow(workflow_name=workflow_name)
+        except ValueError:
+            raise ValueError(f"Workflow '{workflow_name}' not found.")
+
+        response = self._post_to_deployed_workflow(workflow, {"action_type": "get-configuration"})
+        if not response["success"]:
+            raise ValueError("Workflow was unable to kick off successfully.", response)
+
+        return response["response"]["configuration"]
+
+
+_workflow_client: Optional[WorkflowClient] = None
+_workflow_client_lock = threading.Lock()
+
+
+def get_workflow_client() -> WorkflowClient:
+    """
+    Get the workflow client shared by the SDK functions of this process. Its cache
+    TTL (in seconds) can be set with AGENT_STUDIO_SDK_CACHE_TTL.
+    """
+    global _workflow_client
+    with _workflow_client_lock:
+        if _workflow_client is None:
+            _workflow_client = WorkflowClient(cache_ttl=float(os.getenv("AGENT_STUDIO_SDK_CACHE_TTL", "300")))
+        return _workflow_client
+
+
+def run_workflow(
+    workflow_name: str = None, workflow_id: str = None, inputs: dict = None, session_id: str = None
+) -> str:
+    """
+    Run a workflow based on the workflow name, and return the ID of the workflow
+    run which can then be used to query the status of that specific workflow run.
+
+    Params:
+    - workflow_name: the name of the workflow to run. It is currently assumed that every
+    workflow has just one deployed workflow instance, so for now we extract the deployed
+    workflow information from just the workflow name.
+    - workflow_id: if you know the Agent Studio id of the workflow, you can call the
+    workflow directly from the id
+    - inputs: a dictionary of inputs to the workflow. For standard (sequential) workflows,
+    this will be a key-value pair of all input fields created during task creation steps.
+    If this is a conversational workflow, then there are exactly two input keys expected:
+    "user_input" and "context". "user_input" is the most recent chat message and "context"
+    is the entire context of the previous conversation, formatted however you want.
+    - session_id: for conversational workflows only. If provided, the deployed workflow
+    keeps the conversation history of this session itself, and only "user_input" needs
+    to be passed in inputs. The history only lives in the memory of one model replica,
+    so it is lost on model restarts and may be missing on other replicas. To make sure
+    it is never lost, keep passing "context" as a JSON list of {"role", "content"}
+    messages, which then replaces the history kept for the session.
+
+    Returns:
+    - a workflow run ID that can be used with get_workflow_events() to track workflow run.
+    """
+    return get_workflow_client().run_workflow(workflow_name, workflow_id, inputs, session_id)
+
+
+def run_workflow_batch(
+    workflow_name: str = None,
+    workflow_id: str = None,
+    inputs_list: list[dict] = None,
+    concurrency: int = 8,
+    session_ids: Optional[list[str]] = None,
+) -> list[dict]:
+    """
+    Run a workflow once for every item of a list of inputs, for example to evaluate a
+    workflow on a dataset. The workflow, its inputs and its deployed model endpoint are
+    resolved once for the whole batch, and the runs are kicked off concurrently over
+    a pooled HTTP session.
+
+    Params:
+    - workflow_name, workflow_id: the workflow to run, as in run_workflow().
+    - inputs_list: the inputs of every run, each as in run_workflow().
+    - concurrency: the maximum number of runs being kicked off at the same time.
+    - session_ids: optionally, the conversation session ID of every run, as in
+    run_workflow().
+
+    Returns:
+    - one {"run_id": ..., "error": ...} dictionary per item of inputs_list, in the same
+    order. Items that failed validation or could not be kicked off have a run_id of None
+    and an error message; they don't prevent the other runs from being kicked off.
+    """
+    return get_workflow_client().run_workflow_batch(workflow_name, workflow_id, inputs_list, concurrency, session_ids)
+
+
+def get_workflow_status(run_id: str, since: Optional[str] = None) -> dict:
+    """
+    Get the events and status of the workflow run. Pass the "cursor" returned from a
+    previous status call as "since" to receive only the events reported after it.
+    """
+    return get_workflow_client().get_workflow_status(run_id, since)
+
+
 def get_workflow_configuration(workflow_name: str) -> dict:
     """
     Get the workflow configuration of a given deployed workflow. This will
     request a deployed workflow to return all information about itself, including
     agents, tasks, tools, etc.
     """
-
-    CDSW_APIV2_KEY = os.environ.get("CDSW_APIV2_KEY")
-
-    # We assume this SDK is ran in the same project as Agent Studio, which means
-    # our client can be automatically configured with env variables that represent
-    # studio's gRPC IP/port.
-    studio: AgentStudioClient = AgentStudioClient()
-
-    # Create our default cml client
-    cml: CMLServiceApi = default_client()
-
-    resp: ListWorkflowsResponse = studio.stub.ListWorkflows(ListWorkflowsRequest())
-    workflows: list[Workflow] = resp.workflows
-
-    # Filter workflow by name
-    try:
-        workflow = next(w for w in workflows if w.name == workflow_name)
-    except:
-        raise ValueError(f"Workflow '{workflow_name}' not found.")
-
-    # Now that we've confirmed the workflow exists, we can see if there is a deployed workflow
-    # that matches this workflow.
-    resp: ListDeployedWorkflowsResponse = studio.stub.ListDeployedWorkflows(ListDeployedWorkflowsRequest())
-    deployed_workflows: list[DeployedWorkflow] = resp.deployed_workflows
-    try:
-        deployed_workflow = next(dw for dw in deployed_workflows if dw.workflow_id == workflow.workflow_id)
-    except:
-        raise ValueError(f"Workflow '{workflow_name}' has not been deployed yet!")
-
-    # Let's get the deployed workflow endpoint to send requests
-    deployed_workflow_endpoint = get_deployed_workflow_endpoint(deployed_workflow)
-
-    # Now we can send requests to this endpoint.
-    out = requests.post(
-        deployed_workflow_endpoint,
-        json={
-            "request": {"action_type": "get-configuration"},
-        },
-        headers={"authorization": f"Bearer {CDSW_APIV2_KEY}", "Content-Type": "application/json"},
-    )
-
-    # Return the run ID.
-    response = out.json()
-    if not response["success"]:
-        raise ValueError("Workflow was unable to kick off successfully.", response)
-
-    return response["response"]["configuration"]
+    return get_workflow_client().get_workflow_configuration(workflow_name)
@@ -16,10 +16,13 @@ from studio.agents.agent_templates import (
 )
 from studio.workflow.test_and_deploy_workflow import (
     test_workflow,
+    stream_workflow_events,
     deploy_workflow,
     undeploy_workflow,
     list_deployed_workflows,
 )
+from studio.workflow.traces import resolve_workflow_trace
+from studio.workflow.metrics import get_workflow_run_metrics
 from studio.workflow.workflow import (
     list_workflows,
     add_workflow,
@@ -37,6 +40,14 @@ from studio.cross_cutting.methods import (
     health_check,
 )
 from studio.cross_cutting.global_thread_pool import initialize_thread_pool, cleanup_thread_pool
+from studio.cross_cutting.response_cache import install_response_cache
+from studio.cross_cutting.watch import (
+    watch_workflows,
+    watch_agents,
+    watch_tasks,
+    watch_tool_instances,
+    watch_deployed_workflows,
+)
 from studio.agents.test_agents import (
     agent_test,
 )
@@ -111,6 +122,9 @@ class AgentStudioApp(AgentStudioServicer):
 
             initialize_thread_pool()
 
+            # Serve repeated reads of the polled list RPCs from memory.
+            self.response_cache = install_response_cache(self)
+
             # Load in environment variables
             self.project_id = os.getenv("CDSW_PROJECT_ID")
             self.engine_id = os.getenv("CDSW_ENGINE_ID")
@@ -268,6 +282,18 @@ class AgentStudioApp(AgentStudioServicer):
         """
         return agent_test(request, self.cml, dao=self.dao)
 
+    def ResolveWorkflowTrace(self, request, context):
+        """
+        Resolve the ops server project and global trace ID of a workflow run trace.
+        """
+        return resolve_workflow_trace(request, self.cml, dao=self.dao)
+
+    def GetWorkflowRunMetrics(self, request, context):
+        """
+        Get token and latency totals and percentiles of completed workflow runs.
+        """
+        return get_workflow_run_metrics(request, self.cml, dao=self.dao)
+
     def TemporaryFileUpload(self, request_iterator, context):
         """
         Upload a temporary file to the server.
@@ -382,6 +408,12 @@ class AgentStudioApp(AgentStudioServicer):
         """
         return test_workflow(request, self.cml, dao=self.dao)
 
+    def StreamWorkflowEvents(self, request, context):
+        """
+        Stream the events of a workflow test run as they happen.
+        """
+        return stream_workflow_events(request, self.cml, dao=self.dao, context=context)
+
     def DeployWorkflow(self, request, context):
         """
         Deploy an existing workflow by its ID.
@@ -444,3 +476,34 @@ class AgentStudioApp(AgentStudioServicer):
 
     def ImportWorkflowTemplate(self, request, context):
         return import_workflow_template(request, self.cml, dao=self.dao)
+
+    # Change watching gRPC methods
+    def WatchWorkflows(self, request, context):
+        """
+        Stream the changes of workflows.
+        """
+        return watch_workflows(request, self.cml, dao=self.dao)
+
+    def WatchAgents(self, request, context):
+        """
+        Stream the changes of agents.
+        """
+        return watch_agents(request, self.cml, dao=self.dao)
+
+    def WatchTasks(self, request, context):
+        """
+        Stream the changes of tasks.
+        """
+        return watch_tasks(request, self.cml, dao=self.dao)
+
+    def WatchToolInstances(self, request, context):
+        """
+        Stream the changes of tool instances.
+        """
+        return watch_tool_instances(request, self.cml, dao=self.dao)
+
+    def WatchDeployedWorkflows(self, request, context):
+        """
+        Stream the changes of deployed workflows.
+        """
+        return watch_deployed_workflows(request, self.cml, dao=self.dao)
@@ -8,6 +8,7 @@ from cmlapi import CMLServiceApi
 import re
 from studio.workflow.utils import invalidate_workflow
 from studio.proto.utils import is_field_set
+from studio.cross_cutting.pagination import apply_read_mask, get_read_mask, is_field_requested, paginate_query
 
 
 def add_task(request: AddTaskRequest, cml: CMLServiceApi, dao: AgentStudioDao = None) -> AddTaskResponse:
@@ -90,38 +91,43 @@ def update_task(request: UpdateTaskRequest, cml: CMLServiceApi, dao: AgentStudio
 def list_tasks(request: ListTasksRequest, cml: CMLServiceApi, dao: AgentStudioDao = None) -> ListTasksResponse:
     """
     List all tasks with metadata, ensuring assigned agent IDs exist or are empty.
+    Tasks can be filtered by workflow, paginated and limited to the fields of a read mask.
     """
     try:
+        read_mask = get_read_mask(request, CrewAITaskMetadata)
         with dao.get_session() as session:
-            tasks: List[db_model.Task] = session.query(db_model.Task).all()
-            if not tasks:
-                return ListTasksResponse(tasks=[])
+            query = session.query(db_model.Task)
 
             # Filter by workflow id
             if is_field_set(request, "workflow_id"):
-                tasks = list(filter(lambda x: x.workflow_id == request.workflow_id, tasks))
+                query = query.filter(db_model.Task.workflow_id == request.workflow_id)
+
+            tasks, next_page_token = paginate_query(query, db_model.Task, request.page_size, request.page_token)
 
             task_list = []
             for task in tasks:
                 is_valid = True  # Default to true if assigned_agent_id is empty
                 # Validate assigned agent ID only if it's not an empty string
-                if task.assigned_agent_id:
+                if task.assigned_agent_id and is_field_requested(read_mask, "is_valid"):
                     agent_exists = session.query(db_model.Agent).filter_by(id=task.assigned_agent_id).one_or_none()
                     is_valid = bool(agent_exists)
 
                 task_list.append(
-                    CrewAITaskMetadata(
-                        task_id=task.id,
-                        workflow_id=task.workflow_id,
-                        description=task.description,
-                        expected_output=task.expected_output,
-                        assigned_agent_id=task.assigned_agent_id,
-                        is_valid=is_valid,
-                        inputs=extract_placeholders(task.description),
+                    apply_read_mask(
+                        CrewAITaskMetadata(
+                            task_id=task.id,
+                            workflow_id=task.workflow_id,
+                            description=task.description,
+                            expected_output=task.expected_output,
+                            assigned_agent_id=task.assigned_agent_id,
+                            is_valid=is_valid,
+                            inputs=extract_placeholders(task.description),
+                        ),
+                        read_mask,
                     )
                 )
 
-            return ListTasksResponse(tasks=task_list)
+            return ListTasksResponse(tasks=task_list, next_page_token=next_page_token)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list tasks: {str(e)}")
 
@@ -11,6 +11,7 @@ import studio.tools.utils as tool_utils
 from studio.cross_cutting.global_thread_pool import get_thread_pool
 import studio.consts as consts
 import studio.cross_cutting.utils as cc_utils
+from studio.cross_cutting.pagination import apply_read_mask, get_read_mask, is_field_requested, paginate_query
 
 
 def create_tool_instance(
@@ -260,46 +261,59 @@ def _list_tool_instances_impl(request: ListToolInstancesRequest, session: DbSess
     """
     Implementation of list tool instances logic
     """
+    read_mask = get_read_mask(request, ToolInstance)
+    # The code and requirements files are only read for the fields derived from them.
+    read_files = is_field_requested(
+        read_mask, "python_code", "python_requirements", "tool_metadata", "is_valid", "tool_description"
+    )
+    query = session.query(db_model.ToolInstance)
     if request.workflow_id:
-        tool_instances = session.query(db_model.ToolInstance).filter_by(workflow_id=request.workflow_id).all()
-    else:
-        tool_instances = session.query(db_model.ToolInstance).all()
+        query = query.filter_by(workflow_id=request.workflow_id)
+    tool_instances, next_page_token = paginate_query(
+        query, db_model.ToolInstance, request.page_size, request.page_token
+    )
 
     tool_instances_response = []
     for tool_instance in tool_instances:
         tool_instance_dir = tool_instance.source_folder_path
-        with open(os.path.join(tool_instance_dir, tool_instance.python_code_file_name), "r") as f:
-            tool_code = f.read()
-        with open(os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name), "r") as f:
-            tool_requirements = f.read()
-
-        is_valid, validation_errors = tool_utils.validate_tool_code(tool_code)
-        user_params = []
-        try:
-            user_params = tool_utils.extract_user_params_from_code(tool_code)
-        except Exception as e:
-            is_valid = False
-            validation_errors.append(f"Error extracting user parameters from python code: {e}")
+        tool_code = ""
+        tool_requirements = ""
+        is_valid, validation_errors, user_params = True, [], []
+        if read_files:
+            with open(os.path.join(tool_instance_dir, tool_instance.python_code_file_name), "r") as f:
+                tool_code = f.read()
+            with open(os.path.join(tool_instance_dir, tool_instance.python_requirements_file_name), "r") as f:
+                tool_requirements = f.read()
+
+            is_valid, validation_errors = tool_utils.validate_tool_code(tool_code)
+            try:
+                user_params = tool_utils.extract_user_params_from_code(tool_code)
+            except Exception as e:
+                is_valid = False
+                validation_errors.append(f"Error extracting user parameters from python code: {e}")
 
         tool_image_uri = ""
         if tool_instance.tool_image_path:
             tool_image_uri = os.path.relpath(tool_instance.tool_image_path, consts.DYNAMIC_ASSETS_LOCATION)
 
         tool_instances_response.append(
-            ToolInstance(
-                id=tool_instance.id,
-                name=tool_instance.name,
-                workflow_id=tool_instance.workflow_id,
-                python_code=tool_code,
-                python_requirements=tool_requirements,
-                source_folder_path=tool_instance.source_folder_path,
-                tool_metadata=json.dumps({"validation_errors": validation_errors, "user_params": user_params}),
-                is_valid=is_valid,
-                tool_image_uri=tool_image_uri,
-                tool_description=tool_utils.extract_tool_description(tool_code),
+            apply_read_mask(
+                ToolInstance(
+                    id=tool_instance.id,
+                    name=tool_instance.name,
+                    workflow_id=tool_instance.workflow_id,
+                    python_code=tool_code,
+                    python_requirements=tool_requirements,
+                    source_folder_path=tool_instance.source_folder_path,
+                    tool_metadata=json.dumps({"validation_errors": validation_errors, "user_params": user_params}),
+                    is_valid=is_valid,
+                    tool_image_uri=tool_image_uri,
+                    tool_description=tool_utils.extract_tool_description(tool_code) if read_files else "",
+                ),
+                read_mask,
             )
         )
-    return ListToolInstancesResponse(tool_instances=tool_instances_response)
+    return ListToolInstancesResponse(tool_instances=tool_instances_response, next_page_token=next_page_token)
 
 
 def _delete_tool_instance_directory(source_folder_path: str):
@@ -1,7 +1,6 @@
 import os
 import re
 from uuid import uuid4
-from typing import List
 from sqlalchemy.exc import SQLAlchemyError
 from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model
@@ -10,6 +9,7 @@ import studio.consts as consts
 import studio.tools.utils as tool_utils
 import studio.cross_cutting.utils as cc_utils
 from studio.proto.utils import is_field_set
+from studio.cross_cutting.pagination import apply_read_mask, get_read_mask, is_field_requested, paginate_query
 from cmlapi import CMLServiceApi
 import json
 import shutil
@@ -19,15 +19,25 @@ def list_tool_templates(
     request: ListToolTemplatesRequest, cml: CMLServiceApi, dao: AgentStudioDao
 ) -> ListToolTemplatesResponse:
     """
-    List all tool templates, including reading Python code and requirements from file paths.
+    List all tool templates, including reading Python code and requirements from file paths,
+    optionally filtered by workflow template, paginated and limited to the fields of a read mask.
     """
     try:
+        read_mask = get_read_mask(request, ToolTemplate)
+        # The code and requirements files are only read for the fields derived from them.
+        read_files = is_field_requested(
+            read_mask, "python_code", "python_requirements", "tool_metadata", "is_valid", "tool_description"
+        )
         with dao.get_session() as session:
-            templates: List[db_model.ToolTemplate] = session.query(db_model.ToolTemplate).all()
+            query = session.query(db_model.ToolTemplate)
 
             # Filter by workflow template
             if is_field_set(request, "workflow_template_id"):
-                templates = list(filter(lambda x: x.workflow_template_id == request.workflow_template_id, templates))
+                query = query.filter(db_model.ToolTemplate.workflow_template_id == request.workflow_template_id)
+
+            templates, next_page_token = paginate_query(
+                query, db_model.ToolTemplate, request.page_size, request.page_token
+            )
 
             response_templates = []
             for template in templates:
@@ -38,9 +48,12 @@ def list_tool_templates(
 
                 # Attempt to read the Python code
                 try:
-                    python_code_file_path = os.path.join(template.source_folder_path, template.python_code_file_name)
-                    with open(python_code_file_path, "r") as file:
-                        python_code = file.read()
+                    if read_files:
+                        python_code_file_path = os.path.join(
+                            template.source_folder_path, template.python_code_file_name
+                        )
+                        with open(python_code_file_path, "r") as file:
+                            python_code = file.read()
                 except Exception:
                     is_valid = False
 
@@ -51,11 +64,12 @@ def list_tool_templates(
 
                 # Attempt to read the Python requirements
                 try:
-                    python_requirements_file_path = os.path.join(
-                        template.source_folder_path, template.python_requirements_file_name
-                    )
-                    with open(python_requirements_file_path, "r") as file:
-                        python_requirements = file.read()
+                    if read_files:
+                        python_requirements_file_path = os.path.join(
+                            template.source_folder_path, template.python_requirements_file_name
+                        )
+                        with open(python_requirements_file_path, "r") as file:
+                            python_requirements = file.read()
                 except Exception:
                     is_valid = False
 
@@ -81,7 +95,10 @@ def list_tool_templates(
                     )
                 )
 
-            return ListToolTemplatesResponse(templates=response_templates)
+            return ListToolTemplatesResponse(
+                templates=[apply_read_mask(template, read_mask) for template in response_templates],
+                next_page_token=next_page_token,
+            )
 
     except SQLAlchemyError as e:
         raise RuntimeError(f"Database error while listing tool templates: {e}")
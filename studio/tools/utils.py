@@ -7,9 +7,12 @@ from textwrap import dedent, indent
 import subprocess
 import threading
 import hashlib
+import time
 from typing import Dict, Tuple, List, Optional, Literal
 from crewai.tools import BaseTool
 
+from studio.cross_cutting.metrics import TOOL_VENV_BUILDS, TOOL_VENV_BUILD_DURATION
+
 # Import engine code manually. Eventually when this code becomes
 # a separate git repo, or a custom runtime image, this path call
 # will go away and workflow engine features will be available already.
@@ -289,7 +292,11 @@ def is_venv_prepared_for_tool(source_folder_path: str, requirements_file_name: s
 
 def _prepare_virtual_env_for_tool_impl(
     source_folder_path: str, requirements_file_name: str, with_: Literal["venv", "uv"]
-):
+) -> str:
+    """
+    Prepare the virtual environment of a tool. Returns the result of the preparation:
+    "installed", "up_to_date" or "error".
+    """
     venv_dir = os.path.join(source_folder_path, ".venv")
     uv_bin = shutil.which("uv")
 
@@ -308,7 +315,7 @@ def _prepare_virtual_env_for_tool_impl(
             venv.create(venv_dir, with_pip=True)
     except Exception as e:
         print(f"Error creating virtual environment for tool directory {source_folder_path}: {e.with_traceback()}")
-        return
+        return "error"
 
     # Check for previous requirements file hash
     hash_file_path = os.path.join(source_folder_path, ".requirements_hash.txt")
@@ -351,13 +358,20 @@ def _prepare_virtual_env_for_tool_impl(
 
             with open(hash_file_path, "w") as hash_file:
                 hash_file.write(requirements_hash)
+            return "installed"
     except subprocess.CalledProcessError as e:
         # We're not raising error as this will bring down the whole studio, as it's running in a thread
         print(f"Error installing venv requirements for tool directory {source_folder_path}: {e.with_traceback()}")
+        return "error"
+    return "up_to_date"
 
 
-def prepare_virtual_env_for_tool(source_folder_path: str, requirements_file_name: str):
-    return _prepare_virtual_env_for_tool_impl(source_folder_path, requirements_file_name, "venv")
+def prepare_virtual_env_for_tool(source_folder_path: str, requirements_file_name: str) -> str:
+    start = time.perf_counter()
+    result = _prepare_virtual_env_for_tool_impl(source_folder_path, requirements_file_name, "venv")
+    TOOL_VENV_BUILD_DURATION.observe(time.perf_counter() - start, result=result)
+    TOOL_VENV_BUILDS.inc(result=result)
+    return result
 
 
 def extract_tool_description(code: str) -> str:
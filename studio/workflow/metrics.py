@@ -0,0 +1,331 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from uuid import uuid4
+import threading
+import json
+import time
+from cmlapi import CMLServiceApi
+from crewai import Crew
+from gql import Client
+from opentelemetry.context import Context
+from sqlalchemy.exc import SQLAlchemyError
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.api import *
+import studio.workflow.utils as workflow_utils
+from studio.sdk.ops import get_crew_events
+
+# Import engine code manually. Eventually when this code becomes
+# a separate git repo, or a custom runtime image, this path call
+# will go away and workflow engine features will be available already.
+import sys
+
+sys.path.append("studio/workflow_engine/src")
+
+from engine.events import get_event_bus, is_terminal_event
+
+
+METRIC_SCOPES = ["run", "agent", "tool", "model"]
+DEFAULT_METRIC_PERCENTILES = [50.0, 90.0, 99.0]
+DEFAULT_METRICS_TIME_RANGE_SECONDS = 24 * 60 * 60
+
+# Deployed runs are only looked up on the ops server this often while they are polled.
+DEPLOYED_RUN_METRICS_CHECK_INTERVAL_SECONDS = 10
+MAX_TRACKED_DEPLOYED_RUNS = 1000
+_deployed_run_checks: "OrderedDict[str, float]" = OrderedDict()
+_deployed_run_checks_lock = threading.Lock()
+
+
+def _parse_event_time(event: Dict[str, Any]) -> float:
+    # The ops server reports UTC times with a "Z" suffix.
+    return datetime.fromisoformat(event["startTime"].replace("Z", "+00:00")).timestamp()
+
+
+def _has_exception(event: Dict[str, Any]) -> bool:
+    return any(sub_event.get("name") == "exception" for sub_event in event.get("events") or [])
+
+
+def _new_metric(scope: str, name: Optional[str]) -> Dict[str, Any]:
+    return {"scope": scope, "name": name, "duration_seconds": None, "call_count": 0, "error_count": 0}
+
+
+def _add_tokens(metric: Dict[str, Any], usage: Dict[str, Any]) -> None:
+    for key in ["prompt_tokens", "completion_tokens", "total_tokens"]:
+        metric[key] = (metric.get(key) or 0) + int(usage.get(key) or 0)
+
+
+def _add_durations(
+    metrics: Dict[str, Dict[str, Any]],
+    events: List[Dict[str, Any]],
+    start_name: str,
+    end_name: str,
+    scope: str,
+    get_name,
+) -> None:
+    """
+    Pair up the start and end events of tasks or tool calls (in order, per name) and
+    add up their counts, errors and durations.
+    """
+    started: Dict[str, List[float]] = defaultdict(list)
+    for event in events:
+        if event["name"] not in (start_name, end_name):
+            continue
+        name = get_name(event["attributes"])
+        metric = metrics.setdefault(name, _new_metric(scope, name))
+        if event["name"] == start_name:
+            started[name].append(_parse_event_time(event))
+            metric["call_count"] += 1
+        elif started[name]:
+            duration = _parse_event_time(event) - started[name].pop(0)
+            metric["duration_seconds"] = (metric["duration_seconds"] or 0.0) + duration
+            if _has_exception(event):
+                metric["error_count"] += 1
+
+
+def _get_agent_name(attributes: Dict[str, Any]) -> Optional[str]:
+    return attributes.get("agent_studio_id") or attributes.get("agent_role")
+
+
+def _get_tool_name(attributes: Dict[str, Any]) -> Optional[str]:
+    return (attributes.get("tool") or {}).get("name")
+
+
+def compute_workflow_run_metrics(
+    trace_id: str, events: List[Dict[str, Any]], workflow_id: Optional[str] = None
+) -> List[db_model.WorkflowRunMetric]:
+    """
+    Compute the metrics rows of a workflow run from its event bus events, or from its
+    events on the ops server: one row for the run, and one row per agent, tool and
+    language model of the run. Returns no rows if the run has not completed.
+    """
+    kickoff = next((event for event in events if event["name"] == "Crew.kickoff"), None)
+    terminal = next((event for event in events if is_terminal_event(event)), None)
+    if not kickoff or not terminal:
+        return []
+    agent_usage = terminal["attributes"].get("agent_usage") or []
+    if isinstance(agent_usage, str):
+        # Span attributes can't hold lists of objects, so spans carry them as JSON.
+        agent_usage = json.loads(agent_usage)
+
+    run_metric = _new_metric("run", workflow_id)
+    run_metric["duration_seconds"] = _parse_event_time(terminal) - _parse_event_time(kickoff)
+    run_metric["call_count"] = 1
+    run_metric["error_count"] = 0 if terminal["name"] == "Crew.complete" else 1
+
+    agent_metrics: Dict[str, Dict[str, Any]] = {}
+    _add_durations(agent_metrics, events, "Agent._start_task", "Agent._end_task", "agent", _get_agent_name)
+    tool_metrics: Dict[str, Dict[str, Any]] = {}
+    _add_durations(tool_metrics, events, "ToolUsage._use", "ToolUsage._end_use", "tool", _get_tool_name)
+
+    model_metrics: Dict[str, Dict[str, Any]] = {}
+    for usage in agent_usage:
+        _add_tokens(run_metric, usage)
+        agent_name = _get_agent_name(usage)
+        _add_tokens(agent_metrics.setdefault(agent_name, _new_metric("agent", agent_name)), usage)
+        if usage.get("model"):
+            model_metric = model_metrics.setdefault(usage["model"], _new_metric("model", usage["model"]))
+            _add_tokens(model_metric, usage)
+            model_metric["call_count"] += int(usage.get("successful_requests") or 0)
+
+    started_at = _parse_event_time(kickoff)
+    return [
+        db_model.WorkflowRunMetric(
+            id=str(uuid4()), trace_id=trace_id, workflow_id=workflow_id, started_at=started_at, **metric
+        )
+        for metric in [run_metric, *agent_metrics.values(), *tool_metrics.values(), *model_metrics.values()]
+    ]
+
+
+def _save_workflow_run_metrics(trace_id: str, metrics: List[db_model.WorkflowRunMetric], dao: AgentStudioDao) -> None:
+    """
+    Save the metrics rows of a run, replacing any rows recorded for the run before,
+    so that a run recorded both in-process and from the ops server is counted once.
+    """
+    with dao.get_session() as session:
+        session.query(db_model.WorkflowRunMetric).filter(db_model.WorkflowRunMetric.trace_id == trace_id).delete(
+            synchronize_session=False
+        )
+        session.add_all(metrics)
+
+
+def record_workflow_run_metrics(trace_id: str, workflow_id: Optional[str] = None, dao: AgentStudioDao = None) -> int:
+    """
+    Record the metrics of a completed workflow test run from the events of the run on
+    the in-process event bus. Returns the number of recorded metrics rows. Recording
+    never raises, so it can't interfere with the run itself. Deployed runs are
+    recorded from the ops server instead (see record_deployed_workflow_run_metrics).
+    """
+    try:
+        metrics = compute_workflow_run_metrics(trace_id, get_event_bus().get_events(trace_id), workflow_id)
+        if not metrics:
+            return 0
+        _save_workflow_run_metrics(trace_id, metrics, dao)
+        return len(metrics)
+    except Exception as e:
+        print(f"Failed to record metrics of workflow run {trace_id}: {e}")
+        return 0
+
+
+def _should_check_deployed_run(trace_id: str) -> bool:
+    now = time.monotonic()
+    with _deployed_run_checks_lock:
+        last_check = _deployed_run_checks.get(trace_id)
+        if last_check is not None and now - last_check < DEPLOYED_RUN_METRICS_CHECK_INTERVAL_SECONDS:
+            return False
+        _deployed_run_checks[trace_id] = now
+        _deployed_run_checks.move_to_end(trace_id)
+        while len(_deployed_run_checks) > MAX_TRACKED_DEPLOYED_RUNS:
+            _deployed_run_checks.popitem(last=False)
+        return True
+
+
+def record_deployed_workflow_run_metrics(
+    client: Client, trace_id: str, trace_info: dict, workflow_id: str, dao: AgentStudioDao = None
+) -> int:
+    """
+    Record the metrics of a workflow run from its events on the ops server, once the
+    run has completed. Deployed workflows run in their own CML model, without the
+    studio's event bus or database, so this is how their runs are recorded. Each run
+    is looked up at most every DEPLOYED_RUN_METRICS_CHECK_INTERVAL_SECONDS, and not
+    at all once its metrics are recorded. Returns the number of recorded metrics rows.
+    Recording never raises, so it can't interfere with the caller.
+    """
+    # Test runs are recorded with their trace IDs as kicked off, without leading zeros.
+    trace_id = trace_id.lower().lstrip("0")
+    try:
+        with dao.get_session() as session:
+            recorded = (
+                session.query(db_model.WorkflowRunMetric.id)
+                .filter(db_model.WorkflowRunMetric.trace_id == trace_id)
+                .first()
+            )
+        if recorded or not _should_check_deployed_run(trace_id):
+            return 0
+        events = get_crew_events(client, trace_id, trace_info)["events"]
+        metrics = compute_workflow_run_metrics(trace_id, events, workflow_id)
+        if not metrics:
+            return 0
+        _save_workflow_run_metrics(trace_id, metrics, dao)
+        return len(metrics)
+    except Exception as e:
+        print(f"Failed to record metrics of deployed workflow run {trace_id}: {e}")
+        return 0
+
+
+def run_workflow_and_record_metrics(
+    crew: Crew,
+    inputs,
+    parent_context: Context,
+    trace_id: str,
+    workflow_id: Optional[str] = None,
+    dao: AgentStudioDao = None,
+):
+    """
+    Run a workflow with the parent OpenTelemetry context, and record the metrics of
+    the run once it completes or fails.
+    """
+    try:
+        return workflow_utils.run_workflow_with_context(crew, inputs, parent_context)
+    finally:
+        record_workflow_run_metrics(trace_id, workflow_id, dao=dao)
+
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    """
+    Percentile of sorted values, interpolating linearly between the closest ranks.
+    """
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * min(max(percentile, 0.0), 100.0) / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def _get_percentiles(values: List[float], percentiles: List[float]) -> List[MetricPercentile]:
+    if not values:
+        return []
+    sorted_values = sorted(values)
+    return [MetricPercentile(percentile=p, value=_percentile(sorted_values, p)) for p in percentiles]
+
+
+def summarize_workflow_run_metrics(
+    metrics: List[db_model.WorkflowRunMetric],
+    scope: str,
+    start_time: float,
+    end_time: float,
+    window_seconds: float = 0,
+    percentiles: Optional[List[float]] = None,
+) -> List[WorkflowRunMetricsSummary]:
+    """
+    Aggregate metrics rows into summaries per time window and name, with totals and
+    percentiles of the per-run durations and total token counts.
+    """
+    percentiles = percentiles or DEFAULT_METRIC_PERCENTILES
+    window_seconds = window_seconds if window_seconds > 0 else end_time - start_time
+    groups: Dict[Tuple[int, str], List[db_model.WorkflowRunMetric]] = defaultdict(list)
+    for metric in metrics:
+        window_index = int((metric.started_at - start_time) // window_seconds)
+        groups[(window_index, metric.name or "")].append(metric)
+
+    summaries = []
+    for (window_index, name), group in sorted(groups.items()):
+        window_start = start_time + window_index * window_seconds
+        durations = [metric.duration_seconds for metric in group if metric.duration_seconds is not None]
+        total_tokens = [metric.total_tokens for metric in group if metric.total_tokens is not None]
+        summaries.append(
+            WorkflowRunMetricsSummary(
+                scope=scope,
+                name=name,
+                window_start=window_start,
+                window_end=min(window_start + window_seconds, end_time),
+                run_count=len({metric.trace_id for metric in group}),
+                call_count=sum(metric.call_count or 0 for metric in group),
+                error_count=sum(metric.error_count or 0 for metric in group),
+                prompt_tokens=sum(metric.prompt_tokens or 0 for metric in group),
+                completion_tokens=sum(metric.completion_tokens or 0 for metric in group),
+                total_tokens=sum(total_tokens),
+                duration_seconds=sum(durations),
+                duration_seconds_percentiles=_get_percentiles(durations, percentiles),
+                total_tokens_percentiles=_get_percentiles(total_tokens, percentiles),
+            )
+        )
+    return summaries
+
+
+def get_workflow_run_metrics(
+    request: GetWorkflowRunMetricsRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> GetWorkflowRunMetricsResponse:
+    """
+    Get totals and percentiles of the token counts and durations of completed workflow
+    runs, per run, agent, tool or language model, over time windows.
+    """
+    scope = request.scope or "run"
+    if scope not in METRIC_SCOPES:
+        raise ValueError(f"Invalid metrics scope '{scope}'. Expected one of: {', '.join(METRIC_SCOPES)}.")
+    end_time = request.end_time or time.time()
+    start_time = request.start_time or end_time - DEFAULT_METRICS_TIME_RANGE_SECONDS
+    if start_time >= end_time:
+        raise ValueError("Metrics start time must be before the end time.")
+    if request.window_seconds < 0:
+        raise ValueError("Metrics window must not be negative.")
+
+    try:
+        with dao.get_session() as session:
+            query = session.query(db_model.WorkflowRunMetric).filter(
+                db_model.WorkflowRunMetric.scope == scope,
+                db_model.WorkflowRunMetric.started_at >= start_time,
+                db_model.WorkflowRunMetric.started_at < end_time,
+            )
+            if request.HasField("workflow_id"):
+                query = query.filter(db_model.WorkflowRunMetric.workflow_id == request.workflow_id)
+            summaries = summarize_workflow_run_metrics(
+                query.all(), scope, start_time, end_time, request.window_seconds, list(request.percentiles)
+            )
+        return GetWorkflowRunMetricsResponse(summaries=summaries)
+    except SQLAlchemyError as e:
+        raise RuntimeError(f"Database error while getting workflow run metrics: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Unexpected error while getting workflow run metrics: {e}")
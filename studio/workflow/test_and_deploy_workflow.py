@@ -3,11 +3,17 @@ import os
 import shutil
 from uuid import uuid4
 import cmlapi
-from typing import Union, List, Optional
+from typing import Union, List, Optional, Iterator
+from collections import OrderedDict
+from concurrent.futures import Future
+import threading
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
 from opentelemetry.context import get_current
 import requests
+import grpc
+import queue
+import time
 from google.protobuf.json_format import MessageToDict
 import json
 from cmlapi import CMLServiceApi
@@ -23,6 +29,8 @@ from studio.cross_cutting.utils import get_studio_subdirectory
 import studio.workflow.utils as workflow_utils
 import studio.consts as consts
 from studio.workflow.utils import is_custom_model_root_dir_feature_enabled
+from studio.workflow.traces import record_workflow_trace
+from studio.workflow.metrics import run_workflow_and_record_metrics
 
 # Import engine code manually. Eventually when this code becomes
 # a separate git repo, or a custom runtime image, this path call
@@ -32,10 +40,35 @@ import sys
 sys.path.append("studio/worfklow_engine/src")
 
 from engine.ops import get_ops_endpoint
-from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
+from engine.events import get_event_bus, is_terminal_event
+from engine.crewai.tracing import TracingConfig, instrument_crewai_workflow, reset_crewai_instrumentation
+from engine.requirements import write_merged_requirements, lock_requirements, build_wheelhouse
 import engine.types as input_types
 
 
+# Executor futures of the workflow test runs of this process, by trace ID, so that
+# event streams can end once their run is over. Only the latest runs are kept.
+MAX_TRACKED_RUNS = 1000
+_run_futures: "OrderedDict[str, Future]" = OrderedDict()
+_run_futures_lock = threading.Lock()
+
+
+def track_workflow_run(trace_id: str, future: Future) -> None:
+    with _run_futures_lock:
+        _run_futures[trace_id.lower().lstrip("0")] = future
+        while len(_run_futures) > MAX_TRACKED_RUNS:
+            _run_futures.popitem(last=False)
+
+
+def is_workflow_run_done(trace_id: str) -> bool:
+    """
+    Whether the run of a trace, started by this process, is over.
+    """
+    with _run_futures_lock:
+        future = _run_futures.get(trace_id)
+    return future is not None and future.done()
+
+
 def _create_collated_input(
     request: Union[TestWorkflowRequest, DeployWorkflowRequest], cml: CMLServiceApi = None, dao: AgentStudioDao = None
 ) -> input_types.CollatedInput:
@@ -201,7 +234,10 @@ def test_workflow(
         collated_input = _create_collated_input(request, cml, dao)
         try:
             reset_crewai_instrumentation()
-            tracer_provider = instrument_crewai_workflow(f"Test Workflow - {collated_input.workflow.name}")
+            # Test runs are always fully traced, regardless of the studio's own tracing config.
+            tracer_provider = instrument_crewai_workflow(
+                f"Test Workflow - {collated_input.workflow.name}", tracing_config=TracingConfig()
+            )
         except Exception as e:
             pass
 
@@ -233,13 +269,24 @@ def test_workflow(
                 # Capture the current OpenTelemetry context
                 parent_context = get_current()
 
-                # Start crew execution in a separate thread with the parent context
-                get_thread_pool().submit(
-                    workflow_utils.run_workflow_with_context,
+                # Index the trace so that run events can be fetched without
+                # searching every ops project for it.
+                record_workflow_trace(
+                    trace_id, f"Test Workflow - {collated_input.workflow.name}", collated_input.workflow.id, dao=dao
+                )
+
+                # Start crew execution in a separate thread with the parent context. The
+                # run's token and latency metrics are recorded once it completes.
+                future = get_thread_pool().submit(
+                    run_workflow_and_record_metrics,
                     crew,
                     dict(request.inputs),
                     parent_context,
+                    trace_id,
+                    collated_input.workflow.id,
+                    dao,
                 )
+                track_workflow_run(trace_id, future)
 
             return TestWorkflowResponse(
                 message="",  # Return empty message since execution is async
@@ -254,6 +301,58 @@ def test_workflow(
         raise RuntimeError(f"Unexpected error while testing workflow: {e}")
 
 
+def _is_client_active(context) -> bool:
+    if context is None:
+        return True
+    # grpc.aio contexts (see studio.aio_service) have no is_active().
+    if hasattr(context, "is_active"):
+        return context.is_active()
+    return not context.done()
+
+
+def stream_workflow_events(
+    request: StreamWorkflowEventsRequest,
+    cml: CMLServiceApi = None,
+    dao: AgentStudioDao = None,
+    context: Optional[grpc.ServicerContext] = None,
+) -> Iterator[WorkflowRunEvent]:
+    """
+    Stream the events of a workflow test run as they are published to the in-process
+    event bus, without waiting for the run's spans to be exported to the ops server
+    and queried back. Events published before the call are replayed first, and the
+    stream ends after the run's terminal event (Crew.complete or Crew.error), once
+    the run is over even if it never published one, or once the client goes away.
+    """
+    if not request.trace_id:
+        raise ValueError("Trace ID is required.")
+
+    trace_id = request.trace_id.lower().lstrip("0")
+    subscriber = get_event_bus().subscribe(trace_id, replay=True)
+    try:
+        deadline = time.monotonic() + consts.WORKFLOW_EVENT_STREAM_TIMEOUT_SECONDS
+        # gRPC only stops a generator at a yield, so cancellations are checked
+        # between waits for events too.
+        while time.monotonic() < deadline and _is_client_active(context):
+            try:
+                event = subscriber.get(timeout=1)
+            except queue.Empty:
+                # Runs publish all of their events before they are done.
+                if is_workflow_run_done(trace_id):
+                    break
+                continue
+            yield WorkflowRunEvent(
+                id=event["id"],
+                name=event["name"],
+                start_time=event["startTime"],
+                attributes=json.dumps(event["attributes"], default=str),
+                events=json.dumps(event["events"], default=str),
+            )
+            if is_terminal_event(event):
+                break
+    finally:
+        get_event_bus().unsubscribe(trace_id, subscriber)
+
+
 def _cleanup_deployments(cml, model_id):
     """
     Helper function to clean up deployments.
@@ -362,6 +461,31 @@ def get_deployed_workflow_config(deployable_workflow_dir: str) -> dict:
         }
 
 
+def prepare_deployed_workflow_requirements(
+    collated_input: input_types.CollatedInput, deployable_workflow_dir: str
+) -> None:
+    """
+    Pre-resolve the Python requirements of every tool in the workflow into a single
+    locked requirements file that ships next to the workflow config. This lets the
+    workflow model install all tool dependencies in one pass (or at build time) instead
+    of installing every tool's requirements file serially on each replica start. A local
+    wheelhouse can optionally be bundled as well so replicas don't need a package index.
+    """
+    requirement_files = sorted(
+        set(
+            os.path.join(
+                deployable_workflow_dir, tool_instance.source_folder_path, tool_instance.python_requirements_file_name
+            )
+            for tool_instance in collated_input.tool_instances
+        )
+    )
+    artifact_dir = os.path.join(deployable_workflow_dir, "workflow")
+    merged_requirements_path = write_merged_requirements(requirement_files, artifact_dir)
+    locked_requirements_path = lock_requirements(merged_requirements_path, artifact_dir)
+    if os.getenv("AGENT_STUDIO_WORKFLOW_WHEELHOUSE_ENABLED", "false").lower() == "true":
+        build_wheelhouse(locked_requirements_path, artifact_dir)
+
+
 def deploy_workflow(
     request: DeployWorkflowRequest, cml: CMLServiceApi, dao: AgentStudioDao = None
 ) -> DeployWorkflowResponse:
@@ -450,6 +574,10 @@ def deploy_workflow(
             "studio-data", os.path.join(deployable_workflow_dir, "studio-data"), ignore=studio_data_workflow_ignore
         )
 
+        # Merge and lock all tool requirements into the deployable artifact so
+        # workflow model replicas don't have to resolve them on every cold start.
+        prepare_deployed_workflow_requirements(collated_input, deployable_workflow_dir)
+
         # Get some deployed workflow configuration parameters based on the version
         # of workbench running, deployment pattern, and entitlements that are currently enabled
         deployed_workflow_config = get_deployed_workflow_config(deployable_workflow_dir)
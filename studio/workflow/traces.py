@@ -0,0 +1,161 @@
+from typing import Optional
+import time
+from cmlapi import CMLServiceApi
+from gql import Client
+from sqlalchemy.exc import SQLAlchemyError
+
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.api import *
+from studio.ops import get_phoenix_ops_graphql_client
+from studio.sdk.ops import get_project_and_trace_info, get_trace_info_for_project
+from studio.workflow.metrics import record_deployed_workflow_run_metrics
+
+
+def normalize_trace_id(trace_id: str) -> str:
+    """
+    Trace IDs returned from kickoffs are formatted without leading zeros, while
+    the ops server stores full 32-character hex trace IDs.
+    """
+    return trace_id.lower().zfill(32)
+
+
+def record_workflow_trace(
+    trace_id: str, project_name: Optional[str] = None, workflow_id: Optional[str] = None, dao: AgentStudioDao = None
+) -> None:
+    """
+    Record the ops project that a workflow run reports its trace to, so that the
+    trace can later be resolved with a single targeted ops server query.
+    """
+    trace_id = normalize_trace_id(trace_id)
+    with dao.get_session() as session:
+        workflow_trace = session.get(db_model.WorkflowTrace, trace_id)
+        if not workflow_trace:
+            workflow_trace = db_model.WorkflowTrace(trace_id=trace_id, created_at=time.time())
+            session.add(workflow_trace)
+        if project_name:
+            workflow_trace.project_name = project_name
+        if workflow_id:
+            workflow_trace.workflow_id = workflow_id
+        if project_name and not workflow_trace.project_id:
+            # Reuse the project ID resolved for any earlier run in the same project.
+            known_project = (
+                session.query(db_model.WorkflowTrace)
+                .filter(
+                    db_model.WorkflowTrace.project_name == project_name, db_model.WorkflowTrace.project_id.isnot(None)
+                )
+                .first()
+            )
+            if known_project:
+                workflow_trace.project_id = known_project.project_id
+
+
+def resolve_workflow_trace_info(
+    client: Client,
+    trace_id: str,
+    project_name: Optional[str] = None,
+    workflow_id: Optional[str] = None,
+    dao: AgentStudioDao = None,
+) -> Optional[dict]:
+    """
+    Resolve the ops project and global trace ID of a workflow run trace. Traces are
+    looked up in the trace index first; a trace whose project is known is resolved
+    with one query against that project, and only unknown traces fall back to
+    searching every project. Resolved traces are persisted to the index, as are
+    the given project and workflow of traces that aren't resolved yet.
+
+    Returns a dictionary containing { "projectId": ..., "globalTraceId": ... }, or
+    None if the trace has not been reported to the ops server yet.
+    """
+    trace_id = normalize_trace_id(trace_id)
+    # Only index traces that come with something to remember about them, so that
+    # lookups of unknown or mistyped trace IDs don't add rows.
+    if project_name or workflow_id:
+        record_workflow_trace(trace_id, project_name, workflow_id, dao=dao)
+    with dao.get_session() as session:
+        workflow_trace = session.get(db_model.WorkflowTrace, trace_id)
+        if workflow_trace and workflow_trace.global_trace_id:
+            return {"projectId": workflow_trace.project_id, "globalTraceId": workflow_trace.global_trace_id}
+        project_id = workflow_trace.project_id if workflow_trace else None
+
+    trace_info = None
+    try:
+        if project_id:
+            trace_info = get_trace_info_for_project(client, project_id, trace_id)
+        else:
+            trace_info = get_project_and_trace_info(client, trace_id)
+    except ValueError:
+        # The trace has not been reported yet, or the recorded project no longer
+        # exists. In the latter case, forget the project so lookups search again.
+        if project_id:
+            with dao.get_session() as session:
+                session.query(db_model.WorkflowTrace).filter(db_model.WorkflowTrace.project_id == project_id).update(
+                    {db_model.WorkflowTrace.project_id: None}
+                )
+    if not trace_info:
+        return None
+
+    # The trace exists in the ops server, so it is worth indexing.
+    record_workflow_trace(trace_id, dao=dao)
+    with dao.get_session() as session:
+        workflow_trace = session.get(db_model.WorkflowTrace, trace_id)
+        workflow_trace.project_id = trace_info["projectId"]
+        workflow_trace.global_trace_id = trace_info["globalTraceId"]
+        if trace_info.get("projectName"):
+            workflow_trace.project_name = trace_info["projectName"]
+    return {"projectId": trace_info["projectId"], "globalTraceId": trace_info["globalTraceId"]}
+
+
+def resolve_workflow_trace(
+    request: ResolveWorkflowTraceRequest, cml: CMLServiceApi = None, dao: AgentStudioDao = None
+) -> ResolveWorkflowTraceResponse:
+    """
+    Resolve the ops server project and global trace ID of a workflow run trace. Runs
+    of known workflows are polled through here, so this is also where the metrics of
+    runs that weren't recorded in-process (deployed runs) are recorded once the run
+    completes.
+    """
+    if not request.trace_id:
+        raise ValueError("Trace ID is required.")
+    try:
+        client = get_phoenix_ops_graphql_client()
+        trace_info = resolve_workflow_trace_info(
+            client,
+            request.trace_id,
+            project_name=request.project_name if request.HasField("project_name") else None,
+            workflow_id=request.workflow_id if request.HasField("workflow_id") else None,
+            dao=dao,
+        )
+        if trace_info:
+            with dao.get_session() as session:
+                workflow_trace = session.get(db_model.WorkflowTrace, normalize_trace_id(request.trace_id))
+                workflow_id = workflow_trace.workflow_id if workflow_trace else None
+            if workflow_id:
+                record_deployed_workflow_run_metrics(client, request.trace_id, trace_info, workflow_id, dao=dao)
+    except SQLAlchemyError as e:
+        raise RuntimeError(f"Database error while resolving workflow trace: {e}")
+    except Exception as e:
+        raise RuntimeError(f"Unexpected error while resolving workflow trace: {e}")
+    if not trace_info:
+        return ResolveWorkflowTraceResponse()
+    return ResolveWorkflowTraceResponse(project_id=trace_info["projectId"], global_trace_id=trace_info["globalTraceId"])
+
+
+def remove_workflow_traces(
+    project_id: str, project_name: Optional[str] = None, before: Optional[float] = None, dao: AgentStudioDao = None
+) -> int:
+    """
+    Remove the traces of an ops project from the trace index, optionally only the
+    ones indexed before a time (in seconds since the epoch). Traces indexed before
+    their time was recorded are always removed. Returns the number of removed traces.
+    """
+    with dao.get_session() as session:
+        in_project = db_model.WorkflowTrace.project_id == project_id
+        if project_name:
+            in_project = in_project | (db_model.WorkflowTrace.project_name == project_name)
+        query = session.query(db_model.WorkflowTrace).filter(in_project)
+        if before is not None:
+            query = query.filter(
+                db_model.WorkflowTrace.created_at.is_(None) | (db_model.WorkflowTrace.created_at < before)
+            )
+        return query.delete(synchronize_session=False)
@@ -7,6 +7,7 @@ from studio.db.dao import AgentStudioDao
 from studio.db import model as db_model
 from studio.api import *
 from studio.proto.utils import is_field_set
+from studio.cross_cutting.pagination import apply_read_mask, get_read_mask, paginate_query
 from studio.task.task import extract_placeholders
 from studio.task.task import remove_task
 from studio.agents.agent import remove_agent, add_agent
@@ -260,37 +261,42 @@ def list_workflows(
 ) -> ListWorkflowsResponse:
     """
     List all workflows with metadata, including full agent, task, and manager agent details,
-    and extract unique placeholders from task descriptions.
+    and extract unique placeholders from task descriptions. Workflows can be paginated and
+    limited to the fields of a read mask.
     """
     try:
+        read_mask = get_read_mask(request, Workflow)
         with dao.get_session() as session:
-            workflows: List[db_model.Workflow] = session.query(db_model.Workflow).all()
-            if not workflows:
-                return ListWorkflowsResponse(workflows=[])
+            workflows, next_page_token = paginate_query(
+                session.query(db_model.Workflow), db_model.Workflow, request.page_size, request.page_token
+            )
 
             workflow_list = []
             for workflow in workflows:
                 # Include workflow metadata with extracted placeholders
                 workflow_list.append(
-                    Workflow(
-                        workflow_id=workflow.id,
-                        name=workflow.name,
-                        description=workflow.description,
-                        crew_ai_workflow_metadata=CrewAIWorkflowMetadata(
-                            agent_id=workflow.crew_ai_agents,
-                            task_id=workflow.crew_ai_tasks,
-                            manager_agent_id=workflow.crew_ai_manager_agent,
-                            process=workflow.crew_ai_process,
-                            manager_llm_model_provider_id=workflow.crew_ai_llm_provider_model_id,
+                    apply_read_mask(
+                        Workflow(
+                            workflow_id=workflow.id,
+                            name=workflow.name,
+                            description=workflow.description,
+                            crew_ai_workflow_metadata=CrewAIWorkflowMetadata(
+                                agent_id=workflow.crew_ai_agents,
+                                task_id=workflow.crew_ai_tasks,
+                                manager_agent_id=workflow.crew_ai_manager_agent,
+                                process=workflow.crew_ai_process,
+                                manager_llm_model_provider_id=workflow.crew_ai_llm_provider_model_id,
+                            ),
+                            # No need to do expensive computation on list operation.
+                            is_ready=False,
+                            is_conversational=workflow.is_conversational,
+                            is_draft=workflow.is_draft,
+                            directory=workflow.directory,
                         ),
-                        # No need to do expensive computation on list operation.
-                        is_ready=False,
-                        is_conversational=workflow.is_conversational,
-                        is_draft=workflow.is_draft,
-                        directory=workflow.directory,
+                        read_mask,
                     )
                 )
-            return ListWorkflowsResponse(workflows=workflow_list)
+            return ListWorkflowsResponse(workflows=workflow_list, next_page_token=next_page_token)
     except SQLAlchemyError as e:
         raise RuntimeError(f"Failed to list workflows: {str(e)}")
 
@@ -7,3 +7,15 @@
 
 # Install engine code
 pip install .
+
+# Install the pre-resolved tool requirements at build time if the deploy pipeline
+# shipped them with the workflow artifact. Replicas will then find all requirements
+# already satisfied and skip installing on startup.
+if [ -f workflow/requirements.txt ]; then
+    if [ -d workflow/wheelhouse ]; then
+        pip install --no-index --find-links workflow/wheelhouse -r workflow/requirements.txt \
+            || pip install -r workflow/requirements.txt
+    else
+        pip install -r workflow/requirements.txt
+    fi
+fi
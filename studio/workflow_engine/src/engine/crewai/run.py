@@ -1,8 +1,14 @@
 # No top level studio.db imports allowed to support wokrflow model deployment
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from opentelemetry.context import attach, detach
+from opentelemetry.propagate import inject, extract
+import multiprocessing
+import threading
 import asyncio
+import os
 from crewai import Task, Crew, LLM as CrewAILLM, Agent
 from crewai.tools import BaseTool
 
@@ -10,6 +16,8 @@ import engine.types as input_types
 from engine.crewai.llms import get_crewai_llm_object_direct
 from engine.crewai.tools import get_embedded_crewai_tool
 from engine.crewai.agents import get_crewai_agent
+from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
+from engine.events import set_event_forwarding_queue, forward_events_to_bus
 
 
 def create_crewai_objects(
@@ -65,17 +73,175 @@ def create_crewai_objects(
     )
 
 
+# Optional pool of pre-forked worker processes for running crews. By default, crews
+# run in threads of the workflow model process, which means CPU-heavy tools serialize
+# on the GIL and stall concurrent runs. In "process" execution mode every kickoff runs
+# in one of these worker processes instead.
+_workflow_process_pool: Optional[ProcessPoolExecutor] = None
+# Arguments the pool was initialized with, to start a new pool if a worker dies.
+_workflow_process_pool_args: Optional[tuple] = None
+_workflow_process_pool_lock = threading.Lock()
+
+# Per-worker-process state, populated by the worker initializer.
+_worker_tracer = None
+
+
+def get_workflow_execution_mode() -> str:
+    return os.getenv("AGENT_STUDIO_WORKFLOW_EXECUTION_MODE", "thread")
+
+
+def get_workflow_process_pool_size() -> int:
+    return int(os.getenv("AGENT_STUDIO_WORKFLOW_PROCESS_WORKERS", str(os.cpu_count() or 1)))
+
+
+def _initialize_workflow_worker(
+    collated_input: input_types.CollatedInput,
+    tool_user_params: Dict[str, Dict[str, str]],
+    workflow_name: str,
+    event_forwarding_queue,
+) -> None:
+    """
+    Initialize a workflow worker process. Tracer providers and their exporters don't
+    survive a fork, so each worker registers its own tracer provider. Run events are
+    forwarded to the parent process's event bus. The crew is also built once up front
+    so that every tool module is imported and validated before the worker accepts its
+    first kickoff.
+    """
+    global _worker_tracer
+
+    set_event_forwarding_queue(event_forwarding_queue)
+    reset_crewai_instrumentation()
+    tracer_provider = instrument_crewai_workflow(workflow_name)
+    _worker_tracer = tracer_provider.get_tracer("opentelemetry.agentstudio.workflow.worker")
+
+    try:
+        create_crewai_objects(collated_input, tool_user_params, _worker_tracer)
+    except Exception as e:
+        # Language model configs may only be complete at kickoff time, so a failed
+        # warmup is not fatal. Tool modules are still imported as far as possible.
+        print(f"Could not build crew prototype in workflow worker {os.getpid()}: {e}")
+
+
+def _warmup_workflow_worker() -> int:
+    return os.getpid()
+
+
+def _start_workflow_process_pool(
+    collated_input: input_types.CollatedInput,
+    tool_user_params: Dict[str, Dict[str, str]],
+    workflow_name: str,
+    max_workers: int,
+) -> ProcessPoolExecutor:
+    mp_context = multiprocessing.get_context("fork")
+    event_forwarding_queue = mp_context.Queue()
+    threading.Thread(target=forward_events_to_bus, args=(event_forwarding_queue,), daemon=True).start()
+    process_pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_initialize_workflow_worker,
+        initargs=(collated_input, tool_user_params, workflow_name, event_forwarding_queue),
+    )
+    wait([process_pool.submit(_warmup_workflow_worker) for _ in range(max_workers)])
+    return process_pool
+
+
+def initialize_workflow_process_pool(
+    collated_input: input_types.CollatedInput,
+    tool_user_params: Dict[str, Dict[str, str]],
+    workflow_name: str,
+    max_workers: Optional[int] = None,
+) -> ProcessPoolExecutor:
+    """
+    Start the pool of workflow worker processes, and eagerly fork every worker so the
+    first kickoffs don't pay for process startup and crew construction.
+    """
+    global _workflow_process_pool, _workflow_process_pool_args
+    max_workers = max_workers or get_workflow_process_pool_size()
+    with _workflow_process_pool_lock:
+        _workflow_process_pool_args = (collated_input, tool_user_params, workflow_name, max_workers)
+        _workflow_process_pool = _start_workflow_process_pool(*_workflow_process_pool_args)
+        return _workflow_process_pool
+
+
+def _replace_broken_workflow_process_pool(broken_pool: ProcessPoolExecutor) -> None:
+    """
+    Replace a pool that broke because one of its workers died (a crash in a native
+    tool, an OOM kill), as a broken pool fails every later submission. Runs that
+    were in flight in the broken pool are lost.
+    """
+    global _workflow_process_pool
+    with _workflow_process_pool_lock:
+        # Another run may have replaced the pool already.
+        if _workflow_process_pool is not broken_pool:
+            return
+        print("A workflow worker process died, starting a new workflow process pool.")
+        broken_pool.shutdown(wait=False, cancel_futures=True)
+        _workflow_process_pool = _start_workflow_process_pool(*_workflow_process_pool_args)
+
+
+def get_workflow_process_pool() -> Optional[ProcessPoolExecutor]:
+    return _workflow_process_pool
+
+
+def cleanup_workflow_process_pool():
+    global _workflow_process_pool, _workflow_process_pool_args
+    with _workflow_process_pool_lock:
+        if _workflow_process_pool:
+            _workflow_process_pool.shutdown(wait=True)
+            _workflow_process_pool = None
+            _workflow_process_pool_args = None
+
+
+def _run_workflow_in_worker(
+    collated_input: input_types.CollatedInput,
+    tool_user_params: Dict[str, Dict[str, str]],
+    inputs: Dict[str, Any],
+    trace_carrier: Dict[str, str],
+) -> str:
+    """
+    Run a workflow inside of a worker process. The parent OpenTelemetry context can't
+    be pickled, so it is carried across the process boundary as W3C trace context
+    headers and re-extracted here, keeping the crew's spans under the parent run span.
+    """
+    token = attach(extract(trace_carrier))
+    try:
+        crewai_objects = create_crewai_objects(collated_input, tool_user_params, _worker_tracer)
+        crew = crewai_objects.crews[collated_input.workflow.id]
+        return crew.kickoff(inputs=dict(inputs)).raw
+    finally:
+        detach(token)
+
+
 async def run_workflow_async(
     collated_input: Any,
     tool_user_params: Dict[str, Dict[str, str]],
     inputs: Dict[str, Any],
     parent_context: Any,  # Use the parent context
     tracer=None,
-) -> None:
+) -> str:
     """
-    Run the workflow task in the background using the parent context.
+    Run the workflow task in the background using the parent context. If the workflow
+    process pool has been initialized, the workflow runs in a worker process, otherwise
+    it runs in a thread of the current process. Returns the raw output of the crew.
+    If a worker dies, the run fails with BrokenProcessPool and the pool is replaced
+    so that later runs succeed.
     """
 
+    loop = asyncio.get_event_loop()
+
+    process_pool = get_workflow_process_pool()
+    if process_pool:
+        trace_carrier: Dict[str, str] = {}
+        inject(trace_carrier, context=parent_context)
+        try:
+            return await loop.run_in_executor(
+                process_pool, _run_workflow_in_worker, collated_input, tool_user_params, dict(inputs), trace_carrier
+            )
+        except BrokenProcessPool:
+            # Starting the new pool forks and warms up every worker, so keep it off the event loop.
+            await loop.run_in_executor(None, _replace_broken_workflow_process_pool, process_pool)
+            raise
+
     def executor_task():
         # Attach the parent context in the background thread
         token = attach(parent_context)
@@ -86,12 +252,11 @@ async def run_workflow_async(
             crew = crewai_objects.crews[collated_input.workflow.id]
 
             # Perform the kickoff
-            crew.kickoff(inputs=dict(inputs))
+            return crew.kickoff(inputs=dict(inputs)).raw
 
         finally:
             # Detach the context when done
             detach(token)
 
     # Run the task in a dedicated thread
-    loop = asyncio.get_event_loop()
-    await loop.run_in_executor(None, executor_task)
+    return await loop.run_in_executor(None, executor_task)
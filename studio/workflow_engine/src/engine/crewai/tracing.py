@@ -32,16 +32,24 @@ from openinference.instrumentation.litellm import LiteLLMInstrumentor
 from opentelemetry.util.types import AttributeValue
 from opentelemetry import trace as trace_api
 from opentelemetry import context as context_api
+from opentelemetry.sdk.trace.sampling import Decision, Sampler, SamplingResult, TraceIdRatioBased
+from pydantic import BaseModel, Field
 from typing import Any, Callable, Iterator, List, Mapping, Optional, Tuple
-from inspect import signature
+from inspect import Signature, signature
+from collections import OrderedDict
+from functools import lru_cache
 from enum import Enum
+import threading
+import hashlib
 import json
 import sys
+import os
 
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
-from engine.ops import get_phoenix_ops_tracer_provider
+from engine.ops import get_phoenix_ops_tracer_provider, flush_phoenix_ops_traces
+from engine.events import publish_workflow_event
 
 
 class SafeJSONEncoder(json.JSONEncoder):
@@ -77,6 +85,33 @@ def _flatten(mapping: Optional[Mapping[str, Any]]) -> Iterator[Tuple[str, Attrib
             yield key, value
 
 
+# Maximum length of string span attributes (inputs, outputs, crew metadata). Longer
+# values are truncated and tagged with their original length and a content hash.
+# Set to 0 to disable truncation.
+MAX_ATTRIBUTE_LENGTH = int(os.getenv("AGENT_STUDIO_TRACING_MAX_ATTRIBUTE_LENGTH", "8192"))
+
+
+def _truncate_attribute(value: str, max_length: Optional[int] = None) -> str:
+    max_length = MAX_ATTRIBUTE_LENGTH if max_length is None else max_length
+    if not max_length or not isinstance(value, str) or len(value) <= max_length:
+        return value
+    digest = hashlib.sha256(value.encode("utf-8", errors="replace")).hexdigest()[:16]
+    return f"{value[:max_length]}... [truncated {len(value)} characters, sha256:{digest}]"
+
+
+@lru_cache(maxsize=1024)
+def _get_cached_signature(function: Callable[..., Any]) -> Signature:
+    return signature(function)
+
+
+def _get_signature(function: Callable[..., Any]) -> Signature:
+    try:
+        return _get_cached_signature(function)
+    except TypeError:
+        # Unhashable callables can't be cached.
+        return signature(function)
+
+
 def _get_input_value(method: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
     """
     Parses a method call's inputs into a JSON string. Ensures a consistent
@@ -84,12 +119,13 @@ def _get_input_value(method: Callable[..., Any], *args: Any, **kwargs: Any) -> s
     keyword arguments.
     """
 
-    # For typical class methods, the corresponding instance of inspect.Signature
-    # does not include the self parameter. However, the inspect.Signature
-    # instance for __call__ does include the self parameter.
-    method_signature = signature(method)
+    # Signatures are cached per underlying function, since bound methods are created
+    # anew on every attribute access. Like the signature of __call__, the signature
+    # of a bound method's function includes the self parameter.
+    function = getattr(method, "__func__", method)
+    method_signature = _get_signature(function)
     first_parameter_name = next(iter(method_signature.parameters), None)
-    signature_contains_self_parameter = first_parameter_name in ["self"]
+    signature_contains_self_parameter = function is not method or first_parameter_name in ["self"]
     bound_arguments = method_signature.bind(
         *(
             # the value bound to the method's self argument is discarded below, so pass None
@@ -98,17 +134,138 @@ def _get_input_value(method: Callable[..., Any], *args: Any, **kwargs: Any) -> s
         *args,
         **kwargs,
     )
-    return safe_json_dumps(
-        {
-            **{
-                argument_name: argument_value
-                for argument_name, argument_value in bound_arguments.arguments.items()
-                if argument_name not in ["self", "kwargs"]
-            },
-            **bound_arguments.arguments.get("kwargs", {}),
+    excluded_argument_names = ["self", "kwargs"]
+    if signature_contains_self_parameter:
+        excluded_argument_names.append(first_parameter_name)
+    arguments = {
+        **{
+            argument_name: argument_value
+            for argument_name, argument_value in bound_arguments.arguments.items()
+            if argument_name not in excluded_argument_names
         },
-        cls=SafeJSONEncoder,
+        **bound_arguments.arguments.get("kwargs", {}),
+    }
+    input_value = safe_json_dumps(arguments, cls=SafeJSONEncoder)
+    if MAX_ATTRIBUTE_LENGTH and len(input_value) > MAX_ATTRIBUTE_LENGTH:
+        # Truncate the arguments one by one, so that the input value stays valid JSON.
+        input_value = safe_json_dumps(
+            {
+                argument_name: _truncate_attribute(
+                    argument_value
+                    if isinstance(argument_value, str)
+                    else safe_json_dumps(argument_value, cls=SafeJSONEncoder)
+                )
+                for argument_name, argument_value in arguments.items()
+            }
+        )
+    return input_value
+
+
+# Crew revisions whose metadata has been reported by this process.
+MAX_REPORTED_CREW_REVISIONS = 1024
+_reported_crew_revisions: "OrderedDict[str, None]" = OrderedDict()
+_reported_crew_revisions_lock = threading.Lock()
+
+
+def _get_crew_revision(crew: Any) -> str:
+    """
+    Fingerprint of a crew's static metadata. Crew keys already hash the agents'
+    roles, goals and backstories and the tasks' descriptions and expected outputs;
+    the remaining settings and tool names are short, so hashing them is cheap.
+    """
+    fingerprint = json.dumps(
+        [
+            crew.key,
+            [
+                [agent.max_iter, agent.max_rpm, agent.allow_delegation, [tool.name for tool in agent.tools or []]]
+                for agent in crew.agents
+            ],
+            [[task.async_execution, task.human_input, [tool.name for tool in task.tools or []]] for task in crew.tasks],
+        ],
+        default=str,
     )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+def _should_report_crew_metadata(crew_revision: str) -> bool:
+    with _reported_crew_revisions_lock:
+        if crew_revision in _reported_crew_revisions:
+            _reported_crew_revisions.move_to_end(crew_revision)
+            return False
+        _reported_crew_revisions[crew_revision] = None
+        while len(_reported_crew_revisions) > MAX_REPORTED_CREW_REVISIONS:
+            _reported_crew_revisions.popitem(last=False)
+        return True
+
+
+def _get_crew_metadata(crew: Any) -> Mapping[str, str]:
+    return {
+        "crew_agents": json.dumps(
+            [
+                {
+                    "key": agent.key,
+                    "id": str(agent.id),
+                    "role": agent.role,
+                    "goal": agent.goal,
+                    "backstory": agent.backstory,
+                    "verbose?": agent.verbose,
+                    "max_iter": agent.max_iter,
+                    "max_rpm": agent.max_rpm,
+                    "i18n": agent.i18n.prompt_file,
+                    "delegation_enabled": agent.allow_delegation,
+                    "tools_names": [tool.name.casefold() for tool in agent.tools or []],
+                }
+                for agent in crew.agents
+            ]
+        ),
+        "crew_tasks": json.dumps(
+            [
+                {
+                    "id": str(task.id),
+                    "description": task.description,
+                    "expected_output": task.expected_output,
+                    "async_execution?": task.async_execution,
+                    "human_input?": task.human_input,
+                    "agent_role": task.agent.role if task.agent else "None",
+                    "agent_key": task.agent.key if task.agent else None,
+                    "context": [task.description for task in task.context] if task.context else None,
+                    "tools_names": [tool.name.casefold() for tool in task.tools or []],
+                }
+                for task in crew.tasks
+            ]
+        ),
+    }
+
+
+def _get_crew_agent_usage(crew: Any) -> List[Mapping[str, Any]]:
+    """
+    Token usage of every agent of a crew, with the language model that the agent
+    uses. Reported with the terminal event of a run, for run metrics.
+    """
+    agents = list(crew.agents or [])
+    if getattr(crew, "manager_agent", None):
+        agents.append(crew.manager_agent)
+    agent_usage = []
+    for agent in agents:
+        try:
+            token_process = getattr(agent, "_token_process", None)
+            if token_process is None:
+                continue
+            usage_metrics = token_process.get_summary()
+            agent_usage.append(
+                {
+                    "agent_studio_id": getattr(agent, "agent_studio_id", None),
+                    "agent_role": agent.role,
+                    "model": getattr(getattr(agent, "llm", None), "model", None),
+                    "prompt_tokens": usage_metrics.prompt_tokens,
+                    "completion_tokens": usage_metrics.completion_tokens,
+                    "total_tokens": usage_metrics.total_tokens,
+                    "successful_requests": usage_metrics.successful_requests,
+                }
+            )
+        except Exception as e:
+            print(f"Failed to get token usage of agent '{getattr(agent, 'role', None)}': {e}")
+    return agent_usage
 
 
 class _ExecuteCoreWrapper:
@@ -185,6 +342,20 @@ class _KickoffWrapper:
         instance: Any,
         args: Tuple[Any, ...],
         kwargs: Mapping[str, Any],
+    ) -> Any:
+        try:
+            return self._traced_kickoff(wrapped, instance, args, kwargs)
+        finally:
+            # Export the run's queued spans as soon as the run completes or fails,
+            # rather than on the next scheduled batch export.
+            flush_phoenix_ops_traces()
+
+    def _traced_kickoff(
+        self,
+        wrapped: Callable[..., Any],
+        instance: Any,
+        args: Tuple[Any, ...],
+        kwargs: Mapping[str, Any],
     ) -> Any:
         if context_api.get_value(context_api._SUPPRESS_INSTRUMENTATION_KEY):
             return wrapped(*args, **kwargs)
@@ -206,51 +377,22 @@ class _KickoffWrapper:
 
             span.set_attribute("crew_key", crew.key)
             span.set_attribute("crew_id", str(crew.id))
-            span.set_attribute("crew_inputs", json.dumps(inputs) if inputs else "")
-            span.set_attribute(
-                "crew_agents",
-                json.dumps(
-                    [
-                        {
-                            "key": agent.key,
-                            "id": str(agent.id),
-                            "role": agent.role,
-                            "goal": agent.goal,
-                            "backstory": agent.backstory,
-                            "verbose?": agent.verbose,
-                            "max_iter": agent.max_iter,
-                            "max_rpm": agent.max_rpm,
-                            "i18n": agent.i18n.prompt_file,
-                            "delegation_enabled": agent.allow_delegation,
-                            "tools_names": [tool.name.casefold() for tool in agent.tools or []],
-                        }
-                        for agent in crew.agents
-                    ]
-                ),
-            )
-            span.set_attribute(
-                "crew_tasks",
-                json.dumps(
-                    [
-                        {
-                            "id": str(task.id),
-                            "description": task.description,
-                            "expected_output": task.expected_output,
-                            "async_execution?": task.async_execution,
-                            "human_input?": task.human_input,
-                            "agent_role": task.agent.role if task.agent else "None",
-                            "agent_key": task.agent.key if task.agent else None,
-                            "context": [task.description for task in task.context] if task.context else None,
-                            "tools_names": [tool.name.casefold() for tool in task.tools or []],
-                        }
-                        for task in crew.tasks
-                    ]
-                ),
-            )
+            span.set_attribute("crew_inputs", _truncate_attribute(json.dumps(inputs)) if inputs else "")
+            # Agents and tasks rarely change between runs, so their (large) metadata is
+            # only reported on the first run of each crew revision.
+            crew_revision = _get_crew_revision(crew)
+            span.set_attribute("crew_revision", crew_revision)
+            if _should_report_crew_metadata(crew_revision):
+                for key, value in _get_crew_metadata(crew).items():
+                    span.set_attribute(key, _truncate_attribute(value))
 
             # Try ending the span early
             # print("ENDING SPAN EARLY")
             span.end()
+            publish_workflow_event(
+                "Crew.kickoff",
+                {"crew_key": crew.key, "crew_id": str(crew.id), "crew_inputs": json.dumps(inputs) if inputs else ""},
+            )
 
             try:
                 crew_output = wrapped(*args, **kwargs)
@@ -271,6 +413,7 @@ class _KickoffWrapper:
             except Exception as exception:
                 span.set_status(trace_api.Status(trace_api.StatusCode.ERROR, str(exception)))
                 span.record_exception(exception)
+                publish_workflow_event("Crew.error", {"agent_usage": _get_crew_agent_usage(crew)}, exception=exception)
                 raise
             span.set_status(trace_api.StatusCode.OK)
             if crew_output_dict := crew_output.to_dict():
@@ -293,7 +436,18 @@ class _KickoffWrapper:
         ) as span:
             span.set_status(trace_api.StatusCode.OK)
             span.set_attribute("crew_output", crew_output.raw)
+            # Token usage of the run, from which the studio records the metrics of
+            # deployed runs (see studio/workflow/metrics.py).
+            agent_usage = _get_crew_agent_usage(crew)
+            span.set_attribute("agent_usage", json.dumps(agent_usage))
+            for attribute, key in [
+                (LLM_TOKEN_COUNT_PROMPT, "prompt_tokens"),
+                (LLM_TOKEN_COUNT_COMPLETION, "completion_tokens"),
+                (LLM_TOKEN_COUNT_TOTAL, "total_tokens"),
+            ]:
+                span.set_attribute(attribute, sum(int(usage.get(key) or 0) for usage in agent_usage))
             span.end()
+            publish_workflow_event("Crew.complete", {"crew_output": crew_output.raw, "agent_usage": agent_usage})
 
         return crew_output
 
@@ -315,17 +469,18 @@ class _ToolUseWrapper:
             span_name = f"{instance.__class__.__name__}.{wrapped.__name__}"
         else:
             span_name = wrapped.__name__
+        input_value = _get_input_value(
+            wrapped,
+            *args,
+            **kwargs,
+        )
         with self._tracer.start_as_current_span(
             span_name,
             attributes=dict(
                 _flatten(
                     {
                         OPENINFERENCE_SPAN_KIND: OpenInferenceSpanKindValues.TOOL,
-                        SpanAttributes.INPUT_VALUE: _get_input_value(
-                            wrapped,
-                            *args,
-                            **kwargs,
-                        ),
+                        SpanAttributes.INPUT_VALUE: input_value,
                     }
                 )
             ),
@@ -341,12 +496,16 @@ class _ToolUseWrapper:
 
             # End span early
             span.end()
+            publish_workflow_event(
+                "ToolUsage._use", {SpanAttributes.TOOL_NAME: tool_name, SpanAttributes.INPUT_VALUE: input_value}
+            )
 
             try:
                 response = wrapped(*args, **kwargs)
             except Exception as exception:
                 span.set_status(trace_api.Status(trace_api.StatusCode.ERROR, str(exception)))
                 span.record_exception(exception)
+                publish_workflow_event("ToolUsage._end_use", {SpanAttributes.TOOL_NAME: tool_name}, exception=exception)
                 raise
             span.set_status(trace_api.StatusCode.OK)
             span.set_attribute(OUTPUT_VALUE, response)
@@ -358,11 +517,14 @@ class _ToolUseWrapper:
             kind=SpanKind.INTERNAL,
             attributes={
                 "tool.name": tool_name,
-                OUTPUT_VALUE: response,
+                OUTPUT_VALUE: _truncate_attribute(response),
             },
         ) as parent_span:
             # End the span right away
             parent_span.end()
+            publish_workflow_event(
+                "ToolUsage._end_use", {SpanAttributes.TOOL_NAME: tool_name, OUTPUT_VALUE: str(response)}
+            )
 
         return response
 
@@ -393,6 +555,16 @@ class WrappedAgent(Agent):
     ) -> str:
         print("HELLO THERE I AM DOING SOMETHING")
 
+        # Attributes reported to the in-process event bus. These mirror the span
+        # attributes below, limited to JSON-serializable values.
+        event_attributes = {
+            "agent_studio_id": self.agent_studio_id,
+            "agent_role": self.role,
+            "task.description": getattr(task, "description", None),
+            "task.expected_output": getattr(task, "expected_output", None),
+            "context": context,
+        }
+
         # Start a parent span for the task execution
         with self._tracer.start_as_current_span(
             name="Agent._start_task",
@@ -401,18 +573,20 @@ class WrappedAgent(Agent):
                 "agent_studio_id": self.agent_studio_id,
                 "agent_role": self.role,
                 "task.context": getattr(task, "context", None),
-                "task.description": getattr(task, "description", None),
-                "task.expected_output": getattr(task, "expected_output", None),
-                "context": context,
+                "task.description": _truncate_attribute(getattr(task, "description", None)),
+                "task.expected_output": _truncate_attribute(getattr(task, "expected_output", None)),
+                "context": _truncate_attribute(context),
             },
         ) as parent_span:
             try:
                 # End the span right away
                 parent_span.end()
+                publish_workflow_event("Agent._start_task", event_attributes)
 
                 # Execute the task and capture the result
                 result = super().execute_task(task, context, tools)
             except Exception as e:
+                publish_workflow_event("Agent._end_task", event_attributes, exception=e)
                 raise
 
         # Start a parent span for the task execution
@@ -423,33 +597,134 @@ class WrappedAgent(Agent):
                 "agent_studio_id": self.agent_studio_id,
                 "agent_role": self.role,
                 "task.context": getattr(task, "context", None),
-                "task.description": getattr(task, "description", None),
-                "task.expected_output": getattr(task, "expected_output", None),
-                "context": context,
+                "task.description": _truncate_attribute(getattr(task, "description", None)),
+                "task.expected_output": _truncate_attribute(getattr(task, "expected_output", None)),
+                "context": _truncate_attribute(context),
             },
         ) as parent_span:
             # End the span right away
             parent_span.end()
+            publish_workflow_event("Agent._end_task", {**event_attributes, OUTPUT_VALUE: str(result)})
 
         return result
 
 
-# Monkey-patch the specific wrappers here
-# TODO: simplify this by writing events to the event bus for the
-# parent trace
+# Monkey-patch the specific wrappers here. Besides reporting spans, the wrappers
+# publish every run event to the in-process event bus (engine.events), which
+# serves live run status without a round trip through the ops server. The
+# early-ended spans are still needed by consumers that read runs back from the
+# ops server.
 crewaiinst._ToolUseWrapper = _ToolUseWrapper
 crewaiinst._ExecuteCoreWrapper = _ExecuteCoreWrapper
 crewaiinst._KickoffWrapper = _KickoffWrapper
 
 
-def instrument_crewai_workflow(workflow_name: str):
+class TracingLevel(str, Enum):
+    """
+    How much of a workflow run is traced. Every level includes the spans of the
+    levels before it.
+    """
+
+    OFF = "off"
+    # The root span of a run, the crew kickoff and the crew completion.
+    RUN = "run"
+    # Agent tasks and tool usages.
+    TASKS = "tasks"
+    # Language model completions.
+    FULL = "full"
+
+
+_TRACING_LEVEL_ORDER = [TracingLevel.OFF, TracingLevel.RUN, TracingLevel.TASKS, TracingLevel.FULL]
+
+RUN_LEVEL_SPAN_NAMES = {"Crew.kickoff", "Crew.complete"}
+FULL_LEVEL_SPAN_KINDS = {OpenInferenceSpanKindValues.LLM.value, OpenInferenceSpanKindValues.EMBEDDING.value}
+
+
+class TracingConfig(BaseModel):
+    """
+    Tracing level and head sampling of workflow runs. Every run is traced at the run
+    level (unless tracing is off), and a sample_rate fraction of runs, chosen by trace
+    ID, is traced at the configured level.
+    """
+
+    level: TracingLevel = TracingLevel.FULL
+    sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
+
+
+def get_tracing_config() -> TracingConfig:
+    """
+    Tracing config from the environment. Deployed workflows can be configured per
+    deployment through their environment variable overrides.
+    """
+    return TracingConfig(
+        level=os.getenv("AGENT_STUDIO_TRACING_LEVEL", TracingLevel.FULL.value),
+        sample_rate=float(os.getenv("AGENT_STUDIO_TRACING_SAMPLE_RATE", "1.0")),
+    )
+
+
+def _get_span_tracing_level(
+    name: str, attributes: Optional[Mapping[str, Any]] = None, is_root: bool = False
+) -> TracingLevel:
+    if is_root or name in RUN_LEVEL_SPAN_NAMES:
+        return TracingLevel.RUN
+    if attributes and attributes.get(OPENINFERENCE_SPAN_KIND) in FULL_LEVEL_SPAN_KINDS:
+        return TracingLevel.FULL
+    return TracingLevel.TASKS
+
+
+class WorkflowTracingSampler(Sampler):
+    """
+    Samples workflow spans by tracing level. Run level spans are always recorded,
+    while more detailed spans are recorded for a sample of the traces. The sampling
+    decision only depends on the trace ID, so all spans of a run are sampled alike,
+    including spans reported from workflow worker processes.
+    """
+
+    def __init__(self, config: TracingConfig):
+        self._config = config
+        self._level_index = _TRACING_LEVEL_ORDER.index(config.level)
+        self._ratio_sampler = TraceIdRatioBased(config.sample_rate)
+
+    def should_sample(
+        self,
+        parent_context: Optional[context_api.Context],
+        trace_id: int,
+        name: str,
+        kind: Optional[SpanKind] = None,
+        attributes: Optional[Mapping[str, Any]] = None,
+        links: Optional[Any] = None,
+        trace_state: Optional[trace_api.TraceState] = None,
+    ) -> SamplingResult:
+        parent_span_context = trace_api.get_current_span(parent_context).get_span_context()
+        span_level = _get_span_tracing_level(name, attributes, is_root=not parent_span_context.is_valid)
+        span_level_index = _TRACING_LEVEL_ORDER.index(span_level)
+        if span_level_index > self._level_index:
+            return SamplingResult(Decision.DROP, trace_state=trace_state)
+        if span_level != TracingLevel.RUN:
+            ratio_result = self._ratio_sampler.should_sample(parent_context, trace_id, name)
+            if not ratio_result.decision.is_sampled():
+                return SamplingResult(Decision.DROP, trace_state=trace_state)
+        return SamplingResult(Decision.RECORD_AND_SAMPLE, attributes, trace_state)
+
+    def get_description(self) -> str:
+        return f"WorkflowTracingSampler{{level={self._config.level.value},sample_rate={self._config.sample_rate}}}"
+
+
+def instrument_crewai_workflow(workflow_name: str, tracing_config: Optional[TracingConfig] = None):
     """
     Instrument agents, crews and tasks within a given model to report
     to the observability platform.
+
+    The tracing config defaults to the environment (see get_tracing_config).
+    Crews are instrumented at every tracing level, since the instrumentation also
+    publishes run events to the in-process event bus, but language model calls are
+    only instrumented at the full level.
     """
-    tracer_provider = get_phoenix_ops_tracer_provider(workflow_name)
+    tracing_config = tracing_config or get_tracing_config()
+    tracer_provider = get_phoenix_ops_tracer_provider(workflow_name, sampler=WorkflowTracingSampler(tracing_config))
     crewaiinst.CrewAIInstrumentor().instrument(tracer_provider=tracer_provider)
-    LiteLLMInstrumentor().instrument(tracer_provider=tracer_provider)
+    if tracing_config.level == TracingLevel.FULL:
+        LiteLLMInstrumentor().instrument(tracer_provider=tracer_provider)
     return tracer_provider
 
 
@@ -0,0 +1,159 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+"""
+Lightweight server-sent events (SSE) wrapper around a deployed workflow's kickoff.
+
+The CML model endpoint only supports request/response calls, so a kickoff there
+returns just a trace ID. This server runs next to the model endpoint and streams
+the events of a run (task start/end, tool usage, final output) as they are published
+to the in-process event bus:
+
+    POST /kickoff         same body as the model endpoint's kickoff action; starts a
+                          run and streams its events.
+    GET  /events?trace_id attaches to an existing run, replaying events published
+                          so far and streaming the rest.
+
+Every stream starts with a "kickoff" event carrying the trace ID and ends after the
+run's terminal event (Crew.complete or Crew.error).
+
+Unlike the model endpoint, this server doesn't sit behind CML's authentication, so
+it only listens on AGENT_STUDIO_WORKFLOW_STREAMING_HOST (127.0.0.1 by default). If
+AGENT_STUDIO_WORKFLOW_STREAMING_TOKEN is set, every request must also carry it as
+an "Authorization: Bearer <token>" header.
+"""
+
+from typing import Any, Callable, Dict, Optional
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import threading
+import hmac
+import queue
+import json
+import time
+import os
+
+import engine.types as input_types
+from engine.events import get_event_bus, is_terminal_event
+
+
+# Seconds between keepalive comments while a run is quiet.
+STREAMING_KEEPALIVE_SECONDS = 15
+
+# Maximum number of seconds a single stream stays open.
+STREAMING_TIMEOUT_SECONDS = int(os.getenv("AGENT_STUDIO_WORKFLOW_STREAMING_TIMEOUT", "3600"))
+
+
+def format_sse_event(name: str, data: Dict[str, Any]) -> bytes:
+    return f"event: {name}\ndata: {json.dumps(data, default=str)}\n\n".encode("utf-8")
+
+
+class WorkflowStreamingRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    # Set by start_workflow_streaming_server.
+    kickoff: Callable[[input_types.ServeWorkflowParameters], str] = None
+    token: Optional[str] = None
+
+    def _is_authorized(self) -> bool:
+        if not self.token:
+            return True
+        authorization = self.headers.get("Authorization", "")
+        if hmac.compare_digest(authorization.encode(), f"Bearer {self.token}".encode()):
+            return True
+        self.send_response(401)
+        self.send_header("WWW-Authenticate", "Bearer")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return False
+
+    def do_POST(self):
+        if not self._is_authorized():
+            return
+        if urlparse(self.path).path.rstrip("/") != "/kickoff":
+            self.send_error(404)
+            return
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(content_length) or b"{}")
+            # Accept both the raw model arguments and the {"request": {...}} envelope
+            # used when calling the model endpoint.
+            serve_workflow_parameters = input_types.ServeWorkflowParameters.model_validate(body.get("request", body))
+        except Exception as e:
+            self.send_error(400, f"Invalid kickoff request: {e}")
+            return
+        if serve_workflow_parameters.action_type != input_types.DeployedWorkflowActions.KICKOFF.value:
+            self.send_error(400, "Only the kickoff action can be streamed.")
+            return
+
+        # Events published before the subscription starts are replayed from history.
+        trace_id = type(self).kickoff(serve_workflow_parameters)
+        self._stream_events(trace_id)
+
+    def do_GET(self):
+        if not self._is_authorized():
+            return
+        url = urlparse(self.path)
+        trace_id = parse_qs(url.query).get("trace_id", [None])[0]
+        if url.path.rstrip("/") != "/events" or not trace_id:
+            self.send_error(404)
+            return
+        self._stream_events(trace_id)
+
+    def _stream_events(self, trace_id: str) -> None:
+        subscriber = get_event_bus().subscribe(trace_id, replay=True)
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self._write(format_sse_event("kickoff", {"trace_id": trace_id}))
+
+            deadline = time.monotonic() + STREAMING_TIMEOUT_SECONDS
+            while time.monotonic() < deadline:
+                try:
+                    event = subscriber.get(timeout=STREAMING_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    self._write(b": keepalive\n\n")
+                    continue
+                self._write(format_sse_event(event["name"], event))
+                if is_terminal_event(event):
+                    break
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; the run itself continues in the background.
+            pass
+        finally:
+            get_event_bus().unsubscribe(trace_id, subscriber)
+            self.close_connection = True
+
+    def _write(self, data: bytes) -> None:
+        self.wfile.write(data)
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        return
+
+
+def start_workflow_streaming_server(
+    kickoff: Callable[[input_types.ServeWorkflowParameters], str],
+    port: int,
+    host: Optional[str] = None,
+    token: Optional[str] = None,
+) -> Optional[ThreadingHTTPServer]:
+    """
+    Start the streaming server in a daemon thread. Returns None if the server
+    could not be started; the model endpoint keeps working either way.
+    """
+    host = host or os.getenv("AGENT_STUDIO_WORKFLOW_STREAMING_HOST", "127.0.0.1")
+    handler = type("BoundWorkflowStreamingRequestHandler", (WorkflowStreamingRequestHandler,), {})
+    handler.kickoff = staticmethod(kickoff)
+    handler.token = token or os.getenv("AGENT_STUDIO_WORKFLOW_STREAMING_TOKEN") or None
+    try:
+        server = ThreadingHTTPServer((host, port), handler)
+    except OSError as e:
+        print(f"Failed to start workflow streaming server on port {port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"Workflow streaming server listening on {host}:{server.server_address[1]}")
+    return server
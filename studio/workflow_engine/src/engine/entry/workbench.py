@@ -1,6 +1,8 @@
 import os
 import sys
 import subprocess
+import importlib.util
+import tempfile
 
 # Extract workflow parameters from the environment
 WORKFLOW_ARTIFACT_TYPE = os.environ.get("AGENT_STUDIO_WORKFLOW_ARTIFACT_TYPE", "config_file")
@@ -9,8 +11,10 @@ WORKFLOW_NAME = os.getenv("AGENT_STUDIO_WORKFLOW_NAME")
 CDSW_DOMAIN = os.getenv("CDSW_DOMAIN")
 
 # Install the cmlapi. This is a required dependency for cross-cutting util modules
-# and ops modules that are used in a workflow.
-subprocess.call(["pip", "install", f"https://{CDSW_DOMAIN}/api/v2/python.tar.gz"])
+# and ops modules that are used in a workflow. Replicas built on a runtime that
+# already ships the cmlapi can skip the network install entirely.
+if importlib.util.find_spec("cmlapi") is None:
+    subprocess.call(["pip", "install", f"https://{CDSW_DOMAIN}/api/v2/python.tar.gz"])
 
 # Manual patch required for CrewAI compatability
 __import__("pysqlite3")
@@ -19,29 +23,78 @@ sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 import asyncio
 from opentelemetry.context import get_current
 from datetime import datetime
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 from pydantic import ValidationError
 import json
 import base64
+import hashlib
+import threading
+import time
 
 import engine.types as input_types
 from engine import consts
-from engine.crewai.run import run_workflow_async
+from engine.crewai.run import run_workflow_async, get_workflow_execution_mode, initialize_workflow_process_pool
 from engine.crewai.tracing import instrument_crewai_workflow, reset_crewai_instrumentation
+from engine.entry.streaming import start_workflow_streaming_server
+from engine.events import get_event_bus, is_terminal_event
+from engine.metrics import get_metrics_registry, start_metrics_server_from_env
+from engine.sessions import get_session_cache
+from engine.requirements import (
+    install_requirements,
+    write_merged_requirements,
+    LOCKED_REQUIREMENTS_FILE_NAME,
+    WHEELHOUSE_DIRECTORY_NAME,
+)
 
 import cml.models_v1 as cml_models
 
 
+WORKFLOW_MODEL_REQUEST_DURATION = get_metrics_registry().histogram(
+    "agent_studio_workflow_model_request_duration_seconds", "Workflow model request durations, by action.", ["action"]
+)
+WORKFLOW_MODEL_REQUEST_ERRORS = get_metrics_registry().counter(
+    "agent_studio_workflow_model_request_errors", "Failed workflow model requests, by action.", ["action"]
+)
+WORKFLOW_RUNS = get_metrics_registry().counter(
+    "agent_studio_workflow_runs", "Workflow runs kicked off on this model that ended, by result.", ["result"]
+)
+WORKFLOW_RUN_DURATION = get_metrics_registry().histogram(
+    "agent_studio_workflow_run_duration_seconds", "Workflow run durations, by result.", ["result"]
+)
+WORKFLOW_RUNS_IN_PROGRESS = get_metrics_registry().gauge(
+    "agent_studio_workflow_runs_in_progress", "Workflow runs currently in progress on this model."
+)
+
+
 # Currently the only artifact type supported for import is directory.
 # the collated input requirements are all relative to the workflow import path.
 def _install_python_requirements(collated_input: input_types.CollatedInput):
+    # Workflows deployed with a pre-resolved requirements file (and optionally a
+    # wheelhouse) next to the workflow config install everything in one pass.
+    artifact_dir = os.path.dirname(WORFKLOW_ARTIFACT)
+    locked_requirements_file = os.path.join(artifact_dir, LOCKED_REQUIREMENTS_FILE_NAME)
+    if os.path.exists(locked_requirements_file):
+        install_requirements(locked_requirements_file, os.path.join(artifact_dir, WHEELHOUSE_DIRECTORY_NAME))
+        return
+
+    # Older deployments only ship per-tool requirements files. Merge them on the
+    # fly so pip still only runs a single resolver pass.
     requirement_files = set()
     for tool_instance in collated_input.tool_instances:
         requirement_files.add(
             os.path.join(tool_instance.source_folder_path, tool_instance.python_requirements_file_name)
         )
-    for requirement_file in requirement_files:
-        subprocess.call(["pip", "install", "-r", requirement_file])
+    try:
+        merged_requirements_file = write_merged_requirements(sorted(requirement_files), tempfile.mkdtemp())
+    except ValueError as e:
+        # The tools pin conflicting versions, which no single pass can install. Keep
+        # the per-tool installs these deployments were built with.
+        print(f"Installing tool requirements one file at a time: {e}")
+        for requirement_file in sorted(requirement_files):
+            if os.path.exists(requirement_file):
+                install_requirements(requirement_file)
+        return
+    install_requirements(merged_requirements_file)
 
 
 if WORKFLOW_ARTIFACT_TYPE == "config_file":
@@ -52,96 +105,258 @@ else:
     raise ValueError("currently only AGENT_STUDIO_WORKFLOW_ARTIFACT_TYPE=config_file is supported.")
 
 
+# Index of every asset URI that this workflow is allowed to serve, built once at
+# startup. Assets requested through GET_ASSET_DATA must belong to one of the
+# workflow's tool instances or agents.
+ALLOWED_ASSET_URIS = set(
+    [tool.tool_image_uri for tool in collated_input.tool_instances if tool.tool_image_uri]
+    + [agent.agent_image_uri for agent in collated_input.agents if agent.agent_image_uri]
+)
+
+# Cache of base64-encoded asset data and its content hash (used as the ETag),
+# keyed by asset URI. Assets in a deployed workflow never change, so entries
+# are never invalidated.
+_asset_cache: Dict[str, Tuple[str, str]] = dict()
+
+
+def _get_encoded_asset(asset_uri: str) -> Optional[Tuple[str, str]]:
+    """
+    Get the base64-encoded data and ETag of an allowed asset, reading and
+    encoding the asset from disk only the first time it is requested.
+    """
+    if asset_uri in _asset_cache:
+        return _asset_cache[asset_uri]
+    if asset_uri not in ALLOWED_ASSET_URIS:
+        return None
+    asset_path = os.path.join(consts.DYNAMIC_ASSETS_LOCATION, asset_uri)
+    if not os.path.exists(asset_path):
+        return None
+    with open(asset_path, "rb") as asset_file:
+        asset_bytes = asset_file.read()
+    # Decode at the destination with: base64.b64decode(asset_data[asset_uri])
+    _asset_cache[asset_uri] = (base64.b64encode(asset_bytes).decode(), hashlib.sha256(asset_bytes).hexdigest())
+    return _asset_cache[asset_uri]
+
+
+def _get_tool_user_params(collated_input: input_types.CollatedInput) -> Dict[str, Dict[str, str]]:
+    """
+    Retrieve the user parameters of every tool instance from the environment variables.
+    """
+    tool_user_params: Dict[str, Dict[str, str]] = {}
+    for tool_instance in collated_input.tool_instances:
+        t_id = tool_instance.id
+        prefix = f"TOOL_{t_id.replace('-', '_')}_USER_PARAMS_"
+        user_param_kv = {}
+        for key, value in os.environ.items():
+            if key.startswith(prefix):
+                param_name = key[len(prefix) :]
+                user_param_kv[param_name] = value
+        tool_user_params[t_id] = user_param_kv
+    return tool_user_params
+
+
+def _set_language_model_configs(collated_input: input_types.CollatedInput) -> None:
+    """
+    Retrieve the language model config from the environment variables and validate it,
+    and put it back in the collated input.
+    """
+    for lm in collated_input.language_models:
+        env_var_key_name = f"MODEL_{lm.model_id.replace('-', '_')}_CONFIG"
+        lm_config: Optional[input_types.Input__LanguageModelConfig] = None
+        try:
+            lm_config_str = os.getenv(env_var_key_name)
+            if lm_config_str:
+                lm_config = input_types.Input__LanguageModelConfig.model_validate(json.loads(lm_config_str))
+        except (ValidationError, json.JSONDecodeError) as e:
+            raise ValueError(f"Error validating language model config for {lm.model_name}: {e}")
+        lm.config = lm_config
+
+
+# In process execution mode, pre-fork the workflow worker processes now so that
+# every worker has already imported and built the crew before the first kickoff.
+if get_workflow_execution_mode() == "process":
+    _worker_collated_input = collated_input.model_copy(deep=True)
+    _set_language_model_configs(_worker_collated_input)
+    initialize_workflow_process_pool(
+        _worker_collated_input, _get_tool_user_params(_worker_collated_input), f"{WORKFLOW_NAME}"
+    )
+
+
 def base64_decode(encoded_str: str):
     decoded_bytes = base64.b64decode(encoded_str)
     return json.loads(decoded_bytes.decode("utf-8"))
 
 
+# Event loop used to run workflows kicked off from threads without a running event
+# loop of their own (the streaming server), started lazily on first use.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None:
+            _background_loop = asyncio.new_event_loop()
+            threading.Thread(target=_background_loop.run_forever, daemon=True).start()
+        return _background_loop
+
+
+async def _run_conversation_turn(session_id: str, user_input: str, workflow_coroutine) -> None:
+    """
+    Run one turn of a conversational workflow session, and record the turn in the
+    session history once the workflow completes. Failed turns are not recorded.
+    """
+    output = await workflow_coroutine
+    if output is not None:
+        get_session_cache().append_turn(session_id, user_input, output)
+
+
+async def _observe_workflow_run(workflow_coroutine):
+    """
+    Await a workflow run, measuring its duration and result.
+    """
+    start = time.perf_counter()
+    result = "error"
+    WORKFLOW_RUNS_IN_PROGRESS.inc()
+    try:
+        output = await workflow_coroutine
+        result = "success"
+        return output
+    finally:
+        WORKFLOW_RUNS_IN_PROGRESS.dec()
+        WORKFLOW_RUN_DURATION.observe(time.perf_counter() - start, result=result)
+        WORKFLOW_RUNS.inc(result=result)
+
+
+def _kickoff(serve_workflow_parameters: input_types.ServeWorkflowParameters) -> str:
+    """
+    Start a workflow run in the background and return its trace ID.
+    """
+    inputs = base64_decode(serve_workflow_parameters.kickoff_inputs) if serve_workflow_parameters.kickoff_inputs else {}
+    session_id = serve_workflow_parameters.session_id if collated_input.workflow.is_conversational else None
+    if session_id and "context" in inputs:
+        # The caller's history wins, and restores sessions this replica doesn't know.
+        get_session_cache().set_context(session_id, inputs["context"])
+    elif session_id:
+        inputs["context"] = get_session_cache().get_context(session_id)
+    collated_input_copy = collated_input.model_copy(deep=True)
+
+    # Instrument our workflow given a specific workflow name and
+    # set up the instrumentation.
+    reset_crewai_instrumentation()
+    tracer_provider = instrument_crewai_workflow(f"{WORKFLOW_NAME}")
+    tracer = tracer_provider.get_tracer("opentelemetry.agentstudio.workflow.model")
+
+    tool_user_params = _get_tool_user_params(collated_input_copy)
+    _set_language_model_configs(collated_input_copy)
+
+    current_time = datetime.now()
+    formatted_time = current_time.strftime("%b %d, %H:%M:%S.%f")[:-3]
+    span_name = f"Workflow Run: {formatted_time}"
+    with tracer.start_as_current_span(span_name) as parent_span:
+        decimal_trace_id = parent_span.get_span_context().trace_id
+        trace_id = hex(decimal_trace_id)[2:]
+
+        # End the parent span early
+        parent_span.add_event("Parent span ending early for visibility")
+        parent_span.end()
+
+        # Capture the current OpenTelemetry context
+        parent_context = get_current()
+
+        # Start the workflow in the background using the parent context
+        workflow_coroutine = _observe_workflow_run(
+            run_workflow_async(collated_input_copy, tool_user_params, inputs, parent_context, tracer)
+        )
+        if session_id:
+            workflow_coroutine = _run_conversation_turn(session_id, inputs.get("user_input", ""), workflow_coroutine)
+        try:
+            asyncio.get_running_loop().create_task(workflow_coroutine)
+        except RuntimeError:
+            asyncio.run_coroutine_threadsafe(workflow_coroutine, _get_background_loop())
+
+    return str(trace_id)
+
+
 @cml_models.cml_model
 def api_wrapper(args: Union[dict, str]) -> str:
     dict_args = args
     if not isinstance(args, dict):
         dict_args = json.loads(args)
     serve_workflow_parameters = input_types.ServeWorkflowParameters.model_validate(dict_args)
+    action = input_types.DeployedWorkflowActions(serve_workflow_parameters.action_type).value
+    with WORKFLOW_MODEL_REQUEST_DURATION.time(action=action):
+        try:
+            return _serve_workflow_action(serve_workflow_parameters)
+        except Exception:
+            WORKFLOW_MODEL_REQUEST_ERRORS.inc(action=action)
+            raise
+
+
+def _serve_workflow_action(serve_workflow_parameters: input_types.ServeWorkflowParameters):
     if serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.KICKOFF.value:
-        inputs = (
-            base64_decode(serve_workflow_parameters.kickoff_inputs) if serve_workflow_parameters.kickoff_inputs else {}
-        )
-        collated_input_copy = collated_input.model_copy(deep=True)
-
-        # Instrument our workflow given a specific workflow name and
-        # set up the instrumentation.
-        reset_crewai_instrumentation()
-        tracer_provider = instrument_crewai_workflow(f"{WORKFLOW_NAME}")
-        tracer = tracer_provider.get_tracer("opentelemetry.agentstudio.workflow.model")
-
-        tool_user_params: Dict[str, Dict[str, str]] = {}
-        for tool_instance in collated_input_copy.tool_instances:
-            t_id = tool_instance.id
-            prefix = f"TOOL_{t_id.replace('-', '_')}_USER_PARAMS_"
-            user_param_kv = {}
-            for key, value in os.environ.items():
-                if key.startswith(prefix):
-                    param_name = key[len(prefix) :]
-                    user_param_kv[param_name] = value
-            tool_user_params[t_id] = user_param_kv
-
-        # Retrieve the language model config from the environment variables and validate it, and put it back in the collated input.
-        for lm in collated_input_copy.language_models:
-            env_var_key_name = f"MODEL_{lm.model_id.replace('-', '_')}_CONFIG"
-            lm_config: Optional[input_types.Input__LanguageModelConfig] = None
-            try:
-                lm_config_str = os.getenv(env_var_key_name)
-                if lm_config_str:
-                    lm_config = input_types.Input__LanguageModelConfig.model_validate(json.loads(lm_config_str))
-            except (ValidationError, json.JSONDecodeError) as e:
-                raise ValueError(f"Error validating language model config for {lm.model_name}: {e}")
-            lm.config = lm_config
-
-        current_time = datetime.now()
-        formatted_time = current_time.strftime("%b %d, %H:%M:%S.%f")[:-3]
-        span_name = f"Workflow Run: {formatted_time}"
-        with tracer.start_as_current_span(span_name) as parent_span:
-            decimal_trace_id = parent_span.get_span_context().trace_id
-            trace_id = hex(decimal_trace_id)[2:]
-
-            # End the parent span early
-            parent_span.add_event("Parent span ending early for visibility")
-            parent_span.end()
-
-            # Capture the current OpenTelemetry context
-            parent_context = get_current()
-
-            # Start the workflow in the background using the parent context
-            asyncio.create_task(
-                run_workflow_async(collated_input_copy, tool_user_params, inputs, parent_context, tracer)
-            )
-
-        return {"trace_id": str(trace_id)}
+        session_id = serve_workflow_parameters.session_id
+        # Histories only live in this replica's memory. When it has none for the
+        # session (a new session, or after a restart, an eviction or a kickoff on
+        # another replica), callers that have the history can resend it as "context".
+        session_known = bool(session_id) and get_session_cache().has_session(session_id)
+        response = {"trace_id": _kickoff(serve_workflow_parameters)}
+        if session_id:
+            response["session_id"] = session_id
+            if collated_input.workflow.is_conversational:
+                response["session_known"] = session_known
+        return response
+    elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.CLEAR_SESSION.value:
+        if not serve_workflow_parameters.session_id:
+            raise ValueError("session_id is required to clear a session.")
+        get_session_cache().clear(serve_workflow_parameters.session_id)
+        return {"session_id": serve_workflow_parameters.session_id}
+    elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_EVENTS.value:
+        # Incremental events of a run, published directly by the in-process tracing
+        # wrappers. Callers pass back next_cursor to only receive new events.
+        if not serve_workflow_parameters.trace_id:
+            raise ValueError("trace_id is required to get workflow events.")
+        all_events = get_event_bus().get_events(serve_workflow_parameters.trace_id)
+        return {
+            "events": all_events[serve_workflow_parameters.event_cursor :],
+            "next_cursor": len(all_events),
+            "complete": any(is_terminal_event(event) for event in all_events),
+        }
     elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_CONFIGURATION.value:
         return {"configuration": collated_input.model_dump()}
     elif serve_workflow_parameters.action_type == input_types.DeployedWorkflowActions.GET_ASSET_DATA.value:
         unavailable_assets = list()
+        not_modified_assets = list()
         asset_data: Dict[str, str] = dict()
+        asset_etags: Dict[str, str] = dict()
         for asset_uri in list(set(serve_workflow_parameters.get_asset_data_inputs)):
-            # Ensure that the asset requested belongs to one of the tool instances or agents
-            matching_tool_ins = next(
-                (tool for tool in collated_input.tool_instances if tool.tool_image_uri == asset_uri), None
-            )
-            matching_agent = next(
-                (agent for agent in collated_input.agents if agent.agent_image_uri == asset_uri), None
-            )
-            if (not matching_tool_ins) and (not matching_agent):
+            # Ensure that the asset requested belongs to one of the tool instances or agents,
+            # and that the asset exists.
+            encoded_asset = _get_encoded_asset(asset_uri)
+            if not encoded_asset:
                 unavailable_assets.append(asset_uri)
                 continue
-            # Ensure that the asset exists
-            asset_path = os.path.join(consts.DYNAMIC_ASSETS_LOCATION, asset_uri)
-            if not os.path.exists(asset_path):
-                unavailable_assets.append(asset_uri)
+            encoded_data, etag = encoded_asset
+            asset_etags[asset_uri] = etag
+            # Conditional request: the caller already has this exact asset.
+            if serve_workflow_parameters.get_asset_data_etags.get(asset_uri) == etag:
+                not_modified_assets.append(asset_uri)
                 continue
-            with open(asset_path, "rb") as asset_file:
-                asset_data[asset_uri] = base64.b64encode(asset_file.read()).decode()
-                # Decode at the destination with: base64.b64decode(asset_data[asset_uri])
-        return {"asset_data": asset_data, "unavailable_assets": unavailable_assets}
+            asset_data[asset_uri] = encoded_data
+        return {
+            "asset_data": asset_data,
+            "asset_etags": asset_etags,
+            "not_modified_assets": not_modified_assets,
+            "unavailable_assets": unavailable_assets,
+        }
     else:
         raise ValueError("Invalid action type.")
+
+
+# Optionally serve kickoffs as server-sent event streams alongside the model endpoint.
+if os.getenv("AGENT_STUDIO_WORKFLOW_STREAMING_PORT"):
+    start_workflow_streaming_server(_kickoff, int(os.getenv("AGENT_STUDIO_WORKFLOW_STREAMING_PORT")))
+
+# Optionally serve operational metrics in the Prometheus text format.
+start_metrics_server_from_env()
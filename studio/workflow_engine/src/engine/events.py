@@ -0,0 +1,184 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+"""
+In-process event bus for workflow runs.
+
+Workflow runs report their progress (task start/end, tool usage, crew completion) as
+spans to the ops server, and clients normally reconstruct a run's progress by querying
+those spans back from the ops server. The event bus gives in-process consumers (a
+streaming endpoint, a polling endpoint) the same events directly, as they happen.
+
+Events are keyed by the "local" trace ID of the run (the hex trace ID returned from a
+kickoff) and take the same shape as the span events returned from the ops server:
+
+    {
+        "id": "<event id>",
+        "name": "Agent._start_task",
+        "startTime": "<ISO timestamp>",
+        "attributes": {"agent_studio_id": "...", "task": {"description": "..."}},
+        "events": [],
+    }
+"""
+
+from typing import Any, Dict, List, Mapping, Optional
+from collections import OrderedDict
+from datetime import datetime, timezone
+from uuid import uuid4
+import threading
+import queue
+
+from opentelemetry import trace as trace_api
+
+
+# Event names that mark the end of a workflow run.
+TERMINAL_EVENT_NAMES = ["Crew.complete", "Crew.error"]
+
+
+def _unflatten(attributes: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Convert dotted span attribute keys ("task.description") into the nested
+    dictionaries that the ops server returns ({"task": {"description": ...}}).
+    """
+    nested: Dict[str, Any] = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        parts = key.split(".")
+        current = nested
+        for part in parts[:-1]:
+            if not isinstance(current.get(part), dict):
+                current[part] = {}
+            current = current[part]
+        current[parts[-1]] = value
+    return nested
+
+
+def get_current_trace_id() -> Optional[str]:
+    """
+    Get the local trace ID of the currently active span, formatted the same way as
+    the trace ID returned from a workflow kickoff.
+    """
+    span_context = trace_api.get_current_span().get_span_context()
+    if not span_context.is_valid:
+        return None
+    return hex(span_context.trace_id)[2:]
+
+
+def is_terminal_event(event: Dict[str, Any]) -> bool:
+    return event.get("name") in TERMINAL_EVENT_NAMES
+
+
+class WorkflowEventBus:
+    """
+    Thread-safe publish/subscribe bus of workflow run events. A bounded history of
+    events is kept for the most recent runs so that subscribers attaching after a
+    kickoff (or polling with a cursor) still receive every event of the run. Once a
+    run has max_events_per_trace events, only its terminal events are still kept,
+    so that the outcome of long runs isn't lost.
+    """
+
+    def __init__(self, max_traces: int = 256, max_events_per_trace: int = 10000):
+        self._lock = threading.Lock()
+        self._history: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._subscribers: Dict[str, List[queue.Queue]] = {}
+        self._max_traces = max_traces
+        self._max_events_per_trace = max_events_per_trace
+
+    def publish(self, trace_id: str, event: Dict[str, Any]) -> None:
+        with self._lock:
+            events = self._history.setdefault(trace_id, [])
+            self._history.move_to_end(trace_id)
+            if len(events) < self._max_events_per_trace or is_terminal_event(event):
+                events.append(event)
+            while len(self._history) > self._max_traces:
+                self._history.popitem(last=False)
+            subscribers = list(self._subscribers.get(trace_id, []))
+        for subscriber in subscribers:
+            subscriber.put(event)
+
+    def subscribe(self, trace_id: str, replay: bool = True) -> queue.Queue:
+        """
+        Subscribe to the events of a run. If replay is set, all events of the run
+        published so far are placed on the queue first.
+        """
+        subscriber: queue.Queue = queue.Queue()
+        with self._lock:
+            if replay:
+                for event in self._history.get(trace_id, []):
+                    subscriber.put(event)
+            self._subscribers.setdefault(trace_id, []).append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, trace_id: str, subscriber: queue.Queue) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(trace_id, [])
+            if subscriber in subscribers:
+                subscribers.remove(subscriber)
+            if not subscribers:
+                self._subscribers.pop(trace_id, None)
+
+    def get_events(self, trace_id: str, cursor: int = 0) -> List[Dict[str, Any]]:
+        """
+        Get all events of a run published after the given cursor (the number of
+        events the caller has already received).
+        """
+        with self._lock:
+            return list(self._history.get(trace_id, [])[cursor:])
+
+
+_event_bus = WorkflowEventBus()
+
+# When set (inside workflow worker processes), events are forwarded to the parent
+# process through this queue rather than being published to the local bus.
+_event_forwarding_queue = None
+
+
+def get_event_bus() -> WorkflowEventBus:
+    return _event_bus
+
+
+def set_event_forwarding_queue(forwarding_queue) -> None:
+    global _event_forwarding_queue
+    _event_forwarding_queue = forwarding_queue
+
+
+def forward_events_to_bus(forwarding_queue) -> None:
+    """
+    Drain events forwarded from worker processes into the local event bus. This
+    blocks forever and is meant to run in a daemon thread of the parent process.
+    """
+    while True:
+        trace_id, event = forwarding_queue.get()
+        _event_bus.publish(trace_id, event)
+
+
+def publish_workflow_event(
+    name: str,
+    attributes: Optional[Mapping[str, Any]] = None,
+    exception: Optional[BaseException] = None,
+    trace_id: Optional[str] = None,
+) -> None:
+    """
+    Publish an event for the workflow run that the current span belongs to. Event
+    publishing never raises, so it can't interfere with the run itself.
+    """
+    try:
+        trace_id = trace_id or get_current_trace_id()
+        if not trace_id:
+            return
+        timestamp = datetime.now(timezone.utc).isoformat()
+        event = {
+            "id": uuid4().hex,
+            "name": name,
+            "startTime": timestamp,
+            "attributes": _unflatten(attributes or {}),
+            "events": [],
+        }
+        if exception is not None:
+            event["events"].append({"name": "exception", "message": str(exception), "timestamp": timestamp})
+        if _event_forwarding_queue is not None:
+            _event_forwarding_queue.put((trace_id, event))
+        else:
+            _event_bus.publish(trace_id, event)
+    except Exception as e:
+        print(f"Failed to publish workflow event '{name}': {e}")
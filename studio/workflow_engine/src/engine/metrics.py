@@ -0,0 +1,321 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+"""
+Operational metrics (counters, gauges and histograms) of the studio server and of
+deployed workflow models, in the Prometheus text exposition format.
+
+Metrics are registered on a process-wide registry and served from a local HTTP port
+when AGENT_STUDIO_METRICS_PORT is set:
+
+    GET /metrics          all metrics in the Prometheus text format
+
+Metrics are kept in memory per process. Workflow worker processes don't report
+metrics of their own; runs are measured from the parent process.
+"""
+
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+import threading
+import bisect
+import math
+import time
+import os
+
+
+# Default histogram buckets, in seconds.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if not label_names:
+        return ""
+    labels = ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values))
+    return f"{{{labels}}}"
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"Metric {self.name} expects labels {list(self.label_names)}, got {list(labels)}.")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def _samples(self) -> Iterator[Tuple[str, Sequence[str], Sequence[str], float]]:
+        """
+        Yield (sample name suffix, label names, label values, value) tuples.
+        """
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for suffix, label_names, label_values, value in self._samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(label_names, label_values)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count, per combination of label values.
+    """
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be increased.")
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def get(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _samples(self):
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            yield "_total", self.label_names, label_values, value
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down, per combination of label values. A gauge without
+    labels can also be computed on every collection from a function.
+    """
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        if self.label_names:
+            raise ValueError("Only gauges without labels can be computed from a function.")
+        self._function = function
+
+    def get(self, **labels: str) -> float:
+        if self._function:
+            return float(self._function())
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    @contextmanager
+    def track_in_progress(self, **labels: str):
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+    def _samples(self):
+        if self._function:
+            try:
+                yield "", (), (), float(self._function())
+            except Exception as e:
+                print(f"Failed to collect gauge {self.name}: {e}")
+            return
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            yield "", self.label_names, label_values, value
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values (typically durations in seconds) over cumulative
+    buckets, per combination of label values.
+    """
+
+    metric_type = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: [count per bucket (the last one being +Inf)], sum
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        bucket_index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            bucket_counts, total = self._values.setdefault(label_values, ([0] * (len(self.buckets) + 1), [0.0]))
+            bucket_counts[bucket_index] += 1
+            total[0] += value
+
+    @contextmanager
+    def time(self, **labels: str):
+        """
+        Observe the duration of the block, whether or not it raises.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels: str) -> int:
+        with self._lock:
+            bucket_counts, _ = self._values.get(self._label_values(labels), ([0], [0.0]))
+            return sum(bucket_counts)
+
+    def _samples(self):
+        with self._lock:
+            values = sorted(
+                (label_values, (list(counts), total[0])) for label_values, (counts, total) in self._values.items()
+            )
+        bucket_label_names = self.label_names + ("le",)
+        for label_values, (bucket_counts, total) in values:
+            cumulative_count = 0
+            for upper_bound, count in zip(self.buckets + (math.inf,), bucket_counts):
+                cumulative_count += count
+                yield "_bucket", bucket_label_names, label_values + (_format_value(upper_bound),), cumulative_count
+            yield "_sum", self.label_names, label_values, total
+            yield "_count", self.label_names, label_values, cumulative_count
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of metrics. Metrics are created on first use and shared by
+    name afterwards, so modules can declare the metrics they report at import time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _get_or_create(self, metric_class, name: str, *args, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, *args, **kwargs)
+            elif not isinstance(metric, metric_class):
+                raise ValueError(f"Metric {name} is already registered as a {metric.metric_type}.")
+            return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, label_names)
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, label_names)
+
+    def histogram(
+        self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, label_names, buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+_metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    return _metrics_registry
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    # Set by start_metrics_server.
+    registry: MetricsRegistry = None
+
+    def do_GET(self):
+        if urlparse(self.path).path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = type(self).registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Scrapes are frequent; don't log every request.
+        pass
+
+
+# Metrics servers started in this process, by port.
+_metrics_servers: Dict[int, ThreadingHTTPServer] = {}
+_metrics_servers_lock = threading.Lock()
+
+
+def start_metrics_server(
+    port: int, host: Optional[str] = None, registry: Optional[MetricsRegistry] = None
+) -> ThreadingHTTPServer:
+    """
+    Serve the metrics registry on a local HTTP port from a daemon thread. Starting
+    a server on a port that is already served by this process reuses that server.
+    """
+    with _metrics_servers_lock:
+        if port and port in _metrics_servers:
+            return _metrics_servers[port]
+        handler = type("BoundMetricsRequestHandler", (MetricsRequestHandler,), {})
+        handler.registry = registry or get_metrics_registry()
+        server = ThreadingHTTPServer((host or os.getenv("AGENT_STUDIO_METRICS_HOST", "127.0.0.1"), port), handler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        _metrics_servers[server.server_address[1]] = server
+    print(f"Metrics server listening on port {server.server_address[1]}")
+    return server
+
+
+def start_metrics_server_from_env() -> Optional[ThreadingHTTPServer]:
+    """
+    Start the metrics server if AGENT_STUDIO_METRICS_PORT is set. Metrics are still
+    collected in memory when it isn't.
+    """
+    port = os.getenv("AGENT_STUDIO_METRICS_PORT")
+    if not port:
+        return None
+    try:
+        return start_metrics_server(int(port))
+    except Exception as e:
+        print(f"Failed to start metrics server on port {port}: {e}")
+        return None
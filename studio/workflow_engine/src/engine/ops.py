@@ -3,11 +3,23 @@ import sys
 __import__("pysqlite3")
 sys.modules["sqlite3"] = sys.modules.pop("pysqlite3")
 
+from typing import Callable, Dict, Literal, Optional, Tuple
+from pydantic import BaseModel
 from engine.utils import get_application_by_name
 from engine.consts import AGENT_STUDIO_OPS_APPLICATION_NAME
 from cmlapi import Application
 from phoenix.otel import register
+from openinference.semconv.resource import ResourceAttributes
+from opentelemetry import trace as trace_api
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.sampling import Sampler
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.exporter.otlp.proto.http import Compression
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+import threading
 import cmlapi
+import time
 import os
 
 
@@ -23,29 +35,204 @@ def get_ops_endpoint() -> str:
     env variable does not exist, extract the endpoint information
     from the running ops application directly. This env var override
     option is to make sure CML models can also reach the ops endpoint.
+    Endpoints discovered from the ops application are cached (see
+    OpsEndpointDiscovery).
     """
     if os.getenv("AGENT_STUDIO_OPS_ENDPOINT"):
         return os.getenv("AGENT_STUDIO_OPS_ENDPOINT")
 
+    return get_ops_endpoint_discovery().get()
+
+
+def _discover_ops_endpoint() -> str:
     cml = cmlapi.default_client()
     application: Application = get_application_by_name(cml, AGENT_STUDIO_OPS_APPLICATION_NAME)
     return f"https://{application.subdomain}.{os.getenv('CDSW_DOMAIN')}"
 
 
-def get_phoenix_ops_tracer_provider(workflow_name: str):
+class OpsEndpointDiscovery:
+    """
+    Cache of the ops endpoint discovered through the CML API, which lists every
+    application of the project on each lookup.
+
+    A discovered endpoint is served for ttl seconds. Once it is older than
+    refresh_after seconds, it is still served while a background thread looks it up
+    again, so callers only wait on the CML API for the first lookup and after an
+    invalidation. If a refresh fails, the cached endpoint is served until it expires.
+    """
+
+    def __init__(self, discover: Callable[[], str], ttl: float, refresh_after: float):
+        self.discover = discover
+        self.ttl = ttl
+        self.refresh_after = min(refresh_after, ttl)
+        self._lock = threading.Lock()
+        # (endpoint, discovery time on the monotonic clock)
+        self._entry: Optional[Tuple[str, float]] = None
+        self._refreshing = False
+
+    def get(self) -> str:
+        with self._lock:
+            entry = self._entry
+            age = time.monotonic() - entry[1] if entry else None
+            if entry and age < self.ttl:
+                if age >= self.refresh_after and not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._refresh, name="ops_endpoint_discovery", daemon=True).start()
+                return entry[0]
+            endpoint = self.discover()
+            self._entry = (endpoint, time.monotonic())
+            return endpoint
+
+    def _refresh(self) -> None:
+        try:
+            endpoint = self.discover()
+            with self._lock:
+                self._entry = (endpoint, time.monotonic())
+        except Exception as e:
+            print(f"Failed to refresh the ops endpoint: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def invalidate(self) -> None:
+        """
+        Forget the discovered endpoint, for example after the ops application was
+        restarted or stopped answering, so that the next call looks it up again.
+        """
+        with self._lock:
+            self._entry = None
+
+
+_ops_endpoint_discovery: Optional[OpsEndpointDiscovery] = None
+_ops_endpoint_discovery_lock = threading.Lock()
+
+
+def get_ops_endpoint_discovery() -> OpsEndpointDiscovery:
+    global _ops_endpoint_discovery
+    with _ops_endpoint_discovery_lock:
+        if _ops_endpoint_discovery is None:
+            _ops_endpoint_discovery = OpsEndpointDiscovery(
+                _discover_ops_endpoint,
+                ttl=float(os.getenv("AGENT_STUDIO_OPS_ENDPOINT_TTL", "600")),
+                refresh_after=float(os.getenv("AGENT_STUDIO_OPS_ENDPOINT_REFRESH_AFTER", "300")),
+            )
+        return _ops_endpoint_discovery
+
+
+def invalidate_ops_endpoint_cache() -> None:
+    get_ops_endpoint_discovery().invalidate()
+
+
+class SpanExportConfig(BaseModel):
+    """
+    How spans are exported to the ops server. With the "batch" processor, ended spans
+    are queued and exported by a background thread in batches, so a chatty crew's
+    early-ended spans don't each block the run on an export request. The "simple"
+    processor exports every span synchronously as it ends.
+    """
+
+    span_processor: Literal["batch", "simple"] = "batch"
+    max_queue_size: int = 2048
+    max_export_batch_size: int = 512
+    schedule_delay_millis: int = 500
+    export_timeout_millis: int = 30000
+    compression: Literal["none", "gzip", "deflate"] = "none"
+    flush_timeout_millis: int = 5000
+
+
+def get_span_export_config() -> SpanExportConfig:
+    return SpanExportConfig(
+        span_processor=os.getenv("AGENT_STUDIO_TRACING_SPAN_PROCESSOR", "batch"),
+        max_queue_size=int(os.getenv("AGENT_STUDIO_TRACING_MAX_QUEUE_SIZE", "2048")),
+        max_export_batch_size=int(os.getenv("AGENT_STUDIO_TRACING_MAX_EXPORT_BATCH_SIZE", "512")),
+        schedule_delay_millis=int(os.getenv("AGENT_STUDIO_TRACING_SCHEDULE_DELAY_MILLIS", "500")),
+        export_timeout_millis=int(os.getenv("AGENT_STUDIO_TRACING_EXPORT_TIMEOUT_MILLIS", "30000")),
+        compression=os.getenv("AGENT_STUDIO_TRACING_COMPRESSION", "none"),
+        flush_timeout_millis=int(os.getenv("AGENT_STUDIO_TRACING_FLUSH_TIMEOUT_MILLIS", "5000")),
+    )
+
+
+# Batching tracer providers by (process ID, project name, ops endpoint, sampler
+# description). Every batch span processor runs its own export thread, so providers
+# are reused across the runs of a project rather than created on each
+# (re-)instrumentation. Worker processes forked from the model process get providers
+# of their own, and a rediscovered ops endpoint gets new providers.
+_tracer_providers: Dict[Tuple[int, str, str, Optional[str]], TracerProvider] = {}
+_tracer_providers_lock = threading.Lock()
+
+
+def get_phoenix_ops_tracer_provider(
+    workflow_name: str, config: Optional[SpanExportConfig] = None, sampler: Optional[Sampler] = None
+):
     """
     Register a tracing provider to route to the phoenix
     observability endpoint. This will ensure the crew and the
     corresponding agents/tasks will report to phoenix.
 
+    Span export is configured through SpanExportConfig, which defaults to the
+    environment (see get_span_export_config). An optional sampler decides which
+    spans are recorded and exported; by default, every span is.
+
     https://docs.arize.com/phoenix/tracing/integrations-tracing/crewai
     """
 
-    ops_addr = get_ops_endpoint()
+    config = config or get_span_export_config()
+    headers = {"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"}
 
-    tracer_provider = register(
-        project_name=workflow_name,
-        endpoint=f"{ops_addr}/v1/traces",
-        headers={"Authorization": f"Bearer {os.getenv('CDSW_APIV2_KEY')}"},
-    )
+    if config.span_processor == "simple":
+        tracer_provider = register(
+            project_name=workflow_name,
+            endpoint=f"{get_ops_endpoint()}/v1/traces",
+            headers=headers,
+        )
+        if sampler:
+            # Tracers pick up the provider's sampler when they are created, which
+            # happens when the provider is handed to the instrumentors.
+            tracer_provider.sampler = sampler
+        return tracer_provider
+
+    endpoint = f"{get_ops_endpoint()}/v1/traces"
+    provider_key = (os.getpid(), workflow_name, endpoint, sampler.get_description() if sampler else None)
+    with _tracer_providers_lock:
+        tracer_provider = _tracer_providers.get(provider_key)
+        if tracer_provider:
+            return tracer_provider
+
+        tracer_provider = TracerProvider(
+            resource=Resource.create({ResourceAttributes.PROJECT_NAME: workflow_name}), sampler=sampler
+        )
+        span_exporter = OTLPSpanExporter(
+            endpoint=endpoint,
+            headers=headers,
+            timeout=config.export_timeout_millis / 1000,
+            compression=Compression(config.compression),
+        )
+        tracer_provider.add_span_processor(
+            BatchSpanProcessor(
+                span_exporter,
+                max_queue_size=config.max_queue_size,
+                max_export_batch_size=min(config.max_export_batch_size, config.max_queue_size),
+                schedule_delay_millis=config.schedule_delay_millis,
+                export_timeout_millis=config.export_timeout_millis,
+            )
+        )
+        # Match phoenix.otel.register, which also sets the global tracer provider.
+        trace_api.set_tracer_provider(tracer_provider)
+        _tracer_providers[provider_key] = tracer_provider
     return tracer_provider
+
+
+def flush_phoenix_ops_traces(timeout_millis: Optional[int] = None) -> None:
+    """
+    Export all spans queued by the batch span processors, so that a completed run is
+    fully visible on the ops server without waiting for the next scheduled export.
+    Flushing never raises, so it can't interfere with the run itself.
+    """
+    timeout_millis = timeout_millis if timeout_millis is not None else get_span_export_config().flush_timeout_millis
+    with _tracer_providers_lock:
+        tracer_providers = [provider for (pid, *_), provider in _tracer_providers.items() if pid == os.getpid()]
+    for tracer_provider in tracer_providers:
+        try:
+            tracer_provider.force_flush(timeout_millis)
+        except Exception as e:
+            print(f"Failed to flush workflow traces: {e}")
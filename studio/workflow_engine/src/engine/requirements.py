@@ -0,0 +1,211 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+"""
+Helpers for pre-resolving the Python requirements of a deployed workflow.
+
+Every tool instance in a workflow ships its own requirements.txt file. Rather than
+installing each of these files serially every time a workflow model replica starts,
+the deploy pipeline merges all tool requirements into a single, deduplicated
+requirements file (locked with a resolver when one is available, and optionally
+backed by a local wheelhouse) that is shipped as part of the deployable artifact.
+The workflow model then installs that file in one resolver pass, or skips the
+install entirely if the environment already satisfies it.
+"""
+
+from typing import Dict, List, Optional
+import importlib.metadata
+import subprocess
+import os
+
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+
+
+MERGED_REQUIREMENTS_FILE_NAME = "requirements.in"
+LOCKED_REQUIREMENTS_FILE_NAME = "requirements.txt"
+WHEELHOUSE_DIRECTORY_NAME = "wheelhouse"
+
+
+def _read_requirement_lines(requirements_file: str) -> List[str]:
+    """
+    Read all requirement specifiers from a requirements file, dropping comments,
+    blank lines, and pip options (-r, -e, --index-url, etc.).
+    """
+    lines = []
+    with open(requirements_file, "r") as f:
+        for line in f:
+            line = line.split(" #")[0].strip()
+            if not line or line.startswith("#") or line.startswith("-"):
+                continue
+            lines.append(line)
+    return lines
+
+
+def _get_pinned_version(requirement: Requirement) -> Optional[Version]:
+    specifiers = list(requirement.specifier)
+    if len(specifiers) != 1 or specifiers[0].operator != "==":
+        return None
+    try:
+        return Version(specifiers[0].version)
+    except InvalidVersion:
+        return None
+
+
+def merge_requirement_files(requirement_files: List[str]) -> List[str]:
+    """
+    Merge multiple requirements files into a single, deduplicated list of
+    requirement specifiers, keyed by canonical package name.
+
+    Specifiers for the same package are combined so that the resolver can satisfy
+    all of them at once. Conflicting exact pins (for example two tools pinning
+    different pydantic patch versions) can never be satisfied together, and picking
+    one of them could break the tools that pinned the other at run time, so they
+    raise a ValueError that names every conflict. Lines that cannot be parsed as
+    PEP 508 requirements (direct URLs, local paths) are passed through untouched.
+    """
+    merged: Dict[str, Requirement] = {}
+    passthrough: List[str] = []
+    conflicts: Dict[str, List[str]] = {}
+
+    for requirement_file in requirement_files:
+        if not os.path.exists(requirement_file):
+            continue
+        for line in _read_requirement_lines(requirement_file):
+            try:
+                requirement = Requirement(line)
+            except InvalidRequirement:
+                if line not in passthrough:
+                    passthrough.append(line)
+                continue
+
+            name = canonicalize_name(requirement.name)
+            existing = merged.get(name)
+            if existing is None:
+                merged[name] = requirement
+                continue
+
+            existing_pin, new_pin = _get_pinned_version(existing), _get_pinned_version(requirement)
+            if existing_pin is not None and new_pin is not None:
+                if new_pin != existing_pin:
+                    pins = conflicts.setdefault(name, [str(existing_pin)])
+                    if str(new_pin) not in pins:
+                        pins.append(str(new_pin))
+                continue
+            if existing_pin is not None or new_pin is not None:
+                # An exact pin always takes precedence over a looser range.
+                merged[name] = existing if existing_pin is not None else requirement
+                continue
+
+            existing.extras.update(requirement.extras)
+            existing.specifier &= requirement.specifier
+
+    if conflicts:
+        raise ValueError(
+            "Tools of the workflow pin conflicting versions of "
+            + ", ".join(f"'{name}' ({', '.join(pins)})" for name, pins in conflicts.items())
+            + ". Pin the same version in every tool's requirements.txt."
+        )
+    return [str(requirement) for requirement in merged.values()] + passthrough
+
+
+def write_merged_requirements(requirement_files: List[str], output_dir: str) -> str:
+    """
+    Merge all requirements files and write the result to the output directory.
+    Returns the path to the merged requirements file.
+    """
+    merged_requirements_path = os.path.join(output_dir, MERGED_REQUIREMENTS_FILE_NAME)
+    with open(merged_requirements_path, "w") as f:
+        f.write("\n".join(merge_requirement_files(requirement_files)) + "\n")
+    return merged_requirements_path
+
+
+def lock_requirements(merged_requirements_path: str, output_dir: str) -> str:
+    """
+    Resolve a merged requirements file into a fully pinned lock file using uv. If
+    the resolver is unavailable or resolution fails, the merged (unlocked) requirements
+    are used as the lock file so that the install still happens in a single pass.
+    Returns the path to the locked requirements file.
+    """
+    locked_requirements_path = os.path.join(output_dir, LOCKED_REQUIREMENTS_FILE_NAME)
+    try:
+        subprocess.run(
+            [
+                "uv",
+                "pip",
+                "compile",
+                merged_requirements_path,
+                "--output-file",
+                locked_requirements_path,
+                "--no-header",
+                "--quiet",
+            ],
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Could not lock workflow requirements, falling back to merged requirements: {e}")
+        with open(merged_requirements_path, "r") as src, open(locked_requirements_path, "w") as dst:
+            dst.write(src.read())
+    return locked_requirements_path
+
+
+def build_wheelhouse(locked_requirements_path: str, output_dir: str) -> Optional[str]:
+    """
+    Download wheels for every locked requirement into a local wheelhouse directory
+    so workflow model replicas can install without reaching a package index.
+    Returns the wheelhouse path, or None if the wheelhouse could not be built.
+    """
+    wheelhouse_dir = os.path.join(output_dir, WHEELHOUSE_DIRECTORY_NAME)
+    try:
+        subprocess.run(
+            ["pip", "download", "--quiet", "-r", locked_requirements_path, "-d", wheelhouse_dir],
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Could not build wheelhouse for workflow requirements: {e}")
+        if os.path.exists(wheelhouse_dir):
+            for file_name in os.listdir(wheelhouse_dir):
+                os.remove(os.path.join(wheelhouse_dir, file_name))
+            os.rmdir(wheelhouse_dir)
+        return None
+    return wheelhouse_dir
+
+
+def are_requirements_satisfied(requirements_file: str) -> bool:
+    """
+    Check whether every requirement in a requirements file is already installed in
+    the current environment at a matching version. Requirements that can't be parsed
+    or whose environment markers don't apply are handled conservatively.
+    """
+    for line in _read_requirement_lines(requirements_file):
+        try:
+            requirement = Requirement(line)
+        except InvalidRequirement:
+            return False
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+        try:
+            installed_version = importlib.metadata.version(requirement.name)
+        except importlib.metadata.PackageNotFoundError:
+            return False
+        if requirement.specifier and not requirement.specifier.contains(installed_version, prereleases=True):
+            return False
+    return True
+
+
+def install_requirements(requirements_file: str, wheelhouse_dir: Optional[str] = None) -> None:
+    """
+    Install a requirements file in a single resolver pass, preferring a local
+    wheelhouse if one was shipped with the deployable artifact. Installation is
+    skipped entirely if the environment already satisfies every requirement.
+    """
+    if are_requirements_satisfied(requirements_file):
+        print(f"All requirements in {requirements_file} are already satisfied.")
+        return
+
+    command = ["pip", "install", "-r", requirements_file]
+    if wheelhouse_dir and os.path.isdir(wheelhouse_dir):
+        command.extend(["--no-index", "--find-links", wheelhouse_dir])
+    if subprocess.call(command) != 0 and wheelhouse_dir:
+        # Fall back to the package index if the wheelhouse is incomplete.
+        subprocess.call(["pip", "install", "-r", requirements_file])
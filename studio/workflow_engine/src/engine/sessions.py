@@ -0,0 +1,180 @@
+# No top level studio.db imports allowed to support wokrflow model deployment
+
+"""
+Server-side conversation histories for conversational deployed workflows.
+
+Conversational workflows take two inputs: the latest "user_input" and the "context"
+of the conversation so far. Without sessions, callers resend the entire history on
+every kickoff. With a session ID, the deployed workflow keeps the history itself (in
+a bounded LRU of sessions) and callers only send the new user input.
+
+The history only lives in the memory of one model replica, so it is lost when the
+model restarts, when the session is evicted, or when a kickoff lands on another
+replica. Kickoffs report whether the session was known ("session_known"), and
+callers that still have the history can send it as "context", which then replaces
+the history kept for the session.
+
+The context passed to the workflow uses the same format as the Agent Studio chat
+view: a JSON list of {"role": ..., "content": ...} messages. To keep prompts from
+growing without bound, histories are limited by a message count and a character
+budget. Messages over the limit are either dropped ("truncate") or folded into a
+short leading summary message ("summarize").
+"""
+
+from typing import Dict, List, Optional
+from collections import OrderedDict
+import threading
+import json
+import os
+
+
+HISTORY_POLICY_TRUNCATE = "truncate"
+HISTORY_POLICY_SUMMARIZE = "summarize"
+
+# Number of characters of each dropped message that is kept in a summary.
+SUMMARY_MESSAGE_CHARACTERS = 200
+
+
+def _summarize_messages(messages: List[Dict[str, str]], previous_summary: Optional[str] = None) -> str:
+    lines = [previous_summary] if previous_summary else []
+    for message in messages:
+        content = message["content"]
+        if len(content) > SUMMARY_MESSAGE_CHARACTERS:
+            content = content[:SUMMARY_MESSAGE_CHARACTERS] + "..."
+        lines.append(f"{message['role']}: {content}")
+    return "\n".join(lines)
+
+
+class ConversationSessionCache:
+    """
+    Thread-safe LRU of conversation histories keyed by session ID. The least recently
+    used session is evicted once more than max_sessions sessions are active.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        max_messages: int = 50,
+        max_context_characters: int = 0,
+        history_policy: str = HISTORY_POLICY_TRUNCATE,
+    ):
+        if history_policy not in [HISTORY_POLICY_TRUNCATE, HISTORY_POLICY_SUMMARIZE]:
+            raise ValueError(f"Invalid conversation history policy: '{history_policy}'")
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[str, List[Dict[str, str]]]" = OrderedDict()
+        self._summaries: Dict[str, str] = {}
+        self.max_sessions = max_sessions
+        self.max_messages = max_messages
+        self.max_context_characters = max_context_characters
+        self.history_policy = history_policy
+
+    def get_history(self, session_id: str) -> List[Dict[str, str]]:
+        """
+        Get the conversation history of a session, including the summary message of
+        earlier turns if the summarize policy is used. Unknown sessions are empty.
+        """
+        with self._lock:
+            messages = self._sessions.get(session_id)
+            if messages is None:
+                return []
+            self._sessions.move_to_end(session_id)
+            history = list(messages)
+            if session_id in self._summaries:
+                summary = f"Summary of the earlier conversation:\n{self._summaries[session_id]}"
+                history.insert(0, {"role": "system", "content": summary})
+            return history
+
+    def has_session(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def set_history(self, session_id: str, messages: List[Dict[str, str]]) -> None:
+        """
+        Replace the conversation history of a session, applying the history limits.
+        """
+        with self._lock:
+            self._sessions[session_id] = [{"role": m["role"], "content": m["content"]} for m in messages]
+            self._sessions.move_to_end(session_id)
+            self._summaries.pop(session_id, None)
+            self._apply_history_limits(session_id, self._sessions[session_id])
+            while len(self._sessions) > self.max_sessions:
+                evicted_session_id, _ = self._sessions.popitem(last=False)
+                self._summaries.pop(evicted_session_id, None)
+
+    def set_context(self, session_id: str, context: str) -> None:
+        """
+        Replace the conversation history of a session with a "context" input of a
+        conversational workflow. Contexts in another format are ignored.
+        """
+        try:
+            messages = json.loads(context)
+            self.set_history(session_id, messages)
+        except (ValueError, TypeError, KeyError) as e:
+            print(f"Not keeping the context of session '{session_id}', which isn't a list of messages: {e}")
+
+    def get_context(self, session_id: str) -> str:
+        """
+        Get the conversation history of a session formatted as the "context" input
+        of a conversational workflow.
+        """
+        return json.dumps(self.get_history(session_id))
+
+    def append_turn(self, session_id: str, user_input: str, output: str) -> None:
+        """
+        Record a completed turn of a conversation, applying the history limits and
+        evicting the least recently used session if the cache is full.
+        """
+        with self._lock:
+            messages = self._sessions.setdefault(session_id, [])
+            self._sessions.move_to_end(session_id)
+            messages.append({"role": "user", "content": user_input})
+            messages.append({"role": "assistant", "content": output})
+            self._apply_history_limits(session_id, messages)
+            while len(self._sessions) > self.max_sessions:
+                evicted_session_id, _ = self._sessions.popitem(last=False)
+                self._summaries.pop(evicted_session_id, None)
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+            self._summaries.pop(session_id, None)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def _apply_history_limits(self, session_id: str, messages: List[Dict[str, str]]) -> None:
+        dropped: List[Dict[str, str]] = []
+        # Always keep the latest turn, even if it alone exceeds the limits.
+        while len(messages) > 2 and (
+            (self.max_messages and len(messages) > self.max_messages)
+            or (
+                self.max_context_characters
+                and sum(len(message["content"]) for message in messages) > self.max_context_characters
+            )
+        ):
+            dropped.append(messages.pop(0))
+        if dropped and self.history_policy == HISTORY_POLICY_SUMMARIZE:
+            summary = _summarize_messages(dropped, self._summaries.get(session_id))
+            if self.max_context_characters:
+                # Keep the most recent part of the summary within the character budget.
+                summary = summary[-self.max_context_characters :]
+            self._summaries[session_id] = summary
+
+
+_session_cache: Optional[ConversationSessionCache] = None
+
+
+def get_session_cache() -> ConversationSessionCache:
+    """
+    Get the conversation session cache of this workflow model, configured from the
+    environment on first use.
+    """
+    global _session_cache
+    if _session_cache is None:
+        _session_cache = ConversationSessionCache(
+            max_sessions=int(os.getenv("AGENT_STUDIO_WORKFLOW_SESSION_CACHE_SIZE", "1000")),
+            max_messages=int(os.getenv("AGENT_STUDIO_WORKFLOW_SESSION_MAX_MESSAGES", "50")),
+            max_context_characters=int(os.getenv("AGENT_STUDIO_WORKFLOW_SESSION_MAX_CONTEXT_CHARACTERS", "0")),
+            history_policy=os.getenv("AGENT_STUDIO_WORKFLOW_SESSION_HISTORY_POLICY", HISTORY_POLICY_TRUNCATE),
+        )
+    return _session_cache
@@ -89,9 +89,20 @@ class DeployedWorkflowActions(str, Enum):
     KICKOFF = "kickoff"
     GET_CONFIGURATION = "get-configuration"
     GET_ASSET_DATA = "get-asset-data"
+    GET_EVENTS = "get-events"
+    CLEAR_SESSION = "clear-session"
 
 
 class ServeWorkflowParameters(BaseModel):
     action_type: DeployedWorkflowActions
     kickoff_inputs: Optional[str] = None
     get_asset_data_inputs: List[str] = list()
+    # ETags of assets the caller already has cached, keyed by asset URI. Assets whose
+    # ETag still matches are reported as not modified instead of being re-sent.
+    get_asset_data_etags: Dict[str, str] = dict()
+    # Run to fetch events for, and the number of events of that run already received.
+    trace_id: Optional[str] = None
+    event_cursor: int = 0
+    # Conversation session of a conversational workflow. When set, the conversation
+    # history is kept by the deployed workflow and only the new user_input is required.
+    session_id: Optional[str] = None
@@ -0,0 +1,126 @@
+import asyncio
+import socket
+import threading
+import time
+
+import grpc
+import pytest
+
+from studio.aio_service import AsyncAgentStudioApp, create_aio_server
+from studio.api import *
+from studio.cross_cutting.metrics import GRPC_REQUESTS, AsyncMetricsServerInterceptor
+from studio.cross_cutting.rpc_classes import RpcClass, get_rpc_classes
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer, AgentStudioStub
+
+
+class FakeServicer(AgentStudioServicer):
+    def __init__(self):
+        self.release = threading.Event()
+        self.closed_streams = []
+
+    def HealthCheck(self, request, context):
+        return HealthCheckResponse(message="Studio is healthy")
+
+    def ListWorkflows(self, request, context):
+        return ListWorkflowsResponse(workflows=[Workflow(workflow_id="w1")])
+
+    def TestModel(self, request, context):
+        self.release.wait(10)
+        return TestModelResponse(response="done")
+
+    def StreamWorkflowEvents(self, request, context):
+        try:
+            for i in range(3):
+                yield WorkflowRunEvent(id=f"{request.trace_id}-{i}")
+        finally:
+            self.closed_streams.append(request.trace_id)
+
+    def TemporaryFileUpload(self, request_iterator, context):
+        data = b"".join(chunk.content for chunk in request_iterator)
+        return FileUploadResponse(file_path=data.decode())
+
+
+def get_free_port() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return str(sock.getsockname()[1])
+
+
+def make_rpc_classes(concurrency: int = 2, timeout: float = 30) -> dict:
+    return {name: RpcClass(name=name, concurrency=concurrency, timeout=timeout) for name in get_rpc_classes().keys()}
+
+
+async def serve_and_call(servicer: FakeServicer, calls, rpc_classes: dict = None) -> None:
+    port = get_free_port()
+    aio_servicer = AsyncAgentStudioApp(servicer, rpc_classes=rpc_classes or make_rpc_classes())
+    server = create_aio_server(aio_servicer, port, interceptors=[AsyncMetricsServerInterceptor()])
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+            return await calls(AgentStudioStub(channel))
+    finally:
+        await server.stop(None)
+        aio_servicer.shutdown()
+
+
+def test_long_running_calls_do_not_block_other_rpcs():
+    servicer = FakeServicer()
+
+    async def calls(stub):
+        # Saturate the long-running pool.
+        slow_calls = [asyncio.ensure_future(stub.TestModel(TestModelRequest())) for _ in range(4)]
+        await asyncio.sleep(0.2)
+        start = time.monotonic()
+        health = await stub.HealthCheck(HealthCheckRequest(), timeout=5)
+        workflows = await stub.ListWorkflows(ListWorkflowsRequest(), timeout=5)
+        fast_duration = time.monotonic() - start
+        servicer.release.set()
+        slow_responses = await asyncio.gather(*slow_calls)
+        return health, workflows, fast_duration, slow_responses
+
+    ok_count = GRPC_REQUESTS.get(method="HealthCheck", code="OK")
+    health, workflows, fast_duration, slow_responses = asyncio.run(serve_and_call(servicer, calls))
+
+    assert health.message == "Studio is healthy"
+    assert [w.workflow_id for w in workflows.workflows] == ["w1"]
+    assert fast_duration < 2
+    assert [r.response for r in slow_responses] == ["done"] * 4
+    assert GRPC_REQUESTS.get(method="HealthCheck", code="OK") == ok_count + 1
+
+
+def test_streaming_rpcs_are_bridged_to_sync_handlers():
+    servicer = FakeServicer()
+
+    async def calls(stub):
+        events = [event.id async for event in stub.StreamWorkflowEvents(StreamWorkflowEventsRequest(trace_id="t1"))]
+
+        async def chunks():
+            for content in [b"a", b"b", b"c"]:
+                yield FileChunk(content=content)
+
+        upload = await stub.TemporaryFileUpload(chunks())
+        return events, upload
+
+    events, upload = asyncio.run(serve_and_call(servicer, calls))
+
+    assert events == ["t1-0", "t1-1", "t1-2"]
+    assert servicer.closed_streams == ["t1"]
+    assert upload.file_path == "abc"
+
+
+def test_class_timeout_aborts_slow_calls():
+    servicer = FakeServicer()
+
+    async def calls(stub):
+        try:
+            with pytest.raises(grpc.aio.AioRpcError) as e:
+                await stub.TestModel(TestModelRequest())
+            health = await stub.HealthCheck(HealthCheckRequest())
+        finally:
+            servicer.release.set()
+        return e.value.code(), health
+
+    code, health = asyncio.run(serve_and_call(servicer, calls, rpc_classes=make_rpc_classes(timeout=0.2)))
+
+    assert code == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert health.message == "Studio is healthy"
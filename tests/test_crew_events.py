@@ -0,0 +1,111 @@
+import json
+import pytest
+from unittest.mock import MagicMock
+from studio.sdk.ops import *
+
+
+TRACE_INFO = {"projectId": "p1", "globalTraceId": "g1"}
+
+
+def make_span(span_id: str, name: str, start_time: str) -> dict:
+    return {
+        "id": span_id,
+        "name": name,
+        "startTime": start_time,
+        "cumulativeTokenCountTotal": 0,
+        "cumulativeTokenCountPrompt": 0,
+        "cumulativeTokenCountCompletion": 0,
+        "endTime": start_time,
+        "attributes": json.dumps({"span": span_id}),
+        "events": None,
+    }
+
+
+class FakeOpsClient:
+    """
+    Serves the descendant listing and aliased span lookups of get_crew_events from
+    an in-memory list of spans, recording the span IDs fetched with attributes.
+    """
+
+    def __init__(self, spans: list):
+        self.spans = spans
+        self.fetched_span_ids = []
+        self.client = MagicMock()
+        self.client.execute.side_effect = self.execute
+
+    def execute(self, query):
+        query_str = query.loc.source.body
+        if "GetCrewEventSpans" in query_str:
+            result = {}
+            for index, span in enumerate(self.spans):
+                if f'node(id: "{span["id"]}")' in query_str:
+                    self.fetched_span_ids.append(span["id"])
+                    result[f"span{index}"] = span
+            return result
+        descendants = [{"id": span["id"], "name": span["name"]} for span in self.spans]
+        return {"node": {"rootSpan": {"name": "Crew.kickoff", "descendants": descendants}}}
+
+
+@pytest.fixture(autouse=True)
+def clear_crew_event_cache():
+    get_crew_event_cache().clear()
+    yield
+    get_crew_event_cache().clear()
+
+
+def test_get_crew_events_sorts_and_filters_events():
+    ops = FakeOpsClient(
+        [
+            make_span("s2", "Agent._start_task", "2025-03-20T10:00:02Z"),
+            make_span("s1", "Crew.kickoff", "2025-03-20T10:00:01Z"),
+            make_span("s3", "SomeInternalSpan", "2025-03-20T10:00:03Z"),
+        ]
+    )
+
+    result = get_crew_events(ops.client, "trace", TRACE_INFO)
+
+    assert result["projectId"] == "p1"
+    assert [event["id"] for event in result["events"]] == ["s1", "s2"]
+    assert result["events"][0]["attributes"] == {"span": "s1"}
+    assert result["events"][0]["events"] == []
+    assert sorted(ops.fetched_span_ids) == ["s1", "s2"]
+
+
+def test_get_crew_events_only_fetches_new_spans():
+    ops = FakeOpsClient([make_span("s1", "Crew.kickoff", "2025-03-20T10:00:01Z")])
+    first = get_crew_events(ops.client, "trace", TRACE_INFO)
+
+    # A span that started earlier is exported after the first poll.
+    ops.spans.append(make_span("s0", "Agent._start_task", "2025-03-20T10:00:00Z"))
+    second = get_crew_events(ops.client, "trace", TRACE_INFO, since=first["cursor"])
+
+    assert [event["id"] for event in second["events"]] == ["s0"]
+    assert ops.fetched_span_ids == ["s1", "s0"]
+
+    # Nothing new since the second poll.
+    third = get_crew_events(ops.client, "trace", TRACE_INFO, since=second["cursor"])
+    assert third["events"] == []
+    assert third["cursor"] == second["cursor"]
+    assert ops.fetched_span_ids == ["s1", "s0"]
+
+    # Without a cursor, every event is returned in start time order.
+    full = get_crew_events(ops.client, "trace", TRACE_INFO)
+    assert [event["id"] for event in full["events"]] == ["s0", "s1"]
+
+
+def test_get_crew_events_unknown_cursor_returns_all_events():
+    ops = FakeOpsClient([make_span("s1", "Crew.kickoff", "2025-03-20T10:00:01Z")])
+
+    result = get_crew_events(ops.client, "trace", TRACE_INFO, since="evicted")
+
+    assert [event["id"] for event in result["events"]] == ["s1"]
+    assert result["cursor"] == "s1"
+
+
+def test_crew_event_cache_evicts_least_recently_used_trace():
+    cache = CrewEventCache(max_traces=1)
+    cache.add_events("g1", [{"id": "a", "startTime": "2025-03-20T10:00:00Z"}])
+    cache.add_events("g2", [{"id": "b", "startTime": "2025-03-20T10:00:00Z"}])
+
+    assert cache.get_event_ids("g1") == set()
+    assert cache.get_event_ids("g2") == {"b"}
@@ -0,0 +1,123 @@
+from concurrent import futures
+
+import grpc
+import pytest
+
+from studio.api import *
+from studio.client import AgentStudioClient
+from studio.cross_cutting.grpc_options import (
+    COMPRESSED_RPCS,
+    CompressionServerInterceptor,
+    get_channel_options,
+    get_compressed_rpcs,
+    get_compression,
+    get_request_compression,
+    get_server_options,
+)
+from studio.proto import agent_studio_pb2_grpc
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer
+
+
+# Larger than the default 4 MiB receive limit of gRPC.
+LARGE_CODE = "x = 1\n" * (1024 * 1024)
+
+
+class LargeTemplatesServicer(AgentStudioServicer):
+    def ListToolTemplates(self, request, context):
+        return ListToolTemplatesResponse(templates=[ToolTemplate(id="t1", python_code=LARGE_CODE)])
+
+    def GetToolTemplate(self, request, context):
+        return GetToolTemplateResponse(template=ToolTemplate(id=request.tool_template_id))
+
+
+class FakeContext:
+    def __init__(self):
+        self.compression = None
+
+    def set_compression(self, compression):
+        self.compression = compression
+
+
+def test_options_from_env(monkeypatch):
+    assert get_compressed_rpcs() == COMPRESSED_RPCS
+    assert get_compression() == grpc.Compression.Gzip
+    assert get_request_compression("ListToolTemplates") == grpc.Compression.Gzip
+    assert get_request_compression("HealthCheck") is None
+
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_COMPRESSED_RPCS", "GetAssetData, ListTasks")
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_COMPRESSION", "deflate")
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_MAX_MESSAGE_LENGTH", "1024")
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_KEEPALIVE_TIME_MS", "5000")
+    assert get_compressed_rpcs() == {"GetAssetData", "ListTasks"}
+    assert get_request_compression("ListTasks") == grpc.Compression.Deflate
+    assert ("grpc.max_receive_message_length", 1024) in get_channel_options()
+    assert ("grpc.http2.min_recv_ping_interval_without_data_ms", 2500) in get_server_options()
+
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_COMPRESSED_RPCS", "none")
+    assert get_compressed_rpcs() == frozenset()
+
+
+@pytest.mark.parametrize("keepalive_time_ms", [None, "1000", "30000"])
+def test_server_accepts_client_pings_before_the_keepalive_time(monkeypatch, keepalive_time_ms):
+    if keepalive_time_ms:
+        monkeypatch.setenv("AGENT_STUDIO_GRPC_KEEPALIVE_TIME_MS", keepalive_time_ms)
+    server_options = dict(get_server_options())
+    client_options = dict(get_channel_options())
+    assert (
+        server_options["grpc.http2.min_recv_ping_interval_without_data_ms"] < client_options["grpc.keepalive_time_ms"]
+    )
+
+
+@pytest.mark.parametrize(
+    "name, value, getter",
+    [
+        ("AGENT_STUDIO_GRPC_COMPRESSION", "brotli", get_compression),
+        ("AGENT_STUDIO_GRPC_MAX_MESSAGE_LENGTH", "0", get_server_options),
+        ("AGENT_STUDIO_GRPC_MAX_MESSAGE_LENGTH", str(2**31), get_channel_options),
+        ("AGENT_STUDIO_GRPC_KEEPALIVE_TIMEOUT_MS", "-1", get_server_options),
+    ],
+)
+def test_invalid_options_are_rejected(monkeypatch, name, value, getter):
+    monkeypatch.setenv(name, value)
+    with pytest.raises(ValueError):
+        getter()
+
+
+def test_interceptor_compresses_only_compressed_rpcs():
+    interceptor = CompressionServerInterceptor(compressed_rpcs=frozenset({"ListToolTemplates"}))
+
+    def continuation(handler_call_details):
+        return grpc.unary_unary_rpc_method_handler(lambda request, context: "response")
+
+    for method, compression in [("ListToolTemplates", grpc.Compression.Gzip), ("HealthCheck", None)]:
+        details = grpc.HandlerCallDetails()
+        details.method = f"/agent_studio.AgentStudio/{method}"
+        handler = interceptor.intercept_service(continuation, details)
+        context = FakeContext()
+        assert handler.unary_unary(None, context) == "response"
+        assert context.compression == compression
+
+
+def test_client_receives_messages_above_the_default_limit():
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=2),
+        interceptors=[CompressionServerInterceptor()],
+        options=get_server_options(),
+    )
+    agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(LargeTemplatesServicer(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        client = AgentStudioClient(server_ip="127.0.0.1", server_port=str(port))
+        response = client.ListToolTemplates(ListToolTemplatesRequest(), timeout=30)
+        assert response.templates[0].python_code == LARGE_CODE
+        # Requests of compressed RPCs are compressed by the client.
+        assert client.GetToolTemplate(GetToolTemplateRequest(tool_template_id="t2")).template.id == "t2"
+        client.channel.close()
+
+        with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+            with pytest.raises(grpc.RpcError) as e:
+                agent_studio_pb2_grpc.AgentStudioStub(channel).ListToolTemplates(ListToolTemplatesRequest())
+            assert e.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    finally:
+        server.stop(None)
@@ -0,0 +1,110 @@
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+
+import pytest
+import urllib.request
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import grpc
+
+from engine.metrics import MetricsRegistry, start_metrics_server
+from studio.cross_cutting.metrics import GRPC_REQUESTS, GRPC_REQUEST_DURATION, MetricsServerInterceptor
+
+
+def test_registry_renders_prometheus_text_format():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.", ["method"])
+    counter.inc(method="Get")
+    counter.inc(2, method="Get")
+    gauge = registry.gauge("queue_depth", "Queue depth.")
+    gauge.set_function(lambda: 7)
+    histogram = registry.histogram("duration_seconds", "Durations.", buckets=[0.1, 1.0])
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    assert registry.counter("requests", "Requests.", ["method"]) is counter
+    assert registry.render().splitlines() == [
+        "# HELP duration_seconds Durations.",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{le="0.1"} 1',
+        'duration_seconds_bucket{le="1"} 2',
+        'duration_seconds_bucket{le="+Inf"} 3',
+        "duration_seconds_sum 5.55",
+        "duration_seconds_count 3",
+        "# HELP queue_depth Queue depth.",
+        "# TYPE queue_depth gauge",
+        "queue_depth 7",
+        "# HELP requests Requests.",
+        "# TYPE requests counter",
+        'requests_total{method="Get"} 3',
+    ]
+
+
+def test_metrics_validate_labels_and_types():
+    registry = MetricsRegistry()
+    counter = registry.counter("requests", "Requests.", ["method"])
+
+    with pytest.raises(ValueError):
+        counter.inc(code="OK")
+    with pytest.raises(ValueError):
+        counter.inc(-1, method="Get")
+    with pytest.raises(ValueError):
+        registry.gauge("requests", "Requests.")
+
+
+def test_metrics_server_serves_registry():
+    registry = MetricsRegistry()
+    registry.counter("requests", "Requests.").inc()
+    server = start_metrics_server(0, host="127.0.0.1", registry=registry)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert "requests_total 1" in response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def intercept(behavior, method: str = "/agent_studio.AgentStudio/ListModels", **handler_kwargs):
+    handler = grpc.unary_unary_rpc_method_handler(behavior)
+    if handler_kwargs:
+        handler = handler._replace(unary_unary=None, **handler_kwargs)
+    return MetricsServerInterceptor().intercept_service(lambda _: handler, SimpleNamespace(method=method))
+
+
+def test_interceptor_measures_unary_calls():
+    context = MagicMock()
+    context.code.return_value = None
+    ok_count = GRPC_REQUESTS.get(method="ListModels", code="OK")
+    duration_count = GRPC_REQUEST_DURATION.get_count(method="ListModels")
+
+    assert intercept(lambda request, context: request + 1).unary_unary(1, context) == 2
+
+    def failing(request, context):
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        intercept(failing).unary_unary(1, context)
+
+    assert GRPC_REQUESTS.get(method="ListModels", code="OK") == ok_count + 1
+    assert GRPC_REQUESTS.get(method="ListModels", code="UNKNOWN") >= 1
+    assert GRPC_REQUEST_DURATION.get_count(method="ListModels") == duration_count + 2
+
+
+def test_interceptor_measures_streams_until_exhausted():
+    context = MagicMock()
+    context.code.return_value = None
+    duration_count = GRPC_REQUEST_DURATION.get_count(method="StreamWorkflowEvents")
+    handler = intercept(
+        None,
+        method="/agent_studio.AgentStudio/StreamWorkflowEvents",
+        unary_stream=lambda request, context: iter([1, 2]),
+    )
+
+    stream = handler.unary_stream(None, context)
+    assert next(stream) == 1
+    assert GRPC_REQUEST_DURATION.get_count(method="StreamWorkflowEvents") == duration_count
+    assert list(stream) == [2]
+    assert GRPC_REQUEST_DURATION.get_count(method="StreamWorkflowEvents") == duration_count + 1
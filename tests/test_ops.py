@@ -0,0 +1,139 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from gql import gql
+
+import studio.ops as ops
+from engine.ops import OpsEndpointDiscovery
+
+
+@pytest.fixture(autouse=True)
+def reset_ops_caches(monkeypatch):
+    monkeypatch.delenv("AGENT_STUDIO_OPS_ENDPOINT", raising=False)
+    ops.invalidate_ops_endpoint_cache()
+    ops._ops_graphql_client = None
+    yield
+    ops.invalidate_ops_endpoint_cache()
+    ops._ops_graphql_client = None
+
+
+class GraphQLHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Client ports of the connections that sent requests, and the number of requests
+    # to fail before answering.
+    client_ports = []
+    failures = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        type(self).client_ports.append(self.client_address[1])
+        if type(self).failures:
+            type(self).failures -= 1
+            status, body = 503, b"{}"
+        else:
+            status, body = 200, json.dumps({"data": {"ok": True}}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def graphql_server(monkeypatch):
+    GraphQLHandler.client_ports = []
+    GraphQLHandler.failures = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), GraphQLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setenv("AGENT_STUDIO_OPS_GRAPHQL_RETRY_BACKOFF", "0")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_ops_endpoint_caches_application_lookup(monkeypatch):
+    monkeypatch.setenv("CDSW_DOMAIN", "example.com")
+    application = SimpleNamespace(subdomain="agent-ops")
+    with (
+        patch("engine.ops.cmlapi.default_client"),
+        patch("engine.ops.get_application_by_name", return_value=application) as get_application,
+    ):
+        assert ops.get_ops_endpoint() == "https://agent-ops.example.com"
+        assert ops.get_ops_endpoint() == "https://agent-ops.example.com"
+        assert get_application.call_count == 1
+
+        ops.invalidate_ops_endpoint_cache()
+        ops.get_ops_endpoint()
+        assert get_application.call_count == 2
+
+
+def test_ops_endpoint_discovery_refreshes_in_background():
+    endpoints = iter(["https://ops-1", "https://ops-2"])
+    refreshed = threading.Event()
+
+    def discover():
+        endpoint = next(endpoints)
+        if endpoint == "https://ops-2":
+            refreshed.set()
+        return endpoint
+
+    discovery = OpsEndpointDiscovery(discover, ttl=60, refresh_after=0)
+
+    assert discovery.get() == "https://ops-1"
+    # The stale endpoint is served while it is refreshed.
+    assert discovery.get() == "https://ops-1"
+    assert refreshed.wait(5)
+    for _ in range(100):
+        if not discovery._refreshing:
+            break
+        threading.Event().wait(0.01)
+    assert discovery._entry[0] == "https://ops-2"
+
+
+def test_ops_endpoint_discovery_expires_and_invalidates():
+    discover = MagicMock(side_effect=["https://ops-1", "https://ops-2", "https://ops-3"])
+    discovery = OpsEndpointDiscovery(discover, ttl=0, refresh_after=0)
+    assert discovery.get() == "https://ops-1"
+    assert discovery.get() == "https://ops-2"
+
+    discovery = OpsEndpointDiscovery(MagicMock(side_effect=["https://ops-1", "https://ops-2"]), 60, 60)
+    assert discovery.get() == discovery.get() == "https://ops-1"
+    discovery.invalidate()
+    assert discovery.get() == "https://ops-2"
+
+
+def test_graphql_client_invalidates_endpoint_when_ops_server_is_unreachable(monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT", "http://127.0.0.1:1")
+    monkeypatch.setenv("AGENT_STUDIO_OPS_GRAPHQL_RETRIES", "0")
+    with patch("studio.ops.invalidate_ops_endpoint_cache") as invalidate:
+        with pytest.raises(Exception):
+            ops.get_phoenix_ops_graphql_client().execute(gql("query { ok }"))
+    invalidate.assert_called_once()
+
+
+def test_graphql_client_is_shared_and_reuses_connections(graphql_server):
+    client = ops.get_phoenix_ops_graphql_client()
+    assert ops.get_phoenix_ops_graphql_client() is client
+
+    for _ in range(3):
+        assert client.execute(gql("query { ok }")) == {"ok": True}
+
+    assert len(GraphQLHandler.client_ports) == 3
+    assert len(set(GraphQLHandler.client_ports)) == 1
+    client.transport.shutdown()
+
+
+def test_graphql_client_retries_unavailable_server(graphql_server):
+    GraphQLHandler.failures = 2
+
+    assert ops.get_phoenix_ops_graphql_client().execute(gql("query { ok }")) == {"ok": True}
+    assert len(GraphQLHandler.client_ports) == 3
+    ops.get_phoenix_ops_graphql_client().transport.shutdown()
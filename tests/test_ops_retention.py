@@ -0,0 +1,120 @@
+import sqlite3
+import time
+from datetime import datetime, timezone
+
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+from studio.ops_retention import TraceRetentionPolicy, plan_trace_retention, run_trace_retention
+
+
+NOW = datetime(2025, 3, 27, tzinfo=timezone.utc)
+
+
+class FakeOpsClient:
+    """
+    Answers the ops server queries of the retention job from in-memory projects.
+    """
+
+    def __init__(self, projects: dict):
+        # Project name -> (total traces, total spans, traces before the cutoff, spans before the cutoff)
+        self.projects = projects
+        self.cleared = []
+
+    def execute(self, document, variable_values=None):
+        operation = document.definitions[0].name.value
+        if operation == "GetProjectsForTraceRetention":
+            return {
+                "projects": {
+                    "edges": [
+                        {"node": {"id": name, "name": name, "traceCount": counts[0], "recordCount": counts[1]}}
+                        for name, counts in self.projects.items()
+                    ]
+                }
+            }
+        if operation == "GetProjectTraceCountsBefore":
+            counts = self.projects[variable_values["id"]]
+            return {"node": {"traceCount": counts[2], "recordCount": counts[3]}}
+        if operation == "ClearProjectTraces":
+            self.cleared.append((variable_values["input"]["id"], variable_values["input"]["endTime"]))
+            return {"clearProject": {"__typename": "Query"}}
+        raise AssertionError(f"Unexpected operation {operation}")
+
+
+def make_client() -> FakeOpsClient:
+    return FakeOpsClient(
+        {
+            "Test Workflow - a": (10, 100, 8, 80),
+            "Test Workflow - b": (5, 50, 0, 0),
+            "Production Workflow": (20, 50, 10, 25),
+        }
+    )
+
+
+def test_policy_matches_projects_by_name_and_pattern():
+    policy = TraceRetentionPolicy(
+        default_max_age_days=30, project_max_age_days={"Test Workflow - *": 7, "Test Workflow - keep": 0}
+    )
+
+    assert policy.get_max_age_days("Test Workflow - a") == 7
+    assert policy.get_max_age_days("Test Workflow - keep") == 0
+    assert policy.get_max_age_days("Production Workflow") == 30
+    assert policy.is_enabled()
+    assert not TraceRetentionPolicy(project_max_age_days={"*": 0}).is_enabled()
+
+
+def test_plan_trace_retention_estimates_reclaimed_space(tmp_path):
+    database_path = tmp_path / "phoenix.db"
+    database_path.write_bytes(b"x" * 2000)
+    policy = TraceRetentionPolicy(project_max_age_days={"Test Workflow - *": 7})
+
+    report = plan_trace_retention(make_client(), policy, now=NOW, database_path=str(database_path))
+
+    assert [(p["projectName"], p["traceCount"], p["cutoff"]) for p in report["projects"]] == [
+        ("Test Workflow - a", 8, "2025-03-20T00:00:00+00:00")
+    ]
+    assert (report["traceCount"], report["spanCount"]) == (8, 80)
+    # 80 of the 200 spans of the database
+    assert report["estimatedReclaimedBytes"] == 800
+
+
+def test_run_trace_retention_dry_run_changes_nothing():
+    client = make_client()
+
+    report = run_trace_retention(client, TraceRetentionPolicy(default_max_age_days=7), dry_run=True)
+
+    assert report["dryRun"]
+    assert [p["projectName"] for p in report["projects"]] == ["Test Workflow - a", "Production Workflow"]
+    assert client.cleared == []
+
+
+def test_run_trace_retention_clears_projects_and_compacts(tmp_path):
+    database_path = str(tmp_path / "phoenix.db")
+    connection = sqlite3.connect(database_path)
+    connection.execute("CREATE TABLE spans (payload BLOB)")
+    connection.executemany("INSERT INTO spans VALUES (?)", [(b"x" * 4096,) for _ in range(100)])
+    connection.commit()
+    connection.execute("DELETE FROM spans")
+    connection.commit()
+    connection.close()
+    client = make_client()
+
+    report = run_trace_retention(client, TraceRetentionPolicy(default_max_age_days=7), database_path=database_path)
+
+    assert [project_id for project_id, _ in client.cleared] == ["Test Workflow - a", "Production Workflow"]
+    assert report["reclaimedBytes"] > 0
+
+
+def test_run_trace_retention_removes_cleared_traces_from_the_index():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    old, recent = time.time() - 30 * 86400, time.time()
+    with dao.get_session() as session:
+        session.add(db_model.WorkflowTrace(trace_id="1", project_id="Test Workflow - a", created_at=old))
+        session.add(db_model.WorkflowTrace(trace_id="2", project_id="Test Workflow - a", created_at=recent))
+        session.add(db_model.WorkflowTrace(trace_id="3", project_name="Production Workflow", created_at=old))
+        session.add(db_model.WorkflowTrace(trace_id="4", project_id="Test Workflow - b", created_at=old))
+
+    report = run_trace_retention(make_client(), TraceRetentionPolicy(default_max_age_days=7, compact=False), dao=dao)
+
+    assert report["removedIndexedTraces"] == 2
+    with dao.get_session() as session:
+        assert sorted(t.trace_id for t in session.query(db_model.WorkflowTrace)) == ["2", "4"]
@@ -0,0 +1,154 @@
+import os
+
+import pytest
+
+from studio.api import *
+from studio.cross_cutting.pagination import decode_page_token, encode_page_token
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+from studio.task.task import list_tasks
+from studio.tools.tool_instance import list_tool_instances
+from studio.tools.tool_template import list_tool_templates
+from studio.workflow.workflow import list_workflows
+
+
+TOOL_CODE = """
+from studio.tools.base import StudioBaseTool
+
+class ExampleTool(StudioBaseTool):
+    description: str = "An example tool"
+"""
+
+
+@pytest.fixture
+def dao():
+    return AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+
+def add_workflows(dao: AgentStudioDao, count: int) -> None:
+    with dao.get_session() as session:
+        for i in range(count):
+            session.add(db_model.Workflow(id=f"w{i}", name=f"Workflow {i}", directory=f"studio-data/workflows/w{i}"))
+
+
+def list_all_pages(list_fn, request, items_field: str, dao: AgentStudioDao) -> list:
+    pages = []
+    while True:
+        response = list_fn(request, cml=None, dao=dao)
+        pages.append(list(getattr(response, items_field)))
+        if not response.next_page_token:
+            return pages
+        request.page_token = response.next_page_token
+
+
+def test_page_tokens_round_trip():
+    assert decode_page_token(encode_page_token(42)) == 42
+    with pytest.raises(ValueError):
+        decode_page_token("not-a-token")
+
+
+def test_list_workflows_pages_in_insertion_order(dao):
+    add_workflows(dao, 5)
+
+    pages = list_all_pages(list_workflows, ListWorkflowsRequest(page_size=2), "workflows", dao)
+
+    assert [[w.workflow_id for w in page] for page in pages] == [["w0", "w1"], ["w2", "w3"], ["w4"]]
+    # Without a page size, everything is listed in one page.
+    response = list_workflows(ListWorkflowsRequest(), cml=None, dao=dao)
+    assert len(response.workflows) == 5
+    assert response.next_page_token == ""
+
+
+def test_pages_skip_removed_items(dao):
+    add_workflows(dao, 4)
+    first_page = list_workflows(ListWorkflowsRequest(page_size=2), cml=None, dao=dao)
+    with dao.get_session() as session:
+        session.query(db_model.Workflow).filter_by(id="w2").delete()
+
+    second_page = list_workflows(
+        ListWorkflowsRequest(page_size=2, page_token=first_page.next_page_token), cml=None, dao=dao
+    )
+
+    assert [w.workflow_id for w in second_page.workflows] == ["w3"]
+    assert second_page.next_page_token == ""
+
+
+def test_list_tasks_filters_by_workflow_and_applies_read_mask(dao):
+    add_workflows(dao, 2)
+    with dao.get_session() as session:
+        for i in range(4):
+            session.add(
+                db_model.Task(
+                    id=f"t{i}", workflow_id=f"w{i % 2}", description=f"Task {{topic}} {i}", assigned_agent_id="a1"
+                )
+            )
+
+    pages = list_all_pages(
+        list_tasks, ListTasksRequest(workflow_id="w1", page_size=1, read_mask=["task_id", "inputs"]), "tasks", dao
+    )
+
+    assert [[t.task_id for t in page] for page in pages] == [["t1"], ["t3"]]
+    task = pages[0][0]
+    assert list(task.inputs) == ["topic"]
+    assert task.workflow_id == "" and task.description == "" and not task.is_valid
+
+
+def test_read_mask_skips_reading_tool_code(dao, tmp_path):
+    add_workflows(dao, 1)
+    (tmp_path / "tool.py").write_text(TOOL_CODE)
+    (tmp_path / "requirements.txt").write_text("requests")
+    with dao.get_session() as session:
+        session.add(
+            db_model.ToolInstance(
+                id="ti1",
+                workflow_id="w0",
+                name="Example",
+                python_code_file_name="tool.py",
+                python_requirements_file_name="requirements.txt",
+                source_folder_path=str(tmp_path),
+                tool_image_path="",
+            )
+        )
+    full = list_tool_instances(ListToolInstancesRequest(workflow_id="w0"), cml=None, dao=dao)
+    assert full.tool_instances[0].python_code == TOOL_CODE
+
+    # The files aren't needed for the requested fields, so they aren't read at all.
+    os.remove(tmp_path / "tool.py")
+    masked = list_tool_instances(
+        ListToolInstancesRequest(workflow_id="w0", read_mask=["id", "name"]), cml=None, dao=dao
+    )
+
+    assert [(t.id, t.name, t.python_code, t.tool_metadata) for t in masked.tool_instances] == [
+        ("ti1", "Example", "", "")
+    ]
+    assert masked.ByteSize() < full.ByteSize()
+
+
+def test_list_tool_templates_filters_by_workflow_template_in_sql(dao):
+    with dao.get_session() as session:
+        session.add(db_model.WorkflowTemplate(id="wt1", name="Template"))
+        for i, workflow_template_id in enumerate([None, "wt1", None]):
+            session.add(
+                db_model.ToolTemplate(
+                    id=f"tt{i}",
+                    name=f"Tool {i}",
+                    workflow_template_id=workflow_template_id,
+                    source_folder_path="/missing",
+                    python_code_file_name="tool.py",
+                    python_requirements_file_name="requirements.txt",
+                    tool_image_path="",
+                )
+            )
+
+    response = list_tool_templates(
+        ListToolTemplatesRequest(workflow_template_id="wt1", read_mask=["id"]), cml=None, dao=dao
+    )
+
+    assert [t.id for t in response.templates] == ["tt1"]
+
+
+def test_invalid_page_token_and_read_mask_are_rejected(dao):
+    with pytest.raises(ValueError, match="Invalid page token"):
+        list_workflows(ListWorkflowsRequest(page_token="bogus"), cml=None, dao=dao)
+    with pytest.raises(ValueError, match="Unknown Workflow fields"):
+        list_workflows(ListWorkflowsRequest(read_mask=["workflow_id", "python_code"]), cml=None, dao=dao)
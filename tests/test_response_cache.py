@@ -0,0 +1,162 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from studio.api import *
+from studio.cross_cutting.response_cache import (
+    ResponseCache,
+    get_write_generation,
+    install_response_cache,
+    is_mutating_rpc,
+)
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+from studio.models.models import add_model, list_models
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer
+from studio.workflow.traces import record_workflow_trace
+from studio.workflow.workflow import list_workflows
+
+
+class ModelsServicer(AgentStudioServicer):
+    def __init__(self, dao):
+        self.dao = dao
+        self.list_calls = 0
+
+    def ListModels(self, request, context):
+        self.list_calls += 1
+        return list_models(request, dao=self.dao)
+
+    def AddModel(self, request, context):
+        return add_model(request, dao=self.dao)
+
+
+def add_db_model(dao: AgentStudioDao, model_id: str) -> None:
+    with dao.get_session() as session:
+        session.add(
+            db_model.Model(model_id=model_id, model_name=model_id, provider_model="gpt-4o", model_type="OPENAI")
+        )
+
+
+@pytest.fixture
+def servicer():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    add_db_model(dao, "m1")
+    servicer = ModelsServicer(dao)
+    install_response_cache(servicer, ResponseCache(ttl=60))
+    return servicer
+
+
+def test_repeated_reads_are_served_from_memory(servicer):
+    first = servicer.ListModels(ListModelsRequest(), MagicMock())
+    second = servicer.ListModels(ListModelsRequest(), MagicMock())
+
+    assert servicer.list_calls == 1
+    assert second == first
+    assert [m.model_id for m in second.model_details] == ["m1"]
+
+
+def test_mutating_rpcs_invalidate_cached_responses(servicer):
+    servicer.ListModels(ListModelsRequest(), MagicMock())
+    generation = get_write_generation()
+
+    servicer.AddModel(
+        AddModelRequest(model_name="m2", provider_model="gpt-4o", model_type="OPENAI", api_key="key"), MagicMock()
+    )
+    response = servicer.ListModels(ListModelsRequest(), MagicMock())
+
+    assert get_write_generation() > generation
+    assert servicer.list_calls == 2
+    assert sorted(m.model_name for m in response.model_details) == ["m1", "m2"]
+
+
+def test_database_writes_outside_rpcs_invalidate_cached_responses(servicer):
+    servicer.ListModels(ListModelsRequest(), MagicMock())
+
+    # Like a background task updating the database.
+    add_db_model(servicer.dao, "m3")
+    response = servicer.ListModels(ListModelsRequest(), MagicMock())
+
+    assert servicer.list_calls == 2
+    assert sorted(m.model_id for m in response.model_details) == ["m1", "m3"]
+
+    # Read-only sessions don't invalidate anything.
+    with servicer.dao.get_session() as session:
+        session.query(db_model.Model).all()
+    servicer.ListModels(ListModelsRequest(), MagicMock())
+    assert servicer.list_calls == 2
+
+
+class WorkflowsServicer(AgentStudioServicer):
+    def __init__(self, dao):
+        self.dao = dao
+        self.list_calls = 0
+
+    def ListWorkflows(self, request, context):
+        self.list_calls += 1
+        return list_workflows(request, cml=None, dao=self.dao)
+
+    def ResolveWorkflowTrace(self, request, context):
+        # Like a trace lookup of a run being polled, which writes the trace index.
+        record_workflow_trace(request.trace_id, request.project_name, dao=self.dao)
+        return ResolveWorkflowTraceResponse()
+
+
+def test_trace_lookups_do_not_invalidate_cached_responses():
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    servicer = WorkflowsServicer(dao)
+    install_response_cache(servicer, ResponseCache(ttl=60))
+    servicer.ListWorkflows(ListWorkflowsRequest(), MagicMock())
+    generation = get_write_generation()
+
+    servicer.ResolveWorkflowTrace(ResolveWorkflowTraceRequest(trace_id="abc", project_name="Test"), MagicMock())
+    servicer.ListWorkflows(ListWorkflowsRequest(), MagicMock())
+
+    assert get_write_generation() == generation
+    assert servicer.list_calls == 1
+    assert not is_mutating_rpc("ResolveWorkflowTrace")
+    assert not is_mutating_rpc("TestWorkflow")
+
+
+def test_cache_is_keyed_by_request_and_expires():
+    cache = ResponseCache(ttl=0.05, max_entries=2)
+    handler = MagicMock(side_effect=lambda request, context: ListToolInstancesResponse())
+    cached = cache.wrap_cached("ListToolInstances", handler)
+
+    cached(ListToolInstancesRequest(workflow_id="w1"), None)
+    cached(ListToolInstancesRequest(workflow_id="w2"), None)
+    cached(ListToolInstancesRequest(workflow_id="w1"), None)
+    assert handler.call_count == 2
+
+    # Least recently used entries are evicted.
+    cached(ListToolInstancesRequest(workflow_id="w3"), None)
+    cached(ListToolInstancesRequest(workflow_id="w2"), None)
+    assert handler.call_count == 4
+
+    cache.clear()
+    cached(ListToolInstancesRequest(workflow_id="w1"), None)
+    assert handler.call_count == 5
+
+
+def test_failed_reads_are_not_cached():
+    cache = ResponseCache(ttl=60)
+    handler = MagicMock(side_effect=[RuntimeError("database is locked"), ListWorkflowsResponse()])
+    cached = cache.wrap_cached("ListWorkflows", handler)
+
+    with pytest.raises(RuntimeError):
+        cached(ListWorkflowsRequest(), None)
+    cached(ListWorkflowsRequest(), None)
+    cached(ListWorkflowsRequest(), None)
+
+    assert handler.call_count == 2
+
+
+def test_mutating_rpcs_and_disabled_cache(monkeypatch):
+    assert is_mutating_rpc("AddWorkflow")
+    assert is_mutating_rpc("DeployWorkflow")
+    assert not is_mutating_rpc("ListWorkflows")
+    assert not is_mutating_rpc("HealthCheck")
+
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_RESPONSE_CACHE_TTL", "0")
+    servicer = AgentStudioServicer()
+    assert install_response_cache(servicer) is None
+    assert "ListModels" not in vars(servicer)
@@ -0,0 +1,121 @@
+from concurrent import futures
+import socket
+import threading
+import time
+
+import grpc
+import pytest
+
+from studio.api import *
+from studio.cross_cutting.rpc_classes import (
+    EVENT_STREAM,
+    FAST_READ,
+    FILE_TRANSFER,
+    LONG_RUNNING,
+    WATCH,
+    WRITE,
+    RpcClass,
+    RpcClassServerInterceptor,
+    get_rpc_class_name,
+    get_rpc_classes,
+    get_rpc_method_classes,
+    get_thread_server_workers,
+)
+from studio.proto import agent_studio_pb2_grpc
+from studio.proto.agent_studio_pb2_grpc import AgentStudioServicer, AgentStudioStub
+
+
+def test_rpc_routing():
+    assert get_rpc_class_name("ListWorkflows") == FAST_READ
+    assert get_rpc_class_name("GetAgent") == FAST_READ
+    assert get_rpc_class_name("HealthCheck") == FAST_READ
+    assert get_rpc_class_name("AddWorkflow") == WRITE
+    assert get_rpc_class_name("SetStudioDefaultModel") == WRITE
+    assert get_rpc_class_name("TestModel") == LONG_RUNNING
+    assert get_rpc_class_name("ListDeployedWorkflows") == LONG_RUNNING
+    assert get_rpc_class_name("DownloadTemporaryFile") == FILE_TRANSFER
+    assert get_rpc_class_name("WatchWorkflows") == WATCH
+    # Long-lived event streams and polled trace lookups don't take the slots of
+    # deploys and model tests.
+    assert get_rpc_class_name("StreamWorkflowEvents") == EVENT_STREAM
+    assert get_rpc_class_name("ResolveWorkflowTrace") == FAST_READ
+    assert not {"StreamWorkflowEvents", "ResolveWorkflowTrace"} & {
+        method for method, rpc_class in get_rpc_method_classes().items() if rpc_class.name == LONG_RUNNING
+    }
+    # Every method of the service has a class.
+    assert {rpc_class.name for rpc_class in get_rpc_method_classes().values()} == {
+        FAST_READ,
+        WRITE,
+        LONG_RUNNING,
+        FILE_TRANSFER,
+        WATCH,
+        EVENT_STREAM,
+    }
+
+
+def test_rpc_classes_from_env(monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_LONG_RUNNING_CONCURRENCY", "3")
+    monkeypatch.setenv("AGENT_STUDIO_GRPC_LONG_RUNNING_TIMEOUT", "1.5")
+
+    rpc_classes = get_rpc_classes()
+
+    assert rpc_classes[LONG_RUNNING] == RpcClass(name=LONG_RUNNING, concurrency=3, timeout=1.5)
+    assert rpc_classes[FAST_READ].concurrency == 8
+    assert get_thread_server_workers(rpc_classes) == 2 * (8 + 4 + 3 + 4 + 16 + 16)
+
+
+class BlockingServicer(AgentStudioServicer):
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Semaphore(0)
+
+    def HealthCheck(self, request, context):
+        return HealthCheckResponse(message="Studio is healthy")
+
+    def TestModel(self, request, context):
+        self.started.release()
+        self.release.wait(10)
+        return TestModelResponse(response="done")
+
+
+@pytest.fixture
+def thread_server():
+    rpc_classes = {name: RpcClass(name=name, concurrency=2, timeout=0.2) for name in get_rpc_classes()}
+    servicer = BlockingServicer()
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=get_thread_server_workers(rpc_classes)),
+        interceptors=[RpcClassServerInterceptor(rpc_classes)],
+    )
+    agent_studio_pb2_grpc.add_AgentStudioServicer_to_server(servicer, server)
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server.add_insecure_port(f"localhost:{port}")
+    server.start()
+    channel = grpc.insecure_channel(f"localhost:{port}")
+    yield servicer, AgentStudioStub(channel)
+    servicer.release.set()
+    channel.close()
+    server.stop(None)
+
+
+def test_interceptor_limits_each_class_separately(thread_server):
+    servicer, stub = thread_server
+
+    # Two calls run, two more wait for a slot and the fifth is rejected.
+    slow_calls = [stub.TestModel.future(TestModelRequest()) for _ in range(5)]
+    assert servicer.started.acquire(timeout=5) and servicer.started.acquire(timeout=5)
+
+    # The long-running class being full doesn't affect other classes.
+    assert stub.HealthCheck(HealthCheckRequest(), timeout=5).message == "Studio is healthy"
+
+    # Waiting calls give up after the class timeout.
+    deadline = time.monotonic() + 5
+    while sum(call.done() for call in slow_calls) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    failed = [call for call in slow_calls if call.done()]
+    assert [call.code() for call in failed] == [grpc.StatusCode.RESOURCE_EXHAUSTED] * 3
+
+    servicer.release.set()
+    assert [call.result(timeout=5).response for call in slow_calls if call not in failed] == ["done"] * 2
+    assert stub.TestModel(TestModelRequest(), timeout=5).response == "done"
@@ -0,0 +1,118 @@
+import asyncio
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from studio.api import *
+from studio.sdk.async_workflows import AsyncWorkflowClient
+from studio.sdk.workflows import WorkflowClient
+from tests.test_sdk_workflows import make_studio
+
+
+class KickoffHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))["request"]
+        inputs = json.loads(base64.b64decode(request["kickoff_inputs"]))
+        body = json.dumps({"success": True, "response": {"trace_id": f"trace-{inputs['topic']}"}}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeAsyncStub:
+    def __init__(self):
+        self.recorded = []
+
+    async def ResolveWorkflowTrace(self, request):
+        if request.project_name:
+            self.recorded.append(request.trace_id)
+            return ResolveWorkflowTraceResponse()
+        return ResolveWorkflowTraceResponse(project_id="p1", global_trace_id=f"global-{request.trace_id}")
+
+
+@pytest.fixture
+def model_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KickoffHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(model_endpoint: str) -> AsyncWorkflowClient:
+    workflow_client = WorkflowClient(studio=make_studio())
+    workflow_client.get_deployed_workflow_endpoint = lambda deployed_workflow: model_endpoint
+    client = AsyncWorkflowClient(workflow_client=workflow_client)
+    client._stub = FakeAsyncStub()
+    return client
+
+
+def event(name: str, **attributes) -> dict:
+    return {"id": name, "name": name, "attributes": attributes, "events": []}
+
+
+def test_run_and_wait_polls_until_complete(model_server):
+    polls = [
+        {"events": [], "cursor": None},
+        {"events": [event("Crew.kickoff")], "cursor": "c1"},
+        {"events": [], "cursor": "c1"},
+        {"events": [event("Crew.complete", crew_output="done")], "cursor": "c2"},
+    ]
+    get_crew_events = MagicMock(side_effect=lambda client, run_id, trace_info, since=None: polls.pop(0))
+    new_events = []
+
+    async def run():
+        async with make_client(model_server) as client:
+            status = await client.run_and_wait(
+                "Research", inputs={"topic": "a"}, poll_interval=0.01, on_events=new_events.extend
+            )
+            return client, status
+
+    with (
+        patch("studio.sdk.async_workflows.get_crew_events", get_crew_events),
+        patch("studio.sdk.async_workflows.get_phoenix_ops_graphql_client"),
+    ):
+        client, status = asyncio.run(run())
+
+    assert status["run_id"] == "trace-a"
+    assert client._stub.recorded == [status["run_id"]]
+    assert (status["complete"], status["output"]) == (True, "done")
+    assert [e["name"] for e in status["events"]] == ["Crew.kickoff", "Crew.complete"]
+    assert [e["name"] for e in new_events] == ["Crew.kickoff", "Crew.complete"]
+    assert [call.kwargs["since"] for call in get_crew_events.call_args_list] == [None, None, "c1", "c1"]
+
+
+def test_run_and_wait_runs_concurrently_and_times_out(model_server):
+    def get_crew_events(client, run_id, trace_info, since=None):
+        if "never" in run_id:
+            return {"events": [], "cursor": None}
+        return {"events": [event("Crew.complete", crew_output=run_id)], "cursor": "c"}
+
+    async def run():
+        async with make_client(model_server) as client:
+            results = await asyncio.gather(
+                *(client.run_and_wait("Research", inputs={"topic": str(i)}, poll_interval=0.01) for i in range(10))
+            )
+            with pytest.raises(asyncio.TimeoutError):
+                await client.run_and_wait("Research", inputs={"topic": "never"}, timeout=0.05, poll_interval=0.01)
+            return results
+
+    with (
+        patch("studio.sdk.async_workflows.get_crew_events", get_crew_events),
+        patch("studio.sdk.async_workflows.get_phoenix_ops_graphql_client"),
+    ):
+        results = asyncio.run(run())
+
+    assert len({result["run_id"] for result in results}) == 10
+    assert all(result["output"] == result["run_id"] for result in results)
@@ -0,0 +1,131 @@
+import base64
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from studio.api import *
+from studio.sdk.utils import TTLCache, get_deployed_workflow_endpoint
+import studio.sdk.workflows as workflows
+from studio.sdk.workflows import WorkflowClient, run_workflow, run_workflow_batch
+
+
+def make_studio() -> MagicMock:
+    studio = MagicMock()
+    studio.stub.ListWorkflows.return_value = ListWorkflowsResponse(
+        workflows=[
+            Workflow(
+                workflow_id="w1",
+                name="Research",
+                crew_ai_workflow_metadata=CrewAIWorkflowMetadata(task_id=["t1"]),
+            )
+        ]
+    )
+    studio.stub.GetTask.return_value = GetTaskResponse(task=CrewAITaskMetadata(task_id="t1", inputs=["topic"]))
+    studio.stub.ListDeployedWorkflows.return_value = ListDeployedWorkflowsResponse(
+        deployed_workflows=[
+            DeployedWorkflow(workflow_id="w1", deployed_workflow_name="research", cml_deployed_model_id="m1")
+        ]
+    )
+    return studio
+
+
+def kickoff_response(request, *args, json: dict = None, **kwargs):
+    inputs = base64.b64decode(json["request"]["kickoff_inputs"]).decode("utf-8")
+    if "fail" in inputs:
+        return SimpleNamespace(json=lambda: {"success": False})
+    return SimpleNamespace(json=lambda: {"success": True, "response": {"trace_id": f"trace-{inputs}"}})
+
+
+@pytest.fixture
+def studio():
+    studio = make_studio()
+    workflows._workflow_client = None
+    with (
+        patch("studio.sdk.workflows.AgentStudioClient", return_value=studio),
+        patch("studio.sdk.workflows.get_deployed_workflow_endpoint", return_value="https://model"),
+        patch("requests.Session.post", autospec=True, side_effect=kickoff_response),
+    ):
+        yield studio
+    workflows._workflow_client = None
+
+
+def test_run_workflow(studio):
+    run_id = run_workflow("Research", inputs={"topic": "a"})
+
+    assert run_id == f"trace-{json.dumps({'topic': 'a'})}"
+    studio.stub.ResolveWorkflowTrace.assert_called_once()
+    with pytest.raises(ValueError):
+        run_workflow("Research", inputs={"unknown": "a"})
+
+
+def test_run_workflow_batch_resolves_workflow_once(studio):
+    inputs_list = [{"topic": str(i)} for i in range(20)] + [{"topic": "fail"}, {"unknown": "a"}]
+
+    results = run_workflow_batch("Research", inputs_list=inputs_list, concurrency=4)
+
+    assert [result["run_id"] for result in results[:20]] == [
+        f"trace-{json.dumps(inputs)}" for inputs in inputs_list[:20]
+    ]
+    assert all(result["error"] is None for result in results[:20])
+    assert [result["run_id"] for result in results[20:]] == [None, None]
+    assert "unable to kick off" in results[20]["error"]
+    assert "not one of the workflow's inputs" in results[21]["error"]
+    assert studio.stub.ListWorkflows.call_count == 1
+    assert studio.stub.GetTask.call_count == 1
+    assert studio.stub.ListDeployedWorkflows.call_count == 1
+    assert studio.stub.ResolveWorkflowTrace.call_count == 20
+
+
+def test_run_workflow_batch_validates_arguments(studio):
+    with pytest.raises(ValueError):
+        run_workflow_batch("Research", inputs_list=[{"topic": "a"}], session_ids=[])
+    with pytest.raises(ValueError):
+        run_workflow_batch("Research", inputs_list=[{"topic": "a"}], concurrency=0)
+    assert run_workflow_batch("Research", inputs_list=[]) == []
+
+
+def test_workflow_client_caches_lookups_until_refresh(studio):
+    client = WorkflowClient(studio=studio, cache_ttl=300)
+
+    client.run_workflow("Research", inputs={"topic": "a"})
+    client.run_workflow(workflow_id="w1", inputs={"topic": "b"})
+    assert studio.stub.ListWorkflows.call_count == 1
+    assert studio.stub.GetTask.call_count == 1
+    assert studio.stub.ListDeployedWorkflows.call_count == 1
+
+    client.refresh()
+    client.run_workflow("Research", inputs={"topic": "c"})
+    assert studio.stub.ListWorkflows.call_count == 2
+
+    client = WorkflowClient(studio=studio, cache_ttl=0)
+    client.run_workflow("Research", inputs={"topic": "a"})
+    client.run_workflow("Research", inputs={"topic": "a"})
+    assert studio.stub.ListWorkflows.call_count == 4
+
+
+def test_ttl_cache_does_not_cache_failed_lookups():
+    cache = TTLCache(300)
+    load = MagicMock(side_effect=[None, "value", "other"])
+
+    assert cache.get("key", load) is None
+    assert cache.get("key", load) == "value"
+    assert cache.get("key", load) == "value"
+    assert load.call_count == 2
+
+
+def test_get_deployed_workflow_endpoint_gets_model_by_id(monkeypatch):
+    monkeypatch.setenv("CDSW_DOMAIN", "ml.example.com")
+    monkeypatch.setenv("CDSW_PROJECT_ID", "p1")
+    http = MagicMock()
+    http.get.return_value = SimpleNamespace(
+        status_code=200, raise_for_status=lambda: None, json=lambda: {"id": "m1", "access_key": "key1"}
+    )
+
+    endpoint = get_deployed_workflow_endpoint(DeployedWorkflow(cml_deployed_model_id="m1"), http=http)
+
+    assert endpoint == "https://modelservice.ml.example.com/model?accessKey=key1"
+    assert http.get.call_args.args[0] == "https://ml.example.com/api/v2/projects/p1/models/m1"
+    http.get.return_value = SimpleNamespace(status_code=404)
+    assert get_deployed_workflow_endpoint(DeployedWorkflow(cml_deployed_model_id="m2"), http=http) is None
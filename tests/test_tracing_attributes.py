@@ -0,0 +1,142 @@
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+
+import json
+from types import SimpleNamespace
+
+import engine.crewai.tracing as tracing
+
+
+class FakeToolUsage:
+    def _use(self, tool_string, tool, calling):
+        return "output"
+
+
+def make_crew(goal: str = "goal") -> SimpleNamespace:
+    tool = SimpleNamespace(name="Search Tool")
+    agent = SimpleNamespace(
+        key="agent",
+        id="agent",
+        role="Agent",
+        goal=goal,
+        backstory="backstory",
+        verbose=False,
+        max_iter=20,
+        max_rpm=None,
+        i18n=SimpleNamespace(prompt_file=None),
+        allow_delegation=False,
+        tools=[tool],
+    )
+    task = SimpleNamespace(
+        id="task",
+        description="description",
+        expected_output="expected output",
+        async_execution=False,
+        human_input=False,
+        agent=agent,
+        context=None,
+        tools=[tool],
+    )
+    return SimpleNamespace(key=f"crew-{goal}", id="crew", agents=[agent], tasks=[task])
+
+
+def test_truncate_attribute():
+    assert tracing._truncate_attribute("short", max_length=10) == "short"
+    assert tracing._truncate_attribute(None, max_length=10) is None
+    assert tracing._truncate_attribute("a" * 20, max_length=0) == "a" * 20
+
+    truncated = tracing._truncate_attribute("a" * 20, max_length=10)
+    assert truncated.startswith("a" * 10 + "... [truncated 20 characters, sha256:")
+    assert truncated == tracing._truncate_attribute("a" * 20, max_length=10)
+
+
+def test_get_input_value_binds_bound_methods_and_caches_signatures():
+    tracing._get_cached_signature.cache_clear()
+    tool_usage = FakeToolUsage()
+
+    for _ in range(3):
+        input_value = tracing._get_input_value(tool_usage._use, "string", tool="t", calling={"a": 1})
+
+    assert json.loads(input_value) == {"tool_string": "string", "tool": "t", "calling": {"a": 1}}
+    assert tracing._get_cached_signature.cache_info().hits == 2
+
+
+def test_get_input_value_truncates_arguments_to_valid_json(monkeypatch):
+    monkeypatch.setattr(tracing, "MAX_ATTRIBUTE_LENGTH", 50)
+
+    input_value = tracing._get_input_value(FakeToolUsage()._use, "s" * 100, tool="t", calling={"a": "b" * 100})
+
+    arguments = json.loads(input_value)
+    assert arguments["tool"] == "t"
+    assert arguments["tool_string"].startswith("s" * 50 + "... [truncated 100 characters")
+    assert arguments["calling"].startswith('{"a": "' + "b" * 43 + "... [truncated")
+
+
+def test_crew_metadata_is_reported_once_per_revision():
+    tracing._reported_crew_revisions.clear()
+    crew = make_crew()
+    revision = tracing._get_crew_revision(crew)
+
+    assert tracing._should_report_crew_metadata(revision)
+    assert not tracing._should_report_crew_metadata(tracing._get_crew_revision(make_crew()))
+
+    changed_revision = tracing._get_crew_revision(make_crew(goal="other goal"))
+    assert changed_revision != revision
+    assert tracing._should_report_crew_metadata(changed_revision)
+
+    crew_tasks = json.loads(tracing._get_crew_metadata(crew)["crew_tasks"])
+    assert crew_tasks[0]["tools_names"] == ["search tool"]
+
+
+def test_get_crew_agent_usage():
+    usage_metrics = SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15, successful_requests=2)
+    crew = make_crew()
+    crew.agents[0].agent_studio_id = "a1"
+    crew.agents[0].llm = SimpleNamespace(model="gpt-4o")
+    crew.agents[0]._token_process = SimpleNamespace(get_summary=lambda: usage_metrics)
+    crew.manager_agent = SimpleNamespace(role="Manager")
+
+    assert tracing._get_crew_agent_usage(crew) == [
+        {
+            "agent_studio_id": "a1",
+            "agent_role": "Agent",
+            "model": "gpt-4o",
+            "prompt_tokens": 10,
+            "completion_tokens": 5,
+            "total_tokens": 15,
+            "successful_requests": 2,
+        }
+    ]
+
+
+def test_crew_complete_span_carries_agent_usage(monkeypatch):
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    published = []
+    monkeypatch.setattr(tracing, "flush_phoenix_ops_traces", lambda: None)
+    monkeypatch.setattr(
+        tracing, "publish_workflow_event", lambda name, attributes=None, **kwargs: published.append(name)
+    )
+    usage_metrics = SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15, successful_requests=2)
+    crew = make_crew("complete")
+    crew.agents[0].agent_studio_id = "a1"
+    crew.agents[0].llm = SimpleNamespace(model="gpt-4o")
+    crew.agents[0]._token_process = SimpleNamespace(get_summary=lambda: usage_metrics)
+    crew.usage_metrics = usage_metrics
+    crew_output = SimpleNamespace(raw="done", to_dict=lambda: {})
+
+    wrapper = tracing._KickoffWrapper(tracer_provider.get_tracer("test"))
+    assert wrapper(lambda inputs: crew_output, crew, (), {"inputs": {}}) is crew_output
+
+    (complete_span,) = [span for span in exporter.get_finished_spans() if span.name == "Crew.complete"]
+    assert json.loads(complete_span.attributes["agent_usage"]) == tracing._get_crew_agent_usage(crew)
+    assert complete_span.attributes[tracing.LLM_TOKEN_COUNT_PROMPT] == 10
+    assert complete_span.attributes[tracing.LLM_TOKEN_COUNT_COMPLETION] == 5
+    assert complete_span.attributes[tracing.LLM_TOKEN_COUNT_TOTAL] == 15
+    assert published == ["Crew.kickoff", "Crew.complete"]
@@ -0,0 +1,152 @@
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+
+import pytest
+from unittest.mock import patch
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+import engine.ops as ops
+import engine.crewai.tracing as tracing
+
+
+@pytest.fixture(autouse=True)
+def ops_endpoint(monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_OPS_ENDPOINT", "http://127.0.0.1:1")
+    ops._tracer_providers.clear()
+    yield
+    for tracer_provider in ops._tracer_providers.values():
+        tracer_provider.shutdown()
+    ops._tracer_providers.clear()
+
+
+def test_span_export_config_from_environment(monkeypatch):
+    monkeypatch.setenv("AGENT_STUDIO_TRACING_MAX_QUEUE_SIZE", "100")
+    monkeypatch.setenv("AGENT_STUDIO_TRACING_COMPRESSION", "gzip")
+
+    config = ops.get_span_export_config()
+
+    assert config.span_processor == "batch"
+    assert config.max_queue_size == 100
+    assert config.compression == "gzip"
+
+
+def test_batch_tracer_provider_is_configured_and_reused():
+    config = ops.SpanExportConfig(max_queue_size=10, max_export_batch_size=50, compression="gzip")
+
+    tracer_provider = ops.get_phoenix_ops_tracer_provider("wf", config)
+
+    span_processors = tracer_provider._active_span_processor._span_processors
+    assert len(span_processors) == 1
+    assert isinstance(span_processors[0], BatchSpanProcessor)
+    assert tracer_provider.resource.attributes["openinference.project.name"] == "wf"
+    assert ops.get_phoenix_ops_tracer_provider("wf", config) is tracer_provider
+    assert ops.get_phoenix_ops_tracer_provider("other", config) is not tracer_provider
+
+
+@patch("engine.ops.register")
+def test_simple_span_processor_uses_phoenix_register(mock_register):
+    tracer_provider = ops.get_phoenix_ops_tracer_provider("wf", ops.SpanExportConfig(span_processor="simple"))
+
+    assert tracer_provider is mock_register.return_value
+    assert mock_register.call_args.kwargs["endpoint"] == "http://127.0.0.1:1/v1/traces"
+    assert ops._tracer_providers == {}
+
+
+def test_flush_phoenix_ops_traces_flushes_providers():
+    tracer_provider = ops.get_phoenix_ops_tracer_provider("wf", ops.SpanExportConfig())
+    with patch.object(tracer_provider, "force_flush", side_effect=RuntimeError("down")) as mock_flush:
+        ops.flush_phoenix_ops_traces(timeout_millis=10)
+    mock_flush.assert_called_once_with(10)
+
+
+def record_workflow_spans(tracing_config, trace_count: int = 1) -> list:
+    """
+    Record a root span, a crew kickoff, an agent task and an LLM call for each of a
+    number of traces, and return the names of the exported spans.
+    """
+    span_exporter = InMemorySpanExporter()
+    tracer_provider = TracerProvider(sampler=tracing.WorkflowTracingSampler(tracing_config))
+    tracer_provider.add_span_processor(SimpleSpanProcessor(span_exporter))
+    tracer = tracer_provider.get_tracer("test")
+    for _ in range(trace_count):
+        with tracer.start_as_current_span("Workflow Run"):
+            with tracer.start_as_current_span("Crew.kickoff"):
+                with tracer.start_as_current_span("Agent._start_task"):
+                    with tracer.start_as_current_span(
+                        "completion", attributes={tracing.OPENINFERENCE_SPAN_KIND: "LLM"}
+                    ):
+                        pass
+    return [span.name for span in span_exporter.get_finished_spans()]
+
+
+def test_tracing_config_from_environment(monkeypatch):
+    assert tracing.get_tracing_config() == tracing.TracingConfig(level="full", sample_rate=1.0)
+
+    monkeypatch.setenv("AGENT_STUDIO_TRACING_LEVEL", "tasks")
+    monkeypatch.setenv("AGENT_STUDIO_TRACING_SAMPLE_RATE", "0.25")
+    assert tracing.get_tracing_config() == tracing.TracingConfig(level="tasks", sample_rate=0.25)
+
+
+def test_workflow_tracing_sampler_levels():
+    full = record_workflow_spans(tracing.TracingConfig(level="full"))
+    assert full == ["completion", "Agent._start_task", "Crew.kickoff", "Workflow Run"]
+
+    tasks = record_workflow_spans(tracing.TracingConfig(level="tasks"))
+    assert tasks == ["Agent._start_task", "Crew.kickoff", "Workflow Run"]
+
+    run = record_workflow_spans(tracing.TracingConfig(level="run"))
+    assert run == ["Crew.kickoff", "Workflow Run"]
+
+    assert record_workflow_spans(tracing.TracingConfig(level="off")) == []
+
+
+def test_workflow_tracing_sampler_samples_detail_by_trace():
+    unsampled = record_workflow_spans(tracing.TracingConfig(level="full", sample_rate=0.0), trace_count=5)
+    assert unsampled == ["Crew.kickoff", "Workflow Run"] * 5
+
+    sampled = record_workflow_spans(tracing.TracingConfig(level="full", sample_rate=0.5), trace_count=200)
+    # Detailed spans are sampled per trace, so a trace has either all or none of them.
+    assert 0 < sampled.count("completion") < 200
+    assert sampled.count("completion") == sampled.count("Agent._start_task")
+    assert sampled.count("Workflow Run") == 200
+
+
+def test_tracer_providers_are_cached_per_sampler():
+    config = ops.SpanExportConfig()
+    run_sampler = tracing.WorkflowTracingSampler(tracing.TracingConfig(level="run"))
+
+    tracer_provider = ops.get_phoenix_ops_tracer_provider("wf", config, sampler=run_sampler)
+
+    assert tracer_provider.sampler is run_sampler
+    assert (
+        ops.get_phoenix_ops_tracer_provider(
+            "wf", config, sampler=tracing.WorkflowTracingSampler(tracing.TracingConfig(level="run"))
+        )
+        is tracer_provider
+    )
+    assert (
+        ops.get_phoenix_ops_tracer_provider(
+            "wf", config, sampler=tracing.WorkflowTracingSampler(tracing.TracingConfig(level="full"))
+        )
+        is not tracer_provider
+    )
+
+
+@patch("engine.crewai.tracing.LiteLLMInstrumentor")
+@patch("engine.crewai.tracing.crewaiinst.CrewAIInstrumentor")
+@patch("engine.crewai.tracing.get_phoenix_ops_tracer_provider")
+def test_instrument_crewai_workflow_skips_llm_instrumentation_below_full(
+    mock_get_provider, mock_crewai_instrumentor, mock_litellm_instrumentor
+):
+    tracing.instrument_crewai_workflow("wf", tracing.TracingConfig(level="tasks", sample_rate=0.1))
+
+    mock_crewai_instrumentor.return_value.instrument.assert_called_once()
+    mock_litellm_instrumentor.return_value.instrument.assert_not_called()
+    sampler = mock_get_provider.call_args.kwargs["sampler"]
+    assert sampler.get_description() == "WorkflowTracingSampler{level=tasks,sample_rate=0.1}"
+
+    tracing.instrument_crewai_workflow("wf", tracing.TracingConfig())
+    mock_litellm_instrumentor.return_value.instrument.assert_called_once()
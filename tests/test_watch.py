@@ -0,0 +1,131 @@
+import threading
+
+import pytest
+
+from studio import consts
+from studio.api import *
+from studio.cross_cutting.change_log import CREATED, DELETED, UPDATED, ChangeLog, EntityChange, get_change_log
+from studio.cross_cutting.watch import HEARTBEAT, RESET, SYNC, watch_deployed_workflows, watch_workflows
+from studio.db import model as db_model
+from studio.db.dao import AgentStudioDao
+
+
+@pytest.fixture
+def dao():
+    return AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+
+def add_workflow(dao: AgentStudioDao, workflow_id: str, name: str = "Research") -> None:
+    with dao.get_session() as session:
+        session.add(db_model.Workflow(id=workflow_id, name=name, directory=f"studio-data/workflows/{workflow_id}"))
+
+
+def change(change_type: str, entity_id: str) -> EntityChange:
+    return EntityChange(0, change_type, "agent", entity_id, "w1")
+
+
+def test_change_log_merges_and_bounds_changes():
+    change_log = ChangeLog(max_changes=3)
+
+    change_log.append([change(CREATED, "a1"), change(UPDATED, "a1"), change(UPDATED, "a2")])
+    assert [(c.sequence, c.change_type, c.entity_id) for c in change_log.wait_for_changes(0, timeout=0)] == [
+        (1, CREATED, "a1"),
+        (2, UPDATED, "a2"),
+    ]
+
+    change_log.append([change(UPDATED, "a1"), change(DELETED, "a1")])
+    assert [(c.sequence, c.change_type) for c in change_log.wait_for_changes(2, timeout=0)] == [(3, DELETED)]
+    assert change_log.wait_for_changes(3, timeout=0) == []
+
+    change_log.append([change(UPDATED, "a2"), change(UPDATED, "a3")])
+    assert change_log.get_sequence() == 5
+    assert change_log.has_changes_since(2)
+    assert not change_log.has_changes_since(1)
+    assert not change_log.has_changes_since(6)
+
+
+def test_change_log_wakes_up_waiting_watchers():
+    change_log = ChangeLog()
+    changes = []
+    watcher = threading.Thread(target=lambda: changes.extend(change_log.wait_for_changes(0, timeout=5)))
+    watcher.start()
+
+    change_log.append([change(CREATED, "a1")])
+    watcher.join(timeout=5)
+
+    assert [c.entity_id for c in changes] == ["a1"]
+
+
+def test_dao_sessions_publish_committed_changes(dao):
+    since = get_change_log().get_sequence()
+
+    add_workflow(dao, "w1")
+    with dao.get_session() as session:
+        session.add(db_model.Agent(id="a1", workflow_id="w1", name="Researcher"))
+        session.query(db_model.Workflow).filter_by(id="w1").one().name = "Research v2"
+    with pytest.raises(ValueError):
+        with dao.get_session() as session:
+            session.add(db_model.Agent(id="a2", workflow_id="w1", name="Writer"))
+            session.flush()
+            raise ValueError("rolled back")
+    with dao.get_session() as session:
+        session.delete(session.query(db_model.Agent).filter_by(id="a1").one())
+
+    changes = get_change_log().wait_for_changes(since, timeout=0)
+    assert [(c.change_type, c.entity_type, c.entity_id, c.workflow_id) for c in changes] == [
+        (CREATED, "workflow", "w1", "w1"),
+        (CREATED, "agent", "a1", "w1"),
+        (UPDATED, "workflow", "w1", "w1"),
+        (DELETED, "agent", "a1", "w1"),
+    ]
+
+
+def test_watch_streams_changes_of_one_entity_type(dao, monkeypatch):
+    monkeypatch.setattr(consts, "WATCH_HEARTBEAT_SECONDS", 0.05)
+    stream = watch_workflows(WatchRequest(), dao=dao)
+
+    sync = next(stream)
+    assert sync.change_type == SYNC
+    assert sync.change_log_id == get_change_log().id
+
+    add_workflow(dao, "w1")
+    with dao.get_session() as session:
+        session.add(db_model.Agent(id="a1", workflow_id="w1", name="Researcher"))
+        session.query(db_model.Workflow).filter_by(id="w1").one().name = "Research v2"
+
+    # The two changes of the workflow are merged when they're caught up on at once.
+    event = next(stream)
+    assert (event.change_type, event.entity_type, event.entity_id) == (CREATED, "workflow", "w1")
+    assert event.workflow.name == "Research v2"
+
+    assert next(stream).change_type == HEARTBEAT
+
+    with dao.get_session() as session:
+        session.delete(session.query(db_model.Agent).filter_by(id="a1").one())
+        session.delete(session.query(db_model.Workflow).filter_by(id="w1").one())
+    event = next(stream)
+    assert (event.change_type, event.entity_id, event.HasField("workflow")) == (DELETED, "w1", False)
+    stream.close()
+
+
+def test_watch_resumes_or_resets(dao, monkeypatch):
+    monkeypatch.setattr(consts, "WATCH_HEARTBEAT_SECONDS", 0.05)
+    change_log = get_change_log()
+    since = change_log.get_sequence()
+    add_workflow(dao, "w1")
+    with dao.get_session() as session:
+        session.add(db_model.DeployedWorkflowInstance(id="d1", name="research", workflow_id="w1"))
+
+    resumed = watch_deployed_workflows(WatchRequest(since_sequence=since, change_log_id=change_log.id), dao=dao)
+    event = next(resumed)
+    assert (event.change_type, event.entity_id) == (CREATED, "d1")
+    assert (event.deployed_workflow.workflow_name, event.deployed_workflow.deployed_workflow_name) == (
+        "Research",
+        "research",
+    )
+
+    # A sequence number of another server process.
+    restarted = watch_deployed_workflows(WatchRequest(since_sequence=since, change_log_id="previous"), dao=dao)
+    event = next(restarted)
+    assert (event.change_type, event.sequence) == (RESET, change_log.get_sequence())
+    assert next(restarted).change_type == HEARTBEAT
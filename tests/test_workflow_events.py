@@ -0,0 +1,178 @@
+from http.client import HTTPConnection
+from uuid import uuid4
+import json
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+
+from opentelemetry.sdk.trace import TracerProvider
+
+from engine.events import WorkflowEventBus, _unflatten, is_terminal_event, get_event_bus, publish_workflow_event
+from engine.entry.streaming import format_sse_event, start_workflow_streaming_server
+
+
+def test_unflatten_nests_dotted_keys():
+    assert _unflatten({"task.description": "d", "task.expected_output": "o", "agent_studio_id": "a", "x": None}) == {
+        "task": {"description": "d", "expected_output": "o"},
+        "agent_studio_id": "a",
+    }
+
+
+def test_event_bus_replays_history_to_late_subscribers():
+    bus = WorkflowEventBus()
+    bus.publish("t1", {"name": "Agent._start_task"})
+    subscriber = bus.subscribe("t1", replay=True)
+    bus.publish("t1", {"name": "Crew.complete"})
+    bus.publish("t2", {"name": "Crew.complete"})
+    assert subscriber.get_nowait()["name"] == "Agent._start_task"
+    assert subscriber.get_nowait()["name"] == "Crew.complete"
+    assert subscriber.empty()
+    bus.unsubscribe("t1", subscriber)
+    bus.publish("t1", {"name": "Crew.error"})
+    assert subscriber.empty()
+
+
+def test_event_bus_get_events_with_cursor():
+    bus = WorkflowEventBus()
+    for i in range(3):
+        bus.publish("t1", {"name": f"e{i}"})
+    assert [e["name"] for e in bus.get_events("t1", 1)] == ["e1", "e2"]
+    assert bus.get_events("missing") == []
+
+
+def test_event_bus_evicts_oldest_traces():
+    bus = WorkflowEventBus(max_traces=2)
+    for trace_id in ["t1", "t2", "t3"]:
+        bus.publish(trace_id, {"name": "e"})
+    assert bus.get_events("t1") == []
+    assert len(bus.get_events("t3")) == 1
+
+
+def test_event_bus_keeps_terminal_events_past_the_cap():
+    bus = WorkflowEventBus(max_events_per_trace=2)
+    for name in ["Crew.kickoff", "Agent._start_task", "Agent._end_task", "Crew.complete"]:
+        bus.publish("t1", {"name": name})
+    assert [e["name"] for e in bus.get_events("t1")] == ["Crew.kickoff", "Agent._start_task", "Crew.complete"]
+
+
+def test_publish_workflow_event_uses_current_trace():
+    tracer = TracerProvider().get_tracer("test")
+    with tracer.start_as_current_span("run") as span:
+        trace_id = hex(span.get_span_context().trace_id)[2:]
+        publish_workflow_event("ToolUsage._end_use", {"tool.name": "t"}, exception=ValueError("boom"))
+    events = get_event_bus().get_events(trace_id)
+    assert len(events) == 1
+    assert events[0]["attributes"] == {"tool": {"name": "t"}}
+    assert events[0]["events"][0]["message"] == "boom"
+    assert not is_terminal_event(events[0])
+
+
+def test_publish_workflow_event_without_trace_is_noop():
+    publish_workflow_event("Crew.complete")
+
+
+def test_format_sse_event():
+    assert format_sse_event("kickoff", {"trace_id": "abc"}) == b'event: kickoff\ndata: {"trace_id": "abc"}\n\n'
+
+
+def kickoff_over_streaming_server(headers: dict = None, token: str = None):
+    """
+    Kick off a stub run through the streaming server, and return the response status,
+    the names of the streamed events and the kickoffs the server made.
+    """
+    kickoffs = []
+
+    def kickoff(serve_workflow_parameters):
+        trace_id = uuid4().hex
+        kickoffs.append(serve_workflow_parameters)
+        get_event_bus().publish(trace_id, {"name": "Agent._start_task"})
+        get_event_bus().publish(trace_id, {"name": "Crew.complete"})
+        return trace_id
+
+    server = start_workflow_streaming_server(kickoff, 0, token=token)
+    try:
+        assert server.server_address[0] == "127.0.0.1"
+        connection = HTTPConnection("127.0.0.1", server.server_address[1], timeout=10)
+        body = json.dumps({"request": {"action_type": "kickoff", "kickoff_inputs": ""}})
+        connection.request("POST", "/kickoff", body, {"Content-Type": "application/json", **(headers or {})})
+        response = connection.getresponse()
+        names = [line[len("event: ") :] for line in response.read().decode().splitlines() if line.startswith("event: ")]
+        connection.close()
+        return response.status, names, kickoffs
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_streaming_server_kickoff_streams_the_events_of_the_run():
+    status, names, kickoffs = kickoff_over_streaming_server()
+    assert status == 200
+    assert names == ["kickoff", "Agent._start_task", "Crew.complete"]
+    assert [k.action_type for k in kickoffs] == ["kickoff"]
+
+
+def test_streaming_server_requires_its_token():
+    status, names, kickoffs = kickoff_over_streaming_server(token="secret")
+    assert (status, names, kickoffs) == (401, [], [])
+    status, _, kickoffs = kickoff_over_streaming_server({"Authorization": "Bearer wrong"}, token="secret")
+    assert (status, kickoffs) == (401, [])
+
+    status, names, kickoffs = kickoff_over_streaming_server({"Authorization": "Bearer secret"}, token="secret")
+    assert status == 200
+    assert names[-1] == "Crew.complete" and len(kickoffs) == 1
+
+
+def test_stream_workflow_events_replays_until_terminal_event():
+    from studio.api import StreamWorkflowEventsRequest
+    from studio.workflow.test_and_deploy_workflow import stream_workflow_events
+
+    publish_workflow_event("Agent._start_task", {"task.description": "d"}, trace_id="abc123")
+    publish_workflow_event("Crew.complete", {"crew_output": "done"}, trace_id="abc123")
+    publish_workflow_event("Agent._start_task", trace_id="abc123")
+
+    events = list(stream_workflow_events(StreamWorkflowEventsRequest(trace_id="000abc123")))
+
+    assert [event.name for event in events] == ["Agent._start_task", "Crew.complete"]
+    assert json.loads(events[0].attributes) == {"task": {"description": "d"}}
+    assert json.loads(events[1].events) == []
+    assert get_event_bus()._subscribers.get("abc123") is None
+
+
+class FakeContext:
+    def __init__(self, active_checks: int):
+        self.active_checks = active_checks
+
+    def is_active(self):
+        self.active_checks -= 1
+        return self.active_checks >= 0
+
+
+def test_stream_workflow_events_ends_when_the_client_cancels():
+    from studio.api import StreamWorkflowEventsRequest
+    from studio.workflow.test_and_deploy_workflow import stream_workflow_events
+
+    publish_workflow_event("Agent._start_task", trace_id="cancelled1")
+
+    # The client goes away after the first event, and no terminal event ever arrives.
+    events = list(stream_workflow_events(StreamWorkflowEventsRequest(trace_id="cancelled1"), context=FakeContext(2)))
+
+    assert [event.name for event in events] == ["Agent._start_task"]
+    assert get_event_bus()._subscribers.get("cancelled1") is None
+
+
+def test_stream_workflow_events_ends_when_the_run_is_done():
+    from concurrent.futures import Future
+
+    from studio.api import StreamWorkflowEventsRequest
+    from studio.workflow.test_and_deploy_workflow import stream_workflow_events, track_workflow_run
+
+    # The run failed before publishing a terminal event.
+    publish_workflow_event("Agent._start_task", trace_id="failed1")
+    future = Future()
+    future.set_exception(RuntimeError("kickoff failed"))
+    track_workflow_run("failed1", future)
+
+    events = list(stream_workflow_events(StreamWorkflowEventsRequest(trace_id="failed1")))
+
+    assert [event.name for event in events] == ["Agent._start_task"]
+    assert get_event_bus()._subscribers.get("failed1") is None
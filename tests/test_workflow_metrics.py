@@ -0,0 +1,208 @@
+import json
+import pytest
+from collections import OrderedDict
+from datetime import datetime
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.api import *
+from studio.workflow.metrics import *
+
+
+TRACE_ID = "a" * 32
+
+
+def make_event(name: str, second: int, attributes: dict = None, exception: bool = False) -> dict:
+    return {
+        "id": f"{name}-{second}",
+        "name": name,
+        "startTime": f"2025-03-27T10:00:{second:02d}+00:00",
+        "attributes": attributes or {},
+        "events": [{"name": "exception", "message": "failed"}] if exception else [],
+    }
+
+
+def make_run_events(terminal: str = "Crew.complete") -> list:
+    agent_usage = [
+        {
+            "agent_studio_id": "a1",
+            "agent_role": "Researcher",
+            "model": "gpt-4o",
+            "prompt_tokens": 100,
+            "completion_tokens": 20,
+            "total_tokens": 120,
+            "successful_requests": 3,
+        },
+        {
+            "agent_studio_id": "a2",
+            "agent_role": "Writer",
+            "model": "gpt-4o",
+            "prompt_tokens": 50,
+            "completion_tokens": 10,
+            "total_tokens": 60,
+            "successful_requests": 1,
+        },
+    ]
+    return [
+        make_event("Crew.kickoff", 0),
+        make_event("Agent._start_task", 1, {"agent_studio_id": "a1"}),
+        make_event("ToolUsage._use", 2, {"tool": {"name": "search"}}),
+        make_event("ToolUsage._end_use", 5, {"tool": {"name": "search"}}),
+        make_event("Agent._end_task", 6, {"agent_studio_id": "a1"}),
+        make_event("Agent._start_task", 6, {"agent_studio_id": "a2"}),
+        make_event("Agent._end_task", 9, {"agent_studio_id": "a2"}, exception=terminal == "Crew.error"),
+        make_event(terminal, 10, {"agent_usage": agent_usage}),
+    ]
+
+
+def get_metric(metrics: list, scope: str, name: str) -> db_model.WorkflowRunMetric:
+    return next(metric for metric in metrics if metric.scope == scope and metric.name == name)
+
+
+def test_compute_workflow_run_metrics():
+    metrics = compute_workflow_run_metrics(TRACE_ID, make_run_events(), "w1")
+
+    assert sorted((metric.scope, metric.name) for metric in metrics) == [
+        ("agent", "a1"),
+        ("agent", "a2"),
+        ("model", "gpt-4o"),
+        ("run", "w1"),
+        ("tool", "search"),
+    ]
+    run = get_metric(metrics, "run", "w1")
+    assert run.duration_seconds == 10
+    assert (run.prompt_tokens, run.completion_tokens, run.total_tokens) == (150, 30, 180)
+    assert run.error_count == 0
+
+    agent = get_metric(metrics, "agent", "a1")
+    assert (agent.call_count, agent.duration_seconds, agent.total_tokens) == (1, 5, 120)
+    tool = get_metric(metrics, "tool", "search")
+    assert (tool.call_count, tool.duration_seconds, tool.total_tokens) == (1, 3, None)
+    model = get_metric(metrics, "model", "gpt-4o")
+    assert (model.call_count, model.duration_seconds, model.total_tokens) == (4, None, 180)
+
+
+def test_compute_workflow_run_metrics_counts_errors_and_skips_incomplete_runs():
+    metrics = compute_workflow_run_metrics(TRACE_ID, make_run_events(terminal="Crew.error"), "w1")
+    assert get_metric(metrics, "run", "w1").error_count == 1
+    assert get_metric(metrics, "agent", "a2").error_count == 1
+
+    assert compute_workflow_run_metrics(TRACE_ID, make_run_events()[:-1], "w1") == []
+
+
+def test_record_workflow_run_metrics_of_runs_past_the_event_cap(monkeypatch):
+    from engine import events
+
+    bus = events.WorkflowEventBus(max_events_per_trace=3)
+    for event in make_run_events():
+        bus.publish(TRACE_ID, event)
+    monkeypatch.setattr(events, "_event_bus", bus)
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+    assert record_workflow_run_metrics(TRACE_ID, "w1", dao=dao) > 0
+    with dao.get_session() as session:
+        run_metric = session.query(db_model.WorkflowRunMetric).filter_by(scope="run").one()
+        assert (run_metric.duration_seconds, run_metric.total_tokens) == (10.0, 180)
+
+
+def make_ops_events(complete: bool = True) -> list:
+    """
+    The events of a deployed run as reported by the ops server: UTC times with a "Z"
+    suffix, and agent usage as a JSON span attribute.
+    """
+    events = make_run_events() if complete else make_run_events()[:-1]
+    for event in events:
+        event["startTime"] = event["startTime"].replace("+00:00", "Z")
+        if "agent_usage" in event["attributes"]:
+            event["attributes"] = {"agent_usage": json.dumps(event["attributes"]["agent_usage"])}
+    return events
+
+
+def test_record_deployed_workflow_run_metrics(monkeypatch):
+    import studio.workflow.metrics as metrics
+
+    lookups = []
+    ops_events = make_ops_events(complete=False)
+
+    def get_crew_events(client, trace_id, trace_info):
+        lookups.append(trace_id)
+        return {"projectId": "p1", "events": ops_events, "cursor": None}
+
+    monkeypatch.setattr(metrics, "get_crew_events", get_crew_events)
+    monkeypatch.setattr(metrics, "_deployed_run_checks", OrderedDict())
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    trace_id = "0" + "c" * 31
+
+    # A running deployed run has no metrics yet, and is not looked up again right away.
+    assert record_deployed_workflow_run_metrics(None, trace_id, {"projectId": "p1"}, "w1", dao=dao) == 0
+    assert record_deployed_workflow_run_metrics(None, trace_id, {"projectId": "p1"}, "w1", dao=dao) == 0
+    assert lookups == ["c" * 31]
+
+    ops_events = make_ops_events()
+    monkeypatch.setattr(metrics, "DEPLOYED_RUN_METRICS_CHECK_INTERVAL_SECONDS", 0)
+    assert record_deployed_workflow_run_metrics(None, trace_id, {"projectId": "p1"}, "w1", dao=dao) == 5
+    # Once recorded, the run is not looked up anymore.
+    assert record_deployed_workflow_run_metrics(None, trace_id, {"projectId": "p1"}, "w1", dao=dao) == 0
+    assert lookups == ["c" * 31] * 2
+
+    with dao.get_session() as session:
+        run_metric = session.query(db_model.WorkflowRunMetric).filter_by(scope="run").one()
+        assert run_metric.trace_id == "c" * 31
+        assert (run_metric.name, run_metric.duration_seconds, run_metric.total_tokens) == ("w1", 10.0, 180)
+
+
+def test_record_workflow_run_metrics_replaces_rows_of_the_run(monkeypatch):
+    from engine import events
+
+    bus = events.WorkflowEventBus()
+    for event in make_run_events():
+        bus.publish(TRACE_ID, event)
+    monkeypatch.setattr(events, "_event_bus", bus)
+    dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+    recorded = record_workflow_run_metrics(TRACE_ID, "w1", dao=dao)
+    assert record_workflow_run_metrics(TRACE_ID, "w1", dao=dao) == recorded
+    with dao.get_session() as session:
+        assert session.query(db_model.WorkflowRunMetric).count() == recorded
+
+
+def test_summarize_workflow_run_metrics_windows_and_percentiles():
+    metrics = [
+        db_model.WorkflowRunMetric(
+            trace_id=f"t{i}", scope="run", name="w1", started_at=float(i), duration_seconds=float(i), total_tokens=10
+        )
+        for i in range(10)
+    ]
+
+    (summary,) = summarize_workflow_run_metrics(metrics, "run", 0.0, 10.0, percentiles=[50, 90])
+    assert summary.run_count == 10
+    assert summary.total_tokens == 100
+    assert summary.duration_seconds == 45
+    assert [(p.percentile, p.value) for p in summary.duration_seconds_percentiles] == [(50, 4.5), (90, 8.1)]
+
+    windows = summarize_workflow_run_metrics(metrics, "run", 0.0, 10.0, window_seconds=4)
+    assert [(s.window_start, s.window_end, s.run_count) for s in windows] == [(0, 4, 4), (4, 8, 4), (8, 10, 2)]
+
+
+def test_get_workflow_run_metrics():
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with test_dao.get_session() as session:
+        session.add_all(compute_workflow_run_metrics(TRACE_ID, make_run_events(), "w1"))
+        session.add_all(compute_workflow_run_metrics("b" * 32, make_run_events(), "w2"))
+    started_at = make_run_events()[0]["startTime"]
+    start_time = datetime.fromisoformat(started_at).timestamp()
+
+    res = get_workflow_run_metrics(
+        GetWorkflowRunMetricsRequest(scope="agent", workflow_id="w1", start_time=start_time, end_time=start_time + 60),
+        dao=test_dao,
+    )
+
+    assert [(s.name, s.run_count, s.total_tokens) for s in res.summaries] == [("a1", 1, 120), ("a2", 1, 60)]
+    assert [p.percentile for p in res.summaries[0].duration_seconds_percentiles] == DEFAULT_METRIC_PERCENTILES
+
+    res = get_workflow_run_metrics(
+        GetWorkflowRunMetricsRequest(start_time=start_time, end_time=start_time + 60), dao=test_dao
+    )
+    assert [(s.name, s.run_count) for s in res.summaries] == [("w1", 1), ("w2", 1)]
+
+    with pytest.raises(ValueError):
+        get_workflow_run_metrics(GetWorkflowRunMetricsRequest(scope="unknown"), dao=test_dao)
@@ -0,0 +1,182 @@
+import base64
+import hashlib
+import importlib
+import json
+import sys
+import time
+import types
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+sys.path.append("studio/workflow_engine/src/")
+
+from engine import consts, sessions
+
+
+COLLATED_INPUT = {
+    "default_language_model_id": "m1",
+    "language_models": [{"model_id": "m1", "model_name": "gpt-4o", "generation_config": {}}],
+    "tool_instances": [
+        {
+            "id": "ti1",
+            "name": "Search",
+            "python_code_file_name": "tool.py",
+            "python_requirements_file_name": "requirements.txt",
+            "source_folder_path": "studio-data/workflows/w1/tools/search",
+            "tool_image_uri": "tool_instance_icons/search.png",
+        }
+    ],
+    "agents": [
+        {
+            "id": "a1",
+            "name": "Researcher",
+            "crew_ai_role": "Researcher",
+            "crew_ai_backstory": "",
+            "crew_ai_goal": "",
+            "tool_instance_ids": ["ti1"],
+            "agent_image_uri": "agent_icons/researcher.png",
+        }
+    ],
+    "tasks": [],
+    "workflow": {
+        "id": "w1",
+        "name": "Workflow",
+        "deployment_id": "d1",
+        "crew_ai_process": "sequential",
+        "agent_ids": ["a1"],
+        "is_conversational": False,
+    },
+}
+
+
+@pytest.fixture
+def workbench(request, tmp_path, monkeypatch):
+    """
+    The workflow model entry point (engine.entry.workbench), imported afresh for a
+    deployed workflow whose artifact lives in tmp_path. The cml package only exists
+    on CML runtimes, so its model decorator is replaced by a pass-through. Fields of
+    the workflow can be overridden by parametrizing the fixture indirectly.
+    """
+    collated_input = {**COLLATED_INPUT, "workflow": {**COLLATED_INPUT["workflow"], **getattr(request, "param", {})}}
+    config_path = tmp_path / "workflow" / "config.json"
+    config_path.parent.mkdir()
+    config_path.write_text(json.dumps(collated_input))
+    # An empty pre-resolved requirements file, so that nothing is installed.
+    (config_path.parent / "requirements.txt").write_text("")
+    assets_dir = tmp_path / "dynamic_assets"
+    (assets_dir / "tool_instance_icons").mkdir(parents=True)
+    (assets_dir / "tool_instance_icons" / "search.png").write_bytes(b"search icon")
+    (assets_dir / "agent_icons").mkdir()
+    (assets_dir / "secret.txt").write_bytes(b"secret")
+
+    monkeypatch.setenv("AGENT_STUDIO_WORKFLOW_ARTIFACT", str(config_path))
+    monkeypatch.setenv("AGENT_STUDIO_WORKFLOW_NAME", "workflow")
+    for name in ["AGENT_STUDIO_WORKFLOW_STREAMING_PORT", "AGENT_STUDIO_METRICS_PORT"]:
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("AGENT_STUDIO_WORKFLOW_EXECUTION_MODE", "thread")
+    monkeypatch.setattr(consts, "DYNAMIC_ASSETS_LOCATION", str(assets_dir))
+    cml_models = types.ModuleType("cml.models_v1")
+    cml_models.cml_model = lambda function: function
+    monkeypatch.setitem(sys.modules, "cml", types.ModuleType("cml"))
+    monkeypatch.setitem(sys.modules, "cml.models_v1", cml_models)
+    monkeypatch.delitem(sys.modules, "engine.entry.workbench", raising=False)
+
+    yield importlib.import_module("engine.entry.workbench")
+    sys.modules.pop("engine.entry.workbench", None)
+
+
+def get_asset_data(workbench, asset_uris: list, etags: dict = None) -> dict:
+    return workbench.api_wrapper(
+        {"action_type": "get-asset-data", "get_asset_data_inputs": asset_uris, "get_asset_data_etags": etags or {}}
+    )
+
+
+def test_get_asset_data_only_serves_assets_of_the_workflow(workbench):
+    response = get_asset_data(
+        workbench,
+        ["tool_instance_icons/search.png", "secret.txt", "../workflow/config.json", "agent_icons/researcher.png"],
+    )
+
+    assert list(response["asset_data"]) == ["tool_instance_icons/search.png"]
+    # Assets of the workflow that are missing on disk are unavailable too.
+    assert sorted(response["unavailable_assets"]) == [
+        "../workflow/config.json",
+        "agent_icons/researcher.png",
+        "secret.txt",
+    ]
+    assert response["asset_etags"] == {"tool_instance_icons/search.png": hashlib.sha256(b"search icon").hexdigest()}
+
+
+def test_get_asset_data_reads_each_asset_once(workbench, monkeypatch):
+    first = get_asset_data(workbench, ["tool_instance_icons/search.png"])
+    monkeypatch.setattr(consts, "DYNAMIC_ASSETS_LOCATION", "/missing")
+
+    second = get_asset_data(workbench, ["tool_instance_icons/search.png"])
+
+    assert second == first
+    assert list(workbench._asset_cache) == ["tool_instance_icons/search.png"]
+
+
+def test_get_asset_data_skips_assets_the_caller_already_has(workbench):
+    etag = hashlib.sha256(b"search icon").hexdigest()
+
+    not_modified = get_asset_data(
+        workbench, ["tool_instance_icons/search.png"], {"tool_instance_icons/search.png": etag}
+    )
+    modified = get_asset_data(workbench, ["tool_instance_icons/search.png"], {"tool_instance_icons/search.png": "old"})
+
+    assert not_modified["asset_data"] == {}
+    assert not_modified["not_modified_assets"] == ["tool_instance_icons/search.png"]
+    assert not_modified["asset_etags"] == {"tool_instance_icons/search.png": etag}
+    assert list(modified["asset_data"]) == ["tool_instance_icons/search.png"]
+    assert modified["not_modified_assets"] == []
+
+
+def kickoff(workbench, inputs: dict, session_id: str) -> dict:
+    return workbench.api_wrapper(
+        {
+            "action_type": "kickoff",
+            "kickoff_inputs": base64.b64encode(json.dumps(inputs).encode()).decode(),
+            "session_id": session_id,
+        }
+    )
+
+
+def wait_for_history(session_id: str, length: int) -> list:
+    deadline = time.monotonic() + 10
+    while len(sessions.get_session_cache().get_history(session_id)) < length and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return sessions.get_session_cache().get_history(session_id)
+
+
+@pytest.mark.parametrize("workbench", [{"is_conversational": True}], indirect=True)
+def test_conversation_turns_keep_the_session_history(workbench, monkeypatch):
+    contexts = []
+
+    async def run_workflow_async(collated_input, tool_user_params, inputs, parent_context, tracer=None):
+        contexts.append(json.loads(inputs["context"]))
+        return f"answer to {inputs['user_input']}"
+
+    monkeypatch.setattr(workbench, "run_workflow_async", run_workflow_async)
+    monkeypatch.setattr(workbench, "instrument_crewai_workflow", lambda workflow_name: TracerProvider())
+    monkeypatch.setattr(workbench, "reset_crewai_instrumentation", lambda: None)
+    monkeypatch.setattr(sessions, "_session_cache", sessions.ConversationSessionCache())
+    first_turn = [{"role": "user", "content": "hi"}, {"role": "assistant", "content": "answer to hi"}]
+
+    assert kickoff(workbench, {"user_input": "hi"}, "s1")["session_known"] is False
+    assert wait_for_history("s1", 2) == first_turn
+    assert kickoff(workbench, {"user_input": "more"}, "s1")["session_known"] is True
+    assert len(wait_for_history("s1", 4)) == 4
+    assert contexts == [[], first_turn]
+
+    # After a restart (or on another replica) the history is gone, and the caller's
+    # context restores it.
+    sessions.get_session_cache().clear("s1")
+    response = kickoff(workbench, {"user_input": "again", "context": json.dumps(first_turn)}, "s1")
+    assert response["session_known"] is False
+    assert contexts[-1] == first_turn
+    assert wait_for_history("s1", 4)[-2:] == [
+        {"role": "user", "content": "again"},
+        {"role": "assistant", "content": "answer to again"},
+    ]
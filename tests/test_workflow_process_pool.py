@@ -0,0 +1,98 @@
+import asyncio
+import os
+import sys
+import time
+import types
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from opentelemetry import trace as trace_api
+from opentelemetry.context import get_current
+from opentelemetry.sdk.trace import TracerProvider
+
+sys.path.append("studio/workflow_engine/src/")
+
+from engine.crewai import run
+from engine.events import get_event_bus, publish_workflow_event
+import engine.types as input_types
+
+
+COLLATED_INPUT = input_types.CollatedInput.model_validate(
+    {
+        "default_language_model_id": "m1",
+        "language_models": [],
+        "tool_instances": [],
+        "agents": [],
+        "tasks": [],
+        "workflow": {
+            "id": "w1",
+            "name": "Workflow",
+            "deployment_id": "d1",
+            "crew_ai_process": "sequential",
+            "is_conversational": False,
+        },
+    }
+)
+
+
+class FakeCrew:
+    """
+    Stands in for the crew of a workflow. The kickoff output is the trace context
+    that the crew runs in, as seen by the worker process.
+    """
+
+    def kickoff(self, inputs):
+        if inputs.get("crash"):
+            os._exit(1)
+        publish_workflow_event("Crew.complete")
+        span_context = trace_api.get_current_span().get_span_context()
+        raw = f"{os.getpid()}/{span_context.trace_id:032x}/{span_context.span_id:016x}"
+        return types.SimpleNamespace(raw=raw)
+
+
+@pytest.fixture
+def process_pool(monkeypatch):
+    # Workers are forked, so they inherit these replacements of the parent process.
+    monkeypatch.setattr(
+        run,
+        "create_crewai_objects",
+        lambda collated_input, tool_user_params, tracer=None: types.SimpleNamespace(crews={"w1": FakeCrew()}),
+    )
+    monkeypatch.setattr(run, "instrument_crewai_workflow", lambda workflow_name: TracerProvider())
+    monkeypatch.setattr(run, "reset_crewai_instrumentation", lambda: None)
+    yield run.initialize_workflow_process_pool(COLLATED_INPUT, {}, "workflow", max_workers=1)
+    run.cleanup_workflow_process_pool()
+
+
+def run_workflow_in_span(inputs: dict):
+    """
+    Run the workflow under a parent span, and return the output of the run along with
+    the parent span context.
+    """
+    tracer = TracerProvider().get_tracer("test")
+    with tracer.start_as_current_span("Workflow Run") as parent_span:
+        output = asyncio.run(run.run_workflow_async(COLLATED_INPUT, {}, inputs, get_current()))
+    return output, parent_span.get_span_context()
+
+
+def test_workflow_runs_in_worker_under_the_parent_span(process_pool):
+    output, parent_span_context = run_workflow_in_span({})
+
+    worker_pid, trace_id, span_id = output.split("/")
+    assert int(worker_pid) != os.getpid()
+    assert trace_id == f"{parent_span_context.trace_id:032x}"
+    assert span_id == f"{parent_span_context.span_id:016x}"
+    # Events published in the worker reach the event bus of this process.
+    deadline = time.monotonic() + 10
+    while not get_event_bus().get_events(trace_id.lstrip("0")) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert [event["name"] for event in get_event_bus().get_events(trace_id.lstrip("0"))] == ["Crew.complete"]
+
+
+def test_broken_process_pool_is_replaced(process_pool):
+    with pytest.raises(BrokenProcessPool):
+        run_workflow_in_span({"crash": True})
+
+    assert run.get_workflow_process_pool() is not process_pool
+    output, parent_span_context = run_workflow_in_span({})
+    assert output.split("/")[1] == f"{parent_span_context.trace_id:032x}"
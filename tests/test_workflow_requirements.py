@@ -0,0 +1,69 @@
+import pytest
+import sys
+import os
+
+sys.path.append("studio/workflow_engine/src/")
+
+from engine.requirements import (
+    merge_requirement_files,
+    write_merged_requirements,
+    are_requirements_satisfied,
+)
+
+
+def _write(tmp_path, name, content):
+    path = os.path.join(tmp_path, name)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+def test_merge_requirement_files_dedupes_and_strips_comments(tmp_path):
+    a = _write(tmp_path, "a.txt", "# comment\npydantic==2.10.6\n\npandas\nslack-sdk==3.21.0  # Slack API\n")
+    b = _write(tmp_path, "b.txt", "pandas\nnumpy\n-r other.txt\n")
+    merged = merge_requirement_files([a, b])
+    assert merged == ["pydantic==2.10.6", "pandas", "slack-sdk==3.21.0", "numpy"]
+
+
+def test_merge_requirement_files_rejects_conflicting_pins(tmp_path):
+    a = _write(tmp_path, "a.txt", "pydantic==2.10.3\nrequests==2.32.3\n")
+    b = _write(tmp_path, "b.txt", "pydantic==2.10.6\nrequests==2.32.3\n")
+    c = _write(tmp_path, "c.txt", "Pydantic==2.9.0\n")
+    with pytest.raises(ValueError, match=r"'pydantic' \(2\.10\.3, 2\.10\.6, 2\.9\.0\)") as e:
+        merge_requirement_files([a, b, c])
+    assert "requests" not in str(e.value)
+
+
+def test_merge_requirement_files_combines_ranges(tmp_path):
+    a = _write(tmp_path, "a.txt", "pytesseract>=0.3.8\nnumpy\n")
+    b = _write(tmp_path, "b.txt", "pytesseract<1.0\nnumpy==1.24.3\n")
+    merged = merge_requirement_files([a, b])
+    assert merged[0] in ["pytesseract<1.0,>=0.3.8", "pytesseract>=0.3.8,<1.0"]
+    assert merged[1] == "numpy==1.24.3"
+
+
+def test_merge_requirement_files_skips_missing_files(tmp_path):
+    a = _write(tmp_path, "a.txt", "requests==2.32.3\n")
+    assert merge_requirement_files([a, os.path.join(tmp_path, "missing.txt")]) == ["requests==2.32.3"]
+
+
+def test_write_merged_requirements(tmp_path):
+    a = _write(tmp_path, "a.txt", "requests==2.32.3\n")
+    merged_path = write_merged_requirements([a], str(tmp_path))
+    with open(merged_path, "r") as f:
+        assert f.read() == "requests==2.32.3\n"
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("pytest\n", True),
+        (f"pytest=={pytest.__version__}\n", True),
+        ("pytest==0.0.1\n", False),
+        ("this-package-does-not-exist-anywhere==1.0\n", False),
+        ("this-package-does-not-exist-anywhere; python_version < '3'\n", True),
+    ],
+)
+def test_are_requirements_satisfied(tmp_path, content, expected):
+    path = _write(tmp_path, "requirements.txt", content)
+    assert are_requirements_satisfied(path) == expected
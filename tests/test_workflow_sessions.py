@@ -0,0 +1,74 @@
+import pytest
+import json
+import sys
+
+sys.path.append("studio/workflow_engine/src/")
+
+from engine.sessions import ConversationSessionCache
+
+
+def test_session_history_and_context():
+    cache = ConversationSessionCache()
+    assert cache.get_history("s1") == []
+    assert cache.get_context("s1") == "[]"
+    cache.append_turn("s1", "hi", "hello")
+    assert json.loads(cache.get_context("s1")) == [
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+
+
+def test_session_cache_evicts_least_recently_used():
+    cache = ConversationSessionCache(max_sessions=2)
+    cache.append_turn("s1", "a", "b")
+    cache.append_turn("s2", "a", "b")
+    cache.get_history("s1")
+    cache.append_turn("s3", "a", "b")
+    assert len(cache) == 2
+    assert cache.get_history("s2") == []
+    assert len(cache.get_history("s1")) == 2
+
+
+def test_session_truncates_by_message_count():
+    cache = ConversationSessionCache(max_messages=4)
+    for i in range(3):
+        cache.append_turn("s1", f"q{i}", f"a{i}")
+    assert [m["content"] for m in cache.get_history("s1")] == ["q1", "a1", "q2", "a2"]
+
+
+def test_session_truncates_by_characters_but_keeps_latest_turn():
+    cache = ConversationSessionCache(max_messages=0, max_context_characters=5)
+    cache.append_turn("s1", "aaa", "bbb")
+    cache.append_turn("s1", "cccccc", "dddddd")
+    assert [m["content"] for m in cache.get_history("s1")] == ["cccccc", "dddddd"]
+
+
+def test_session_summarize_policy():
+    cache = ConversationSessionCache(max_messages=2, history_policy="summarize")
+    cache.append_turn("s1", "q0", "a0")
+    cache.append_turn("s1", "q1", "a1")
+    history = cache.get_history("s1")
+    assert history[0]["role"] == "system"
+    assert "user: q0\nassistant: a0" in history[0]["content"]
+    assert [m["content"] for m in history[1:]] == ["q1", "a1"]
+    cache.clear("s1")
+    assert cache.get_history("s1") == []
+
+
+def test_session_invalid_policy():
+    with pytest.raises(ValueError):
+        ConversationSessionCache(history_policy="unknown")
+
+
+def test_session_context_replaces_the_history():
+    cache = ConversationSessionCache(max_messages=2)
+    cache.append_turn("s1", "a", "b")
+    assert cache.has_session("s1") and not cache.has_session("s2")
+
+    cache.set_context("s1", json.dumps([{"role": "user", "content": "c"}, {"role": "assistant", "content": "d"}] * 2))
+    assert cache.get_history("s1") == [{"role": "user", "content": "c"}, {"role": "assistant", "content": "d"}]
+    # Contexts that aren't lists of messages leave the history alone.
+    cache.set_context("s1", "free-form context")
+    cache.set_context("s2", json.dumps(["c", "d"]))
+    assert len(cache.get_history("s1")) == 2
+    assert not cache.has_session("s2")
@@ -0,0 +1,121 @@
+from unittest.mock import patch, MagicMock
+from studio.db.dao import AgentStudioDao
+from studio.db import model as db_model
+from studio.api import *
+from studio.workflow.traces import *
+
+
+TRACE_ID = "0" + "a" * 31
+
+
+def test_record_workflow_trace_normalizes_trace_id():
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+    record_workflow_trace("a" * 31, "Test Workflow - wf", "w1", dao=test_dao)
+
+    with test_dao.get_session() as session:
+        workflow_trace = session.get(db_model.WorkflowTrace, TRACE_ID)
+        assert workflow_trace.project_name == "Test Workflow - wf"
+        assert workflow_trace.workflow_id == "w1"
+        assert workflow_trace.project_id is None
+
+
+def test_record_workflow_trace_reuses_known_project_id():
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+    with test_dao.get_session() as session:
+        session.add(db_model.WorkflowTrace(trace_id="1" * 32, project_name="wf", project_id="p1", global_trace_id="g1"))
+
+    record_workflow_trace(TRACE_ID, "wf", dao=test_dao)
+
+    with test_dao.get_session() as session:
+        assert session.get(db_model.WorkflowTrace, TRACE_ID).project_id == "p1"
+
+
+@patch("studio.workflow.traces.get_project_and_trace_info")
+@patch("studio.workflow.traces.get_trace_info_for_project")
+def test_resolve_workflow_trace_info_uses_index(mock_project_lookup, mock_scan):
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+
+    with test_dao.get_session() as session:
+        session.add(db_model.WorkflowTrace(trace_id=TRACE_ID, project_id="p1", global_trace_id="g1"))
+
+    trace_info = resolve_workflow_trace_info(MagicMock(), TRACE_ID, dao=test_dao)
+
+    assert trace_info == {"projectId": "p1", "globalTraceId": "g1"}
+    mock_project_lookup.assert_not_called()
+    mock_scan.assert_not_called()
+
+
+@patch("studio.workflow.traces.get_project_and_trace_info")
+@patch("studio.workflow.traces.get_trace_info_for_project")
+def test_resolve_workflow_trace_info_queries_known_project(mock_project_lookup, mock_scan):
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    mock_project_lookup.return_value = {"projectId": "p1", "globalTraceId": "g2"}
+
+    with test_dao.get_session() as session:
+        session.add(db_model.WorkflowTrace(trace_id="1" * 32, project_name="wf", project_id="p1", global_trace_id="g1"))
+
+    trace_info = resolve_workflow_trace_info(MagicMock(), TRACE_ID, project_name="wf", dao=test_dao)
+
+    assert trace_info == {"projectId": "p1", "globalTraceId": "g2"}
+    mock_project_lookup.assert_called_once()
+    mock_scan.assert_not_called()
+    with test_dao.get_session() as session:
+        assert session.get(db_model.WorkflowTrace, TRACE_ID).global_trace_id == "g2"
+
+
+@patch("studio.workflow.traces.get_project_and_trace_info")
+def test_resolve_workflow_trace_info_not_reported_yet(mock_scan):
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    mock_scan.side_effect = ValueError("No project found")
+
+    assert resolve_workflow_trace_info(MagicMock(), TRACE_ID, dao=test_dao) is None
+    # Lookups of unknown traces don't add them to the index.
+    with test_dao.get_session() as session:
+        assert session.query(db_model.WorkflowTrace).count() == 0
+
+
+@patch("studio.workflow.traces.get_project_and_trace_info")
+@patch("studio.workflow.traces.get_phoenix_ops_graphql_client")
+def test_resolve_workflow_trace_scans_unknown_traces_once(mock_client, mock_scan):
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    mock_scan.return_value = {"projectId": "p1", "projectName": "wf", "globalTraceId": "g1"}
+
+    req = ResolveWorkflowTraceRequest(trace_id=TRACE_ID)
+    res = resolve_workflow_trace(req, dao=test_dao)
+    res = resolve_workflow_trace(req, dao=test_dao)
+
+    assert res.project_id == "p1"
+    assert res.global_trace_id == "g1"
+    mock_scan.assert_called_once()
+
+
+def test_remove_workflow_traces_of_a_project():
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with test_dao.get_session() as session:
+        session.add(db_model.WorkflowTrace(trace_id="1", project_id="p1", created_at=100))
+        session.add(db_model.WorkflowTrace(trace_id="2", project_id="p1", created_at=300))
+        session.add(db_model.WorkflowTrace(trace_id="3", project_name="wf", created_at=None))
+        session.add(db_model.WorkflowTrace(trace_id="4", project_id="p2", created_at=100))
+
+    assert remove_workflow_traces("p1", "wf", before=200, dao=test_dao) == 2
+
+    with test_dao.get_session() as session:
+        assert sorted(t.trace_id for t in session.query(db_model.WorkflowTrace)) == ["2", "4"]
+
+
+@patch("studio.workflow.traces.record_deployed_workflow_run_metrics")
+@patch("studio.workflow.traces.get_phoenix_ops_graphql_client")
+def test_resolve_workflow_trace_records_runs_of_known_workflows(mock_client, mock_record):
+    test_dao = AgentStudioDao(engine_url="sqlite:///:memory:", echo=False)
+    with test_dao.get_session() as session:
+        session.add(db_model.WorkflowTrace(trace_id=TRACE_ID, workflow_id="w1", project_id="p1", global_trace_id="g1"))
+        session.add(db_model.WorkflowTrace(trace_id="1" * 32, project_id="p1", global_trace_id="g2"))
+
+    resolve_workflow_trace(ResolveWorkflowTraceRequest(trace_id=TRACE_ID), dao=test_dao)
+    resolve_workflow_trace(ResolveWorkflowTraceRequest(trace_id="1" * 32), dao=test_dao)
+
+    mock_record.assert_called_once_with(
+        mock_client.return_value, TRACE_ID, {"projectId": "p1", "globalTraceId": "g1"}, "w1", dao=test_dao
+    )